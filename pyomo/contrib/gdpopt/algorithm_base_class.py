@@ -63,6 +63,9 @@ class _GDPoptAlgorithm:
         self.original_obj = None
         self._dummy_obj = None
         self.original_util_block = None
+        # The SubproblemEngine of the OA algorithms (for the duration of
+        # a solve)
+        self._subproblem_engine = None
 
         self.log_formatter = (
             '{:>9}   {:>15}   {:>11.5f}   {:>11.5f}   {:>8.2%}   {:>7.2f}  {}'
@@ -144,6 +147,7 @@ class _GDPoptAlgorithm:
                 }:
                     self._transfer_incumbent_to_original_model(config.logger)
                 self._delete_original_model_util_block()
+                self._subproblem_engine = None
             return self.pyomo_results
 
     def _solve_gdp(self, original_model, config):
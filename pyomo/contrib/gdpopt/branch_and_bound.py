@@ -10,6 +10,7 @@
 #  ___________________________________________________________________________
 
 from collections import namedtuple
+from contextlib import contextmanager
 from heapq import heappush, heappop
 import traceback
 
@@ -34,6 +35,7 @@ from pyomo.contrib.gdpopt.config_options import (
     _add_nlp_solve_configs,
 )
 from pyomo.contrib.gdpopt.nlp_initialization import restore_vars_to_original_values
+from pyomo.contrib.gdpopt.subproblem_engine import SubproblemEngine
 from pyomo.contrib.gdpopt.util import (
     copy_var_list_values,
     SuppressInfeasibleWarning,
@@ -210,38 +212,19 @@ class GDP_LBB_Solver(_GDPoptAlgorithm):
             node_count=0,
             unbranched_disjunction_indices=unbranched_disjunction_indices,
         )
+        if config.threads > 1:
+            return self._parallel_branch_and_bound(root_node, sort_tuple, config)
         heappush(queue, (sort_tuple, root_node))
 
         # Do the branch and bound
         while len(queue) > 0:
             # visit the top node on the heap
             node_data, node_model = heappop(queue)
-            config.logger.info(
-                "Nodes: %s LB %.10g Unbranched %s"
-                % (
-                    self.explored_nodes,
-                    node_data.obj_lb,
-                    node_data.num_unbranched_disjunctions,
-                )
-            )
+            self._log_node(node_data, config)
 
             # Check time limit
             if self.reached_time_limit(config):
-                no_feasible_soln = float('inf')
-                self.LB = (
-                    node_data.obj_lb
-                    if self.objective_sense == minimize
-                    else -no_feasible_soln
-                )
-                self.UB = (
-                    no_feasible_soln
-                    if self.objective_sense == minimize
-                    else -node_data.obj_lb
-                )
-                config.logger.info(
-                    'Final bound values: LB: {}  UB: {}'.format(self.LB, self.UB)
-                )
-                return self._get_final_results_object()
+                return self._time_limit_results(node_data, config)
 
             # Handle current node
             if not node_data.is_screened:
@@ -250,13 +233,8 @@ class GDP_LBB_Solver(_GDPoptAlgorithm):
                 new_node_data = self._prescreen_node(node_data, node_model, config)
                 # replace with updated node data
                 heappush(queue, (new_node_data, node_model))
-            elif (
-                node_data.obj_lb < node_data.obj_ub - config.bound_tolerance
-                and not node_data.is_evaluated
-            ):
+            elif self._needs_evaluation(node_data, config):
                 # Node has not been fully evaluated.
-                # Note: infeasible and unbounded nodes will skip this condition,
-                # because of strict inequality
                 new_node_data = self._evaluate_node(node_data, node_model, config)
                 # replace with updated node data
                 heappush(queue, (new_node_data, node_model))
@@ -266,34 +244,66 @@ class GDP_LBB_Solver(_GDPoptAlgorithm):
             ):
                 # We have reached a leaf node, or the best available node is
                 # infeasible.
-
-                # Update the incumbent and put it in the original model
-                self.update_incumbent(
-                    node_model.component(self.original_util_block.name)
-                )
-                self._transfer_incumbent_to_original_model(config.logger)
-
-                self.LB = (
-                    node_data.obj_lb
-                    if self.objective_sense == minimize
-                    else -node_data.obj_ub
+                return self._final_results(
+                    node_data,
+                    node_model.component(self.original_util_block.name),
+                    config,
                 )
-                self.UB = (
-                    node_data.obj_ub
-                    if self.objective_sense == minimize
-                    else -node_data.obj_lb
-                )
-                self.iteration = self.explored_nodes
-                if node_data.obj_lb == float('inf'):
-                    self.pyomo_results.solver.termination_condition = tc.infeasible
-                elif node_data.obj_ub == float('-inf'):
-                    self.pyomo_results.solver.termination_condition = tc.unbounded
-                else:
-                    self.pyomo_results.solver.termination_condition = tc.optimal
-                return self._get_final_pyomo_results_object()
             else:
                 self._branch_on_node(node_data, node_model, config)
 
+    def _log_node(self, node_data, config):
+        config.logger.info(
+            "Nodes: %s LB %.10g Unbranched %s"
+            % (
+                self.explored_nodes,
+                node_data.obj_lb,
+                node_data.num_unbranched_disjunctions,
+            )
+        )
+
+    @staticmethod
+    def _needs_evaluation(node_data, config):
+        # Note: infeasible and unbounded nodes are never (re)evaluated,
+        # because of the strict inequality
+        return not node_data.is_screened or (
+            node_data.obj_lb < node_data.obj_ub - config.bound_tolerance
+            and not node_data.is_evaluated
+        )
+
+    def _time_limit_results(self, node_data, config):
+        no_feasible_soln = float('inf')
+        self.LB = (
+            node_data.obj_lb if self.objective_sense == minimize else -no_feasible_soln
+        )
+        self.UB = (
+            no_feasible_soln if self.objective_sense == minimize else -node_data.obj_lb
+        )
+        config.logger.info(
+            'Final bound values: LB: {}  UB: {}'.format(self.LB, self.UB)
+        )
+        return self._get_final_pyomo_results_object()
+
+    def _final_results(self, node_data, node_utils, config):
+        # Update the incumbent and put it in the original model
+        self.update_incumbent(node_utils)
+        self._transfer_incumbent_to_original_model(config.logger)
+
+        self.LB = (
+            node_data.obj_lb if self.objective_sense == minimize else -node_data.obj_ub
+        )
+        self.UB = (
+            node_data.obj_ub if self.objective_sense == minimize else -node_data.obj_lb
+        )
+        self.iteration = self.explored_nodes
+        if node_data.obj_lb == float('inf'):
+            self.pyomo_results.solver.termination_condition = tc.infeasible
+        elif node_data.obj_ub == float('-inf'):
+            self.pyomo_results.solver.termination_condition = tc.unbounded
+        else:
+            self.pyomo_results.solver.termination_condition = tc.optimal
+        return self._get_final_pyomo_results_object()
+
     def _branch_on_node(self, node_data, node_model, config):
         node_utils = node_model.component(self.original_util_block.name)
 
@@ -305,59 +315,39 @@ class GDP_LBB_Solver(_GDPoptAlgorithm):
         )
         config.logger.info("Branching on disjunction %s" % disjunction_to_branch.name)
         node_count = self.created_nodes
-        newly_created_nodes = 0
 
         for disjunct_index_to_fix_True in range(num_unfixed_disjuncts):
             # Create a new branch for each unfixed disjunct
             child_model = node_model.clone()
             child_utils = child_model.component(node_utils.name)
-            child_disjunction_to_branch = child_utils.disjunction_list[
-                disjunction_to_branch_idx
-            ]
-            child_unfixed_disjuncts = child_utils.disjunction_to_unfixed_disjuncts[
-                child_disjunction_to_branch
-            ]
-            for idx, child_disjunct in enumerate(child_unfixed_disjuncts):
-                if idx == disjunct_index_to_fix_True:
-                    child_disjunct.indicator_var.fix(True)
-                else:
-                    child_disjunct.deactivate()
-            if not child_disjunction_to_branch.xor:
-                raise NotImplementedError(
-                    "We still need to add support for non-XOR disjunctions."
-                )
-            # This requires adding all combinations of activation status among
-            # unfixed_disjuncts Reactivate nonlinear constraints in the
-            # newly-fixed child disjunct
-            fixed_True_disjunct = child_unfixed_disjuncts[disjunct_index_to_fix_True]
-            for constr in child_utils.disjunct_to_nonlinear_constraints.get(
-                fixed_True_disjunct, ()
-            ):
-                constr.activate()
-                child_model.BigM[constr] = 1  # set arbitrary BigM (ok, because
-                # we fix corresponding Y=True)
-
+            child_unfixed_disjuncts = self._fix_branch(
+                child_model, disjunction_to_branch_idx, disjunct_index_to_fix_True
+            )
             del child_utils.disjunction_to_unfixed_disjuncts[
-                child_disjunction_to_branch
+                child_utils.disjunction_list[disjunction_to_branch_idx]
             ]
             for child_disjunct in child_unfixed_disjuncts:
                 child_utils.disjunct_to_nonlinear_constraints.pop(child_disjunct, None)
 
-            newly_created_nodes += 1
-            child_node_data = node_data._replace(
-                is_screened=False,
-                is_evaluated=False,
-                num_unbranched_disjunctions=node_data.num_unbranched_disjunctions - 1,
-                node_count=node_count + newly_created_nodes,
-                unbranched_disjunction_indices=node_data.unbranched_disjunction_indices[
-                    1:
-                ],
-                obj_ub=float('inf'),
+            child_node_data = self._child_node_data(
+                node_data, node_count + disjunct_index_to_fix_True + 1
             )
             heappush(self.bb_queue, (child_node_data, child_model))
 
-        self.created_nodes += newly_created_nodes
+        self._log_branch(node_data, num_unfixed_disjuncts, config)
 
+    def _child_node_data(self, node_data, node_count):
+        self.created_nodes += 1
+        return node_data._replace(
+            is_screened=False,
+            is_evaluated=False,
+            num_unbranched_disjunctions=node_data.num_unbranched_disjunctions - 1,
+            node_count=node_count,
+            unbranched_disjunction_indices=node_data.unbranched_disjunction_indices[1:],
+            obj_ub=float('inf'),
+        )
+
+    def _log_branch(self, node_data, num_unfixed_disjuncts, config):
         config.logger.info(
             "Added %s new nodes with %s relaxed disjunctions to "
             "the heap. Size now %s."
@@ -368,6 +358,144 @@ class GDP_LBB_Solver(_GDPoptAlgorithm):
             )
         )
 
+    def _fix_branch(self, node_model, disjunction_idx, disjunct_index_to_fix_True):
+        """Fix one of the unfixed disjuncts of a disjunction to True
+
+        The other unfixed disjuncts are deactivated, and the nonlinear
+        constraints of the disjunct fixed to True are reactivated.
+        Returns the list of (previously) unfixed disjuncts.
+
+        """
+        node_utils = node_model.component(self.original_util_block.name)
+        disjunction = node_utils.disjunction_list[disjunction_idx]
+        unfixed_disjuncts = node_utils.disjunction_to_unfixed_disjuncts[disjunction]
+        for idx, disjunct in enumerate(unfixed_disjuncts):
+            if idx == disjunct_index_to_fix_True:
+                disjunct.indicator_var.fix(True)
+            else:
+                disjunct.deactivate()
+        if not disjunction.xor:
+            raise NotImplementedError(
+                "We still need to add support for non-XOR disjunctions."
+            )
+        # This requires adding all combinations of activation status among
+        # unfixed_disjuncts Reactivate nonlinear constraints in the
+        # newly-fixed disjunct
+        fixed_True_disjunct = unfixed_disjuncts[disjunct_index_to_fix_True]
+        for constr in node_utils.disjunct_to_nonlinear_constraints.get(
+            fixed_True_disjunct, ()
+        ):
+            constr.activate()
+            node_model.BigM[constr] = 1  # set arbitrary BigM (ok, because
+            # we fix corresponding Y=True)
+        return unfixed_disjuncts
+
+    def _parallel_branch_and_bound(self, root_node, root_node_data, config):
+        """Best-first branch and bound evaluating nodes in worker processes
+
+        Nodes are not represented by models: each open node is the
+        tuple of branching decisions ((disjunction index, index of the
+        disjunct fixed to True), ...) applied to the root node.  The
+        workers apply the decisions to their copy of the root node,
+        evaluate the node and send back the updated node data and
+        variable values.  The bounds of all nodes (and hence the
+        incumbent) are kept in this (coordinating) process.
+
+        """
+        batch_size = config.node_batch_size or config.threads
+        queue = self.bb_queue = []
+        # Heap entries are (node data, branching decisions, variable
+        # values of the last evaluation of the node)
+        heappush(queue, (root_node_data, (), None))
+
+        root_utils = root_node.component(self.original_util_block.name)
+        with SubproblemEngine(
+            self,
+            root_utils,
+            config,
+            evaluate=_screen_or_evaluate_node,
+            # (the workers only use the util block for its name, and the
+            # results for the objective sense)
+            worker_attributes={
+                'original_util_block': root_utils,
+                'pyomo_results': self.pyomo_results,
+            },
+        ) as engine:
+            return self._parallel_search(engine, root_node, batch_size, config)
+
+    def _parallel_search(self, engine, root_node, batch_size, config):
+        root_utils = root_node.component(self.original_util_block.name)
+        queue = self.bb_queue
+        # Without the SAT check and the local rnGDP solve, screening a
+        # node does not need its model, so it is done here rather than in
+        # the workers
+        screen_here = not (config.check_sat or config.solve_local_rnGDP)
+        while len(queue) > 0:
+            node_data, decisions, soln = heappop(queue)
+            self._log_node(node_data, config)
+
+            # Check time limit
+            if self.reached_time_limit(config):
+                return self._time_limit_results(node_data, config)
+
+            if screen_here and not node_data.is_screened:
+                self.explored_nodes += 1
+                new_node_data = self._prescreen_node(node_data, None, config)
+                heappush(queue, (new_node_data, decisions, soln))
+            elif self._needs_evaluation(node_data, config):
+                # Evaluate the best open nodes that need evaluating
+                batch = [(node_data, decisions)]
+                while (
+                    len(batch) < batch_size
+                    and queue
+                    and self._needs_evaluation(queue[0][0], config)
+                    and not (screen_here and not queue[0][0].is_screened)
+                ):
+                    batch.append(heappop(queue)[:2])
+                self.explored_nodes += sum(
+                    1 for node_data, _ in batch if not node_data.is_screened
+                )
+                for (_, decisions), ((new_node_data, soln), _) in zip(
+                    batch, engine.solve(batch, batch_size=len(batch))
+                ):
+                    # replace with updated node data
+                    heappush(queue, (new_node_data, decisions, soln))
+            elif (
+                node_data.num_unbranched_disjunctions == 0
+                or node_data.obj_lb == float('inf')
+            ):
+                # We have reached a leaf node, or the best available
+                # node is infeasible.  Load the node solution into
+                # the root node to record the incumbent.
+                for decision in decisions:
+                    self._fix_branch(root_node, *decision)
+                if soln is not None:
+                    for var, val in zip(root_utils.algebraic_variable_list, soln):
+                        var.set_value(val, skip_validation=True)
+                return self._final_results(node_data, root_utils, config)
+            else:
+                # Branch: this only creates the children's decisions
+                disjunction_idx = node_data.unbranched_disjunction_indices[0]
+                disjunction = root_utils.disjunction_list[disjunction_idx]
+                config.logger.info("Branching on disjunction %s" % disjunction.name)
+                if not disjunction.xor:
+                    raise NotImplementedError(
+                        "We still need to add support for non-XOR disjunctions."
+                    )
+                num_unfixed_disjuncts = len(
+                    root_utils.disjunction_to_unfixed_disjuncts[disjunction]
+                )
+                node_count = self.created_nodes
+                for idx in range(num_unfixed_disjuncts):
+                    child_node_data = self._child_node_data(
+                        node_data, node_count + idx + 1
+                    )
+                    heappush(
+                        queue,
+                        (child_node_data, decisions + ((disjunction_idx, idx),), soln),
+                    )
+                self._log_branch(node_data, num_unfixed_disjuncts, config)
+
     def _prescreen_node(self, node_data, node_model, config):
         # Check node for satisfiability if sat-solver is enabled
         if config.check_sat and satisfiable(node_model, config.logger) is False:
@@ -612,3 +740,61 @@ class GDP_LBB_Solver(_GDPoptAlgorithm):
                 ignore_integrality=True,
             )
             return float('-inf'), float('inf')
+
+
+@contextmanager
+def _node_decisions(solver, root_node, decisions):
+    """Temporarily apply the branching decisions of a node to the root node"""
+    root_utils = root_node.component(solver.original_util_block.name)
+    var_values = [v.value for v in root_utils.algebraic_variable_list]
+    fixed = []
+    try:
+        for disjunction_idx, disjunct_idx in decisions:
+            unfixed_disjuncts = root_utils.disjunction_to_unfixed_disjuncts[
+                root_utils.disjunction_list[disjunction_idx]
+            ]
+            nonlinear_constraints = root_utils.disjunct_to_nonlinear_constraints.get(
+                unfixed_disjuncts[disjunct_idx], ()
+            )
+            prior_M = [root_node.BigM.get(c, None) for c in nonlinear_constraints]
+            fixed.append(
+                (unfixed_disjuncts, disjunct_idx, nonlinear_constraints, prior_M)
+            )
+            solver._fix_branch(root_node, disjunction_idx, disjunct_idx)
+        yield
+    finally:
+        for unfixed_disjuncts, disjunct_idx, nonlinear_constraints, prior_M in reversed(
+            fixed
+        ):
+            for idx, disjunct in enumerate(unfixed_disjuncts):
+                if idx == disjunct_idx:
+                    disjunct.indicator_var.unfix()
+                else:
+                    disjunct.activate()
+            for constr, M in zip(nonlinear_constraints, prior_M):
+                constr.deactivate()
+                if M is None:
+                    del root_node.BigM[constr]
+                else:
+                    root_node.BigM[constr] = M
+        for v, val in zip(root_utils.algebraic_variable_list, var_values):
+            v.set_value(val, skip_validation=True)
+
+
+def _screen_or_evaluate_node(solver, root_utils, node, config):
+    """Screen or evaluate a node (in a worker process)
+
+    The node is given as (node data, branching decisions).  Returns the
+    updated node data and the values of the algebraic variables after
+    the evaluation.
+
+    """
+    node_data, decisions = node
+    root_node = root_utils.parent_block()
+    with _node_decisions(solver, root_node, decisions):
+        if not node_data.is_screened:
+            node_data = solver._prescreen_node(node_data, root_node, config)
+        else:
+            node_data = solver._evaluate_node(node_data, root_node, config)
+        soln = [v.value for v in root_utils.algebraic_variable_list]
+    return node_data, soln
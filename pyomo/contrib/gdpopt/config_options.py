@@ -14,6 +14,7 @@ from pyomo.common.config import (
     ConfigList,
     ConfigValue,
     In,
+    InEnum,
     NonNegativeFloat,
     NonNegativeInt,
     PositiveInt,
@@ -25,6 +26,7 @@ from pyomo.contrib.gdpopt.util import a_logger, _DoNothing
 from pyomo.util.config_domains import ComponentDataSet
 from pyomo.core.base import LogicalConstraint
 from pyomo.gdp.disjunct import Disjunction
+from pyomo.gdp.plugins.multiple_bigm import ProcessStartMethod
 
 _supported_algorithms = {
     'LOA': ('gdpopt.loa', 'Logic-based Outer Approximation'),
@@ -431,6 +433,93 @@ def _add_BB_configs(CONFIG):
             When True, GDPopt-LBB will solve a local MINLP at each node.""",
         ),
     )
+    CONFIG.declare(
+        "threads",
+        ConfigValue(
+            default=1,
+            domain=PositiveInt,
+            description="Number of worker processes used to evaluate nodes",
+            doc="""
+            Number of worker processes used to evaluate nodes.
+
+            If greater than 1, GDPopt-LBB evaluates several open nodes
+            concurrently in a pool of worker processes.  Each worker
+            holds a copy of the root node, and only the branching
+            decisions of a node are sent to the worker that evaluates
+            it.  If set to 1 (the default), nodes are evaluated one at a
+            time in this process.
+            """,
+        ),
+    )
+    CONFIG.declare(
+        "node_batch_size",
+        ConfigValue(
+            default=None,
+            domain=PositiveInt,
+            description="Maximum number of open nodes evaluated concurrently",
+            doc="""
+            Maximum number of open nodes evaluated concurrently when
+            threads is greater than 1.  The nodes with the best bounds
+            are evaluated first.  If not specified, this is the number of
+            threads.
+            """,
+        ),
+    )
+    CONFIG.declare(
+        "process_start_method",
+        ConfigValue(
+            default=None,
+            domain=InEnum(ProcessStartMethod),
+            description="Start method used for spawning node evaluation processes",
+            doc="""
+            Start method used for spawning the worker processes that
+            evaluate nodes ('fork', 'spawn', or 'forkserver').  If not
+            specified, use 'fork' on POSIX (or 'forkserver' if Python
+            has multiple threads) and 'spawn' on Windows.  The 'spawn'
+            and 'forkserver' methods require dill to send the model to
+            the workers.  This option is ignored if threads is 1.
+            """,
+        ),
+    )
+
+
+def _add_enumerate_configs(CONFIG):
+    CONFIG.declare(
+        "threads",
+        ConfigValue(
+            default=1,
+            domain=PositiveInt,
+            description="Number of worker processes used to solve subproblems",
+            doc="""
+            Number of worker processes used to solve subproblems.
+
+            If greater than 1, GDPopt-enumerate solves the subproblems of
+            several discrete solutions concurrently in a pool of worker
+            processes.  Each worker holds a copy of the subproblem, and
+            only the discrete solution is sent to the worker that solves
+            it.  The subproblem callbacks (call_before_subproblem_solve,
+            etc.) are called in the worker processes.  If set to 1 (the
+            default), subproblems are solved one at a time in this
+            process.
+            """,
+        ),
+    )
+    CONFIG.declare(
+        "process_start_method",
+        ConfigValue(
+            default=None,
+            domain=InEnum(ProcessStartMethod),
+            description="Start method used for spawning subproblem processes",
+            doc="""
+            Start method used for spawning the worker processes that
+            solve subproblems ('fork', 'spawn', or 'forkserver').  If not
+            specified, use 'fork' on POSIX (or 'forkserver' if Python
+            has multiple threads) and 'spawn' on Windows.  The 'spawn'
+            and 'forkserver' methods require dill to send the subproblem
+            to the workers.  This option is ignored if threads is 1.
+            """,
+        ),
+    )
 
 
 def _add_mip_solver_configs(CONFIG):
@@ -568,3 +657,39 @@ def _add_ldsda_configs(CONFIG):
             """,
         ),
     )
+    CONFIG.declare(
+        "threads",
+        ConfigValue(
+            default=1,
+            domain=PositiveInt,
+            description="Number of worker processes used to evaluate neighbors",
+            doc="""
+            Number of worker processes used to evaluate neighbors.
+
+            If greater than 1, GDPopt-LDSDA solves the subproblems of all
+            unexplored neighbors of the current point concurrently in a
+            pool of worker processes.  Each worker holds a copy of the
+            working model, which it fixes to the external variable values
+            of each neighbor it is sent.  The results are processed in
+            the order of the search directions, so the search path is the
+            same as with a single thread.  If set to 1 (the default),
+            neighbors are evaluated one at a time in this process.
+            """,
+        ),
+    )
+    CONFIG.declare(
+        "process_start_method",
+        ConfigValue(
+            default=None,
+            domain=InEnum(ProcessStartMethod),
+            description="Start method used for spawning neighbor evaluation processes",
+            doc="""
+            Start method used for spawning the worker processes that
+            evaluate neighbors ('fork', 'spawn', or 'forkserver').  If not
+            specified, use 'fork' on POSIX (or 'forkserver' if Python
+            has multiple threads) and 'spawn' on Windows.  The 'spawn'
+            and 'forkserver' methods require dill to send the model to
+            the workers.  This option is ignored if threads is 1.
+            """,
+        ),
+    )
@@ -11,11 +11,12 @@
 
 from itertools import product
 
-from pyomo.common.collections import ComponentSet
+from pyomo.common.collections import ComponentMap
 from pyomo.common.config import document_kwargs_from_configdict
 
 from pyomo.contrib.gdpopt.algorithm_base_class import _GDPoptAlgorithm
 from pyomo.contrib.gdpopt.config_options import (
+    _add_enumerate_configs,
     _add_mip_solver_configs,
     _add_nlp_solve_configs,
     _add_nlp_solver_configs,
@@ -28,14 +29,9 @@ from pyomo.contrib.gdpopt.create_oa_subproblems import (
     add_disjunction_list,
     get_subproblem,
 )
-from pyomo.contrib.gdpopt.solve_subproblem import solve_subproblem
-from pyomo.contrib.gdpopt.util import (
-    fix_discrete_solution_in_subproblem,
-    time_code,
-    get_main_elapsed_time,
-)
+from pyomo.contrib.gdpopt.subproblem_engine import SubproblemEngine
+from pyomo.contrib.gdpopt.util import time_code, get_main_elapsed_time
 
-from pyomo.core import value
 from pyomo.opt import TerminationCondition as tc
 from pyomo.opt.base import SolverFactory
 
@@ -64,6 +60,7 @@ class GDP_Enumeration_Solver(_GDPoptAlgorithm):
     )
     # If we don't enumerate over integer values, we might have MILP subproblems
     _add_mip_solver_configs(CONFIG)
+    _add_enumerate_configs(CONFIG)
 
     algorithm = 'enumerate'
 
@@ -73,24 +70,38 @@ class GDP_Enumeration_Solver(_GDPoptAlgorithm):
         return super().solve(model, **kwds)
 
     def _discrete_solution_iterator(
-        self, disjunctions, non_indicator_boolean_vars, discrete_var_list, config
+        self,
+        disjunctions,
+        non_indicator_boolean_vars,
+        discrete_var_list,
+        disjunct_list,
+        config,
     ):
+        """Yields all the discrete solutions as tuples (indices of the True
+        Disjuncts in disjunct_list, Boolean var values, integer var values)
+        """
+        disjunct_index = ComponentMap(
+            (disjunct, idx) for idx, disjunct in enumerate(disjunct_list)
+        )
         discrete_var_values = [range(v.lb, v.ub + 1) for v in discrete_var_list]
         # we will calculate all the possible indicator_var realizations, and
         # then multiply those out by all the boolean var realizations and all
         # the integer var realizations.
         for true_indicators in product(
-            *[disjunction.disjuncts for disjunction in disjunctions]
+            *[
+                [disjunct_index[disjunct] for disjunct in disjunction.disjuncts]
+                for disjunction in disjunctions
+            ]
         ):
             if not config.force_subproblem_nlp:
-                yield (ComponentSet(true_indicators), (), ())
+                yield (true_indicators, (), ())
             else:
                 for boolean_realization in product(
                     [True, False], repeat=len(non_indicator_boolean_vars)
                 ):
                     for integer_realization in product(*discrete_var_values):
                         yield (
-                            ComponentSet(true_indicators),
+                            true_indicators,
                             boolean_realization,
                             integer_realization,
                         )
@@ -126,46 +137,66 @@ class GDP_Enumeration_Solver(_GDPoptAlgorithm):
 
         subproblem, subproblem_util_block = get_subproblem(original_model, util_block)
 
-        discrete_solns = list(
-            self._discrete_solution_iterator(
-                subproblem_util_block.disjunction_list,
-                subproblem_util_block.non_indicator_boolean_variable_list,
-                subproblem_util_block.discrete_variable_list,
-                config,
+        self.num_discrete_solns = 1
+        for disjunction in subproblem_util_block.disjunction_list:
+            self.num_discrete_solns *= len(disjunction.disjuncts)
+        if config.force_subproblem_nlp:
+            self.num_discrete_solns *= 2 ** len(
+                subproblem_util_block.non_indicator_boolean_variable_list
             )
+            for v in subproblem_util_block.discrete_variable_list:
+                self.num_discrete_solns *= v.ub - v.lb + 1
+        discrete_solns = self._discrete_solution_iterator(
+            subproblem_util_block.disjunction_list,
+            subproblem_util_block.non_indicator_boolean_variable_list,
+            subproblem_util_block.discrete_variable_list,
+            subproblem_util_block.disjunct_list,
+            config,
         )
-        self.num_discrete_solns = len(discrete_solns)
-        for soln in discrete_solns:
+
+        with SubproblemEngine(self, subproblem_util_block, config) as engine:
+            self._enumerate(engine, discrete_solns, config)
+
+    def _enumerate(self, engine, discrete_solns, config):
+        # Solve in batches no larger than the remaining number of
+        # iterations
+        batch_size = config.threads
+        if config.iterlim is not None:
+            batch_size = max(1, min(batch_size, config.iterlim))
+        results = engine.solve(discrete_solns, batch_size=batch_size)
+        while True:
             # We will interrupt based on time limit or iteration limit:
             if self.reached_time_limit(config) or self.reached_iteration_limit(config):
                 break
+            with time_code(self.timing, 'nlp'):
+                result = next(results, None)
+            if result is None:
+                break
+            result, cached = result
             self.iteration += 1
 
-            with time_code(self.timing, 'nlp'):
-                with fix_discrete_solution_in_subproblem(
-                    *soln, subproblem_util_block, config, self
-                ):
-                    nlp_termination = solve_subproblem(
-                        subproblem_util_block, self, config
-                    )
-                    if nlp_termination in {tc.optimal, tc.feasible}:
-                        primal_improved = self._update_bounds_after_solve(
-                            'subproblem',
-                            primal=value(subproblem_util_block.obj.expr),
-                            logger=config.logger,
-                        )
-                        if primal_improved:
-                            self.update_incumbent(subproblem_util_block)
-
-                    elif nlp_termination == tc.unbounded:
-                        # the whole problem is unbounded, we can stop
-                        self._update_primal_bound_to_unbounded(config)
-                        self._log_current_state(config.logger, 'subproblem', True)
-                        break
-
-                    else:
-                        # Just log where we are
-                        self._log_current_state(config.logger, 'subproblem')
+            nlp_termination = result.termination_condition
+            if cached:
+                # The same subproblem was already solved: the bounds and
+                # incumbent already account for it.
+                self._log_current_state(config.logger, 'subproblem')
+            elif nlp_termination in {tc.optimal, tc.feasible}:
+                primal_improved = self._update_bounds_after_solve(
+                    'subproblem', primal=result.objective_value, logger=config.logger
+                )
+                if primal_improved:
+                    self.incumbent_continuous_soln = list(result.continuous_soln)
+                    self.incumbent_boolean_soln = list(result.boolean_soln)
+
+            elif nlp_termination == tc.unbounded:
+                # the whole problem is unbounded, we can stop
+                self._update_primal_bound_to_unbounded(config)
+                self._log_current_state(config.logger, 'subproblem', True)
+                break
+
+            else:
+                # Just log where we are
+                self._log_current_state(config.logger, 'subproblem')
 
             if self.iteration == self.num_discrete_solns:
                 # We can terminate optimally or declare infeasibility: We have
@@ -32,6 +32,7 @@ from pyomo.contrib.gdpopt.config_options import (
     _add_nlp_solve_configs,
 )
 from pyomo.contrib.gdpopt.nlp_initialization import restore_vars_to_original_values
+from pyomo.contrib.gdpopt.subproblem_engine import SubproblemEngine
 from pyomo.contrib.gdpopt.util import SuppressInfeasibleWarning, get_main_elapsed_time
 from pyomo.contrib.satsolver.satsolver import satisfiable
 from pyomo.core import minimize, Suffix, TransformationFactory, Objective, value
@@ -54,6 +55,30 @@ ExternalVarInfo = namedtuple(
     ],
 )
 
+# Data tuple for the result of a subproblem solve.  This holds no
+# Pyomo components, so it can be sent back from a worker process.
+SubproblemSolution = namedtuple(
+    'SubproblemSolution',
+    [
+        'termination_condition',  # termination condition of the MINLP solver
+        'primal_bound',  # primal bound reported by the MINLP solver
+        'objective_value',  # value of the objective at the solution
+        'continuous_soln',  # values of the algebraic variables
+        'boolean_soln',  # values of the transformed Boolean variables
+    ],
+)
+
+# Termination conditions for which the subproblem solution is feasible
+_feasible_termination = {
+    tc.optimal,
+    tc.feasible,
+    tc.globallyOptimal,
+    tc.locallyOptimal,
+    tc.maxTimeLimit,
+    tc.maxIterations,
+    tc.maxEvaluations,
+}
+
 
 @SolverFactory.register(
     'gdpopt.ldsda',
@@ -111,7 +136,12 @@ class GDP_LDSDA_Solver(_GDPoptAlgorithm):
         )
         self.best_direction = None
         self.current_point = tuple(config.starting_point)
-        self.explored_point_set = set()
+        # Maps each explored point (tuple of external variable values) to
+        # the objective value of its subproblem (None if it was infeasible)
+        self.explored_points = {}
+        # Solves the subproblems of several points (in worker processes if
+        # config.threads > 1)
+        self._engine = None
 
         # Create utility block on the original model so that we will be able to
         # copy solutions between
@@ -140,6 +170,32 @@ class GDP_LDSDA_Solver(_GDPoptAlgorithm):
         if not hasattr(self.working_model_util_block, 'BigM'):
             self.working_model_util_block.BigM = Suffix()
         self._log_header(logger)
+        try:
+            with SubproblemEngine(
+                self,
+                self.working_model_util_block,
+                config,
+                evaluate=_solve_external_var_point,
+                worker_attributes={
+                    'working_model': self.working_model,
+                    'working_model_util_block': self.working_model_util_block,
+                    'original_util_block': self.working_model_util_block,
+                    'pyomo_results': self.pyomo_results,
+                    'explored_points': {},
+                },
+            ) as self._engine:
+                self._search(config)
+        finally:
+            self._engine = None
+
+    def _search(self, config):
+        """Run the LD-SDA search from the starting point.
+
+        Parameters
+        ----------
+        config : ConfigBlock
+            GDPopt configuration block
+        """
         # Solve the initial point
         _ = self._solve_GDP_subproblem(self.current_point, 'Initial point', config)
 
@@ -159,6 +215,8 @@ class GDP_LDSDA_Solver(_GDPoptAlgorithm):
     def _solve_GDP_subproblem(self, external_var_value, search_type, config):
         """Solve the GDP subproblem with disjunctions fixed according to the external variable.
 
+        Points that were already explored are not solved again.
+
         Parameters
         ----------
         external_var_value : list
@@ -172,6 +230,35 @@ class GDP_LDSDA_Solver(_GDPoptAlgorithm):
         -------
         bool
             True if the primal bound is improved
+        float
+            The objective value of the subproblem (None if it is infeasible)
+        """
+        point = tuple(external_var_value)
+        if point in self.explored_points:
+            # The bounds were already updated with this point
+            return False, self.explored_points[point]
+        return self._handle_subproblem_solution(
+            point, self._solve_external_var_point(point, config), search_type, config
+        )
+
+    def _solve_external_var_point(self, external_var_value, config):
+        """Solve the subproblem of the working model at the given point.
+
+        This does not update the bounds or the incumbent, so it can also
+        run in the worker processes.
+
+        Parameters
+        ----------
+        external_var_value : tuple
+            The values of the external variables to be evaluated
+        config : ConfigBlock
+            GDPopt configuration block
+
+        Returns
+        -------
+        SubproblemSolution
+            The result of the subproblem solve, or None if the
+            subproblem was found to be infeasible before the solve
         """
         self.fix_disjunctions_with_external_var(external_var_value)
         subproblem = self.working_model.clone()
@@ -189,7 +276,7 @@ class GDP_LDSDA_Solver(_GDPoptAlgorithm):
                     'contrib.deactivate_trivial_constraints'
                 ).apply_to(subproblem, tmp=False, ignore_infeasible=False)
             except InfeasibleConstraintException:
-                return False, None
+                return None
             minlp_args = dict(config.minlp_solver_args)
             if config.time_limit is not None and config.minlp_solver == 'gams':
                 elapsed = get_main_elapsed_time(self.timing)
@@ -197,13 +284,22 @@ class GDP_LDSDA_Solver(_GDPoptAlgorithm):
                 minlp_args['add_options'] = minlp_args.get('add_options', [])
                 minlp_args['add_options'].append('option reslim=%s;' % remaining)
             result = SolverFactory(config.minlp_solver).solve(subproblem, **minlp_args)
-            # Retrieve the primal bound (objective value) from the subproblem
-            obj = next(subproblem.component_data_objects(Objective, active=True))
-            primal_bound = value(obj)
-            primal_improved = self._handle_subproblem_result(
-                result, subproblem, external_var_value, config, search_type
-            )
-        return primal_improved, primal_bound
+        # Retrieve the objective value from the subproblem
+        obj = next(subproblem.component_data_objects(Objective, active=True))
+        util_block = subproblem.component(self.original_util_block.name)
+        return SubproblemSolution(
+            termination_condition=result.solver.termination_condition,
+            primal_bound=(
+                result.problem.upper_bound
+                if self.objective_sense == minimize
+                else result.problem.lower_bound
+            ),
+            objective_value=value(obj, exception=False),
+            continuous_soln=[v.value for v in util_block.algebraic_variable_list],
+            boolean_soln=[
+                v.value for v in util_block.transformed_boolean_variable_list
+            ],
+        )
 
     def _get_external_information(self, util_block, config):
         """Function that obtains information from the model to perform the reformulation with external variables.
@@ -313,7 +409,7 @@ class GDP_LDSDA_Solver(_GDPoptAlgorithm):
                     boolean_var.fix(False)
                     if boolean_var.get_associated_binary() is not None:
                         boolean_var.get_associated_binary().fix(0)
-        self.explored_point_set.add(tuple(external_var_values_list))
+        self.explored_points.setdefault(tuple(external_var_values_list), None)
 
     def _get_directions(self, dimension, config):
         """Function creates the search directions of the given dimension.
@@ -354,7 +450,7 @@ class GDP_LDSDA_Solver(_GDPoptAlgorithm):
         bool
             True if the neighbor is valid, False otherwise
         """
-        if neighbor in self.explored_point_set:
+        if neighbor in self.explored_points:
             return False
         return all(
             external_var_value >= external_var_info.LB
@@ -381,42 +477,46 @@ class GDP_LDSDA_Solver(_GDPoptAlgorithm):
             config.integer_tolerance
         )  # Use integer_tolerance for objective comparison
 
-        # Loop through all possible directions (neighbors)
+        # Generate the valid neighbors by applying each direction to the
+        # current point
+        neighbors = []
         for direction in self.directions:
-            # Generate a neighbor point by applying the direction to the current point
             neighbor = tuple(map(sum, zip(self.current_point, direction)))
-
-            # Check if the neighbor is valid
             if self._check_valid_neighbor(neighbor):
-                # Solve the subproblem for this neighbor
-                primal_improved, primal_bound = self._solve_GDP_subproblem(
-                    neighbor, 'Neighbor search', config
-                )
+                neighbors.append((direction, neighbor))
+
+        # Loop through the results of the neighbor subproblems (in the order
+        # of the directions)
+        for (direction, neighbor), (primal_improved, primal_bound) in zip(
+            neighbors,
+            self._solve_GDP_subproblems(
+                [neighbor for _, neighbor in neighbors], 'Neighbor search', config
+            ),
+        ):
+            if primal_improved:
+                locally_optimal = False
 
-                if primal_improved:
-                    locally_optimal = False
-
-                    # --- Tiebreaker Logic ---
-                    if abs(fmin - primal_bound) < abs_tol:
-                        # Calculate the Euclidean distance from the current point
-                        dist = sum(
-                            (x - y) ** 2 for x, y in zip(neighbor, self.current_point)
-                        )
-
-                        # Update the best neighbor if this one is farther away
-                        if dist > best_dist:
-                            best_neighbor = neighbor
-                            self.best_direction = direction
-                            best_dist = dist  # Update the best distance
-                    else:
-                        # Standard improvement logic: update if the objective is better
-                        fmin = primal_bound  # Update the best objective value
-                        best_neighbor = neighbor  # Update the best neighbor
-                        self.best_direction = direction  # Update the best direction
-                        best_dist = sum(
-                            (x - y) ** 2 for x, y in zip(neighbor, self.current_point)
-                        )
-                    # --- End of Tiebreaker Logic ---
+                # --- Tiebreaker Logic ---
+                if abs(fmin - primal_bound) < abs_tol:
+                    # Calculate the Euclidean distance from the current point
+                    dist = sum(
+                        (x - y) ** 2 for x, y in zip(neighbor, self.current_point)
+                    )
+
+                    # Update the best neighbor if this one is farther away
+                    if dist > best_dist:
+                        best_neighbor = neighbor
+                        self.best_direction = direction
+                        best_dist = dist  # Update the best distance
+                else:
+                    # Standard improvement logic: update if the objective is better
+                    fmin = primal_bound  # Update the best objective value
+                    best_neighbor = neighbor  # Update the best neighbor
+                    self.best_direction = direction  # Update the best direction
+                    best_dist = sum(
+                        (x - y) ** 2 for x, y in zip(neighbor, self.current_point)
+                    )
+                # --- End of Tiebreaker Logic ---
 
         # Move to the best neighbor if an improvement was found
         if not locally_optimal:
@@ -436,7 +536,7 @@ class GDP_LDSDA_Solver(_GDPoptAlgorithm):
         while primal_improved:
             next_point = tuple(map(sum, zip(self.current_point, self.best_direction)))
             if self._check_valid_neighbor(next_point):
-                primal_improved = self._solve_GDP_subproblem(
+                primal_improved, _ = self._solve_GDP_subproblem(
                     next_point, 'Line search', config
                 )
                 if primal_improved:
@@ -444,57 +544,75 @@ class GDP_LDSDA_Solver(_GDPoptAlgorithm):
             else:
                 break
 
-    def _handle_subproblem_result(
-        self, subproblem_result, subproblem, external_var_value, config, search_type
-    ):
-        """Function that handles the result of the subproblem
+    def _solve_GDP_subproblems(self, external_var_values, search_type, config):
+        """Solve the GDP subproblems of several (unexplored) points.
+
+        If the engine has a pool of worker processes, the subproblems are
+        solved concurrently.  Otherwise, they are solved one at a time as
+        the results are requested.
 
         Parameters
         ----------
-        subproblem_result : tuple
-            the result of the subproblem
-        subproblem : ConcreteModel
-            the subproblem model
-        external_var_value : list
-            the values of the external variables
+        external_var_values : list
+            The list of external variable values (tuples) to be evaluated
+        search_type : str
+            The type of search, neighbor search or line search
         config : ConfigBlock
             GDPopt configuration block
+
+        Yields
+        ------
+        tuple
+            The result of _solve_GDP_subproblem for each point, in order
+        """
+        if self._engine.pool is None or len(external_var_values) < 2:
+            for point in external_var_values:
+                yield self._solve_GDP_subproblem(point, search_type, config)
+            return
+        solutions = self._engine.solve(
+            external_var_values, batch_size=len(external_var_values)
+        )
+        for point, (solution, _) in zip(external_var_values, solutions):
+            yield self._handle_subproblem_solution(point, solution, search_type, config)
+
+    def _handle_subproblem_solution(self, point, solution, search_type, config):
+        """Function that handles the result of the subproblem
+
+        Parameters
+        ----------
+        point : tuple
+            the values of the external variables
+        solution : SubproblemSolution
+            the result of the subproblem (None if it was infeasible)
         search_type : str
             the type of search, neighbor search or line search
+        config : ConfigBlock
+            GDPopt configuration block
 
         Returns
         -------
         bool
             True if the result improved the current point, False otherwise
+        float
+            The objective value of the subproblem (None if it is infeasible)
         """
-        if subproblem_result is None:
-            return False
-        if subproblem_result.solver.termination_condition in {
-            tc.optimal,
-            tc.feasible,
-            tc.globallyOptimal,
-            tc.locallyOptimal,
-            tc.maxTimeLimit,
-            tc.maxIterations,
-            tc.maxEvaluations,
-        }:
-            primal_bound = (
-                subproblem_result.problem.upper_bound
-                if self.objective_sense == minimize
-                else subproblem_result.problem.lower_bound
-            )
-            primal_improved = self._update_bounds_after_solve(
-                search_type,
-                primal=primal_bound,
-                logger=config.logger,
-                current_point=external_var_value,
-            )
-            if primal_improved:
-                self.update_incumbent(
-                    subproblem.component(self.original_util_block.name)
-                )
-            return primal_improved
-        return False
+        if (
+            solution is None
+            or solution.termination_condition not in _feasible_termination
+        ):
+            self.explored_points[point] = None
+            return False, None
+        self.explored_points[point] = solution.objective_value
+        primal_improved = self._update_bounds_after_solve(
+            search_type,
+            primal=solution.primal_bound,
+            logger=config.logger,
+            current_point=point,
+        )
+        if primal_improved:
+            self.incumbent_continuous_soln = list(solution.continuous_soln)
+            self.incumbent_boolean_soln = list(solution.boolean_soln)
+        return primal_improved, solution.objective_value
 
     def _log_header(self, logger):
         logger.info(
@@ -538,3 +656,8 @@ class GDP_LDSDA_Solver(_GDPoptAlgorithm):
             self._log_current_state(logger, search_type, current_point, primal_improved)
 
         return primal_improved
+
+
+def _solve_external_var_point(solver, util_block, external_var_value, config):
+    """Solve the subproblem of one point (in a worker process)"""
+    return solver._solve_external_var_point(external_var_value, config)
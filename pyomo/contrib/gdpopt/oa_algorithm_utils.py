@@ -11,6 +11,7 @@
 
 from math import fabs
 from pyomo.contrib.gdpopt.solve_subproblem import solve_subproblem
+from pyomo.contrib.gdpopt.subproblem_engine import SubproblemEngine
 from pyomo.contrib.gdpopt.util import fix_discrete_problem_solution_in_subproblem
 from pyomo.core import value
 from pyomo.opt import TerminationCondition as tc
@@ -20,10 +21,26 @@ class _OAAlgorithmMixIn(object):
     def _fix_discrete_soln_solve_subproblem_and_add_cuts(
         self, discrete_prob_util_block, subprob_util_block, config
     ):
+        engine = self._subproblem_engine
+        if engine is None or engine.util_block is not subprob_util_block:
+            engine = self._subproblem_engine = SubproblemEngine(
+                self, subprob_util_block, config
+            )
         with fix_discrete_problem_solution_in_subproblem(
             discrete_prob_util_block, subprob_util_block, self, config
         ):
+            discrete_soln = engine.fixed_discrete_solution()
+            known_result = engine.results.get(engine.signature(discrete_soln))
+            if known_result is not None:
+                # This subproblem was already solved (and its cuts added)
+                config.logger.debug(
+                    'Skipping the subproblem: this discrete solution was '
+                    'already explored.'
+                )
+                nlp_termination = known_result.termination_condition
+                return nlp_termination not in {tc.infeasible, tc.unbounded}
             nlp_termination = solve_subproblem(subprob_util_block, self, config)
+            engine.record(discrete_soln, nlp_termination)
             if nlp_termination in {tc.optimal, tc.feasible}:
                 primal_improved = self._update_bounds_after_solve(
                     'subproblem',
@@ -0,0 +1,316 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""Memoized (and optionally parallel) solves of the fixed subproblem.
+
+The subproblem is created once (by get_subproblem) and every discrete
+solution is solved by fixing and unfixing it in place.  The
+SubproblemEngine remembers the result for each discrete solution, keyed
+by the signature of its active disjuncts, so that discrete solutions that
+lead to the same subproblem are only solved once.  If config.threads is
+greater than 1, the engine can also solve independent discrete solutions
+concurrently in worker processes, each of which holds its own copy of the
+subproblem.
+
+The algorithms that solve other kinds of subproblems (e.g., the nodes of
+LBB or the points of LD-SDA) use the same engine, with their own
+(module-level) function to solve each one.
+"""
+
+from collections import namedtuple
+from math import fabs
+
+from pyomo.common import timing
+from pyomo.common.collections import Bunch, ComponentMap, ComponentSet
+from pyomo.contrib.gdpopt.solve_subproblem import solve_subproblem
+from pyomo.contrib.gdpopt.util import (
+    fix_discrete_solution_in_subproblem,
+    get_main_elapsed_time,
+    get_process_start_method,
+)
+from pyomo.core import Block, Constraint, Objective, value
+from pyomo.gdp.plugins.multiple_bigm import worker_pool, worker_state
+from pyomo.opt import TerminationCondition as tc
+from pyomo.util.vars_from_expressions import get_vars_from_components
+
+# Data tuple for the result of a subproblem solve.  This holds no Pyomo
+# components, so it can be sent back from a worker process.
+SubproblemResult = namedtuple(
+    'SubproblemResult',
+    [
+        'termination_condition',  # as returned by solve_subproblem
+        'objective_value',  # None unless the subproblem was feasible
+        'continuous_soln',  # values of the algebraic variables
+        'boolean_soln',  # values of the transformed Boolean variables
+    ],
+)
+
+
+class SubproblemEngine(object):
+    """Solves the subproblem for discrete solutions of the GDP
+
+    Discrete solutions are given as tuples (indices of the True disjuncts
+    in the disjunct_list of the subproblem util block, values of the
+    non-indicator Boolean variables, values of the discrete variables).
+
+    The memoization key (signature) of a discrete solution leaves out the
+    True disjuncts that are nested in a False disjunct (since those are
+    deactivated in the subproblem), unless their indicator variable is
+    used elsewhere in the subproblem.
+
+    Other subproblems can be solved by passing `evaluate`: a module-level
+    function evaluate(solver, util_block, item, config) that solves the
+    subproblem of an item and returns a picklable result.  Those results
+    are not memoized.
+
+    Use as a context manager to start (and shut down) the worker
+    processes when config.threads is greater than 1.  Each worker makes
+    its own instance of the solver class, with the given
+    worker_attributes set on it.
+
+    Parameters
+    ----------
+    solver: _GDPoptAlgorithm
+        The GDPopt solver
+    util_block: Block
+        The util block of the subproblem
+    config: ConfigBlock
+        GDPopt configuration block
+    evaluate: function
+        Solves the subproblem of an item (None for discrete solutions)
+    worker_attributes: dict
+        Attributes of the solver that evaluate needs in the workers
+        (e.g., Pyomo components, which are sent along with the
+        subproblem)
+    """
+
+    def __init__(
+        self, solver, util_block, config, evaluate=None, worker_attributes=None
+    ):
+        self.solver = solver
+        self.util_block = util_block
+        self.config = config
+        self.memoize = evaluate is None
+        self.evaluate = _solve_discrete_solution if evaluate is None else evaluate
+        self.worker_attributes = worker_attributes or {}
+        self.pool = None
+        self._pool_context = None
+        # Maps signatures to SubproblemResults
+        self.results = {}
+        if not self.memoize:
+            return
+
+        disjunct_index = ComponentMap(
+            (disjunct, idx) for idx, disjunct in enumerate(util_block.disjunct_list)
+        )
+        used_vars = ComponentSet(
+            get_vars_from_components(
+                util_block.parent_block(),
+                ctype=(Constraint, Objective),
+                descend_into=Block,
+                active=True,
+            )
+        )
+        # For each disjunct, the indices of the disjuncts it is nested in
+        # (or None if its value always matters)
+        self._ancestors = []
+        for disjunct in util_block.disjunct_list:
+            if disjunct.binary_indicator_var in used_vars:
+                self._ancestors.append(None)
+                continue
+            ancestors = []
+            parent = disjunct.parent_block()
+            while parent is not None:
+                if parent in disjunct_index:
+                    ancestors.append(disjunct_index[parent])
+                parent = parent.parent_block()
+            self._ancestors.append(ancestors)
+
+    def __enter__(self):
+        config = self.config
+        threads = getattr(config, 'threads', 1)
+        if threads > 1:
+            method = get_process_start_method(config.process_start_method)
+            config.logger.info(
+                f"Solving subproblems on {threads} worker processes with "
+                f"process start method {method.value}."
+            )
+            state = Bunch(
+                solver_class=self.solver.__class__,
+                solver_attributes=self.worker_attributes,
+                util_block=self.util_block,
+                config=config,
+                evaluate=self.evaluate,
+            )
+            self._pool_context = worker_pool(
+                __name__, threads, state, method, initializer=_setup_worker_solver
+            )
+            self.pool = self._pool_context.__enter__()
+        return self
+
+    def __exit__(self, et, ev, tb):
+        if self.pool is not None:
+            self.pool = None
+            self._pool_context.__exit__(et, ev, tb)
+            self._pool_context = None
+
+    def signature(self, discrete_soln):
+        """Returns the memoization key of a discrete solution"""
+        true_indices, boolean_values, integer_values = discrete_soln
+        true_set = set(true_indices)
+        return (
+            tuple(
+                sorted(
+                    idx
+                    for idx in true_set
+                    if self._ancestors[idx] is None
+                    or true_set.issuperset(self._ancestors[idx])
+                )
+            ),
+            tuple(bool(val) for val in boolean_values),
+            tuple(integer_values),
+        )
+
+    def fixed_discrete_solution(self):
+        """Returns the discrete solution currently fixed in the subproblem"""
+        util_block = self.util_block
+        return (
+            tuple(
+                idx
+                for idx, disjunct in enumerate(util_block.disjunct_list)
+                if disjunct.binary_indicator_var.fixed
+                and fabs(disjunct.binary_indicator_var.value - 1)
+                <= self.config.integer_tolerance
+            ),
+            tuple(
+                v.get_associated_binary().value > 0.5
+                for v in util_block.non_indicator_boolean_variable_list
+            ),
+            (
+                tuple(v.value for v in util_block.discrete_variable_list)
+                if self.config.force_subproblem_nlp
+                else ()
+            ),
+        )
+
+    def solve(self, items, batch_size=None):
+        """Solve the subproblem for each item (by default, discrete
+        solution)
+
+        Discrete solutions whose signature was already solved are not
+        solved again.  With a pool of worker processes, the items are
+        solved concurrently in batches (by default, of the number of
+        workers), so that the caller can stop between batches (e.g., at a
+        time limit).
+
+        Yields
+        ------
+        tuple
+            (result, True if it was already known) for each item, in
+            order
+        """
+        if self.pool is None:
+            for item in items:
+                key = self.signature(item) if self.memoize else None
+                result = self.results.get(key, None)
+                if result is not None:
+                    yield result, True
+                    continue
+                result = self.evaluate(self.solver, self.util_block, item, self.config)
+                if self.memoize:
+                    self.results[key] = result
+                yield result, False
+            return
+
+        if batch_size is None:
+            batch_size = self.config.threads
+        items = iter(items)
+        while True:
+            batch = [item for _, item in zip(range(batch_size), items)]
+            if not batch:
+                return
+            if self.memoize:
+                keys = [self.signature(item) for item in batch]
+            else:
+                # Every item is new
+                keys = list(range(len(batch)))
+            # Solve each new key once
+            new = {}
+            for key, item in zip(keys, batch):
+                if key not in self.results:
+                    new.setdefault(key, item)
+            elapsed_time = get_main_elapsed_time(self.solver.timing)
+            new_results = dict(
+                zip(
+                    new,
+                    self.pool.starmap(
+                        _solve_in_worker,
+                        [(item, elapsed_time) for item in new.values()],
+                    ),
+                )
+            )
+            if self.memoize:
+                self.results.update(new_results)
+            for key in keys:
+                if key in new:
+                    yield new_results[key], False
+                    # Only the first occurrence is new
+                    del new[key]
+                else:
+                    yield self.results[key], True
+
+    def record(self, discrete_soln, termination_condition):
+        """Record the result of a subproblem solved by the caller
+
+        The subproblem must still be fixed to the discrete solution.
+        """
+        self.results[self.signature(discrete_soln)] = _subproblem_result(
+            self.util_block, termination_condition
+        )
+
+
+def _subproblem_result(util_block, termination_condition):
+    return SubproblemResult(
+        termination_condition=termination_condition,
+        objective_value=(
+            value(util_block.obj.expr)
+            if termination_condition in {tc.optimal, tc.feasible}
+            else None
+        ),
+        continuous_soln=[v.value for v in util_block.algebraic_variable_list],
+        boolean_soln=[v.value for v in util_block.transformed_boolean_variable_list],
+    )
+
+
+def _solve_discrete_solution(solver, util_block, discrete_soln, config):
+    true_indices, boolean_values, integer_values = discrete_soln
+    true_disjuncts = ComponentSet(util_block.disjunct_list[idx] for idx in true_indices)
+    with fix_discrete_solution_in_subproblem(
+        true_disjuncts, boolean_values, integer_values, util_block, config, solver
+    ):
+        termination_condition = solve_subproblem(util_block, solver, config)
+        return _subproblem_result(util_block, termination_condition)
+
+
+# Things we call in subprocesses. These can't be member functions, or
+# else we'd have to pickle `self`, which is problematic.
+def _setup_worker_solver(state):
+    state.solver = state.solver_class()
+    for name, val in state.solver_attributes.items():
+        setattr(state.solver, name, val)
+
+
+def _solve_in_worker(item, elapsed_time):
+    """Solve the subproblem of one item in a worker process"""
+    state = worker_state(__name__)
+    # Keep the (main) elapsed time in sync with the coordinator
+    state.solver.timing.main_timer_start_time = timing.default_timer() - elapsed_time
+    return state.evaluate(state.solver, state.util_block, item, state.config)
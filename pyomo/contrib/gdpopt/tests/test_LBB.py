@@ -14,16 +14,26 @@
 from io import StringIO
 import logging
 from math import fabs
+import os
 from os.path import abspath, dirname, join, normpath
 
 import pyomo.common.unittest as unittest
 
 from pyomo.common.fileutils import import_file
 from pyomo.common.log import LoggingIntercept
+from pyomo.contrib.gdpopt.branch_and_bound import GDP_LBB_Solver
 import pyomo.contrib.gdpopt.tests.common_tests as ct
 from pyomo.contrib.satsolver.satsolver import z3_available
-from pyomo.environ import SolverFactory, value, ConcreteModel, Var, Objective, maximize
-from pyomo.gdp import Disjunction
+from pyomo.environ import (
+    SolverFactory,
+    value,
+    ConcreteModel,
+    Var,
+    Objective,
+    maximize,
+    RangeSet,
+)
+from pyomo.gdp import Disjunct, Disjunction
 from pyomo.opt import TerminationCondition
 
 currdir = dirname(abspath(__file__))
@@ -120,6 +130,21 @@ class TestGDPopt_LBB(unittest.TestCase):
         )
         ct.check_8PP_solution(self, eight_process, results)
 
+    @unittest.skipUnless(license_available, "Problem is too big for unlicensed BARON.")
+    @unittest.skipIf(os.name == 'nt', "fork is not available on Windows")
+    def test_LBB_8PP_parallel(self):
+        """Test the logic-based branch and bound algorithm in parallel."""
+        exfile = import_file(join(exdir, 'eight_process', 'eight_proc_model.py'))
+        eight_process = exfile.build_eight_process_flowsheet()
+        results = SolverFactory('gdpopt.lbb').solve(
+            eight_process,
+            tee=False,
+            minlp_solver=minlp_solver,
+            minlp_solver_args=minlp_args,
+            threads=2,
+        )
+        ct.check_8PP_solution(self, eight_process, results)
+
     @unittest.skipUnless(license_available, "Problem is too big for unlicensed BARON.")
     def test_LBB_8PP_max(self):
         """Test the logic-based branch and bound algorithm."""
@@ -287,5 +312,131 @@ class TestGDPopt_LBB_Z3(unittest.TestCase):
         self.assertAlmostEqual(objective_value, 4.46, 2)
 
 
+class _CostLBB(GDP_LBB_Solver):
+    """LBB with a stand-in for the MINLP subproblem solver
+
+    Disjunct d[i, j] sets x[i] to cost[i, j], and the objective is the
+    sum of the x.  The node subproblem picks the cheapest disjunct that
+    is not deactivated in each disjunction.
+    """
+
+    def _solve_rnGDP_subproblem(self, model, config):
+        obj = 0
+        for i in model.I:
+            costs = [
+                model.cost[i, j]
+                for j in model.J
+                if not model.d[i, j].indicator_var.fixed
+                or model.d[i, j].indicator_var.value
+            ]
+            model.x[i].set_value(min(costs))
+            obj += min(costs)
+        return obj, obj
+
+
+@unittest.skipIf(os.name == 'nt', "fork is not available on Windows")
+class TestGDPopt_LBB_parallel(unittest.TestCase):
+    def make_model(self):
+        m = ConcreteModel()
+        m.I = RangeSet(4)
+        m.J = RangeSet(3)
+        m.cost = {(i, j): (i * 7 + j * 5) % 4 + i for i in m.I for j in m.J}
+        m.x = Var(m.I, bounds=(0, 10))
+        m.d = Disjunct(m.I, m.J)
+        for i in m.I:
+            for j in m.J:
+                m.d[i, j].c = m.x[i] == m.cost[i, j]
+        m.disj = Disjunction(m.I, rule=lambda m, i: [m.d[i, j] for j in m.J])
+        m.o = Objective(expr=sum(m.x.values()))
+        return m
+
+    def solve(self, **kwds):
+        m = self.make_model()
+        solver = _CostLBB()
+        results = solver.solve(m, **kwds)
+        return m, solver, results
+
+    def test_parallel_matches_serial(self):
+        m1, serial, results1 = self.solve()
+        m2, parallel, results2 = self.solve(threads=2, node_batch_size=3)
+        expected = sum(min(m1.cost[i, j] for j in m1.J) for i in m1.I)
+        for m, results in ((m1, results1), (m2, results2)):
+            self.assertEqual(
+                results.solver.termination_condition, TerminationCondition.optimal
+            )
+            self.assertEqual(results.problem.lower_bound, expected)
+            self.assertEqual(value(m.o), expected)
+            for i in m.I:
+                chosen = [j for j in m.J if m.d[i, j].indicator_var.value]
+                self.assertEqual(len(chosen), 1)
+                self.assertEqual(m.x[i].value, m.cost[i, chosen[0]])
+        self.assertEqual(serial.explored_nodes, parallel.explored_nodes)
+
+    def test_parallel_log(self):
+        output = StringIO()
+        with LoggingIntercept(output, 'pyomo.contrib.gdpopt', logging.INFO):
+            self.solve(threads=2, process_start_method='fork')
+        self.assertIn(
+            "Solving subproblems on 2 worker processes with process start "
+            "method fork",
+            output.getvalue(),
+        )
+
+    def test_screening_in_coordinator(self):
+        from pyomo.contrib.gdpopt.subproblem_engine import SubproblemEngine
+
+        # Without check_sat and solve_local_rnGDP, only screened nodes are
+        # sent to the workers
+        sent = []
+        solve = SubproblemEngine.solve
+
+        def record(engine, items, batch_size=None):
+            sent.extend(node_data for node_data, _ in items)
+            return solve(engine, items, batch_size)
+
+        with unittest.mock.patch.object(SubproblemEngine, 'solve', record):
+            self.solve(threads=2, process_start_method='fork')
+        self.assertTrue(sent)
+        self.assertTrue(all(node_data.is_screened for node_data in sent))
+
+    def test_time_limit(self):
+        for threads in (1, 2):
+            with unittest.mock.patch(
+                'pyomo.contrib.gdpopt.algorithm_base_class.get_main_elapsed_time',
+                return_value=10,
+            ):
+                m, solver, results = self.solve(threads=threads, time_limit=1)
+            self.assertEqual(
+                results.solver.termination_condition, TerminationCondition.maxTimeLimit
+            )
+
+    def test_node_decisions_are_undone(self):
+        from pyomo.contrib.gdpopt.branch_and_bound import _node_decisions
+
+        # Intercept the search to apply decisions to the root node
+        m = self.make_model()
+        solver = _CostLBB()
+        captured = {}
+
+        def capture(engine, root_node, batch_size, config):
+            with _node_decisions(solver, root_node, ((0, 1), (2, 0))):
+                d = root_node.d
+                captured['during'] = (
+                    d[1, 2].indicator_var.fixed,
+                    d[1, 2].indicator_var.value,
+                    d[1, 1].active,
+                    d[3, 1].indicator_var.value,
+                )
+            captured['after'] = [
+                (d.active, d.indicator_var.fixed) for d in root_node.d.values()
+            ]
+            return solver._get_final_pyomo_results_object()
+
+        solver._parallel_search = capture
+        solver.solve(m, threads=2)
+        self.assertEqual(captured['during'], (True, True, False, True))
+        self.assertEqual(captured['after'], [(True, False)] * 12)
+
+
 if __name__ == '__main__':
     unittest.main()
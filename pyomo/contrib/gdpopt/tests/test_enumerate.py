@@ -9,8 +9,19 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import os
+
+from pyomo.common import timing
 import pyomo.common.unittest as unittest
+from pyomo.contrib.gdpopt.create_oa_subproblems import (
+    add_disjunct_list,
+    add_algebraic_variable_list,
+    add_boolean_variable_lists,
+    add_util_block,
+    get_subproblem,
+)
 from pyomo.contrib.gdpopt.enumerate import GDP_Enumeration_Solver
+from pyomo.contrib.gdpopt.subproblem_engine import SubproblemEngine
 
 from pyomo.environ import (
     SolverFactory,
@@ -22,11 +33,66 @@ from pyomo.environ import (
     Integers,
     Constraint,
     ConcreteModel,
+    LogicalConstraint,
+    RangeSet,
 )
-from pyomo.gdp import Disjunction
+from pyomo.gdp import Disjunct, Disjunction
+from pyomo.opt import SolverResults
 import pyomo.gdp.tests.models as models
 
 
+@SolverFactory.register(
+    '_gdpopt_enumerate_test_solver', doc="Solver for fixed GDPopt test subproblems"
+)
+class _FixedVarSolver(object):
+    """Stand-in for the subproblem solver
+
+    In the test models, fixing the disjuncts fixes all the variables
+    (through the subproblem presolve), so there is nothing left to solve.
+    """
+
+    solves = 0
+
+    def __init__(self, **kwds):
+        pass
+
+    def available(self, exception_flag=True):
+        return True
+
+    def solve(self, model, **kwds):
+        _FixedVarSolver.solves += 1
+        results = SolverResults()
+        results.solver.termination_condition = TerminationCondition.optimal
+        return results
+
+
+def _evaluate_item(solver, util_block, item, config):
+    # The subproblem of an item for SubproblemEngine(evaluate=...)
+    return item * solver.scale, os.getpid(), util_block.local_name
+
+
+def _nested_model():
+    # x[1] is set by one of the inner disjuncts of the first outer
+    # disjunct, or by the second outer disjunct; x[2] by a two-term
+    # disjunction
+    m = ConcreteModel()
+    m.I = RangeSet(3)
+    m.x = Var([1, 2], bounds=(0, 10))
+    m.outer = Disjunct([1, 2])
+    m.outer[1].inner = Disjunct(m.I)
+    for i in m.I:
+        m.outer[1].inner[i].c = Constraint(expr=m.x[1] == 2 * i)
+    m.outer[1].inner_disjunction = Disjunction(expr=[m.outer[1].inner[i] for i in m.I])
+    m.outer[2].c = Constraint(expr=m.x[1] == 5)
+    m.outer_disjunction = Disjunction(expr=[m.outer[1], m.outer[2]])
+    m.d = Disjunct([1, 2])
+    m.d[1].c = Constraint(expr=m.x[2] == 3)
+    m.d[2].c = Constraint(expr=m.x[2] == 1)
+    m.disjunction = Disjunction(expr=[m.d[1], m.d[2]])
+    m.o = Objective(expr=m.x[1] - m.x[2])
+    return m
+
+
 @unittest.skipUnless(SolverFactory('gurobi').available(), 'Gurobi not available')
 @unittest.skipUnless(SolverFactory('gurobi').license_is_valid(), 'Gurobi not licensed')
 class TestGDPoptEnumerate(unittest.TestCase):
@@ -163,6 +229,131 @@ class TestGDPoptEnumerate(unittest.TestCase):
         self.assertEqual(results.problem.upper_bound, -float('inf'))
 
 
+class TestGDPoptEnumerateSubproblemEngine(unittest.TestCase):
+    def solve(self, m, **kwds):
+        _FixedVarSolver.solves = 0
+        return SolverFactory('gdpopt.enumerate').solve(
+            m, mip_solver='_gdpopt_enumerate_test_solver', **kwds
+        )
+
+    def test_nested_disjuncts_are_solved_once(self):
+        m = _nested_model()
+        results = self.solve(m)
+        # All 12 combinations are enumerated, but the choice of inner
+        # disjunct does not matter when outer[2] is True
+        self.assertEqual(results.solver.iterations, 12)
+        self.assertEqual(_FixedVarSolver.solves, 8)
+        self.assertEqual(
+            results.solver.termination_condition, TerminationCondition.optimal
+        )
+        self.assertEqual(results.problem.upper_bound, -1)
+        self.assertEqual(value(m.x[1]), 2)
+        self.assertEqual(value(m.x[2]), 3)
+        self.assertTrue(value(m.outer[1].inner[1].indicator_var))
+        self.assertTrue(value(m.d[1].indicator_var))
+
+    def test_signature(self):
+        m = _nested_model()
+        m.Y = LogicalConstraint(
+            expr=m.outer[1].inner[3].indicator_var.implies(m.d[2].indicator_var)
+        )
+        util_block = add_util_block(m)
+        add_disjunct_list(util_block)
+        add_algebraic_variable_list(util_block)
+        add_boolean_variable_lists(util_block)
+        subproblem, subproblem_util_block = get_subproblem(m, util_block)
+        engine = SubproblemEngine(None, subproblem_util_block, None)
+        names = [d.local_name for d in subproblem_util_block.disjunct_list]
+        idx = {name: i for i, name in enumerate(names)}
+
+        def signature(*true_disjuncts):
+            return engine.signature(
+                (tuple(idx[name] for name in true_disjuncts), (), ())
+            )
+
+        # Inner disjuncts of a False disjunct do not matter...
+        self.assertEqual(
+            signature('outer[2]', 'inner[1]', 'd[1]'),
+            signature('outer[2]', 'inner[2]', 'd[1]'),
+        )
+        self.assertNotEqual(
+            signature('outer[1]', 'inner[1]', 'd[1]'),
+            signature('outer[1]', 'inner[2]', 'd[1]'),
+        )
+        # ... unless their indicator variable is used elsewhere
+        self.assertNotEqual(
+            signature('outer[2]', 'inner[3]', 'd[1]'),
+            signature('outer[2]', 'inner[2]', 'd[1]'),
+        )
+
+    @unittest.skipIf(os.name == 'nt', "fork is not available on Windows")
+    def test_evaluate(self):
+        m = _nested_model()
+        util_block = add_util_block(m)
+        solver = GDP_Enumeration_Solver()
+        solver.scale = 3
+        solver.timing.main_timer_start_time = timing.default_timer()
+        for threads in (1, 2):
+            config = solver.config(dict(threads=threads, process_start_method='fork'))
+            with SubproblemEngine(
+                solver,
+                util_block,
+                config,
+                evaluate=_evaluate_item,
+                worker_attributes={'scale': 3},
+            ) as engine:
+                results = list(engine.solve([1, 2, 1, 4]))
+            # The results are not memoized
+            self.assertEqual(
+                [(ans, known) for (ans, _, _), known in results],
+                [(3, False), (6, False), (3, False), (12, False)],
+            )
+            self.assertEqual(engine.results, {})
+            self.assertEqual(
+                {name for (_, _, name), _ in results}, {util_block.local_name}
+            )
+            pids = {pid for (_, pid, _), _ in results}
+            if threads == 1:
+                self.assertEqual(pids, {os.getpid()})
+            else:
+                self.assertNotIn(os.getpid(), pids)
+
+    def test_iteration_limit(self):
+        m = _nested_model()
+        results = self.solve(m, iterlim=5)
+        self.assertEqual(results.solver.iterations, 5)
+        self.assertEqual(
+            results.solver.termination_condition, TerminationCondition.maxIterations
+        )
+
+    @unittest.skipIf(os.name == 'nt', "fork is not available on Windows")
+    def test_parallel_matches_serial(self):
+        m1 = _nested_model()
+        results1 = self.solve(m1)
+        m2 = _nested_model()
+        results2 = self.solve(m2, threads=3, process_start_method='fork')
+        # Subproblems were solved in the workers
+        self.assertEqual(_FixedVarSolver.solves, 0)
+        for attr in ('iterations', 'termination_condition'):
+            self.assertEqual(
+                getattr(results2.solver, attr), getattr(results1.solver, attr)
+            )
+        self.assertEqual(results2.problem.upper_bound, results1.problem.upper_bound)
+        self.assertEqual(results2.problem.lower_bound, results1.problem.lower_bound)
+        for v1, v2 in zip(
+            m1.component_data_objects(Var), m2.component_data_objects(Var)
+        ):
+            self.assertEqual(v2.value, v1.value)
+
+        results3 = self.solve(
+            _nested_model(), threads=3, process_start_method='fork', iterlim=5
+        )
+        self.assertEqual(results3.solver.iterations, 5)
+        self.assertEqual(
+            results3.solver.termination_condition, TerminationCondition.maxIterations
+        )
+
+
 @unittest.skipUnless(SolverFactory('ipopt').available(), 'Ipopt not available')
 class TestGDPoptEnumerate_ipopt_tests(unittest.TestCase):
     def test_infeasible_GDP(self):
@@ -8,10 +8,64 @@
 #  rights in this software.
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
-from pyomo.environ import SolverFactory, value, Var, Constraint, TransformationFactory
-from pyomo.gdp import Disjunct
+import os
+
+from pyomo.environ import (
+    SolverFactory,
+    value,
+    Var,
+    Constraint,
+    TransformationFactory,
+    ConcreteModel,
+    RangeSet,
+    Objective,
+)
+from pyomo.gdp import Disjunct, Disjunction
 import pyomo.common.unittest as unittest
+from pyomo.contrib.gdpopt.ldsda import (
+    GDP_LDSDA_Solver,
+    SubproblemSolution,
+    tabulate_available,
+)
 from pyomo.contrib.gdpopt.tests.four_stage_dynamic_model import build_model
+from pyomo.opt import SolverResults, TerminationCondition
+
+
+@SolverFactory.register(
+    '_ldsda_test_solver', doc="Solver for the fixed LD-SDA test subproblems"
+)
+class _FixedVarSolver(object):
+    """Stand-in for the MINLP solver of the LD-SDA subproblems
+
+    In the test models, fixing the disjuncts fixes the bounds of all
+    variables (through FBBT), so the subproblem is "solved" by moving the
+    variables to their bounds.
+    """
+
+    def __init__(self, **kwds):
+        pass
+
+    def solve(self, model, **kwds):
+        for v in model.component_data_objects(Var, descend_into=True):
+            if v.value is None:
+                v.set_value(v.lb)
+        results = SolverResults()
+        results.solver.termination_condition = TerminationCondition.optimal
+        obj = next(model.component_data_objects(Objective, active=True))
+        results.problem.upper_bound = results.problem.lower_bound = value(obj)
+        return results
+
+
+class _CountingLDSDA(GDP_LDSDA_Solver):
+    """LD-SDA that records the points whose subproblems are solved"""
+
+    def __init__(self, **kwds):
+        super().__init__(**kwds)
+        self.solved_points = []
+
+    def _solve_external_var_point(self, external_var_value, config):
+        self.solved_points.append(external_var_value)
+        return super()._solve_external_var_point(external_var_value, config)
 
 
 class TestGDPoptLDSDA(unittest.TestCase):
@@ -57,5 +111,109 @@ class TestGDPoptLDSDA(unittest.TestCase):
             self.assertAlmostEqual(value(model.obj), -23.305325, places=4)
 
 
+@unittest.skipUnless(tabulate_available, "tabulate is not available")
+class TestGDPoptLDSDAStandIn(unittest.TestCase):
+    def make_model(self, costs):
+        # Disjunct d[i, j] sets x[i] to costs[i - 1][j - 1]
+        m = ConcreteModel()
+        m.I = RangeSet(len(costs))
+        m.J = RangeSet(len(costs[0]))
+        m.x = Var(m.I, bounds=(0, 10))
+        m.d = Disjunct(m.I, m.J)
+        for i in m.I:
+            for j in m.J:
+                m.d[i, j].c = Constraint(expr=m.x[i] == costs[i - 1][j - 1])
+        m.disj = Disjunction(m.I, rule=lambda m, i: [m.d[i, j] for j in m.J])
+        m.o = Objective(expr=sum(m.x.values()))
+        return m
+
+    def solve(self, costs, starting_point, **kwds):
+        m = self.make_model(costs)
+        solver = _CountingLDSDA()
+        results = solver.solve(
+            m,
+            minlp_solver='_ldsda_test_solver',
+            starting_point=starting_point,
+            disjunction_list=list(m.disj.values()),
+            **kwds,
+        )
+        return m, solver, results
+
+    def test_line_search(self):
+        m, solver, results = self.solve([[5, 4, 3, 2, 4]], [1])
+        self.assertEqual(value(m.o), 2)
+        self.assertEqual(solver.current_point, (4,))
+        # The line search stops at the first point that does not improve
+        self.assertEqual(solver.solved_points, [(1,), (2,), (3,), (4,), (5,)])
+        self.assertEqual(
+            solver.explored_points, {(1,): 5, (2,): 4, (3,): 3, (4,): 2, (5,): 4}
+        )
+
+    def test_explored_points_are_not_solved_again(self):
+        costs = [[4, 3, 2, 3], [1, 2, 0, 3], [3, 1, 2, 0]]
+        for direction_norm in ('L2', 'Linf'):
+            m, solver, results = self.solve(
+                costs, [1, 1, 1], direction_norm=direction_norm
+            )
+            self.assertEqual(value(m.o), results.problem.upper_bound)
+            self.assertEqual(len(solver.solved_points), len(solver.explored_points))
+            self.assertEqual(set(solver.solved_points), set(solver.explored_points))
+            # Points that were already explored are not solved again
+            self.assertEqual(
+                solver._solve_GDP_subproblem((1, 1, 1), 'Neighbor search', None),
+                (False, 8),
+            )
+            self.assertEqual(len(solver.solved_points), len(solver.explored_points))
+
+    def test_infeasible_point(self):
+        m, solver, results = self.solve([[5, 4, 3, 2, 4]], [1])
+        infeasible = SubproblemSolution(
+            termination_condition=TerminationCondition.infeasible,
+            primal_bound=None,
+            objective_value=7,
+            continuous_soln=None,
+            boolean_soln=None,
+        )
+        # The result is the one that is cached for the point
+        for solution in (infeasible, None):
+            self.assertEqual(
+                solver._handle_subproblem_solution(
+                    (6,), solution, 'Neighbor search', None
+                ),
+                (False, None),
+            )
+            self.assertIsNone(solver.explored_points[(6,)])
+            self.assertEqual(
+                solver._solve_GDP_subproblem((6,), 'Neighbor search', None),
+                (False, None),
+            )
+
+    @unittest.skipIf(os.name == 'nt', "fork is not available on Windows")
+    def test_parallel_matches_serial(self):
+        costs = [[4, 3, 2, 3], [1, 2, 0, 3], [3, 1, 2, 0]]
+        for direction_norm in ('L2', 'Linf'):
+            m1, serial, results1 = self.solve(
+                costs, [1, 1, 1], direction_norm=direction_norm
+            )
+            m2, parallel, results2 = self.solve(
+                costs,
+                [1, 1, 1],
+                direction_norm=direction_norm,
+                threads=2,
+                process_start_method='fork',
+            )
+            self.assertEqual(value(m2.o), value(m1.o))
+            self.assertEqual(parallel.current_point, serial.current_point)
+            self.assertEqual(parallel.explored_points, serial.explored_points)
+            self.assertEqual(
+                [m2.x[i].value for i in m2.I], [m1.x[i].value for i in m1.I]
+            )
+            self.assertEqual(
+                [d.indicator_var.value for d in m2.d.values()],
+                [d.indicator_var.value for d in m1.d.values()],
+            )
+            self.assertEqual(results2.problem.upper_bound, results1.problem.upper_bound)
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -33,6 +33,7 @@ from pyomo.core import (
 )
 from pyomo.core.expr.numvalue import native_types
 from pyomo.gdp import Disjunct, Disjunction
+from pyomo.gdp.plugins.multiple_bigm import get_process_start_method
 from pyomo.gdp.util import _parent_disjunct
 from pyomo.opt import SolverFactory
 
@@ -24,6 +24,7 @@ from pyomo.solvers.plugins.solvers.persistent_solver import PersistentSolver
 from pyomo.common.collections import ComponentMap, Bunch, ComponentSet
 from pyomo.common.errors import InfeasibleConstraintException
 from pyomo.contrib.mindtpy.cut_generation import add_no_good_cuts
+from pyomo.contrib.mindtpy.cut_pool import CutPool
 from operator import itemgetter
 from pyomo.common.errors import DeveloperError
 from pyomo.solvers.plugins.solvers.gurobi_direct import gurobipy
@@ -74,6 +75,7 @@ from pyomo.contrib.mindtpy.util import (
     set_solver_constraint_violation_tolerance,
     update_solver_timelimit,
     copy_var_list_values,
+    update_persistent_solver_instance,
 )
 
 single_tree, single_tree_available = attempt_import('pyomo.contrib.mindtpy.single_tree')
@@ -145,6 +147,15 @@ class _MindtPyAlgorithm(object):
         self.last_iter_cuts = False
         # Store the OA cuts generated in the mip_start_process.
         self.mip_start_lazy_oa_cuts = []
+        # The cut pool of the main problem (if config.use_cut_pool)
+        self.cut_pool = None
+        # The state of the main problem in the persistent MIP solvers (see
+        # update_persistent_solver_instance)
+        self.mip_instance_state = None
+        self.regularization_mip_instance_state = None
+        # The continuous variable values of the last feasible fixed-NLP
+        # solution (if config.fixed_nlp_warm_start is 'previous')
+        self.fixed_nlp_warm_start_values = None
         # Whether to load solutions in solve() function
         self.mip_load_solutions = True
         self.nlp_load_solutions = True
@@ -292,6 +303,7 @@ class _MindtPyAlgorithm(object):
                 )
                 if isinstance(self.mip_opt, PersistentSolver):
                     self.mip_opt.set_instance(self.original_model)
+                    self.mip_instance_state = None
                 update_solver_timelimit(
                     self.mip_opt, config.mip_solver, self.timing, config
                 )
@@ -990,6 +1002,7 @@ class _MindtPyAlgorithm(object):
 
         if isinstance(self.mip_opt, PersistentSolver):
             self.mip_opt.set_instance(m)
+            self.mip_instance_state = None
         mip_args = dict(config.mip_solver_args)
         update_solver_timelimit(self.mip_opt, config.mip_solver, self.timing, config)
         results = self.mip_opt.solve(
@@ -1203,6 +1216,10 @@ class _MindtPyAlgorithm(object):
         if self.primal_bound_improved:
             self.best_solution_found = fixed_nlp.clone()
             self.best_solution_found_time = get_main_elapsed_time(self.timing)
+        if config.fixed_nlp_warm_start == 'previous':
+            self.fixed_nlp_warm_start_values = [
+                v.value for v in fixed_nlp.MindtPy_utils.continuous_variable_list
+            ]
         # Add the linear cut
         copy_var_list_values(
             fixed_nlp.MindtPy_utils.variable_list,
@@ -1576,6 +1593,7 @@ class _MindtPyAlgorithm(object):
             # determine if persistent solver is called.
             if isinstance(self.mip_opt, PersistentSolver):
                 self.mip_opt.set_instance(self.mip, symbolic_solver_labels=True)
+                self.mip_instance_state = None
             mip_args = dict(config.mip_solver_args)
             update_solver_timelimit(
                 self.mip_opt, config.mip_solver, self.timing, config
@@ -1664,19 +1682,30 @@ class _MindtPyAlgorithm(object):
 
         # setup main problem
         self.setup_main()
+        if self.cut_pool is not None:
+            with time_code(self.timing, 'cut pool'):
+                self.cut_pool.collect(self.mip.MindtPy_utils.cuts)
         mip_args = self.set_up_mip_solver()
-        update_solver_timelimit(self.mip_opt, config.mip_solver, self.timing, config)
+        if self.cut_pool is not None:
+            # The MIP solver now holds the active cuts
+            self.cut_pool.solver_loaded()
 
         try:
-            main_mip_results = self.mip_opt.solve(
-                self.mip,
-                tee=config.mip_solver_tee,
-                load_solutions=self.mip_load_solutions,
-                **mip_args,
-            )
-            # update_attributes should be before load_from(main_mip_results), since load_from(main_mip_results) may fail.
-            if len(main_mip_results.solution) > 0:
-                self.mip.solutions.load_from(main_mip_results)
+            while True:
+                update_solver_timelimit(
+                    self.mip_opt, config.mip_solver, self.timing, config
+                )
+                main_mip_results = self.mip_opt.solve(
+                    self.mip,
+                    tee=config.mip_solver_tee,
+                    load_solutions=self.mip_load_solutions,
+                    **mip_args,
+                )
+                # update_attributes should be before load_from(main_mip_results), since load_from(main_mip_results) may fail.
+                if len(main_mip_results.solution) > 0:
+                    self.mip.solutions.load_from(main_mip_results)
+                if not self.separate_pooled_cuts(main_mip_results):
+                    break
         except (ValueError, AttributeError, RuntimeError) as e:
             config.logger.error(e, exc_info=True)
             if config.single_tree:
@@ -1713,6 +1742,52 @@ class _MindtPyAlgorithm(object):
             )
         return self.mip, main_mip_results
 
+    def separate_pooled_cuts(self, main_mip_results):
+        """Updates the cut pool with the solution of the main problem.
+
+        If the main problem was solved to optimality, the cuts in the pool
+        that are violated by its solution are activated. If there are
+        none, the solution is optimal for the main problem with all the
+        pooled cuts, and the active cuts that are not binding are aged.
+
+        Parameters
+        ----------
+        main_mip_results : SolverResults
+            Results from solving the main MIP.
+
+        Returns
+        -------
+        bool
+            True if cuts were activated, and the main problem has to be
+            solved again.
+        """
+        if (
+            self.cut_pool is None
+            or main_mip_results.solver.termination_condition is not tc.optimal
+        ):
+            return False
+        config = self.config
+        with time_code(self.timing, 'cut pool'):
+            activated = self.cut_pool.separate()
+            if activated:
+                config.logger.debug(
+                    'Activated %s violated cuts from the cut pool.' % activated
+                )
+                self.cut_pool.update_solver(self.mip_opt)
+                return True
+            deactivated = self.cut_pool.age()
+            config.logger.debug(
+                'Cut pool: %s of %s cuts active (%s deactivated, %s duplicates '
+                'dropped).'
+                % (
+                    self.cut_pool.num_active(),
+                    len(self.cut_pool),
+                    deactivated,
+                    self.cut_pool.num_dropped,
+                )
+            )
+        return False
+
     def solve_fp_main(self):
         """This function solves the MIP main problem.
 
@@ -1765,7 +1840,17 @@ class _MindtPyAlgorithm(object):
         self.setup_regularization_main()
 
         if isinstance(self.regularization_mip_opt, PersistentSolver):
-            self.regularization_mip_opt.set_instance(self.mip)
+            if config.incremental_mip_update:
+                self.regularization_mip_instance_state = (
+                    update_persistent_solver_instance(
+                        self.regularization_mip_opt,
+                        self.mip,
+                        self.regularization_mip_instance_state,
+                    )
+                )
+            else:
+                self.regularization_mip_opt.set_instance(self.mip)
+                self.regularization_mip_instance_state = None
         update_solver_timelimit(
             self.regularization_mip_opt,
             config.mip_regularization_solver,
@@ -1822,7 +1907,18 @@ class _MindtPyAlgorithm(object):
         # determine if persistent solver is called.
         config = self.config
         if isinstance(self.mip_opt, PersistentSolver):
-            self.mip_opt.set_instance(self.mip, symbolic_solver_labels=True)
+            if config.incremental_mip_update:
+                # Only send the changes (e.g., the new cuts) since the last
+                # solve of the main problem
+                self.mip_instance_state = update_persistent_solver_instance(
+                    self.mip_opt,
+                    self.mip,
+                    self.mip_instance_state,
+                    symbolic_solver_labels=True,
+                )
+            else:
+                self.mip_opt.set_instance(self.mip, symbolic_solver_labels=True)
+                self.mip_instance_state = None
         if config.single_tree:
             self.set_up_lazy_OA_callback()
         if config.use_tabu_list:
@@ -1869,6 +1965,15 @@ class _MindtPyAlgorithm(object):
             self.config,
             skip_fixed=False,
         )
+        if self.fixed_nlp_warm_start_values is not None:
+            # Start the continuous variables from the previous fixed-NLP
+            # solution instead
+            for var, val in zip(
+                self.fixed_nlp.MindtPy_utils.continuous_variable_list,
+                self.fixed_nlp_warm_start_values,
+            ):
+                if val is not None and not var.fixed:
+                    var.set_value(val, skip_validation=True)
 
         if update_bound:
             self.update_dual_bound(value(MindtPy.mip_obj.expr))
@@ -1986,6 +2091,7 @@ class _MindtPyAlgorithm(object):
         )
         if isinstance(self.mip_opt, PersistentSolver):
             self.mip_opt.set_instance(main_mip)
+            self.mip_instance_state = None
         update_solver_timelimit(self.mip_opt, config.mip_solver, self.timing, config)
         with SuppressInfeasibleWarning():
             main_mip_results = self.mip_opt.solve(
@@ -2319,6 +2425,12 @@ class _MindtPyAlgorithm(object):
                 config.logger.info(
                     'The threads parameter is corrected to 1 since incumbent callback conflicts with multi-threads mode.'
                 )
+        if config.use_cut_pool and config.single_tree:
+            config.use_cut_pool = False
+            config.logger.info(
+                'The cut pool is not used since the cuts are added through '
+                'lazy constraint callbacks in the single-tree implementation.'
+            )
         if config.solution_pool:
             if config.mip_solver not in {'cplex_persistent', 'gurobi_persistent'}:
                 if config.mip_solver in {'appsi_cplex', 'appsi_gurobi'}:
@@ -2623,6 +2735,8 @@ class _MindtPyAlgorithm(object):
             getattr(self.mip, 'ipopt_zU_out', _DoNothing()).deactivate()
 
         MindtPy = self.mip.MindtPy_utils
+        if config.use_cut_pool:
+            self.cut_pool = CutPool(config)
         if len(MindtPy.grey_box_list) > 0:
             for grey_box in MindtPy.grey_box_list:
                 grey_box.deactivate()
@@ -2737,6 +2851,25 @@ class _MindtPyAlgorithm(object):
             self.mip_opt.update_config.update_objective = False
             self.mip_opt.update_config.treat_fixed_vars_as_params = True
 
+        if config.mip_regularization_solver in {
+            'appsi_cplex',
+            'appsi_gurobi',
+            'appsi_highs',
+        }:
+            # mip regularization problem (the objective is rebuilt for every
+            # regularization problem)
+            opt = self.regularization_mip_opt
+            opt.update_config.check_for_new_or_removed_constraints = True
+            opt.update_config.check_for_new_or_removed_vars = True
+            opt.update_config.check_for_new_or_removed_params = False
+            opt.update_config.check_for_new_objective = True
+            opt.update_config.update_constraints = True
+            opt.update_config.update_vars = True
+            opt.update_config.update_params = False
+            opt.update_config.update_named_expressions = False
+            opt.update_config.update_objective = False
+            opt.update_config.treat_fixed_vars_as_params = True
+
         if config.nlp_solver == 'appsi_ipopt':
             # fixed-nlp
             self.nlp_opt.update_config.check_for_new_or_removed_constraints = False
@@ -210,6 +210,51 @@ def _add_oa_cuts_configs(CONFIG):
             domain=bool,
         ),
     )
+    CONFIG.declare(
+        'use_cut_pool',
+        ConfigValue(
+            default=False,
+            description='Manage the linear cuts of the main problem in a cut pool.',
+            doc='Keep the linear cuts (OA, ECP and affine cuts) in a cut pool '
+            'that drops duplicate cuts, only keeps the tightest of (nearly) '
+            'parallel cuts active, and deactivates cuts that have not been '
+            'binding for cut_pool_max_age main iterations. Inactive cuts are '
+            'reactivated (and the main problem is solved again) when they are '
+            'violated by the main solution. Not used with single_tree.',
+            domain=bool,
+        ),
+    )
+    CONFIG.declare(
+        'cut_pool_max_age',
+        ConfigValue(
+            default=5,
+            domain=PositiveInt,
+            description='Number of main iterations a cut in the cut pool may be '
+            'not binding before it is deactivated.',
+        ),
+    )
+    CONFIG.declare(
+        'cut_pool_parallel_tolerance',
+        ConfigValue(
+            default=1e-6,
+            domain=PositiveFloat,
+            description='Tolerance to consider two cuts in the cut pool ' 'parallel.',
+            doc='Two cuts in the same variables are (nearly) parallel if the '
+            'Euclidean distance between their normalized coefficient vectors '
+            'is at most this tolerance.',
+        ),
+    )
+    CONFIG.declare(
+        'cut_pool_duplicate_tolerance',
+        ConfigValue(
+            default=1e-6,
+            domain=PositiveFloat,
+            description='Tolerance to consider two parallel cuts in the cut '
+            'pool duplicates.',
+            doc='Two (nearly) parallel cuts are duplicates if the right-hand '
+            'sides of the normalized cuts differ by at most this tolerance.',
+        ),
+    )
 
 
 def _add_goa_configs(CONFIG):
@@ -575,6 +620,31 @@ def _add_subsolver_configs(CONFIG):
             'solving the mixed-integer main problems.',
         ),
     )
+    CONFIG.declare(
+        'incremental_mip_update',
+        ConfigValue(
+            default=False,
+            description='Only send the changes of the main problem to persistent '
+            'MIP solvers.',
+            doc='With persistent MIP solvers (gurobi_persistent, '
+            'cplex_persistent), keep the main problem loaded in the solver '
+            'between iterations and only add the new cuts, variables and '
+            'objective. By default, the main problem is reloaded for every '
+            'solve.',
+            domain=bool,
+        ),
+    )
+    CONFIG.declare(
+        'fixed_nlp_warm_start',
+        ConfigValue(
+            default='main',
+            domain=In(['main', 'previous']),
+            description='Initial point of the fixed-NLP subproblem',
+            doc='Initialize the continuous variables of the fixed-NLP subproblem '
+            'from the solution of the main problem (main) or from the last '
+            'feasible fixed-NLP solution (previous).',
+        ),
+    )
     CONFIG.declare(
         'mip_solver_mipgap',
         ConfigValue(
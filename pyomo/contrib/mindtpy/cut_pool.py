@@ -0,0 +1,276 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""Cut pool for the MindtPy main problem.
+
+The cuts are still generated as constraints of the ConstraintLists on the
+MindtPy_utils.cuts block of the main problem (so that the rest of MindtPy
+can refer to them), but once they are collected by the CutPool, the pool
+decides which of them are active in the main problem:
+
+- every cut is stored as a sparse vector a (normalized to unit length)
+  and a right-hand side b, such that the cut reads a^T x <= b;
+- a new cut is compared with the pooled cuts in the same variables whose
+  direction is within config.cut_pool_parallel_tolerance (in Euclidean
+  norm) of its own: if the right-hand sides differ by at most
+  config.cut_pool_duplicate_tolerance, the new cut is dropped, and
+  otherwise only the tightest of the (nearly) parallel cuts is active;
+- active cuts that were not binding at the main solution for more than
+  config.cut_pool_max_age main iterations are deactivated;
+- inactive cuts are reactivated as soon as they are violated by a main
+  solution (after which the main problem is solved again), so the
+  solution of the main problem still satisfies all the pooled cuts.
+"""
+
+from math import isnan, sqrt
+
+from pyomo.common.collections import ComponentMap
+from pyomo.common.dependencies import numpy as np, numpy_available
+from pyomo.core.expr import identify_variables
+from pyomo.repn import generate_standard_repn
+from pyomo.solvers.plugins.solvers.persistent_solver import PersistentSolver
+
+# The ConstraintLists on MindtPy_utils.cuts managed by the cut pool
+pooled_cut_lists = ('oa_cuts', 'ecp_cuts', 'aff_cuts')
+
+
+class _PooledCut(object):
+    __slots__ = ('constraint', 'cols', 'coefs', 'rhs', 'age')
+
+    def __init__(self, constraint, cols, coefs, rhs):
+        self.constraint = constraint
+        self.cols = cols
+        self.coefs = coefs
+        self.rhs = rhs
+        self.age = 0
+
+    def distance(self, coefs):
+        """Returns the Euclidean distance between the direction of this cut
+        and the (normalized) coefficients of a cut in the same columns"""
+        return sqrt(sum((a - b) ** 2 for a, b in zip(self.coefs, coefs)))
+
+
+class CutPool(object):
+    """Pool of the linear cuts of the MindtPy main problem
+
+    Parameters
+    ----------
+    config : ConfigBlock
+        The specific configurations for MindtPy.
+    """
+
+    def __init__(self, config):
+        self.config = config
+        self.cuts = []
+        # Maps the columns of the cuts to the tightest pooled cut of each
+        # of their directions
+        self._directions = {}
+        # Variables of the pooled cuts (the columns of the pool)
+        self._vars = []
+        self._var_index = ComponentMap()
+        # Number of cuts of each ConstraintList that was collected
+        self._collected = ComponentMap()
+        # Nonzeros of the pooled cuts, in coordinate format
+        self._rows = []
+        self._cols = []
+        self._coefs = []
+        self._matrix = None
+        # Maps the cuts (de)activated since the MIP solver was last
+        # updated to whether they were active then
+        self._changed = ComponentMap()
+        self.num_dropped = 0
+
+    def __len__(self):
+        return len(self.cuts)
+
+    def num_active(self):
+        return sum(1 for cut in self.cuts if cut.constraint.active)
+
+    def collect(self, cuts_block):
+        """Add the new (active) cuts on the cuts block to the pool"""
+        for name in pooled_cut_lists:
+            cut_list = cuts_block.component(name)
+            if cut_list is None:
+                continue
+            start = self._collected.get(cut_list, 0)
+            end = self._collected[cut_list] = len(cut_list)
+            for idx in range(start + 1, end + 1):
+                if idx in cut_list and cut_list[idx].active:
+                    self.add(cut_list[idx])
+
+    def add(self, constraint):
+        """Add a cut to the pool
+
+        Cuts that are not linear, are ranged, or contain fixed variables
+        are left alone (i.e., they stay active in the main problem).
+
+        Returns
+        -------
+        bool
+            True if the cut was pooled (or dropped as a duplicate)
+        """
+        if constraint.has_lb() == constraint.has_ub():
+            return False
+        if any(v.fixed for v in identify_variables(constraint.body)):
+            return False
+        repn = generate_standard_repn(constraint.body, quadratic=False)
+        if not repn.is_linear():
+            return False
+        # Normalize to a^T x <= b
+        if constraint.has_ub():
+            sign, rhs = 1, constraint.ub - repn.constant
+        else:
+            sign, rhs = -1, repn.constant - constraint.lb
+        terms = {}
+        for var, coef in zip(repn.linear_vars, repn.linear_coefs):
+            col = self._var_index.get(var, None)
+            if col is None:
+                col = self._var_index[var] = len(self._vars)
+                self._vars.append(var)
+            terms[col] = terms.get(col, 0) + sign * coef
+        norm = sqrt(sum(coef * coef for coef in terms.values()))
+        if not norm:
+            return False
+        cols = tuple(sorted(terms))
+        coefs = tuple(terms[col] / norm for col in cols)
+        rhs /= norm
+
+        cut = _PooledCut(constraint, cols, coefs, rhs)
+        directions = self._directions.setdefault(cols, [])
+        idx, pooled = min(
+            enumerate(directions),
+            key=lambda item: item[1].distance(coefs),
+            default=(None, None),
+        )
+        if (
+            pooled is not None
+            and pooled.distance(coefs) <= self.config.cut_pool_parallel_tolerance
+        ):
+            if abs(pooled.rhs - rhs) <= self.config.cut_pool_duplicate_tolerance:
+                # Duplicate: we do not need this cut at all
+                constraint.deactivate()
+                self.num_dropped += 1
+                return True
+            if pooled.rhs < rhs:
+                # The new cut is (nearly) implied by the pooled one
+                self._store(cut)
+                self._deactivate(cut)
+                return True
+            # The new cut supersedes the pooled one
+            self._deactivate(pooled)
+            directions[idx] = cut
+        else:
+            directions.append(cut)
+        self._store(cut)
+        return True
+
+    def _store(self, cut):
+        row = len(self.cuts)
+        self.cuts.append(cut)
+        self._rows.extend(row for _ in cut.cols)
+        self._cols.extend(cut.cols)
+        self._coefs.extend(cut.coefs)
+        self._matrix = None
+
+    def _activate(self, cut):
+        cut.age = 0
+        self._changed.setdefault(cut.constraint, cut.constraint.active)
+        cut.constraint.activate()
+
+    def _deactivate(self, cut):
+        self._changed.setdefault(cut.constraint, cut.constraint.active)
+        cut.constraint.deactivate()
+
+    def activities(self):
+        """Returns a^T x of the pooled cuts at the current variable values
+
+        The activity of cuts with variables without a value is nan.
+        """
+        nan = float('nan')
+        values = [nan if v.value is None else v.value for v in self._vars]
+        if not numpy_available:
+            return [
+                sum(coef * values[col] for col, coef in zip(cut.cols, cut.coefs))
+                for cut in self.cuts
+            ]
+        if self._matrix is None:
+            self._matrix = (
+                np.array(self._rows, dtype=int),
+                np.array(self._cols, dtype=int),
+                np.array(self._coefs, dtype=float),
+            )
+        rows, cols, coefs = self._matrix
+        x = np.array(values, dtype=float)
+        return np.bincount(
+            rows, weights=coefs * x[cols], minlength=len(self.cuts)
+        ).tolist()
+
+    def separate(self):
+        """Activate the inactive cuts that are violated by the current
+        variable values
+
+        Returns
+        -------
+        int
+            The number of activated cuts
+        """
+        tol = self.config.constraint_tolerance
+        count = 0
+        for cut, activity in zip(self.cuts, self.activities()):
+            if not cut.constraint.active and activity - cut.rhs > tol:
+                self._activate(cut)
+                count += 1
+        return count
+
+    def age(self):
+        """Age the active cuts that are not binding at the current variable
+        values and deactivate the ones older than config.cut_pool_max_age
+
+        Returns
+        -------
+        int
+            The number of deactivated cuts
+        """
+        tol = self.config.constraint_tolerance
+        max_age = self.config.cut_pool_max_age
+        count = 0
+        for cut, activity in zip(self.cuts, self.activities()):
+            if not cut.constraint.active or isnan(activity):
+                continue
+            if cut.rhs - activity > tol:
+                cut.age += 1
+                if cut.age > max_age:
+                    self._deactivate(cut)
+                    count += 1
+            else:
+                cut.age = 0
+        return count
+
+    def solver_loaded(self):
+        """Record that the MIP solver was (re)loaded with the main problem
+        (and therefore holds the active cuts)"""
+        self._changed.clear()
+
+    def update_solver(self, opt):
+        """Send the changes to the active cuts since the MIP solver was
+        loaded (or last updated) to a persistent MIP solver
+
+        The changes are only sent to persistent solvers (from
+        pyomo.solvers) that have an instance; APPSI solvers pick them up
+        when solving, and the other solvers rewrite the whole problem.
+        """
+        if isinstance(opt, PersistentSolver) and opt.has_instance():
+            for con, was_active in self._changed.items():
+                if con.active and not was_active:
+                    opt.add_constraint(con)
+                elif not con.active and was_active:
+                    opt.remove_constraint(con)
+        self._changed.clear()
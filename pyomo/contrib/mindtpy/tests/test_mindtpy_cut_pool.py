@@ -0,0 +1,236 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+"""Tests for the cut pool of the MindtPy main problem."""
+from unittest.mock import MagicMock, patch
+
+import pyomo.common.unittest as unittest
+from pyomo.contrib.mindtpy import cut_pool
+from pyomo.contrib.mindtpy.algorithm_base_class import _MindtPyAlgorithm
+from pyomo.contrib.mindtpy.config_options import _get_MindtPy_OA_config
+from pyomo.contrib.mindtpy.cut_pool import CutPool
+from pyomo.environ import Block, ConcreteModel, ConstraintList, Var, exp
+from pyomo.opt import SolverResults, TerminationCondition as tc
+from pyomo.solvers.plugins.solvers.persistent_solver import PersistentSolver
+
+
+def _model():
+    m = ConcreteModel()
+    m.x = Var(bounds=(0, 10))
+    m.y = Var(bounds=(0, 10))
+    m.cuts = Block()
+    m.cuts.oa_cuts = ConstraintList()
+    return m
+
+
+def _config(**kwds):
+    config = _get_MindtPy_OA_config()
+    config.set_value(dict(use_cut_pool=True, **kwds))
+    return config
+
+
+class TestCutPool(unittest.TestCase):
+    def test_duplicate_and_parallel_cuts(self):
+        m = _model()
+        oa = m.cuts.oa_cuts
+        oa.add(m.x + m.y <= 4)
+        # Duplicate (after scaling)
+        oa.add(2 * m.x + 2 * m.y <= 8)
+        # Parallel, but looser
+        oa.add(-m.x - m.y >= -5)
+        # Parallel and tighter
+        oa.add(3 * m.x + 3 * m.y - 6 <= 3)
+        # Another direction
+        oa.add(m.x - m.y >= 1)
+        pool = CutPool(_config())
+        pool.collect(m.cuts)
+
+        self.assertEqual(pool.num_dropped, 1)
+        self.assertEqual(len(pool), 4)
+        self.assertEqual(
+            [c.active for c in oa.values()], [False, False, False, True, True]
+        )
+        self.assertEqual(pool.num_active(), 2)
+        self.assertAlmostEqual(pool.cuts[2].rhs, 3 / 2**0.5)
+        self.assertEqual(pool.cuts[3].cols, (0, 1))
+        self.assertAlmostEqual(pool.cuts[3].coefs[0], -(0.5**0.5))
+        self.assertAlmostEqual(pool.cuts[3].coefs[1], 0.5**0.5)
+
+        # Cuts are only collected once
+        oa.add(m.y <= 9)
+        pool.collect(m.cuts)
+        self.assertEqual(len(pool), 5)
+        self.assertEqual(pool.num_dropped, 1)
+
+    def test_parallel_tolerance(self):
+        m = _model()
+        oa = m.cuts.oa_cuts
+        # Directions that are only about 2e-4 apart, but whose x
+        # coefficients are on either side of 0.605
+        oa.add(0.6049 * m.x + (1 - 0.6049**2) ** 0.5 * m.y <= 4)
+        oa.add(0.6051 * m.x + (1 - 0.6051**2) ** 0.5 * m.y <= 3)
+        # A direction that is more than 0.01 away
+        oa.add(0.62 * m.x + (1 - 0.62**2) ** 0.5 * m.y <= 2)
+        pool = CutPool(_config(cut_pool_parallel_tolerance=0.01))
+        pool.collect(m.cuts)
+        self.assertEqual(len(pool), 3)
+        self.assertEqual([c.active for c in oa.values()], [False, True, True])
+
+        # Nearly parallel cuts with nearly the same right-hand side
+        m = _model()
+        oa = m.cuts.oa_cuts
+        oa.add(0.6051 * m.x + (1 - 0.6051**2) ** 0.5 * m.y <= 3)
+        oa.add(0.605 * m.x + (1 - 0.605**2) ** 0.5 * m.y <= 3.05)
+        pool = CutPool(
+            _config(cut_pool_parallel_tolerance=0.01, cut_pool_duplicate_tolerance=0.1)
+        )
+        pool.collect(m.cuts)
+        self.assertEqual(pool.num_dropped, 1)
+        self.assertEqual(len(pool), 1)
+        self.assertFalse(oa[2].active)
+
+    def test_cuts_left_alone(self):
+        m = _model()
+        m.z = Var()
+        m.z.fix(1)
+        oa = m.cuts.oa_cuts
+        oa.add(exp(m.x) <= 4)
+        oa.add((0, m.x + m.y, 4))
+        oa.add(m.x + m.z <= 4)
+        oa.add(m.x - m.x <= 1)
+        pool = CutPool(_config())
+        pool.collect(m.cuts)
+        self.assertEqual(len(pool), 0)
+        self.assertTrue(all(c.active for c in oa.values()))
+
+    def _check_separate_and_age(self):
+        m = _model()
+        oa = m.cuts.oa_cuts
+        oa.add(m.x <= 4)
+        oa.add(m.y >= 1)
+        m.y.set_value(1)
+        pool = CutPool(_config(cut_pool_max_age=2))
+        pool.collect(m.cuts)
+
+        m.x.set_value(1)
+        # Ages: x <= 4 is not binding, y >= 1 is
+        for i in range(2):
+            self.assertEqual(pool.age(), 0)
+        self.assertEqual([cut.age for cut in pool.cuts], [2, 0])
+        self.assertEqual(pool.age(), 1)
+        self.assertFalse(oa[1].active)
+        self.assertTrue(oa[2].active)
+
+        # Nothing is violated
+        m.x.set_value(4)
+        self.assertEqual(pool.separate(), 0)
+        self.assertFalse(oa[1].active)
+        # ... now it is
+        m.x.set_value(5)
+        self.assertEqual(pool.separate(), 1)
+        self.assertTrue(oa[1].active)
+        self.assertEqual(pool.cuts[0].age, 0)
+
+        # Variables without a value
+        m.y.set_value(None)
+        self.assertEqual(pool.age(), 0)
+        self.assertTrue(oa[2].active)
+
+    def test_separate_and_age(self):
+        self._check_separate_and_age()
+
+    def test_separate_and_age_no_numpy(self):
+        with patch.object(cut_pool, 'numpy_available', False):
+            self._check_separate_and_age()
+
+    def test_update_solver(self):
+        m = _model()
+        oa = m.cuts.oa_cuts
+        oa.add(m.x <= 4)
+        oa.add(m.x <= 3)
+        oa.add(m.y <= 3)
+        pool = CutPool(_config())
+        pool.collect(m.cuts)
+        self.assertFalse(oa[1].active)
+
+        # The solver is loaded with the active cuts
+        opt = MagicMock(spec=PersistentSolver)
+        pool.solver_loaded()
+        m.x.set_value(4.5)
+        self.assertEqual(pool.separate(), 1)
+        pool.update_solver(opt)
+        opt.add_constraint.assert_called_once_with(oa[1])
+        opt.remove_constraint.assert_not_called()
+
+        # Deactivated cuts are removed from the solver
+        opt.reset_mock()
+        pool._deactivate(pool.cuts[2])
+        pool.update_solver(opt)
+        opt.remove_constraint.assert_called_once_with(oa[3])
+        opt.add_constraint.assert_not_called()
+
+        # Cuts that are back in the state they were loaded in are left alone
+        opt.reset_mock()
+        pool._deactivate(pool.cuts[0])
+        pool._activate(pool.cuts[0])
+        pool.update_solver(opt)
+        opt.add_constraint.assert_not_called()
+        opt.remove_constraint.assert_not_called()
+
+        # Changes made before the solver is (re)loaded are not sent
+        pool._activate(pool.cuts[2])
+        pool.solver_loaded()
+        pool.update_solver(opt)
+        opt.add_constraint.assert_not_called()
+
+        # Other solvers (re)write the whole problem
+        pool._deactivate(pool.cuts[0])
+        pool.update_solver(object())
+        self.assertEqual(len(pool._changed), 0)
+
+    def test_separate_pooled_cuts(self):
+        m = _model()
+        oa = m.cuts.oa_cuts
+        oa.add(m.x <= 3)
+        oa.add(m.x <= 4)
+        solver = _MindtPyAlgorithm()
+        solver.config = _config()
+        solver.mip_opt = None
+        solver.cut_pool = CutPool(solver.config)
+        solver.cut_pool.collect(m.cuts)
+        self.assertFalse(oa[2].active)
+
+        results = SolverResults()
+        results.solver.termination_condition = tc.optimal
+        m.x.set_value(4.5)
+        self.assertTrue(solver.separate_pooled_cuts(results))
+        self.assertTrue(oa[2].active)
+        m.x.set_value(3)
+        self.assertFalse(solver.separate_pooled_cuts(results))
+        self.assertEqual([cut.age for cut in solver.cut_pool.cuts], [0, 1])
+
+        # Only optimal main solutions are used
+        results.solver.termination_condition = tc.maxTimeLimit
+        m.x.set_value(5)
+        self.assertFalse(solver.separate_pooled_cuts(results))
+        self.assertEqual([cut.age for cut in solver.cut_pool.cuts], [0, 1])
+
+    def test_single_tree_config(self):
+        solver = _MindtPyAlgorithm()
+        solver.config = _config(single_tree=True)
+        with self.assertLogs('pyomo.contrib.mindtpy', level='INFO') as cm:
+            solver.check_config()
+        self.assertFalse(solver.config.use_cut_pool)
+        self.assertIn('cut pool is not used', cm.output[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,16 +9,63 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+from unittest.mock import patch
+
 import pyomo.common.unittest as unittest
-from pyomo.contrib.mindtpy.util import set_var_valid_value
+from pyomo.contrib.gdpopt.util import time_code
+from pyomo.contrib.mindtpy.util import (
+    set_var_valid_value,
+    update_persistent_solver_instance,
+)
 
-from pyomo.environ import Var, Integers, ConcreteModel, Integers
+from pyomo.environ import (
+    Var,
+    Integers,
+    ConcreteModel,
+    Constraint,
+    ConstraintList,
+    Objective,
+    VarList,
+)
 from pyomo.contrib.mindtpy.algorithm_base_class import _MindtPyAlgorithm
 from pyomo.contrib.mindtpy.config_options import _get_MindtPy_OA_config
 from pyomo.contrib.mindtpy.tests.MINLP5_simple import SimpleMINLP5
 from pyomo.contrib.mindtpy.util import add_var_bound
 
 
+class _RecordingPersistentSolver(object):
+    """Records the calls of update_persistent_solver_instance"""
+
+    def __init__(self):
+        self.model = None
+        self.calls = []
+
+    def has_instance(self):
+        return self.model is not None
+
+    def set_instance(self, model, **kwds):
+        self.calls.append(('set_instance', kwds))
+        self.model = model
+
+    def add_var(self, var):
+        self.calls.append(('add_var', var.name))
+
+    def update_var(self, var):
+        self.calls.append(('update_var', var.name))
+
+    def remove_var(self, var):
+        self.calls.append(('remove_var', var.name))
+
+    def add_constraint(self, con):
+        self.calls.append(('add_constraint', con.name))
+
+    def remove_constraint(self, con):
+        self.calls.append(('remove_constraint', con.name))
+
+    def set_objective(self, obj):
+        self.calls.append(('set_objective', obj.name))
+
+
 class UnitTestMindtPy(unittest.TestCase):
     def test_set_var_valid_value(self):
         m = ConcreteModel()
@@ -96,6 +143,160 @@ class UnitTestMindtPy(unittest.TestCase):
             solver_object.working_model.y.upper, solver_object.config.integer_var_bound
         )
 
+    def test_update_persistent_solver_instance(self):
+        m = ConcreteModel()
+        m.x = Var(bounds=(0, 4))
+        m.y = Var(within=Integers, bounds=(0, 4))
+        m.o = Objective(expr=m.x + m.y)
+        m.cuts = ConstraintList()
+        m.cuts.add(m.x + m.y >= 1)
+        opt = _RecordingPersistentSolver()
+        states = update_persistent_solver_instance(
+            opt, m, None, symbolic_solver_labels=True
+        )
+        self.assertEqual(
+            opt.calls, [('set_instance', {'symbolic_solver_labels': True})]
+        )
+
+        # New cuts, variables and objective, and changed bounds
+        opt.calls = []
+        m.slack = VarList()
+        m.cuts.add(m.x - m.y + m.slack.add() <= 2)
+        m.cuts[1].deactivate()
+        m.y.setub(3)
+        m.o.deactivate()
+        m.o2 = Objective(expr=m.x - m.y)
+        states = update_persistent_solver_instance(opt, m, states)
+        self.assertEqual(
+            opt.calls,
+            [
+                ('update_var', 'y'),
+                ('add_var', 'slack[1]'),
+                ('remove_constraint', 'cuts[1]'),
+                ('set_objective', 'o2'),
+                ('add_constraint', 'cuts[2]'),
+            ],
+        )
+
+        # Nothing changed
+        opt.calls = []
+        states = update_persistent_solver_instance(opt, m, states)
+        self.assertEqual(opt.calls, [('set_objective', 'o2')])
+
+        # Deleted components
+        opt.calls = []
+        m.del_component(m.cuts)
+        m.del_component(m.slack)
+        states = update_persistent_solver_instance(opt, m, states)
+        self.assertEqual(
+            opt.calls,
+            [
+                ('remove_constraint', '[Unattached ConstraintData]'),
+                ('set_objective', 'o2'),
+                ('remove_var', '[Unattached VarData]'),
+            ],
+        )
+
+        # Deleting a variable that is still used reloads the model
+        opt.calls = []
+        m.z = Var()
+        states = update_persistent_solver_instance(opt, m, states)
+        m.c = Constraint(expr=m.x + m.z <= 4)
+        m.del_component(m.z)
+        states = update_persistent_solver_instance(opt, m, states)
+        self.assertEqual(
+            opt.calls,
+            [
+                ('add_var', 'z'),
+                ('set_objective', 'o2'),
+                ('set_objective', 'o2'),
+                ('add_constraint', 'c'),
+                ('set_instance', {}),
+            ],
+        )
+
+        # ... as does fixing variables
+        opt.calls = []
+        m.del_component(m.c)
+        m.x.fix(1)
+        states = update_persistent_solver_instance(opt, m, states)
+        self.assertEqual(opt.calls, [('set_instance', {})])
+
+        # ... and loading a different model
+        opt.calls = []
+        m2 = m.clone()
+        update_persistent_solver_instance(opt, m2, states)
+        self.assertEqual(opt.calls, [('set_instance', {})])
+
+    def test_fixed_nlp_warm_start(self):
+        for warm_start, x_value in (('main', 2), ('previous', 5)):
+            solver_object = _MindtPyAlgorithm()
+            solver_object.config = _get_MindtPy_OA_config()
+            solver_object.config.fixed_nlp_warm_start = warm_start
+            solver_object.config.add_no_good_cuts = False
+            solver_object.set_up_solve_data(SimpleMINLP5())
+            solver_object.create_utility_block(
+                solver_object.working_model, 'MindtPy_utils'
+            )
+            solver_object.process_objective()
+            solver_object.mip = solver_object.working_model.clone()
+            solver_object.fixed_nlp = solver_object.working_model.clone()
+            # The cuts are not needed to check the warm start
+            solver_object.add_cuts = lambda **kwds: None
+
+            # Feasible fixed-NLP solution
+            solver_object.fixed_nlp.x.set_value(5)
+            with time_code(solver_object.timing, 'main', is_main_timer=True):
+                solver_object.handle_subproblem_optimal(solver_object.fixed_nlp)
+            if warm_start == 'previous':
+                self.assertEqual(solver_object.fixed_nlp_warm_start_values[0], 5)
+            else:
+                self.assertIsNone(solver_object.fixed_nlp_warm_start_values)
+
+            # Next main solution
+            solver_object.mip.x.set_value(2)
+            solver_object.mip.y.set_value(7)
+            solver_object.handle_main_optimal(solver_object.mip, update_bound=False)
+            self.assertEqual(solver_object.fixed_nlp.x.value, x_value)
+            self.assertEqual(solver_object.fixed_nlp.y.value, 7)
+
+    def test_incremental_mip_update(self):
+        solver_object = _MindtPyAlgorithm()
+        solver_object.config = _get_MindtPy_OA_config()
+        solver_object.set_up_solve_data(SimpleMINLP5())
+        solver_object.create_utility_block(solver_object.working_model, 'MindtPy_utils')
+        solver_object.mip = solver_object.working_model.clone()
+        solver_object.mip.MindtPy_utils.cuts.activate()
+        solver_object.mip_opt = opt = _RecordingPersistentSolver()
+        with patch(
+            'pyomo.contrib.mindtpy.algorithm_base_class.PersistentSolver',
+            _RecordingPersistentSolver,
+        ):
+            # By default, the main problem is reloaded for every solve
+            self.assertFalse(solver_object.config.incremental_mip_update)
+            solver_object.set_up_mip_solver()
+            solver_object.set_up_mip_solver()
+            self.assertEqual(
+                opt.calls, [('set_instance', {'symbolic_solver_labels': True})] * 2
+            )
+            self.assertIsNone(solver_object.mip_instance_state)
+
+            # Only the changes are sent with incremental_mip_update
+            opt.calls = []
+            solver_object.config.incremental_mip_update = True
+            solver_object.mip.MindtPy_utils.cuts.oa_cuts = ConstraintList()
+            solver_object.set_up_mip_solver()
+            solver_object.mip.MindtPy_utils.cuts.oa_cuts.add(solver_object.mip.x >= 2)
+            solver_object.set_up_mip_solver()
+            self.assertEqual(
+                opt.calls,
+                [
+                    ('set_instance', {'symbolic_solver_labels': True}),
+                    ('set_objective', 'objective'),
+                    ('add_constraint', 'MindtPy_utils.cuts.oa_cuts[1]'),
+                ],
+            )
+
 
 if __name__ == '__main__':
     unittest.main()
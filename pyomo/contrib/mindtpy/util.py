@@ -10,8 +10,9 @@
 #  ___________________________________________________________________________
 
 """Utility functions and classes for the MindtPy solver."""
+from collections import namedtuple
 import logging
-from pyomo.common.collections import ComponentMap
+from pyomo.common.collections import ComponentMap, ComponentSet
 from pyomo.core import (
     Block,
     Constraint,
@@ -31,6 +32,7 @@ from pyomo.contrib.fbbt.fbbt import compute_bounds_on_expr
 import pyomo.core.expr as EXPR
 from pyomo.contrib.gdpopt.util import get_main_elapsed_time, time_code
 from pyomo.util.model_size import build_model_size_report
+from pyomo.util.vars_from_expressions import get_vars_from_components
 from pyomo.common.dependencies import attempt_import
 from pyomo.solvers.plugins.solvers.gurobi_direct import gurobipy
 from pyomo.solvers.plugins.solvers.gurobi_persistent import GurobiPersistent
@@ -626,6 +628,112 @@ def set_solver_constraint_violation_tolerance(
             opt.options['add_options'].append('$offecho')
 
 
+def _var_state(var):
+    return (var.lb, var.ub, var.domain, var.fixed, var.value if var.fixed else None)
+
+
+# What update_persistent_solver_instance loaded into a persistent solver
+PersistentInstanceState = namedtuple(
+    'PersistentInstanceState',
+    [
+        'model',  # the loaded model
+        'var_states',  # maps the loaded variables to their state
+        'constraints',  # the loaded constraints
+    ],
+)
+
+
+def update_persistent_solver_instance(opt, model, instance_state=None, **kwds):
+    """Load a model into a persistent solver, or update the loaded model.
+
+    If instance_state is None (or is the state of another model), the model
+    is loaded from scratch with set_instance. Otherwise, only the changes
+    since the last call are sent to the solver: new and removed variables and
+    constraints, changed variable bounds and domains, and the active
+    objective. Changes to fixed variables are substituted into the
+    constraints by the persistent solvers, so they still reload the model.
+
+    The solver must not be loaded with anything else between the calls (pass
+    instance_state=None after that).
+
+    Parameters
+    ----------
+    opt : PersistentSolver
+        The persistent solver.
+    model : Pyomo model
+        The model to load.
+    instance_state : PersistentInstanceState, optional
+        The state returned by the previous call.
+    kwds
+        Passed on to set_instance (e.g., symbolic_solver_labels).
+
+    Returns
+    -------
+    PersistentInstanceState
+        The state of the model in the solver, to pass to the next call.
+    """
+    # The same variables and constraints as set_instance loads
+    new_state = PersistentInstanceState(
+        model,
+        ComponentMap(
+            (v, _var_state(v))
+            for v in model.component_data_objects(Var, active=True, descend_into=True)
+        ),
+        ComponentSet(
+            c
+            for c in model.component_data_objects(
+                Constraint, active=True, descend_into=True
+            )
+            if c.has_lb() or c.has_ub()
+        ),
+    )
+    if (
+        instance_state is None
+        or instance_state.model is not model
+        or not opt.has_instance()
+        or any(
+            state[3:] != instance_state.var_states[v][3:]
+            for v, state in new_state.var_states.items()
+            if v in instance_state.var_states
+        )
+    ):
+        opt.set_instance(model, **kwds)
+        return new_state
+
+    for v, state in new_state.var_states.items():
+        if v not in instance_state.var_states:
+            opt.add_var(v)
+        elif state != instance_state.var_states[v]:
+            opt.update_var(v)
+
+    for con in instance_state.constraints:
+        if con not in new_state.constraints:
+            opt.remove_constraint(con)
+    opt.set_objective(
+        next(model.component_data_objects(Objective, active=True, descend_into=True))
+    )
+    for con in new_state.constraints:
+        if con not in instance_state.constraints:
+            opt.add_constraint(con)
+
+    # Variables that were deleted from the model
+    removed_vars = [
+        v for v in instance_state.var_states if v not in new_state.var_states
+    ]
+    if removed_vars:
+        referenced_vars = ComponentSet(
+            get_vars_from_components(
+                model, (Constraint, Objective), active=True, descend_into=True
+            )
+        )
+        if any(v in referenced_vars for v in removed_vars):
+            opt.set_instance(model, **kwds)
+            return new_state
+        for v in removed_vars:
+            opt.remove_var(v)
+    return new_state
+
+
 def get_integer_solution(model, string_zero=False):
     """Extract the value of integer variables from the provided model.
 
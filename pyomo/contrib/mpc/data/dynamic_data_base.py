@@ -9,6 +9,7 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+from pyomo.common.dependencies import numpy as np
 from pyomo.core.base.set import Set
 from pyomo.contrib.mpc.data.get_cuid import get_indexed_cuid
 
@@ -110,6 +111,47 @@ class _DynamicDataBase(object):
             }
             self._data.update(other)
 
+    def get_array(self, keys=None, context=None):
+        """
+        Returns the values for the specified keys as a NumPy array.
+
+        The rows of the returned array correspond to the provided keys
+        or, if no keys are provided, to the CUIDs in this object's dict
+        (in order). Values of None are returned as NaN.
+
+        """
+        cuids = self._get_cuids(keys, context)
+        return np.array([self._data[cuid] for cuid in cuids], dtype=float)
+
+    def set_array(self, array, keys=None, context=None):
+        """
+        Sets the values for the specified keys from a NumPy array.
+
+        The rows of the array correspond to the provided keys or, if
+        no keys are provided, to the CUIDs in this object's dict (in
+        order).
+
+        """
+        cuids = self._get_cuids(keys, context)
+        array = np.asarray(array, dtype=float)
+        self._validate_array_shape(array, len(cuids))
+        self._data.update(zip(cuids, array.tolist()))
+
+    def _get_cuids(self, keys, context):
+        if keys is None:
+            return list(self._data)
+        return [
+            get_indexed_cuid(key, (self._orig_time_set,), context=context)
+            for key in keys
+        ]
+
+    def _validate_array_shape(self, array, n_keys):
+        if not array.shape or array.shape[0] != n_keys:
+            raise ValueError(
+                "Array of shape %s is not compatible with %s keys"
+                % (array.shape, n_keys)
+            )
+
     def to_serializable(self):
         """
         Returns a json-serializable object.
@@ -93,6 +93,15 @@ class IntervalData(_DynamicDataBase):
                 "%s and %s are not comparable" % (self.__class__, other.__class__)
             )
 
+    def _validate_array_shape(self, array, n_keys):
+        super()._validate_array_shape(array, n_keys)
+        if array.ndim != 2 or array.shape[1] != len(self._intervals):
+            raise ValueError(
+                "IntervalData with %s intervals requires a 2-D array "
+                "with %s columns (got shape %s)"
+                % (len(self._intervals), len(self._intervals), array.shape)
+            )
+
     def get_intervals(self):
         return self._intervals
 
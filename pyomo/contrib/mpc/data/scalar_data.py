@@ -35,6 +35,13 @@ class ScalarData(_DynamicDataBase):
                 )
         super().__init__(data, time_set=time_set, context=context)
 
+    def _validate_array_shape(self, array, n_keys):
+        super()._validate_array_shape(array, n_keys)
+        if array.ndim != 1:
+            raise ValueError(
+                "ScalarData requires a 1-D array (got shape %s)" % (array.shape,)
+            )
+
     def to_serializable(self):
         """
         Convert to json-serializable object.
@@ -78,6 +78,15 @@ class TimeSeriesData(_DynamicDataBase):
                 "%s and %s are not comparable" % (self.__class__, other.__class__)
             )
 
+    def _validate_array_shape(self, array, n_keys):
+        super()._validate_array_shape(array, n_keys)
+        if array.ndim != 2 or array.shape[1] != len(self._time):
+            raise ValueError(
+                "TimeSeriesData with %s time points requires a 2-D array "
+                "with %s columns (got shape %s)"
+                % (len(self._time), len(self._time), array.shape)
+            )
+
     def get_time_points(self):
         """
         Get time points of the time series data
@@ -11,6 +11,7 @@
 
 import pyomo.common.unittest as unittest
 
+from pyomo.common.dependencies import numpy as np, numpy_available
 import pyomo.environ as pyo
 from pyomo.contrib.mpc.data.scalar_data import ScalarData
 
@@ -114,6 +115,18 @@ class TestScalarData(unittest.TestCase):
         with self.assertRaisesRegex(NotImplementedError, msg):
             data = data.extract_variables([m.var[:, "A"]], copy_values=True)
 
+    @unittest.skipUnless(numpy_available, "numpy is not available")
+    def test_get_set_array(self):
+        m = self._make_model()
+        data = ScalarData({m.var[:, "A"]: 0.5, m.var[:, "B"]: 2.0})
+        np.testing.assert_array_equal(data.get_array(), [0.5, 2.0])
+        data.set_array(np.array([1.5, 3.0]))
+        self.assertEqual(data, ScalarData({m.var[:, "A"]: 1.5, m.var[:, "B"]: 3.0}))
+        data.set_array([4.0], keys=[m.var[:, "B"]])
+        np.testing.assert_array_equal(data.get_array(), [1.5, 4.0])
+        with self.assertRaisesRegex(ValueError, "requires a 1-D array"):
+            data.set_array(np.array([[1.0], [2.0]]))
+
 
 if __name__ == "__main__":
     unittest.main()
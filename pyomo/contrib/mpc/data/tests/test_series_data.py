@@ -11,6 +11,7 @@
 
 import pyomo.common.unittest as unittest
 
+from pyomo.common.dependencies import numpy as np, numpy_available
 import pyomo.environ as pyo
 from pyomo.contrib.mpc.data.scalar_data import ScalarData
 from pyomo.contrib.mpc.data.series_data import TimeSeriesData
@@ -263,6 +264,33 @@ class TestSeriesData(unittest.TestCase):
         t1_data = data.get_data_at_time(0.1)
         self.assertEqual(t1_data, ScalarData({m.var[:, "A"]: 1, m.var[:, "B"]: 2}))
 
+    @unittest.skipUnless(numpy_available, "numpy is not available")
+    def test_get_set_array(self):
+        m = self._make_model()
+        data_dict = {m.var[:, "A"]: [1, 2, 3], m.var[:, "B"]: [2, 4, 6]}
+        data = TimeSeriesData(data_dict, m.time)
+
+        arr = data.get_array()
+        self.assertEqual(arr.shape, (2, 3))
+        np.testing.assert_array_equal(arr, [[1, 2, 3], [2, 4, 6]])
+        arr = data.get_array([m.var[:, "B"]])
+        np.testing.assert_array_equal(arr, [[2, 4, 6]])
+
+        data.set_array(np.array([[7, 8, 9]]), keys=[m.var[:, "A"]])
+        self.assertEqual(
+            data,
+            TimeSeriesData(
+                {m.var[:, "A"]: [7, 8, 9], m.var[:, "B"]: [2, 4, 6]}, m.time
+            ),
+        )
+
+        msg = "requires a 2-D array with 3 columns"
+        with self.assertRaisesRegex(ValueError, msg):
+            data.set_array(np.array([[1, 2], [3, 4]]))
+        msg = "not compatible with 2 keys"
+        with self.assertRaisesRegex(ValueError, msg):
+            data.set_array(np.array([[1, 2, 3]]))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -32,8 +32,8 @@ def load_data_from_scalar(data, model, time):
     """
     data = data.get_data()
     t_iter = time if _is_iterable(time) else (time,)
-    for cuid, val in data.items():
-        var = model.find_component(cuid)
+    variables = model.find_components(data.keys())
+    for var, (cuid, val) in zip(variables, data.items()):
         if var is None:
             _raise_invalid_cuid(cuid, model)
         # TODO: Time points should probably use find_nearest_index
@@ -70,8 +70,8 @@ def load_data_from_series(data, model, time, tolerance=0.0):
             " of time points to load data from series"
         )
     data = data.get_data()
-    for cuid, vals in data.items():
-        var = model.find_component(cuid)
+    variables = model.find_components(data.keys())
+    for var, (cuid, vals) in zip(variables, data.items()):
         if var is None:
             _raise_invalid_cuid(cuid, model)
         for idx, val in zip(time_indices, vals):
@@ -167,8 +167,8 @@ def load_data_from_interval(
             idx_list[i] = None
 
     data = data.get_data()
-    for cuid, vals in data.items():
-        var = model.find_component(cuid)
+    variables = model.find_components(data.keys())
+    for var, (cuid, vals) in zip(variables, data.items()):
         if var is None:
             _raise_invalid_cuid(cuid, model)
         for i, t in zip(idx_list, time):
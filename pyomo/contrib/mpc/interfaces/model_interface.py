@@ -340,16 +340,13 @@ class DynamicModelInterface(object):
             # NOTE: Nondeterministic order in non-C Python < 3.7
             # Should these data structures use OrderedDicts internally
             # to enforce an order here?
-            variables = [
-                self.model.find_component(key) for key in target_data.get_data().keys()
-            ]
+            variables = self.model.find_components(target_data.get_data().keys())
         else:
             # Variables were provided. These could be anything. Process them
             # to get time-indexed variables on the model.
-            variables = [
-                self.model.find_component(get_indexed_cuid(var, (self.time,)))
-                for var in variables
-            ]
+            variables = self.model.find_components(
+                get_indexed_cuid(var, (self.time,)) for var in variables
+            )
         return get_penalty_from_target(
             variables,
             time,
@@ -391,7 +388,7 @@ class DynamicModelInterface(object):
 
         """
         cuids = [get_indexed_cuid(var, (self.time,)) for var in variables]
-        variables = [self.model.find_component(cuid) for cuid in cuids]
+        variables = self.model.find_components(cuids)
         time_list = list(self.time)
         # Make sure that sample points exist (within tolerance) in the time
         # set.
@@ -45,7 +45,9 @@ import types
 import json
 from collections.abc import Callable
 from itertools import combinations
+from collections import Counter
 from functools import singledispatchmethod
+from contextlib import contextmanager
 
 from pyomo.common.dependencies import (
     attempt_import,
@@ -232,6 +234,43 @@ def _experiment_instance_creation_callback(
     return instance
 
 
+def _parmest_model_state(model):
+    """Returns the state of a parmest model that _reset_parmest_model
+    restores"""
+    return (
+        [
+            (v, v.value, v.fixed)
+            for v in model.component_data_objects(pyo.Var, descend_into=True)
+        ],
+        [
+            obj
+            for obj in model.component_data_objects(
+                pyo.Objective, active=True, descend_into=True
+            )
+        ],
+    )
+
+
+def _reset_parmest_model(model, state):
+    """Restore a (cached) parmest model to its initial state, undoing
+    what the scenario callback and the extensive form did to it"""
+    parent = model.parent_block()
+    if parent is not None:
+        parent.del_component(model)
+    # The additions of the scenario callback and create_EF (the last two
+    # only for an extensive form of a single scenario)
+    for name in ('_mpisppy_node_list', '_mpisppy_probability', 'ref_vars'):
+        if name in model.__dict__:
+            delattr(model, name)
+    model.del_component('EF_Obj')
+    var_values, objectives = state
+    for v, val, fixed in var_values:
+        v.set_value(val, skip_validation=True)
+        v.fixed = fixed
+    for obj in objectives:
+        obj.activate()
+
+
 def SSE(model):
     """
     Returns an expression that is used to compute the sum of squared errors
@@ -770,6 +809,23 @@ class Estimator(object):
     solver_options: dict, optional
         Provides options to the solver (also the name of an attribute).
         Default is None.
+    task_manager: callable, optional
+        Creates the task manager (from the number of tasks) that
+        distributes the bootstrap, leave-N-out and objective_at_theta
+        estimates. Default is utils.ParallelTaskManager, which uses MPI
+        (if available). Use utils.LocalPoolTaskManager (or, e.g.,
+        ``functools.partial(utils.LocalPoolTaskManager, processes=4)``)
+        to run them on a pool of local worker processes.
+    reuse_extensive_form: bool, optional
+        If True, theta_est_bootstrap and theta_est_leaveNout build the
+        extensive form of all the experiments once (per process) and
+        represent each sample by the objective weights of the scenarios
+        (the multiplicity of each experiment in the sample). Every
+        estimate then only updates the weights and re-solves the
+        extensive form, warm-started from the previous estimate, with the
+        persistent 'appsi_ipopt' solver (if available, else 'ipopt').
+        The experiments left out of a sample must still be feasible at
+        the estimated theta values. Default is False.
     """
 
     # The singledispatchmethod decorator is used here as a deprecation
@@ -785,6 +841,8 @@ class Estimator(object):
         tee=False,
         diagnostic_mode=False,
         solver_options=None,
+        task_manager=None,
+        reuse_extensive_form=False,
     ):
 
         # check that we have a (non-empty) list of experiments
@@ -815,6 +873,20 @@ class Estimator(object):
         self.tee = tee
         self.diagnostic_mode = diagnostic_mode
         self.solver_options = solver_options
+        self.task_manager = task_manager
+        self.reuse_extensive_form = reuse_extensive_form
+        # True within _cached_models
+        self._caching = False
+        # Maps experiment numbers to the cached parmest models of the
+        # experiment and their initial state, while the models are cached
+        # (with a task_manager, see _cached_models)
+        self._model_cache = None
+        # Number of cached models of each experiment in use since the
+        # last _release_cached_models
+        self._models_in_use = Counter()
+        # (extensive form, solver) of _Q_opt_weighted, while the models
+        # are cached
+        self._weighted_ef = None
 
         # TODO: delete this when the deprecated interface is removed
         self.pest_deprecated = None
@@ -968,9 +1040,80 @@ class Estimator(object):
         return parmest_model
 
     def _instance_creation_callback(self, experiment_number=None, cb_data=None):
-        model = self._create_parmest_model(experiment_number)
+        if self._model_cache is None:
+            return self._create_parmest_model(experiment_number)
+        # An experiment can appear several times in the same extensive
+        # form (e.g., in a bootstrap sample), so it may need more than one
+        # cached model
+        models = self._model_cache.setdefault(experiment_number, [])
+        idx = self._models_in_use[experiment_number]
+        self._models_in_use[experiment_number] += 1
+        if idx == len(models):
+            model = self._create_parmest_model(experiment_number)
+            models.append((model, _parmest_model_state(model)))
+            return model
+        model, state = models[idx]
+        _reset_parmest_model(model, state)
         return model
 
+    def _release_cached_models(self):
+        """Allow the cached models to be reused as new scenarios (i.e.,
+        the scenarios they were used as before are no longer needed)"""
+        self._models_in_use.clear()
+
+    @contextmanager
+    def _cached_models(self):
+        """Reuse the parmest models (and the weighted extensive form)
+        across the estimates within this context
+
+        With a task_manager, the parmest model of each experiment is
+        built (at most) once per process and then reset for every
+        scenario it is used for (the theta values are fixed again by the
+        scenario callback).  Worker processes of a LocalPoolTaskManager
+        each fill their own cache.  Otherwise, every scenario is built
+        from scratch, as outside of this context.
+        """
+        if self._caching:
+            yield
+            return
+        self._caching = True
+        if self.task_manager is not None:
+            self._model_cache = {}
+        try:
+            yield
+        finally:
+            self._caching = False
+            self._model_cache = None
+            self._models_in_use.clear()
+            self._weighted_ef = None
+
+    def _task_manager(self, n_total_tasks):
+        if self.task_manager is None:
+            return utils.ParallelTaskManager(n_total_tasks)
+        return self.task_manager(n_total_tasks)
+
+    def _estimate_sample(self, sample):
+        if self.reuse_extensive_form and len(self.exp_list) > 1:
+            return self._Q_opt_weighted(sample)
+        return self._Q_opt(bootlist=list(sample))
+
+    def _bootstrap_task(self, task):
+        idx, sample = task
+        objval, thetavals = self._estimate_sample(sample)
+        thetavals['samples'] = sample
+        return thetavals
+
+    def _leaveNout_task(self, task):
+        idx, sample = task
+        objval, thetavals = self._estimate_sample(sample)
+        lNo_s = list(set(range(len(self.exp_list))) - set(sample))
+        thetavals['lNo'] = np.sort(lNo_s)
+        return thetavals
+
+    def _objective_at_theta_task(self, thetavals):
+        obj, thetvals, worststatus = self._Q_at_theta(thetavals)
+        return obj, worststatus
+
     def _Q_opt(
         self,
         ThetaVals=None,
@@ -988,6 +1131,8 @@ class Estimator(object):
         if solver == "k_aug":
             raise RuntimeError("k_aug no longer supported.")
 
+        self._release_cached_models()
+
         # (Bootstrap scenarios will use indirection through the bootlist)
         if bootlist is None:
             scenario_numbers = list(range(len(self.exp_list)))
@@ -1163,6 +1308,104 @@ class Estimator(object):
         else:
             raise RuntimeError("Unknown solver in Q_Opt=" + solver)
 
+    def _create_weighted_ef(self):
+        """
+        Create the extensive form of all the experiments, in which the
+        objective of each scenario is multiplied by the mutable Param
+        scenario_weight.
+        """
+        scenario_numbers = list(range(len(self.exp_list)))
+        scen_names = ["Scenario{}".format(i) for i in scenario_numbers]
+
+        # The scenarios stay in this extensive form, so they are not taken
+        # from the model cache
+        outer_cb_data = dict()
+        outer_cb_data["callback"] = (
+            lambda experiment_number, cb_data: self._create_parmest_model(
+                experiment_number
+            )
+        )
+        outer_cb_data["cb_data"] = None
+        outer_cb_data["theta_names"] = self.estimator_theta_names
+
+        # The objective of each scenario (create_EF deactivates them)
+        scenario_objs = []
+
+        def scenario_creator(scenario_name, cb_data):
+            instance = _experiment_instance_creation_callback(
+                scenario_name, None, cb_data
+            )
+            scenario_objs.append(
+                next(instance.component_data_objects(pyo.Objective, active=True))
+            )
+            return instance
+
+        if use_mpisppy:
+            create_EF = sputils.create_EF
+        else:
+            create_EF = local_ef.create_EF
+        ef = create_EF(
+            scen_names,
+            scenario_creator,
+            EF_name="_Q_opt_weighted",
+            suppress_warnings=True,
+            scenario_creator_kwargs={"cb_data": outer_cb_data},
+        )
+
+        ef.scenario_weight = pyo.Param(
+            scenario_numbers, mutable=True, initialize=1 / len(scenario_numbers)
+        )
+        ef.EF_Obj.expr = sum(
+            ef.scenario_weight[i] * obj.expr
+            for i, obj in zip(scenario_numbers, scenario_objs)
+        )
+
+        solver = SolverFactory('appsi_ipopt')
+        if not solver.available(exception_flag=False):
+            solver = SolverFactory('ipopt')
+        if self.solver_options is not None:
+            for key in self.solver_options:
+                solver.options[key] = self.solver_options[key]
+
+        return ef, solver
+
+    def _Q_opt_weighted(self, sample):
+        """
+        Estimate theta for a sample of the experiments (a list of
+        experiment numbers, with repetition) by re-weighting the
+        scenarios of the extensive form of all the experiments.
+
+        Returns the objective function value and the theta values, like
+        _Q_opt(bootlist=sample).
+        """
+        if self._weighted_ef is not None:
+            ef, solver = self._weighted_ef
+        else:
+            ef, solver = self._create_weighted_ef()
+            if self._caching:
+                self._weighted_ef = ef, solver
+
+        counts = Counter(sample)
+        for i, weight in ef.scenario_weight.items():
+            weight.set_value(counts[i] / len(sample))
+
+        solve_result = solver.solve(ef, tee=self.tee)
+        assert_optimal_termination(solve_result)
+
+        if self.diagnostic_mode:
+            print(
+                '    Solver termination condition = ',
+                str(solve_result.solver.termination_condition),
+            )
+
+        theta_vals = {}
+        for nd_name, Var, sol_val in ef_nonants(ef):
+            # the scenarios are blocks, so strip the scenario name
+            var_name = Var.name[Var.name.find(".") + 1 :]
+            theta_vals[var_name] = sol_val
+
+        return pyo.value(ef.EF_Obj), pd.Series(theta_vals)
+
     def _cov_at_theta(self, method, solver, step):
         """
         Covariance matrix calculation using all scenarios in the data
@@ -1411,6 +1654,7 @@ class Estimator(object):
         """
 
         optimizer = pyo.SolverFactory('ipopt')
+        self._release_cached_models()
 
         if len(thetavals) > 0:
             dummy_cb = {
@@ -1789,14 +2033,11 @@ class Estimator(object):
 
         global_list = self._get_sample_list(samplesize, bootstrap_samples, replacement)
 
-        task_mgr = utils.ParallelTaskManager(bootstrap_samples)
+        task_mgr = self._task_manager(bootstrap_samples)
         local_list = task_mgr.global_to_local_data(global_list)
 
-        bootstrap_theta = list()
-        for idx, sample in local_list:
-            objval, thetavals = self._Q_opt(bootlist=list(sample))
-            thetavals['samples'] = sample
-            bootstrap_theta.append(thetavals)
+        with self._cached_models():
+            bootstrap_theta = task_mgr.map_local(self._bootstrap_task, local_list)
 
         global_bootstrap_theta = task_mgr.allgather_global_data(bootstrap_theta)
         bootstrap_theta = pd.DataFrame(global_bootstrap_theta)
@@ -1849,15 +2090,11 @@ class Estimator(object):
 
         global_list = self._get_sample_list(samplesize, lNo_samples, replacement=False)
 
-        task_mgr = utils.ParallelTaskManager(len(global_list))
+        task_mgr = self._task_manager(len(global_list))
         local_list = task_mgr.global_to_local_data(global_list)
 
-        lNo_theta = list()
-        for idx, sample in local_list:
-            objval, thetavals = self._Q_opt(bootlist=list(sample))
-            lNo_s = list(set(range(len(self.exp_list))) - set(sample))
-            thetavals['lNo'] = np.sort(lNo_s)
-            lNo_theta.append(thetavals)
+        with self._cached_models():
+            lNo_theta = task_mgr.map_local(self._leaveNout_task, local_list)
 
         global_bootstrap_theta = task_mgr.allgather_global_data(lNo_theta)
         lNo_theta = pd.DataFrame(global_bootstrap_theta)
@@ -2015,20 +2252,31 @@ class Estimator(object):
             all_thetas = theta_values.to_dict('records')
 
         if all_thetas:
-            task_mgr = utils.ParallelTaskManager(len(all_thetas))
+            task_mgr = self._task_manager(len(all_thetas))
             local_thetas = task_mgr.global_to_local_data(all_thetas)
         else:
             if initialize_parmest_model:
-                task_mgr = utils.ParallelTaskManager(
+                task_mgr = self._task_manager(
                     1
                 )  # initialization performed using just 1 set of theta values
         # walk over the mesh, return objective function
         all_obj = list()
         if len(all_thetas) > 0:
-            for Theta in local_thetas:
-                obj, thetvals, worststatus = self._Q_at_theta(
-                    Theta, initialize_parmest_model=initialize_parmest_model
-                )
+            if initialize_parmest_model:
+                # The initialized model has to end up on this Estimator,
+                # so this is done in this process
+                results = []
+                for Theta in local_thetas:
+                    obj, thetvals, worststatus = self._Q_at_theta(
+                        Theta, initialize_parmest_model=initialize_parmest_model
+                    )
+                    results.append((obj, worststatus))
+            else:
+                with self._cached_models():
+                    results = task_mgr.map_local(
+                        self._objective_at_theta_task, local_thetas
+                    )
+            for Theta, (obj, worststatus) in zip(local_thetas, results):
                 if worststatus != pyo.TerminationCondition.infeasible:
                     all_obj.append(list(Theta.values()) + [obj])
                 # DLW, Aug2018: should we also store the worst solver status?
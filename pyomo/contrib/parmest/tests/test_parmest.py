@@ -430,6 +430,28 @@ class TestRooneyBiegler(unittest.TestCase):
             seed=_RANDOM_SEED_FOR_TESTING,
         )
 
+    def test_bootstrap_reuse_extensive_form(self):
+        theta_est = self.pest.theta_est_bootstrap(
+            5, return_samples=True, seed=_RANDOM_SEED_FOR_TESTING
+        )
+
+        self.pest.reuse_extensive_form = True
+        theta_est_reuse = self.pest.theta_est_bootstrap(
+            5, return_samples=True, seed=_RANDOM_SEED_FOR_TESTING
+        )
+        self.assertIsNone(self.pest._weighted_ef)
+        for i in range(5):
+            self.assertEqual(
+                list(theta_est["samples"][i]), list(theta_est_reuse["samples"][i])
+            )
+        for name in ["asymptote", "rate_constant"]:
+            np.testing.assert_allclose(
+                theta_est[name], theta_est_reuse[name], rtol=1e-4
+            )
+
+        lNo_theta = self.pest.theta_est_leaveNout(1)
+        self.assertEqual(lNo_theta.shape, (6, 2))
+
     @unittest.skipIf(
         not graphics.imports_available, "parmest.graphics imports are unavailable"
     )
@@ -28,6 +28,10 @@ import pyomo.contrib.parmest.parmest as parmest
 from pyomo.opt import SolverFactory
 
 from pyomo.contrib.parmest.utils.model_utils import update_model_from_suffix
+from pyomo.contrib.parmest.utils.mpi_utils import (
+    LocalPoolTaskManager,
+    ParallelTaskManager,
+)
 from pyomo.contrib.doe.examples.reactor_example import (
     ReactorExperiment as FullReactorExperiment,
 )
@@ -204,5 +208,164 @@ class TestUtils(unittest.TestCase):
         update_model_from_suffix(m.empty_suffix, [])
 
 
+def _square(x):
+    return x * x
+
+
+@unittest.skipIf(
+    not parmest.parmest_available,
+    "Cannot test parmest: required dependencies are missing",
+)
+class TestLocalPoolTaskManager(unittest.TestCase):
+
+    def test_map_local_serial(self):
+        task_mgr = ParallelTaskManager(4)
+        local_data = task_mgr.global_to_local_data([1, 2, 3, 4])
+        self.assertEqual(task_mgr.map_local(_square, local_data), [1, 4, 9, 16])
+
+        # A single worker process runs the tasks in this process
+        task_mgr = LocalPoolTaskManager(4, processes=1)
+        local_data = task_mgr.global_to_local_data([1, 2, 3, 4])
+        self.assertEqual(task_mgr.map_local(lambda x: -x, local_data), [-1, -2, -3, -4])
+
+    @unittest.skipUnless(
+        'fork' in parmest.utils.mpi_utils.multiprocessing.get_all_start_methods(),
+        "The 'fork' start method is not available",
+    )
+    def test_map_local_fork(self):
+        task_mgr = LocalPoolTaskManager(5, processes=2, start_method='fork')
+        local_data = task_mgr.global_to_local_data(list(range(5)))
+        offset = 10
+        results = task_mgr.map_local(lambda x: x + offset, local_data)
+        self.assertEqual(results, [10, 11, 12, 13, 14])
+        self.assertEqual(task_mgr.allgather_global_data(results), results)
+        self.assertIsNone(parmest.utils.mpi_utils._worker_state.func)
+
+    def test_map_local_spawn(self):
+        task_mgr = LocalPoolTaskManager(3, processes=2, start_method='spawn')
+        local_data = task_mgr.global_to_local_data([2, 3, 4])
+        self.assertEqual(task_mgr.map_local(_square, local_data), [4, 9, 16])
+
+    def test_cached_models(self):
+        from pyomo.contrib.parmest.examples.rooney_biegler.rooney_biegler import (
+            RooneyBieglerExperiment,
+        )
+
+        data = pd.DataFrame(
+            data=[[1, 8.3], [2, 10.3], [3, 19.0]], columns=['hour', 'y']
+        )
+        exp_list = [RooneyBieglerExperiment(data.loc[i, :]) for i in data.index]
+        pest = parmest.Estimator(exp_list, obj_function='SSE')
+        self.assertIsNone(pest._model_cache)
+        self.assertIsNot(
+            pest._instance_creation_callback(0), pest._instance_creation_callback(0)
+        )
+        # Without a task_manager, the models are not cached
+        with pest._cached_models():
+            self.assertIsNone(pest._model_cache)
+            self.assertIsNot(
+                pest._instance_creation_callback(0), pest._instance_creation_callback(0)
+            )
+
+        pest = parmest.Estimator(
+            exp_list, obj_function='SSE', task_manager=LocalPoolTaskManager
+        )
+        cb_data = {
+            "callback": pest._instance_creation_callback,
+            "ThetaVals": {"asymptote": 15},
+            "theta_names": pest.estimator_theta_names,
+            "cb_data": None,
+        }
+        with pest._cached_models():
+            m1 = parmest._experiment_instance_creation_callback(
+                "Scenario1", None, cb_data
+            )
+            with pest._cached_models():
+                m2 = pest._instance_creation_callback(1)
+            # An experiment that is used twice needs two models
+            self.assertIsNot(m1, m2)
+            pest._instance_creation_callback(2)
+            self.assertEqual(list(pest._model_cache), [1, 2])
+            self.assertEqual(len(pest._model_cache[1]), 2)
+            self.assertTrue(m1.asymptote.fixed)
+            rate_constant = m1.rate_constant.value
+
+            # Use m1 in an extensive form
+            ef = pyo.ConcreteModel()
+            ef.Scenario1 = m1
+            m1.Total_Cost_Objective.deactivate()
+            m1._mpisppy_probability = 1
+            m1.rate_constant.set_value(7)
+
+            # Once released, the cached models are reset and reused
+            pest._release_cached_models()
+            cb_data["ThetaVals"] = {"asymptote": 20}
+            self.assertIs(
+                parmest._experiment_instance_creation_callback(
+                    "Scenario1", None, cb_data
+                ),
+                m1,
+            )
+            self.assertIsNone(m1.parent_block())
+            self.assertTrue(m1.Total_Cost_Objective.active)
+            self.assertFalse(hasattr(m1, '_mpisppy_probability'))
+            self.assertEqual(m1.rate_constant.value, rate_constant)
+            self.assertTrue(m1.asymptote.fixed)
+            self.assertEqual(m1.asymptote.value, 20)
+            self.assertFalse(m1.rate_constant.fixed)
+
+            self.assertIs(pest._instance_creation_callback(1), m2)
+            self.assertFalse(m2.asymptote.fixed)
+            self.assertEqual(m2.hour, 2)
+            self.assertEqual(len(pest._model_cache[1]), 2)
+        self.assertIsNone(pest._model_cache)
+
+    def test_task_manager(self):
+        from pyomo.contrib.parmest.examples.rooney_biegler.rooney_biegler import (
+            RooneyBieglerExperiment,
+        )
+
+        data = pd.DataFrame(data=[[1, 8.3], [2, 10.3]], columns=['hour', 'y'])
+        exp_list = [RooneyBieglerExperiment(data.loc[i, :]) for i in data.index]
+        pest = parmest.Estimator(exp_list, obj_function='SSE')
+        self.assertIs(type(pest._task_manager(2)), ParallelTaskManager)
+
+        pest = parmest.Estimator(
+            exp_list, obj_function='SSE', task_manager=LocalPoolTaskManager
+        )
+        task_mgr = pest._task_manager(2)
+        self.assertIsInstance(task_mgr, LocalPoolTaskManager)
+        self.assertEqual(task_mgr.global_to_local_data([1, 2]), [1, 2])
+
+    def test_weighted_extensive_form(self):
+        from pyomo.contrib.parmest.examples.rooney_biegler.rooney_biegler import (
+            RooneyBieglerExperiment,
+        )
+
+        data = pd.DataFrame(
+            data=[[1, 8.3], [2, 10.3], [3, 19.0]], columns=['hour', 'y']
+        )
+        exp_list = [RooneyBieglerExperiment(data.loc[i, :]) for i in data.index]
+        pest = parmest.Estimator(
+            exp_list, obj_function='SSE', reuse_extensive_form=True
+        )
+        ef, solver = pest._create_weighted_ef()
+        self.assertEqual(
+            [ef.find_component(f'Scenario{i}').hour for i in range(3)], [1, 2, 3]
+        )
+        for i in range(3):
+            self.assertAlmostEqual(pyo.value(ef.scenario_weight[i]), 1 / 3)
+
+        # The bootstrap sample [0, 0, 2]
+        ef.scenario_weight[0] = 2 / 3
+        ef.scenario_weight[1] = 0
+        ef.scenario_weight[2] = 1 / 3
+        for i, y in enumerate([8.0, 11.0, 17.0]):
+            ef.find_component(f'Scenario{i}').y[i + 1].set_value(y)
+        self.assertAlmostEqual(
+            pyo.value(ef.EF_Obj), (2 * 0.3**2 + (19.0 - 17.0) ** 2) / 3
+        )
+
+
 if __name__ == "__main__":
     unittest.main()
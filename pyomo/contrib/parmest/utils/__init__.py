@@ -20,6 +20,10 @@ from pyomo.contrib.parmest.utils.ipopt_solver_wrapper import ipopt_solve_with_st
 
 from pyomo.contrib.parmest.utils.model_utils import convert_params_to_vars
 
-from pyomo.contrib.parmest.utils.mpi_utils import MPIInterface, ParallelTaskManager
+from pyomo.contrib.parmest.utils.mpi_utils import (
+    MPIInterface,
+    ParallelTaskManager,
+    LocalPoolTaskManager,
+)
 
 from pyomo.contrib.parmest.utils.scenario_tree import build_vardatalist, ScenarioNode
@@ -11,6 +11,9 @@
 
 from collections import OrderedDict
 import importlib
+import threading
+
+from pyomo.common.dependencies import multiprocessing
 
 """
 This module is a collection of classes that provide a
@@ -130,6 +133,10 @@ class ParallelTaskManager:
             'Unknown type passed to global_to_local_data. Expected list or OrderedDict.'
         )
 
+    def map_local(self, func, local_data):
+        """Return [func(d) for d in local_data]"""
+        return [func(d) for d in local_data]
+
     def allgather_global_data(self, local_data):
         assert len(local_data) == len(self._local_map)
         if not self._mpi_interface.have_mpi:
@@ -161,3 +168,74 @@ class ParallelTaskManager:
         for i in range(self._mpi_interface.size):
             global_data.extend(global_data_list_of_lists[i])
         return global_data
+
+
+# The function called by the worker processes of a LocalPoolTaskManager
+_worker_state = threading.local()
+_worker_state.func = None
+
+
+class LocalPoolTaskManager(ParallelTaskManager):
+    """Task manager that runs the local tasks on a local process pool
+
+    The tasks are distributed over the MPI processes (if any) like the
+    ParallelTaskManager, but map_local calls the function on a pool of
+    worker processes of this machine. Each worker keeps its copy of the
+    function (and of the object it is bound to) for all the tasks it
+    runs, so that, e.g., models cached by that object are reused.
+
+    Parameters
+    ----------
+    n_total_tasks: int
+        The total number of tasks
+    mpi_interface: MPIInterface, optional
+    processes: int, optional
+        The number of worker processes. Default is os.cpu_count().
+    start_method: str, optional
+        The multiprocessing start method. Default is 'fork' where it is
+        available and 'spawn' otherwise. With 'spawn' and 'forkserver',
+        the function must be picklable.
+    """
+
+    def __init__(
+        self, n_total_tasks, mpi_interface=None, processes=None, start_method=None
+    ):
+        super().__init__(n_total_tasks, mpi_interface=mpi_interface)
+        self._processes = processes
+        if start_method is None:
+            if 'fork' in multiprocessing.get_all_start_methods():
+                start_method = 'fork'
+            else:
+                start_method = 'spawn'
+        self._start_method = start_method
+
+    def map_local(self, func, local_data):
+        """Return [func(d) for d in local_data], computed on the pool"""
+        local_data = list(local_data)
+        processes = self._processes or multiprocessing.cpu_count()
+        processes = min(processes, len(local_data))
+        if processes <= 1:
+            return super().map_local(func, local_data)
+
+        context = multiprocessing.get_context(self._start_method)
+        if self._start_method == 'fork':
+            # The workers inherit the function from this process
+            _worker_state.func = func
+            pool = context.Pool(processes=processes)
+        else:
+            pool = context.Pool(
+                processes=processes, initializer=_setup_worker, initargs=(func,)
+            )
+        try:
+            with pool:
+                return pool.map(_call_in_worker, local_data, chunksize=1)
+        finally:
+            _worker_state.func = None
+
+
+def _setup_worker(func):
+    _worker_state.func = func
+
+
+def _call_in_worker(data):
+    return _worker_state.func(data)
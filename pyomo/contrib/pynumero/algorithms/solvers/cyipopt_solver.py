@@ -62,9 +62,12 @@ relocated_module_attribute(
     "6.6.0",
 )
 
+from pyomo.common.collections import ComponentMap, ComponentSet
 from pyomo.common.config import ConfigBlock, ConfigValue
 from pyomo.common.timing import TicTocTimer
-from pyomo.core.base import Block, Objective, minimize
+from pyomo.core.base import Block, Objective, Var, minimize
+from pyomo.core.expr.numvalue import value
+from pyomo.core.expr.visitor import identify_mutable_parameters
 from pyomo.opt import SolverStatus, SolverResults, TerminationCondition
 from pyomo.opt.results.solution import Solution
 
@@ -320,8 +323,22 @@ class PyomoCyIpoptSolver(object):
                 "PyomoCyIpoptSolver.solve(model): model must be a Pyomo Block"
             )
 
+        nlp = self._create_nlp(model)
+        problem = cyipopt_interface.CyIpoptNLP(
+            nlp,
+            intermediate_callback=config.intermediate_callback,
+            halt_on_evaluation_error=config.halt_on_evaluation_error,
+        )
+        results = self._solve_problem(model, nlp, problem, problem.x_init(), config)
+
+        if config.return_nlp:
+            return results, nlp
+
+        return results
+
+    def _create_nlp(self, model):
         # If this is a Pyomo model / block, then we need to create
-        # the appropriate PyomoNLP, then wrap it in a CyIpoptNLP
+        # the appropriate PyomoNLP (which will be wrapped in a CyIpoptNLP)
         grey_box_blocks = list(
             model.component_data_objects(egb.ExternalGreyBoxBlock, active=True)
         )
@@ -345,12 +362,9 @@ class PyomoCyIpoptSolver(object):
             # it from the model ASAP
             if n_obj == 0:
                 model.del_component(objective)
+        return nlp
 
-        problem = cyipopt_interface.CyIpoptNLP(
-            nlp,
-            intermediate_callback=config.intermediate_callback,
-            halt_on_evaluation_error=config.halt_on_evaluation_error,
-        )
+    def _solve_problem(self, model, nlp, problem, x0, config):
         ng = len(problem.g_lb())
         nx = len(problem.x_lb())
         cyipopt_solver = problem
@@ -384,7 +398,7 @@ class PyomoCyIpoptSolver(object):
         timer = TicTocTimer()
         try:
             with capture_output(sys.stdout if config.tee else None, capture_fd=True):
-                x, info = cyipopt_solver.solve(problem.x_init())
+                x, info = cyipopt_solver.solve(x0)
             solverStatus = SolverStatus.ok
         except:
             msg = "Exception encountered during cyipopt solve:"
@@ -446,9 +460,6 @@ class PyomoCyIpoptSolver(object):
 
         problem.close()
 
-        if config.return_nlp:
-            return results, nlp
-
         return results
 
     #
@@ -459,3 +470,183 @@ class PyomoCyIpoptSolver(object):
 
     def __exit__(self, t, v, traceback):
         pass
+
+
+class PersistentPyomoCyIpoptSolver(PyomoCyIpoptSolver):
+    """A CyIpopt interface that reuses the NLP between solves of a model
+
+    The first solve of a model builds the
+    :class:`~pyomo.contrib.pynumero.interfaces.pyomo_nlp.PyomoNLP`
+    (writing the model and loading it into the ASL).  Subsequent
+    solves of the same model reuse the NLP, and only update:
+
+    - the initial point (from the current variable values),
+    - the variable bounds,
+    - the values of fixed variables, and
+    - the constraint bounds that depend on mutable Params.
+
+    Fixed variables are included in the NLP and passed to Ipopt with
+    equal lower and upper bounds (see the Ipopt
+    ``fixed_variable_treatment`` option), so fixed variables are the
+    most efficient way to represent data that changes between
+    solves.  Mutable Params that only appear in the bounds of the
+    active constraints (e.g., ``m.x + m.y <= m.p``) are updated in the
+    existing NLP.  The ASL stores all other mutable Params as
+    constants, so changing the value of a mutable Param that appears in
+    the body of an active constraint or in the objective rebuilds the
+    NLP.  Structural changes to the model (e.g., adding, removing,
+    activating, or deactivating components) are not detected: call
+    :meth:`set_instance` after modifying the model structure.
+
+    """
+
+    def __init__(self, **kwds):
+        super().__init__(**kwds)
+        self._model = None
+        self._nlp = None
+        self._variables = None
+        self._indexed_vars = None
+        self._other_vars = None
+        self._params = None
+        self._param_values = None
+        self._bound_cons = None
+
+    def set_instance(self, model):
+        """Build (or rebuild) the NLP for the specified model"""
+        if not isinstance(model, Block):
+            raise ValueError(
+                "PersistentPyomoCyIpoptSolver.set_instance(model): "
+                "model must be a Pyomo Block"
+            )
+        # Temporarily unfix all fixed variables so that they are
+        # included in the NLP.
+        fixed_vars = [
+            v for v in model.component_data_objects(Var, descend_into=True) if v.fixed
+        ]
+        for v in fixed_vars:
+            v.unfix()
+        try:
+            nlp = self._create_nlp(model)
+        finally:
+            for v in fixed_vars:
+                v.fix()
+        self._set_model(model)
+        self._nlp = nlp
+        self._variables = variables = nlp.get_pyomo_variables()
+
+        # Group the variables by IndexedVar so that their values can be
+        # collected with get_values_array()
+        var_index = ComponentMap((v, i) for i, v in enumerate(variables))
+        self._indexed_vars = []
+        others = []
+        for comp in ComponentSet(v.parent_component() for v in variables):
+            if comp.is_indexed() and all(v in var_index for v in comp.values()):
+                self._indexed_vars.append(
+                    (comp, np.array([var_index[v] for v in comp.values()], dtype=int))
+                )
+            else:
+                others.extend(v for v in comp.values() if v in var_index)
+        self._other_vars = (others, np.array([var_index[v] for v in others], dtype=int))
+
+        # Params in the constraint bodies and the objective are
+        # constants in the ASL: changing them rebuilds the NLP.  Params
+        # that only appear in the constraint bounds are updated through
+        # the NLP constraint bounds.
+        constraints = nlp.get_pyomo_constraints()
+        params = ComponentSet()
+        for con in constraints:
+            params.update(identify_mutable_parameters(con.body))
+        for comp in model.component_data_objects(Objective, active=True):
+            params.update(identify_mutable_parameters(comp.expr))
+        self._bound_cons = []
+        for i, con in enumerate(constraints):
+            bound_params = ComponentSet()
+            for bound in (con.lower, con.upper):
+                if bound is not None:
+                    bound_params.update(identify_mutable_parameters(bound))
+            if any(p not in params for p in bound_params):
+                self._bound_cons.append((i, con, value(con.lower), value(con.upper)))
+        self._params = list(params)
+        self._param_values = [p.value for p in self._params]
+
+    def _params_changed(self):
+        return any(p.value != val for p, val in zip(self._params, self._param_values))
+
+    def _get_primals_data(self):
+        nlp = self._nlp
+        variables = self._variables
+        n = len(variables)
+        vals = np.empty(n)
+        for comp, idx in self._indexed_vars:
+            vals[idx] = comp.get_values_array()
+        others, idx = self._other_vars
+        if others:
+            vals[idx] = np.fromiter(
+                (np.nan if v.value is None else v.value for v in others),
+                dtype=float,
+                count=len(others),
+            )
+        fixed = np.fromiter((v.fixed for v in variables), dtype=bool, count=n)
+        bounds = np.array([v.bounds for v in variables], dtype=float).reshape(n, 2)
+        has_value = ~np.isnan(vals)
+        missing = fixed & ~has_value
+        if missing.any():
+            raise ValueError(
+                "Variable '%s' is fixed but does not have a value"
+                % (variables[int(np.argmax(missing))].name,)
+            )
+        lb, ub = bounds[:, 0], bounds[:, 1]
+        lb = np.where(fixed, vals, np.where(np.isnan(lb), -np.inf, lb))
+        ub = np.where(fixed, vals, np.where(np.isnan(ub), np.inf, ub))
+        x0 = np.where(has_value, vals, nlp.init_primals())
+        return lb, ub, x0
+
+    def _get_constraint_bounds(self):
+        # Returns None if the NLP constraint bounds are current, and
+        # False if they cannot be updated (and the NLP must be rebuilt)
+        if not self._bound_cons:
+            return None
+        nlp = self._nlp
+        g_lb = nlp.constraints_lb().copy()
+        g_ub = nlp.constraints_ub().copy()
+        for i, con, lower, upper in self._bound_cons:
+            # The NLP bounds include the constant part of the body, so
+            # shift them by the change in the constraint bounds
+            for g, old, new in ((g_lb, lower, con.lower), (g_ub, upper, con.upper)):
+                if new is None:
+                    continue
+                new = value(new)
+                if new == old:
+                    continue
+                if old is None or not np.isfinite(old) or not np.isfinite(new):
+                    return False
+                g[i] += new - old
+        return g_lb, g_ub
+
+    def solve(self, model, **kwds):
+        config = self.config(kwds, preserve_implicit=True)
+
+        if model is not self._model or self._params_changed():
+            self.set_instance(model)
+        g_bounds = self._get_constraint_bounds()
+        if g_bounds is False:
+            self.set_instance(model)
+            g_bounds = None
+        g_lb, g_ub = g_bounds or (None, None)
+        nlp = self._nlp
+        lb, ub, x0 = self._get_primals_data()
+        problem = cyipopt_interface.CyIpoptNLP(
+            nlp,
+            intermediate_callback=config.intermediate_callback,
+            halt_on_evaluation_error=config.halt_on_evaluation_error,
+            primals_lb=lb,
+            primals_ub=ub,
+            constraints_lb=g_lb,
+            constraints_ub=g_ub,
+        )
+        results = self._solve_problem(model, nlp, problem, x0, config)
+
+        if config.return_nlp:
+            return results, nlp
+
+        return results
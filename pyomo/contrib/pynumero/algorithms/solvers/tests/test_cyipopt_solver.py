@@ -416,3 +416,72 @@ class TestCyIpoptSolver(unittest.TestCase):
         x, y = iterate_data[-1]
         self.assertTrue(np.allclose(x_sol, x))
         self.assertTrue(np.allclose(y_sol, y))
+
+
+@unittest.skipUnless(cyipopt_available, "cyipopt is not available")
+class TestPersistentCyIpoptSolver(unittest.TestCase):
+    def test_resolve(self):
+        m = create_model2()
+        m.p = pyo.Param(initialize=5, mutable=True)
+        m.d.set_value(m.x[1] + m.x[2] <= m.p)
+        solver = pyo.SolverFactory("cyipopt_persistent")
+
+        res = solver.solve(m)
+        self.assertEqual(res.solver.termination_condition, "optimal")
+        self.assertAlmostEqual(m.x[1].value, 3.0, places=5)
+        self.assertAlmostEqual(m.x[2].value, 2.0, places=5)
+        nlp = solver._nlp
+
+        # Updated bounds do not rebuild the NLP
+        m.x[1].setub(2.0)
+        solver.solve(m)
+        self.assertIs(solver._nlp, nlp)
+        self.assertAlmostEqual(m.x[1].value, 2.0, places=5)
+        self.assertAlmostEqual(m.x[2].value, 2.0, places=5)
+
+        # ...nor do fixed variables
+        m.x[2].fix(1.0)
+        solver.solve(m)
+        self.assertIs(solver._nlp, nlp)
+        self.assertAlmostEqual(m.x[1].value, 2.0, places=5)
+        self.assertEqual(m.x[2].value, 1.0)
+        self.assertTrue(m.x[2].fixed)
+
+        m.x[2].unfix()
+        m.x[1].setub(3.0)
+        solver.solve(m)
+        self.assertIs(solver._nlp, nlp)
+        self.assertAlmostEqual(m.x[1].value, 3.0, places=5)
+        self.assertAlmostEqual(m.x[2].value, 2.0, places=5)
+
+        # Mutable Params in the constraint bounds are updated in place
+        m.p = 4
+        solver.solve(m)
+        self.assertIs(solver._nlp, nlp)
+        self.assertAlmostEqual(m.x[1].value + m.x[2].value, 4.0, places=5)
+
+        # ...but changing a mutable Param in a constraint body rebuilds
+        # the NLP
+        m.q = pyo.Param(initialize=1, mutable=True)
+        m.d.set_value(m.q * m.x[1] + m.x[2] <= m.p)
+        solver.set_instance(m)
+        nlp = solver._nlp
+        m.q = 2
+        solver.solve(m)
+        self.assertIsNot(solver._nlp, nlp)
+        self.assertAlmostEqual(2 * m.x[1].value + m.x[2].value, 4.0, places=5)
+
+        # As does solving a different model
+        nlp = solver._nlp
+        solver.solve(create_model2())
+        self.assertIsNot(solver._nlp, nlp)
+
+    def test_fixed_var_without_value(self):
+        m = create_model2()
+        solver = pyo.SolverFactory("cyipopt_persistent")
+        solver.solve(m)
+        m.x[2].fix(None)
+        with self.assertRaisesRegex(
+            ValueError, r"Variable 'x\[2\]' is fixed but does not have a value"
+        ):
+            solver.solve(m)
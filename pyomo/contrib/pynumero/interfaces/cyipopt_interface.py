@@ -254,15 +254,33 @@ class CyIpoptProblemInterface(cyipopt_Problem, metaclass=abc.ABCMeta):
 
 
 class CyIpoptNLP(CyIpoptProblemInterface):
-    def __init__(self, nlp, intermediate_callback=None, halt_on_evaluation_error=None):
+    def __init__(
+        self,
+        nlp,
+        intermediate_callback=None,
+        halt_on_evaluation_error=None,
+        primals_lb=None,
+        primals_ub=None,
+        constraints_lb=None,
+        constraints_ub=None,
+    ):
         """This class provides a CyIpoptProblemInterface for use
         with the CyIpoptSolver class that can take in an NLP
         as long as it provides vectors as numpy ndarrays and
         matrices as scipy.sparse.coo_matrix objects. This class
         provides the interface between AmplNLP or PyomoNLP objects
         and the CyIpoptSolver
+
+        The variable bounds reported by the NLP may be overridden with
+        ``primals_lb`` and ``primals_ub`` (e.g., to fix variables by
+        setting equal lower and upper bounds), and the constraint bounds
+        with ``constraints_lb`` and ``constraints_ub``.
         """
         self._nlp = nlp
+        self._primals_lb = primals_lb
+        self._primals_ub = primals_ub
+        self._constraints_lb = constraints_lb
+        self._constraints_ub = constraints_ub
         self._intermediate_callback = intermediate_callback
 
         cyipopt_has_eval_error = cyipopt_available and hasattr(
@@ -372,15 +390,23 @@ class CyIpoptNLP(CyIpoptProblemInterface):
         return self._nlp.init_primals()
 
     def x_lb(self):
+        if self._primals_lb is not None:
+            return self._primals_lb
         return self._nlp.primals_lb()
 
     def x_ub(self):
+        if self._primals_ub is not None:
+            return self._primals_ub
         return self._nlp.primals_ub()
 
     def g_lb(self):
+        if self._constraints_lb is not None:
+            return self._constraints_lb
         return self._nlp.constraints_lb()
 
     def g_ub(self):
+        if self._constraints_ub is not None:
+            return self._constraints_ub
         return self._nlp.constraints_ub()
 
     def scaling_factors(self):
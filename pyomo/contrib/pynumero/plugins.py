@@ -12,7 +12,10 @@
 from pyomo.common.extensions import ExtensionBuilderFactory
 from pyomo.opt import SolverFactory
 from .build import PyNumeroBuilder
-from .algorithms.solvers.cyipopt_solver import PyomoCyIpoptSolver
+from .algorithms.solvers.cyipopt_solver import (
+    PyomoCyIpoptSolver,
+    PersistentPyomoCyIpoptSolver,
+)
 from .algorithms.solvers.scipy_solvers import (
     PyomoFsolveSolver,
     PyomoRootSolver,
@@ -26,6 +29,10 @@ def load():
     SolverFactory.register(
         'cyipopt', doc='Cyipopt: direct python bindings to the Ipopt NLP solver'
     )(PyomoCyIpoptSolver)
+    SolverFactory.register(
+        'cyipopt_persistent',
+        doc='Cyipopt: persistent in-memory interface to the Ipopt NLP solver',
+    )(PersistentPyomoCyIpoptSolver)
     SolverFactory.register(
         "scipy.fsolve",
         doc=("fsolve: A SciPy wrapper around MINPACK's hybrd and hybrj algorithms"),
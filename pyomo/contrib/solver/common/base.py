@@ -10,6 +10,8 @@
 #  ___________________________________________________________________________
 
 from typing import Sequence, Dict, Optional, Mapping, List, Tuple
+import asyncio
+import functools
 import os
 
 from pyomo.core.base.constraint import ConstraintData
@@ -86,6 +88,22 @@ class SolverBase:
     - :class:`~pyomo.contrib.solver.common.config.PersistentSolverConfig`
     - :class:`~pyomo.contrib.solver.common.config.PersistentBranchAndBoundConfig`
 
+    **Thread Safety**
+
+    Non-persistent solver interfaces (e.g., ``ipopt``) keep all the
+    state of a solve local to that call, so a single solver object may
+    be used to solve distinct models concurrently from multiple
+    threads.  Persistent interfaces (and the legacy wrappers) store the
+    model and options on the solver object and should not be shared
+    between threads: create one solver object per thread.  Temporary
+    files are managed by a separate
+    :data:`~pyomo.common.tempfiles.TempfileManager` for each thread.
+    As the variable "stale" flag is shared by all threads by default,
+    applications that solve in multiple threads should call
+    :meth:`StaleFlagManager.set_thread_local()
+    <pyomo.core.staleflag._StaleFlagManager.set_thread_local>` so
+    that each thread tracks variable staleness independently.
+
     """
 
     CONFIG = SolverConfig()
@@ -138,6 +156,32 @@ class SolverBase:
             f"Derived class {self.__class__.__name__} failed to implement required method 'solve'."
         )
 
+    async def solve_async(self, model: BlockData, **kwargs) -> Results:
+        """Solve a Pyomo model without blocking the running event loop.
+
+        The default implementation runs :py:meth:`solve` in the event
+        loop's default executor.  Derived classes that execute the
+        solver in a subprocess should override this method to run the
+        subprocess asynchronously.
+
+        Parameters
+        ----------
+        model: BlockData
+            The Pyomo model to be solved
+        **kwargs
+            Additional keyword arguments (see :py:meth:`solve`)
+
+        Returns
+        -------
+        results: :class:`Results<pyomo.contrib.solver.common.results.Results>`
+            A results object
+
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            None, functools.partial(self.solve, model, **kwargs)
+        )
+
     def available(self) -> Availability:
         """Test if the solver is available on this system.
 
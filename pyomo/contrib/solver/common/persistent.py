@@ -58,6 +58,9 @@ class PersistentSolverUtils(abc.ABC):
         )  # var_id: [dict[constraints, None], dict[sos constraints, None], None or objective]
         self._vars_referenced_by_con = {}
         self._vars_referenced_by_obj = []
+        # (var ids, vars) referenced by the constraints / objective; see
+        # _get_referenced_vars()
+        self._referenced_vars_cache = None
         self._expr_types = None
         self._treat_fixed_vars_as_params = treat_fixed_vars_as_params
         self._active_config = self.config
@@ -78,6 +81,7 @@ class PersistentSolverUtils(abc.ABC):
         pass
 
     def add_variables(self, variables: List[VarData]):
+        self._referenced_vars_cache = None
         for v in variables:
             if id(v) in self._referenced_variables:
                 raise ValueError(f'Variable {v.name} has already been added')
@@ -113,6 +117,27 @@ class PersistentSolverUtils(abc.ABC):
                 new_vars[v_id] = v
         self.add_variables(list(new_vars.values()))
 
+    def _get_referenced_vars(self):
+        """Return the ids and the variables used by the active
+        constraints, SOS constraints, or the objective
+
+        The (parallel) lists are cached until the constraints,
+        variables, or objective change, so that solution loading does
+        not need to re-scan all the variables.
+
+        """
+        if self._referenced_vars_cache is None:
+            var_ids = [
+                v_id
+                for v_id, (using_cons, using_sos, using_obj) in (
+                    self._referenced_variables.items()
+                )
+                if using_cons or using_sos or (using_obj is not None)
+            ]
+            variables = [self._vars[v_id][0] for v_id in var_ids]
+            self._referenced_vars_cache = (var_ids, variables)
+        return self._referenced_vars_cache
+
     def _check_to_remove_vars(self, variables: List[VarData]):
         vars_to_remove = {}
         for v in variables:
@@ -123,6 +148,7 @@ class PersistentSolverUtils(abc.ABC):
         self.remove_variables(list(vars_to_remove.values()))
 
     def add_constraints(self, cons: List[ConstraintData]):
+        self._referenced_vars_cache = None
         all_fixed_vars = {}
         for con in cons:
             if con in self._named_expressions:
@@ -150,6 +176,7 @@ class PersistentSolverUtils(abc.ABC):
         pass
 
     def add_sos_constraints(self, cons: List[SOSConstraintData]):
+        self._referenced_vars_cache = None
         for con in cons:
             if con in self._vars_referenced_by_con:
                 raise ValueError(f'Constraint {con.name} has already been added')
@@ -167,6 +194,7 @@ class PersistentSolverUtils(abc.ABC):
         pass
 
     def set_objective(self, obj: ObjectiveData):
+        self._referenced_vars_cache = None
         if self._objective is not None:
             for v in self._vars_referenced_by_obj:
                 self._referenced_variables[id(v)][2] = None
@@ -227,6 +255,7 @@ class PersistentSolverUtils(abc.ABC):
         pass
 
     def remove_constraints(self, cons: List[ConstraintData]):
+        self._referenced_vars_cache = None
         self._remove_constraints(cons)
         for con in cons:
             if con not in self._named_expressions:
@@ -246,6 +275,7 @@ class PersistentSolverUtils(abc.ABC):
         pass
 
     def remove_sos_constraints(self, cons: List[SOSConstraintData]):
+        self._referenced_vars_cache = None
         self._remove_sos_constraints(cons)
         for con in cons:
             if con not in self._vars_referenced_by_con:
@@ -264,6 +294,7 @@ class PersistentSolverUtils(abc.ABC):
         pass
 
     def remove_variables(self, variables: List[VarData]):
+        self._referenced_vars_cache = None
         self._remove_variables(variables)
         for v in variables:
             v_id = id(v)
@@ -11,6 +11,7 @@
 
 from typing import Sequence, Dict, Optional, Mapping, NoReturn
 
+from pyomo.common.dependencies import numpy as np
 from pyomo.core.base.constraint import ConstraintData
 from pyomo.core.base.var import VarData
 from pyomo.core.staleflag import StaleFlagManager
@@ -60,6 +61,25 @@ class SolutionLoaderBase:
             f"Derived class {self.__class__.__name__} failed to implement required method 'get_primals'."
         )
 
+    def get_primals_array(self, vars_to_load: Sequence[VarData]) -> 'np.ndarray':
+        """
+        Returns the solution values of the specified variables as a NumPy array.
+
+        Parameters
+        ----------
+        vars_to_load: list
+            The variables whose solution values should be retrieved.
+
+        Returns
+        -------
+        primals: numpy.ndarray
+            The solution values, in the same order as vars_to_load
+        """
+        primals = self.get_primals(vars_to_load=vars_to_load)
+        return np.fromiter(
+            (primals[v] for v in vars_to_load), dtype=float, count=len(vars_to_load)
+        )
+
     def get_duals(
         self, cons_to_load: Optional[Sequence[ConstraintData]] = None
     ) -> Dict[ConstraintData, float]:
@@ -114,10 +134,18 @@ class PersistentSolutionLoader(SolutionLoaderBase):
         if not self._valid:
             raise RuntimeError('The results in the solver are no longer valid.')
 
+    def load_vars(self, vars_to_load=None):
+        self._assert_solution_still_valid()
+        self._solver._load_vars(vars_to_load=vars_to_load)
+
     def get_primals(self, vars_to_load=None):
         self._assert_solution_still_valid()
         return self._solver._get_primals(vars_to_load=vars_to_load)
 
+    def get_primals_array(self, vars_to_load):
+        self._assert_solution_still_valid()
+        return self._solver._get_primals_array(vars_to_load=vars_to_load)
+
     def get_duals(
         self, cons_to_load: Optional[Sequence[ConstraintData]] = None
     ) -> Dict[ConstraintData, float]:
@@ -9,7 +9,14 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import asyncio
+import codecs
+import io
+import locale
+import subprocess
+
 from pyomo.common.errors import PyomoException
+from pyomo.opt.solver.log_parser import LogParser
 from pyomo.core.expr.visitor import ExpressionValueVisitor, nonpyomo_leaf_types
 import pyomo.core.expr as EXPR
 from pyomo.core.base.objective import Objective
@@ -120,3 +127,75 @@ def collect_vars_and_named_exprs(expr):
         list(_visitor.fixed_vars.values()),
         list(_visitor._external_functions.values()),
     )
+
+
+async def run_subprocess_async(cmd, ostreams, timeout=None, env=None):
+    """Run a command without blocking the event loop
+
+    The command output (stdout and stderr) is decoded and written to
+    each stream in ``ostreams`` as it is produced (analogous to running
+    the command through a :class:`~pyomo.common.tee.TeeStream`).  If
+    the command does not complete within ``timeout`` seconds, or the
+    awaiting task is cancelled, the process is killed.  Any
+    :class:`~pyomo.opt.solver.log_parser.LogParser` in ``ostreams`` is
+    attached to the process (so that its callback can stop the command).
+
+    Parameters
+    ----------
+    cmd: List[str]
+        The command to execute
+    ostreams: List[io.TextIOBase]
+        The streams to write the command output to
+    timeout: float
+        Seconds to wait for the command to complete (``None`` waits
+        indefinitely)
+    env: dict
+        The environment for the subprocess
+
+    Returns
+    -------
+    int
+        The command return code
+
+    Raises
+    ------
+    subprocess.TimeoutExpired
+        If the command did not complete within ``timeout`` seconds
+
+    """
+    process = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        env=env,
+    )
+    for stream in ostreams:
+        if isinstance(stream, LogParser):
+            stream.attach(process)
+    # Decode the output the same way as subprocess.run(...,
+    # universal_newlines=True)
+    decoder = io.IncrementalNewlineDecoder(
+        codecs.getincrementaldecoder(locale.getpreferredencoding(False))(),
+        translate=True,
+    )
+
+    async def _tee():
+        while True:
+            data = await process.stdout.read(io.DEFAULT_BUFFER_SIZE)
+            text = decoder.decode(data, final=not data)
+            if text:
+                for stream in ostreams:
+                    stream.write(text)
+            if not data:
+                break
+
+    try:
+        await asyncio.wait_for(asyncio.gather(_tee(), process.wait()), timeout)
+    except asyncio.TimeoutError:
+        raise subprocess.TimeoutExpired(cmd, timeout) from None
+    finally:
+        if process.returncode is None:
+            process.kill()
+            await process.wait()
+    return process.returncode
@@ -16,7 +16,12 @@ from typing import List, Optional
 from collections.abc import Iterable
 
 from pyomo.common.collections import ComponentSet, ComponentMap, OrderedSet
-from pyomo.common.dependencies import attempt_import
+from pyomo.common.dependencies import (
+    attempt_import,
+    numpy as np,
+    scipy,
+    scipy_available,
+)
 from pyomo.common.errors import ApplicationError
 from pyomo.common.tee import capture_output, TeeStream
 from pyomo.common.timing import HierarchicalTimer
@@ -108,14 +113,38 @@ class GurobiSolutionLoader(PersistentSolutionLoader):
             vars_to_load=vars_to_load, solution_number=solution_number
         )
 
+    def get_primals_array(self, vars_to_load, solution_number=0):
+        self._assert_solution_still_valid()
+        return self._solver._get_primals_array(
+            vars_to_load=vars_to_load, solution_number=solution_number
+        )
+
+
+class _AttributeUpdates:
+    """Collect attribute changes so that they can be passed to gurobi
+    with a single ``Model.setAttr`` call per attribute."""
+
+    def __init__(self):
+        self._updates = {}
+
+    def add(self, attr, obj, val):
+        objs, vals = self._updates.setdefault(attr, ([], []))
+        objs.append(obj)
+        vals.append(val)
+
+    def apply(self, gurobi_model):
+        for attr, (objs, vals) in self._updates.items():
+            gurobi_model.setAttr(attr, objs, vals)
+        self._updates.clear()
+
 
 class _MutableLowerBound:
     def __init__(self, expr):
         self.var = None
         self.expr = expr
 
-    def update(self):
-        self.var.setAttr('lb', value(self.expr))
+    def update(self, updates):
+        updates.add('LB', self.var, value(self.expr))
 
 
 class _MutableUpperBound:
@@ -123,8 +152,8 @@ class _MutableUpperBound:
         self.var = None
         self.expr = expr
 
-    def update(self):
-        self.var.setAttr('ub', value(self.expr))
+    def update(self, updates):
+        updates.add('UB', self.var, value(self.expr))
 
 
 class _MutableLinearCoefficient:
@@ -134,7 +163,9 @@ class _MutableLinearCoefficient:
         self.con = None
         self.gurobi_model = None
 
-    def update(self):
+    def update(self, updates):
+        # gurobi has no vectorized interface for coefficient changes,
+        # but chgCoeff is queued until the next model update anyway
         self.gurobi_model.chgCoeff(self.con, self.var, value(self.expr))
 
 
@@ -144,14 +175,16 @@ class _MutableRangeConstant:
         self.rhs_expr = None
         self.con = None
         self.slack_name = None
+        self.slack = None
         self.gurobi_model = None
 
-    def update(self):
+    def update(self, updates):
         rhs_val = value(self.rhs_expr)
         lhs_val = value(self.lhs_expr)
-        self.con.rhs = rhs_val
-        slack = self.gurobi_model.getVarByName(self.slack_name)
-        slack.ub = rhs_val - lhs_val
+        if self.slack is None:
+            self.slack = self.gurobi_model.getVarByName(self.slack_name)
+        updates.add('RHS', self.con, rhs_val)
+        updates.add('UB', self.slack, rhs_val - lhs_val)
 
 
 class _MutableConstant:
@@ -159,8 +192,8 @@ class _MutableConstant:
         self.expr = None
         self.con = None
 
-    def update(self):
-        self.con.rhs = value(self.expr)
+    def update(self, updates):
+        updates.add('RHS', self.con, value(self.expr))
 
 
 class _MutableQuadraticConstraint:
@@ -206,15 +239,18 @@ class _MutableObjective:
         self.quadratic_coefs = quadratic_coefs
         self.last_quadratic_coef_values = [value(i.expr) for i in self.quadratic_coefs]
 
-    def get_updated_expression(self):
-        for ndx, coef in enumerate(self.linear_coefs):
-            coef.var.obj = value(coef.expr)
+    def get_updated_expression(self, updates):
+        for coef in self.linear_coefs:
+            updates.add('Obj', coef.var, value(coef.expr))
         self.gurobi_model.ObjCon = value(self.constant.expr)
 
         gurobi_expr = None
         for ndx, coef in enumerate(self.quadratic_coefs):
             if value(coef.expr) != self.last_quadratic_coef_values[ndx]:
                 if gurobi_expr is None:
+                    # the linear coefficients have to reach the model
+                    # before we rebuild the objective from it
+                    updates.apply(self.gurobi_model)
                     self.gurobi_model.update()
                     gurobi_expr = self.gurobi_model.getObjective()
                 current_coef_value = value(coef.expr)
@@ -271,6 +307,8 @@ class GurobiPersistent(
         self._constraints_added_since_update = OrderedSet()
         self._vars_added_since_update = ComponentSet()
         self._last_results_object: Optional[Results] = None
+        # (var ids, gurobi vars) of the referenced variables
+        self._referenced_gurobi_vars = None
 
     def release_license(self):
         self._reinit()
@@ -304,13 +342,15 @@ class GurobiPersistent(
                 self._solver_model.setParam('MIPGapAbs', config.abs_gap)
 
             if config.use_mipstart:
+                updates = _AttributeUpdates()
                 for (
                     pyomo_var_id,
                     gurobi_var,
                 ) in self._pyomo_var_to_solver_var_map.items():
                     pyomo_var = self._vars[pyomo_var_id][0]
                     if pyomo_var.is_integer() and pyomo_var.value is not None:
-                        self.set_var_attr(pyomo_var, 'Start', pyomo_var.value)
+                        updates.add('Start', gurobi_var, pyomo_var.value)
+                updates.apply(self._solver_model)
 
             for key, option in options.items():
                 self._solver_model.setParam(key, option)
@@ -439,9 +479,7 @@ class GurobiPersistent(
         if self._objective is None:
             self.set_objective(None)
 
-    def _get_expr_from_pyomo_expr(self, expr):
-        mutable_linear_coefficients = []
-        mutable_quadratic_coefficients = []
+    def _get_repn(self, expr):
         repn = generate_standard_repn(expr, quadratic=True, compute_values=False)
 
         degree = repn.polynomial_degree()
@@ -449,22 +487,33 @@ class GurobiPersistent(
             raise IncompatibleModelError(
                 f'GurobiAuto does not support expressions of degree {degree}.'
             )
+        return repn
 
-        if len(repn.linear_vars) > 0:
-            linear_coef_vals = []
-            for ndx, coef in enumerate(repn.linear_coefs):
-                if not is_constant(coef):
-                    mutable_linear_coefficient = _MutableLinearCoefficient()
-                    mutable_linear_coefficient.expr = coef
-                    mutable_linear_coefficient.var = self._pyomo_var_to_solver_var_map[
-                        id(repn.linear_vars[ndx])
-                    ]
-                    mutable_linear_coefficients.append(mutable_linear_coefficient)
-                linear_coef_vals.append(value(coef))
-            new_expr = gurobipy.LinExpr(
-                linear_coef_vals,
-                [self._pyomo_var_to_solver_var_map[id(i)] for i in repn.linear_vars],
-            )
+    def _get_linear_coefficients(self, repn):
+        mutable_linear_coefficients = []
+        linear_coef_vals = []
+        gurobi_vars = []
+        for coef, v in zip(repn.linear_coefs, repn.linear_vars):
+            gurobi_var = self._pyomo_var_to_solver_var_map[id(v)]
+            if not is_constant(coef):
+                mutable_linear_coefficient = _MutableLinearCoefficient()
+                mutable_linear_coefficient.expr = coef
+                mutable_linear_coefficient.var = gurobi_var
+                mutable_linear_coefficients.append(mutable_linear_coefficient)
+            linear_coef_vals.append(value(coef))
+            gurobi_vars.append(gurobi_var)
+        return linear_coef_vals, gurobi_vars, mutable_linear_coefficients
+
+    def _get_expr_from_pyomo_expr(self, expr):
+        return self._get_expr_from_repn(self._get_repn(expr))
+
+    def _get_expr_from_repn(self, repn):
+        mutable_quadratic_coefficients = []
+        linear_coef_vals, gurobi_vars, mutable_linear_coefficients = (
+            self._get_linear_coefficients(repn)
+        )
+        if len(gurobi_vars) > 0:
+            new_expr = gurobipy.LinExpr(linear_coef_vals, gurobi_vars)
         else:
             new_expr = 0.0
 
@@ -489,15 +538,114 @@ class GurobiPersistent(
             mutable_quadratic_coefficients,
         )
 
+    def _add_linear_constraint_block(self, rows):
+        """Add linear (non-range) constraints with a single addMConstr call
+
+        Parameters
+        ----------
+        rows: list
+            (constraint, name, repn) tuples
+        """
+        columns = {}
+        gurobi_vars = []
+        indptr = [0]
+        indices = []
+        data = []
+        senses = []
+        rhs = []
+        names = []
+        row_helpers = []
+        for con, conname, repn in rows:
+            linear_coef_vals, row_vars, mutable_linear_coefficients = (
+                self._get_linear_coefficients(repn)
+            )
+            for gurobi_var in row_vars:
+                col = columns.get(id(gurobi_var))
+                if col is None:
+                    col = columns[id(gurobi_var)] = len(gurobi_vars)
+                    gurobi_vars.append(gurobi_var)
+                indices.append(col)
+            data.extend(linear_coef_vals)
+            indptr.append(len(indices))
+
+            if con.equality:
+                sense = gurobipy.GRB.EQUAL
+                rhs_expr = con.lower - repn.constant
+            elif con.has_lb():
+                sense = gurobipy.GRB.GREATER_EQUAL
+                rhs_expr = con.lower - repn.constant
+            elif con.has_ub():
+                sense = gurobipy.GRB.LESS_EQUAL
+                rhs_expr = con.upper - repn.constant
+            else:
+                raise ValueError(
+                    "Constraint does not have a lower " f"or an upper bound: {con} \n"
+                )
+            senses.append(sense)
+            rhs.append(value(rhs_expr))
+            names.append(conname)
+            row_helpers.append((rhs_expr, mutable_linear_coefficients))
+
+        A = scipy.sparse.csr_array(
+            (np.array(data, dtype=float), indices, indptr),
+            shape=(len(rows), len(gurobi_vars)),
+        )
+        gurobipy_cons = self._solver_model.addMConstr(
+            A, gurobi_vars, senses, np.array(rhs, dtype=float)
+        ).tolist()
+        self._solver_model.setAttr('ConstrName', gurobipy_cons, names)
+
+        for (
+            (con, conname, repn),
+            gurobipy_con,
+            (rhs_expr, mutable_linear_coefficients),
+        ) in zip(rows, gurobipy_cons, row_helpers):
+            helpers = []
+            if not is_constant(rhs_expr):
+                mutable_constant = _MutableConstant()
+                mutable_constant.expr = rhs_expr
+                mutable_constant.con = gurobipy_con
+                helpers.append(mutable_constant)
+            for tmp in mutable_linear_coefficients:
+                tmp.con = gurobipy_con
+                tmp.gurobi_model = self._solver_model
+            helpers.extend(mutable_linear_coefficients)
+            if helpers:
+                self._mutable_helpers[con] = helpers
+            self._pyomo_con_to_solver_con_map[con] = gurobipy_con
+            self._solver_con_to_pyomo_con_map[id(gurobipy_con)] = con
+
     def _add_constraints(self, cons: List[ConstraintData]):
+        # Consecutive linear constraints are collected into a sparse
+        # block and added through the matrix API (which accepts a list
+        # of existing variables starting with gurobipy 10).  Range and
+        # quadratic constraints are still added one at a time (after
+        # flushing the pending linear block, so that the Gurobi rows
+        # are in the same order as the constraints).
+        if len(cons) > 1 and scipy_available and gurobipy.GRB.VERSION_MAJOR >= 10:
+            linear_rows = []
+        else:
+            linear_rows = None
         for con in cons:
             conname = self._symbol_map.getSymbol(con, self._labeler)
+            repn = self._get_repn(con.body)
+            if (
+                linear_rows is not None
+                and len(repn.linear_vars) > 0
+                and len(repn.quadratic_vars) == 0
+                and (con.equality or not (con.has_lb() and con.has_ub()))
+            ):
+                linear_rows.append((con, conname, repn))
+                continue
+            if linear_rows:
+                self._add_linear_constraint_block(linear_rows)
+                linear_rows = []
             (
                 gurobi_expr,
                 repn_constant,
                 mutable_linear_coefficients,
                 mutable_quadratic_coefficients,
-            ) = self._get_expr_from_pyomo_expr(con.body)
+            ) = self._get_expr_from_repn(repn)
 
             if (
                 gurobi_expr.__class__ in {gurobipy.LinExpr, gurobipy.Var}
@@ -616,6 +764,8 @@ class GurobiPersistent(
 
             self._pyomo_con_to_solver_con_map[con] = gurobipy_con
             self._solver_con_to_pyomo_con_map[id(gurobipy_con)] = con
+        if linear_rows:
+            self._add_linear_constraint_block(linear_rows)
         self._constraints_added_since_update.update(cons)
         self._needs_updated = True
 
@@ -646,11 +796,13 @@ class GurobiPersistent(
         self._needs_updated = True
 
     def _remove_constraints(self, cons: List[ConstraintData]):
+        if any(con in self._constraints_added_since_update for con in cons):
+            self._update_gurobi_model()
+        self._solver_model.remove(
+            [self._pyomo_con_to_solver_con_map[con] for con in cons]
+        )
         for con in cons:
-            if con in self._constraints_added_since_update:
-                self._update_gurobi_model()
             solver_con = self._pyomo_con_to_solver_con_map[con]
-            self._solver_model.remove(solver_con)
             self._symbol_map.removeSymbol(con)
             del self._pyomo_con_to_solver_con_map[con]
             del self._solver_con_to_pyomo_con_map[id(solver_con)]
@@ -660,31 +812,35 @@ class GurobiPersistent(
         self._needs_updated = True
 
     def _remove_sos_constraints(self, cons: List[SOSConstraintData]):
+        if any(con in self._constraints_added_since_update for con in cons):
+            self._update_gurobi_model()
+        self._solver_model.remove(
+            [self._pyomo_sos_to_solver_sos_map[con] for con in cons]
+        )
         for con in cons:
-            if con in self._constraints_added_since_update:
-                self._update_gurobi_model()
-            solver_sos_con = self._pyomo_sos_to_solver_sos_map[con]
-            self._solver_model.remove(solver_sos_con)
             self._symbol_map.removeSymbol(con)
             del self._pyomo_sos_to_solver_sos_map[con]
         self._needs_updated = True
 
     def _remove_variables(self, variables: List[VarData]):
+        if any(var in self._vars_added_since_update for var in variables):
+            self._update_gurobi_model()
+        self._solver_model.remove(
+            [self._pyomo_var_to_solver_var_map[id(var)] for var in variables]
+        )
         for var in variables:
             v_id = id(var)
-            if var in self._vars_added_since_update:
-                self._update_gurobi_model()
-            solver_var = self._pyomo_var_to_solver_var_map[v_id]
-            self._solver_model.remove(solver_var)
             self._symbol_map.removeSymbol(var)
             del self._pyomo_var_to_solver_var_map[v_id]
-            self._mutable_bounds.pop(v_id, None)
+            self._mutable_bounds.pop((v_id, 'lb'), None)
+            self._mutable_bounds.pop((v_id, 'ub'), None)
         self._needs_updated = True
 
     def _remove_parameters(self, params: List[ParamData]):
         pass
 
     def _update_variables(self, variables: List[VarData]):
+        updates = _AttributeUpdates()
         for var in variables:
             var_id = id(var)
             if var_id not in self._pyomo_var_to_solver_var_map:
@@ -697,17 +853,27 @@ class GurobiPersistent(
             lb, ub, vtype = self._process_domain_and_bounds(
                 var, var_id, None, None, None, gurobipy_var
             )
-            gurobipy_var.setAttr('lb', lb)
-            gurobipy_var.setAttr('ub', ub)
-            gurobipy_var.setAttr('vtype', vtype)
+            updates.add('LB', gurobipy_var, lb)
+            updates.add('UB', gurobipy_var, ub)
+            updates.add('VType', gurobipy_var, vtype)
+        updates.apply(self._solver_model)
         self._needs_updated = True
 
     def update_parameters(self):
+        updates = _AttributeUpdates()
+        if any(
+            con in self._constraints_added_since_update
+            for con in self._range_constraints
+            if con in self._mutable_helpers
+        ):
+            # range constraints look up their slack variable by name
+            self._update_gurobi_model()
         for con, helpers in self._mutable_helpers.items():
             for helper in helpers:
-                helper.update()
+                helper.update(updates)
         for k, (v, helper) in self._mutable_bounds.items():
-            helper.update()
+            helper.update(updates)
+        updates.apply(self._solver_model)
 
         for con, helper in self._mutable_quadratic_helpers.items():
             if con in self._constraints_added_since_update:
@@ -722,7 +888,7 @@ class GurobiPersistent(
             new_con = self._solver_model.addQConstr(
                 new_gurobi_expr, new_sense, new_rhs, name=name
             )
-            self._pyomo_con_to_solver_con_map[id(pyomo_con)] = new_con
+            self._pyomo_con_to_solver_con_map[pyomo_con] = new_con
             del self._solver_con_to_pyomo_con_map[id(gurobi_con)]
             self._solver_con_to_pyomo_con_map[id(new_con)] = pyomo_con
             helper.con = new_con
@@ -730,7 +896,8 @@ class GurobiPersistent(
 
         helper = self._mutable_objective
         pyomo_obj = self._objective
-        new_gurobi_expr = helper.get_updated_expression()
+        new_gurobi_expr = helper.get_updated_expression(updates)
+        updates.apply(self._solver_model)
         if new_gurobi_expr is not None:
             if pyomo_obj.sense == minimize:
                 sense = gurobipy.GRB.MINIMIZE
@@ -869,7 +1036,36 @@ class GurobiPersistent(
 
         return results
 
-    def _load_suboptimal_mip_solution(self, vars_to_load, solution_number):
+    def _get_gurobi_vars(self, vars_to_load=None):
+        # Return the (referenced) Pyomo variables and the corresponding
+        # gurobipy variables
+        if vars_to_load is None:
+            var_ids, variables = self._get_referenced_vars()
+            if (
+                self._referenced_gurobi_vars is None
+                or self._referenced_gurobi_vars[0] is not var_ids
+            ):
+                self._referenced_gurobi_vars = (
+                    var_ids,
+                    list(map(self._pyomo_var_to_solver_var_map.__getitem__, var_ids)),
+                )
+            return variables, self._referenced_gurobi_vars[1]
+        var_map = self._pyomo_var_to_solver_var_map
+        ref_vars = self._referenced_variables
+        variables = []
+        gurobi_vars = []
+        for v in vars_to_load:
+            v_id = id(v)
+            using_cons, using_sos, using_obj = ref_vars[v_id]
+            if using_cons or using_sos or (using_obj is not None):
+                variables.append(self._vars[v_id][0])
+                gurobi_vars.append(var_map[v_id])
+        return variables, gurobi_vars
+
+    def _get_primal_values(self, gurobi_vars, solution_number=0):
+        if solution_number == 0:
+            return self._solver_model.getAttr("X", gurobi_vars)
+
         if (
             self.get_model_attr('NumIntVars') == 0
             and self.get_model_attr('NumBinVars') == 0
@@ -877,55 +1073,39 @@ class GurobiPersistent(
             raise ValueError(
                 'Cannot obtain suboptimal solutions for a continuous model'
             )
-        var_map = self._pyomo_var_to_solver_var_map
-        ref_vars = self._referenced_variables
         original_solution_number = self.get_gurobi_param_info('SolutionNumber')[2]
         self.set_gurobi_param('SolutionNumber', solution_number)
-        gurobi_vars_to_load = [var_map[pyomo_var] for pyomo_var in vars_to_load]
-        vals = self._solver_model.getAttr("Xn", gurobi_vars_to_load)
-        res = ComponentMap()
-        for var_id, val in zip(vars_to_load, vals):
-            using_cons, using_sos, using_obj = ref_vars[var_id]
-            if using_cons or using_sos or (using_obj is not None):
-                res[self._vars[var_id][0]] = val
+        vals = self._solver_model.getAttr("Xn", gurobi_vars)
         self.set_gurobi_param('SolutionNumber', original_solution_number)
-        return res
+        return vals
 
-    def _load_vars(self, vars_to_load=None, solution_number=0):
-        for v, val in self._get_primals(
-            vars_to_load=vars_to_load, solution_number=solution_number
-        ).items():
-            v.set_value(val, skip_validation=True)
-        StaleFlagManager.mark_all_as_stale(delayed=True)
-
-    def _get_primals(self, vars_to_load=None, solution_number=0):
+    def _check_for_solution(self):
         if self._needs_updated:
             self._update_gurobi_model()  # this is needed to ensure that solutions cannot be loaded after the model has been changed
 
         if self._solver_model.SolCount == 0:
             raise NoSolutionError()
 
-        var_map = self._pyomo_var_to_solver_var_map
-        ref_vars = self._referenced_variables
-        if vars_to_load is None:
-            vars_to_load = self._pyomo_var_to_solver_var_map.keys()
-        else:
-            vars_to_load = [id(v) for v in vars_to_load]
-
-        if solution_number != 0:
-            return self._load_suboptimal_mip_solution(
-                vars_to_load=vars_to_load, solution_number=solution_number
-            )
+    def _load_vars(self, vars_to_load=None, solution_number=0):
+        self._check_for_solution()
+        variables, gurobi_vars = self._get_gurobi_vars(vars_to_load)
+        vals = self._get_primal_values(gurobi_vars, solution_number)
+        for v, val in zip(variables, vals):
+            v.set_value(val, skip_validation=True)
+        StaleFlagManager.mark_all_as_stale(delayed=True)
 
-        gurobi_vars_to_load = [var_map[pyomo_var_id] for pyomo_var_id in vars_to_load]
-        vals = self._solver_model.getAttr("X", gurobi_vars_to_load)
+    def _get_primals(self, vars_to_load=None, solution_number=0):
+        self._check_for_solution()
+        variables, gurobi_vars = self._get_gurobi_vars(vars_to_load)
+        vals = self._get_primal_values(gurobi_vars, solution_number)
+        return ComponentMap(zip(variables, vals))
 
-        res = ComponentMap()
-        for var_id, val in zip(vars_to_load, vals):
-            using_cons, using_sos, using_obj = ref_vars[var_id]
-            if using_cons or using_sos or (using_obj is not None):
-                res[self._vars[var_id][0]] = val
-        return res
+    def _get_primals_array(self, vars_to_load, solution_number=0):
+        self._check_for_solution()
+        var_map = self._pyomo_var_to_solver_var_map
+        gurobi_vars = [var_map[id(v)] for v in vars_to_load]
+        vals = self._get_primal_values(gurobi_vars, solution_number)
+        return np.array(vals, dtype=float)
 
     def _get_reduced_costs(self, vars_to_load=None):
         if self._needs_updated:
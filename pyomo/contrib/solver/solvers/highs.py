@@ -11,19 +11,21 @@
 
 import logging
 import io
-from typing import List, Optional
+from typing import Callable, List, Optional
 
 from pyomo.common.collections import ComponentMap
+from pyomo.common.config import ConfigValue
 from pyomo.common.dependencies import attempt_import
 from pyomo.common.errors import ApplicationError
 from pyomo.common.flags import NOTSET
 from pyomo.common.tee import TeeStream, capture_output
+from pyomo.opt.solver.log_parser import HiGHSLogParser
 from pyomo.core.kernel.objective import minimize, maximize
 from pyomo.core.base.var import VarData
 from pyomo.core.base.constraint import ConstraintData
 from pyomo.core.base.sos import SOSConstraintData
 from pyomo.core.base.param import ParamData
-from pyomo.core.expr.numvalue import value, is_constant
+from pyomo.core.expr.numvalue import value, is_constant, native_numeric_types
 from pyomo.repn import generate_standard_repn
 from pyomo.core.expr.numeric_expr import NPV_MaxExpression, NPV_MinExpression
 from pyomo.common.dependencies import numpy as np
@@ -235,12 +237,94 @@ class _MutableConstraintBounds:
         self.highs.changeRowBounds(row_ndx, lb, ub)
 
 
+class _BulkModelData:
+    """Columns and rows collected while loading a model into HiGHS
+
+    When building the initial model (:meth:`Highs.set_instance`), the
+    persistent bookkeeping adds the variables and constraints in many
+    small batches.  Rather than passing each batch to HiGHS, we collect
+    the column data and the (CSR) row data here and pass the whole
+    model to HiGHS at once.
+
+    """
+
+    def __init__(self):
+        self.col_lb = []
+        self.col_ub = []
+        self.col_type = []
+        self.row_lb = []
+        self.row_ub = []
+        self.row_start = []
+        self.row_index = []
+        self.row_value = []
+
+    def flush(self, highs):
+        n_cols = len(self.col_lb)
+        if n_cols:
+            n_existing = highs.getNumCol()
+            highs.addVars(
+                n_cols,
+                np.array(self.col_lb, dtype=np.double),
+                np.array(self.col_ub, dtype=np.double),
+            )
+            highs.changeColsIntegrality(
+                n_cols,
+                np.arange(n_existing, n_existing + n_cols),
+                np.array(self.col_type),
+            )
+        n_rows = len(self.row_lb)
+        if n_rows:
+            highs.addRows(
+                n_rows,
+                np.array(self.row_lb, dtype=np.double),
+                np.array(self.row_ub, dtype=np.double),
+                len(self.row_value),
+                np.array(self.row_start),
+                np.array(self.row_index),
+                np.array(self.row_value, dtype=np.double),
+            )
+        self.__init__()
+
+
+class HighsConfig(PersistentBranchAndBoundConfig):
+    def __init__(
+        self,
+        description=None,
+        doc=None,
+        implicit=False,
+        implicit_domain=None,
+        visibility=0,
+    ):
+        super().__init__(
+            description=description,
+            doc=doc,
+            implicit=implicit,
+            implicit_domain=implicit_domain,
+            visibility=visibility,
+        )
+
+        self.progress_callback: Optional[Callable] = self.declare(
+            'progress_callback',
+            ConfigValue(
+                default=None,
+                description="""Function called with a
+                :py:class:`~pyomo.opt.solver.log_parser.SolverProgress`
+                record for each iteration / node report of the HiGHS log
+                while HiGHS is running.  If the function returns
+                ``True``, HiGHS is interrupted (this requires a version
+                of highspy that provides ``Highs.cancelSolve()``) and the
+                current point is returned with the ``interrupted``
+                termination condition.""",
+            ),
+        )
+
+
 class Highs(PersistentSolverMixin, PersistentSolverUtils, PersistentSolverBase):
     """
     Interface to HiGHS
     """
 
-    CONFIG = PersistentBranchAndBoundConfig()
+    CONFIG = HighsConfig()
 
     _available = None
 
@@ -258,6 +342,10 @@ class Highs(PersistentSolverMixin, PersistentSolverUtils, PersistentSolverBase):
         self._mutable_bounds = {}
         self._last_results_object: Optional[Results] = None
         self._sol = None
+        # Model data not yet passed to HiGHS (only while in set_instance)
+        self._bulk_data = None
+        # (var ids, column indices) of the referenced variables
+        self._referenced_cols = None
 
     def available(self):
         if highspy_available:
@@ -285,26 +373,43 @@ class Highs(PersistentSolverMixin, PersistentSolverUtils, PersistentSolverBase):
         timer = config.timer
         options = config.solver_options
         ostreams = [io.StringIO()] + config.tee
+        if config.progress_callback is not None:
+            log_parser = HiGHSLogParser(config.progress_callback)
+            # cancelSolve() is only available in newer versions of highspy
+            if hasattr(self._solver_model, 'cancelSolve'):
+                log_parser.set_interrupt(self._solver_model.cancelSolve)
+            else:
+                logger.warning(
+                    "This version of highspy does not support interrupting "
+                    "the solve: the progress_callback cannot stop HiGHS"
+                )
+            ostreams.append(log_parser)
+        else:
+            log_parser = None
 
-        with capture_output(output=TeeStream(*ostreams), capture_fd=True):
-            self._solver_model.setOptionValue('log_to_console', True)
-
-            if config.threads is not None:
-                self._solver_model.setOptionValue('threads', config.threads)
-            if config.time_limit is not None:
-                self._solver_model.setOptionValue('time_limit', config.time_limit)
-            if config.rel_gap is not None:
-                self._solver_model.setOptionValue('mip_rel_gap', config.rel_gap)
-            if config.abs_gap is not None:
-                self._solver_model.setOptionValue('mip_abs_gap', config.abs_gap)
-
-            for key, option in options.items():
-                self._solver_model.setOptionValue(key, option)
-            timer.start('optimize')
-            if self.version()[:2] >= (1, 8):
-                self._solver_model.HandleKeyboardInterrupt = True
-            self._solver_model.run()
-            timer.stop('optimize')
+        try:
+            with capture_output(output=TeeStream(*ostreams), capture_fd=True):
+                self._solver_model.setOptionValue('log_to_console', True)
+
+                if config.threads is not None:
+                    self._solver_model.setOptionValue('threads', config.threads)
+                if config.time_limit is not None:
+                    self._solver_model.setOptionValue('time_limit', config.time_limit)
+                if config.rel_gap is not None:
+                    self._solver_model.setOptionValue('mip_rel_gap', config.rel_gap)
+                if config.abs_gap is not None:
+                    self._solver_model.setOptionValue('mip_abs_gap', config.abs_gap)
+
+                for key, option in options.items():
+                    self._solver_model.setOptionValue(key, option)
+                timer.start('optimize')
+                if self.version()[:2] >= (1, 8):
+                    self._solver_model.HandleKeyboardInterrupt = True
+                self._solver_model.run()
+                timer.stop('optimize')
+        finally:
+            if log_parser is not None:
+                log_parser.close()
 
         return self._postsolve()
 
@@ -372,6 +477,11 @@ class Highs(PersistentSolverMixin, PersistentSolverUtils, PersistentSolverBase):
             self._pyomo_var_to_solver_var_map[v_id] = current_num_vars
             current_num_vars += 1
 
+        if self._bulk_data is not None:
+            self._bulk_data.col_lb.extend(lbs)
+            self._bulk_data.col_ub.extend(ubs)
+            self._bulk_data.col_type.extend(vtypes)
+            return
         self._solver_model.addVars(
             len(lbs), np.array(lbs, dtype=np.double), np.array(ubs, dtype=np.double)
         )
@@ -407,20 +517,38 @@ class Highs(PersistentSolverMixin, PersistentSolverUtils, PersistentSolverBase):
             self._model = model
 
             self._solver_model = highspy.Highs()
-            self.add_block(model)
+            self._bulk_data = _BulkModelData()
+            try:
+                self.add_block(model)
+                self._flush_bulk_data()
+            finally:
+                self._bulk_data = None
             if self._objective is None:
                 self.set_objective(None)
 
+    def _flush_bulk_data(self):
+        # Pass any columns / rows collected by set_instance to HiGHS
+        if self._bulk_data is not None:
+            self._bulk_data.flush(self._solver_model)
+
     def _add_constraints(self, cons: List[ConstraintData]):
         self._sol = None
         if self._last_results_object is not None:
             self._last_results_object.solution_loader.invalidate()
         current_num_cons = len(self._pyomo_con_to_solver_con_map)
-        lbs = []
-        ubs = []
-        starts = []
-        var_indices = []
-        coef_values = []
+        var_map = self._pyomo_var_to_solver_var_map
+        if self._bulk_data is not None:
+            lbs = self._bulk_data.row_lb
+            ubs = self._bulk_data.row_ub
+            starts = self._bulk_data.row_start
+            var_indices = self._bulk_data.row_index
+            coef_values = self._bulk_data.row_value
+        else:
+            lbs = []
+            ubs = []
+            starts = []
+            var_indices = []
+            coef_values = []
 
         for con in cons:
             repn = generate_standard_repn(
@@ -432,7 +560,16 @@ class Highs(PersistentSolverMixin, PersistentSolverUtils, PersistentSolverBase):
                 )
 
             starts.append(len(coef_values))
-            for ndx, coef in enumerate(repn.linear_coefs):
+            if all(
+                coef.__class__ in native_numeric_types for coef in repn.linear_coefs
+            ):
+                # Fast path: no mutable coefficients
+                var_indices.extend(map(var_map.__getitem__, map(id, repn.linear_vars)))
+                coef_values.extend(repn.linear_coefs)
+                coefs = ()
+            else:
+                coefs = repn.linear_coefs
+            for ndx, coef in enumerate(coefs):
                 v = repn.linear_vars[ndx]
                 v_id = id(v)
                 coef_val = value(coef)
@@ -481,6 +618,8 @@ class Highs(PersistentSolverMixin, PersistentSolverUtils, PersistentSolverBase):
             self._solver_con_to_pyomo_con_map[current_num_cons] = con
             current_num_cons += 1
 
+        if self._bulk_data is not None:
+            return
         self._solver_model.addRows(
             len(lbs),
             np.array(lbs, dtype=np.double),
@@ -596,6 +735,7 @@ class Highs(PersistentSolverMixin, PersistentSolverUtils, PersistentSolverBase):
         self._mutable_objective.update()
 
     def _set_objective(self, obj):
+        self._flush_bulk_data()
         self._sol = None
         if self._last_results_object is not None:
             self._last_results_object.solution_loader.invalidate()
@@ -720,6 +860,9 @@ class Highs(PersistentSolverMixin, PersistentSolverUtils, PersistentSolverBase):
         elif status == getattr(highspy.HighsModelStatus, "kSolutionLimit", NOTSET):
             # kSolutionLimit was introduced in HiGHS v1.5.3 for MIP-related limits
             results.termination_condition = TerminationCondition.iterationLimit
+        elif status == getattr(highspy.HighsModelStatus, "kInterrupt", NOTSET):
+            # kInterrupt is reported after cancelSolve() (progress_callback)
+            results.termination_condition = TerminationCondition.interrupted
         elif status == highspy.HighsModelStatus.kUnknown:
             results.termination_condition = TerminationCondition.unknown
         else:
@@ -756,33 +899,43 @@ class Highs(PersistentSolverMixin, PersistentSolverUtils, PersistentSolverBase):
 
         return results
 
-    def _load_vars(self, vars_to_load=None):
-        for v, val in self._get_primals(vars_to_load=vars_to_load).items():
-            v.set_value(val, skip_validation=True)
-        StaleFlagManager.mark_all_as_stale(delayed=True)
+    def _get_columns(self, vars_to_load=None):
+        # Return the variables and an array of their column indices
+        if vars_to_load is None:
+            var_ids, variables = self._get_referenced_vars()
+            if self._referenced_cols is None or self._referenced_cols[0] is not var_ids:
+                cols = np.fromiter(
+                    map(self._pyomo_var_to_solver_var_map.__getitem__, var_ids),
+                    dtype=np.intp,
+                    count=len(var_ids),
+                )
+                self._referenced_cols = (var_ids, cols)
+            return variables, self._referenced_cols[1]
+        variables = list(vars_to_load)
+        var_map = self._pyomo_var_to_solver_var_map
+        cols = np.fromiter(
+            (var_map[id(v)] for v in variables), dtype=np.intp, count=len(variables)
+        )
+        return variables, cols
 
-    def _get_primals(self, vars_to_load=None):
+    def _get_primal_values(self, vars_to_load=None):
         if self._sol is None or not self._sol.value_valid:
             raise NoSolutionError()
+        variables, cols = self._get_columns(vars_to_load)
+        return variables, np.asarray(self._sol.col_value, dtype=np.double)[cols]
 
-        res = ComponentMap()
-        if vars_to_load is None:
-            var_ids_to_load = []
-            for v, ref_info in self._referenced_variables.items():
-                using_cons, using_sos, using_obj = ref_info
-                if using_cons or using_sos or (using_obj is not None):
-                    var_ids_to_load.append(v)
-        else:
-            var_ids_to_load = [id(v) for v in vars_to_load]
-
-        var_vals = self._sol.col_value
+    def _load_vars(self, vars_to_load=None):
+        variables, vals = self._get_primal_values(vars_to_load)
+        for v, val in zip(variables, vals.tolist()):
+            v.set_value(val, skip_validation=True)
+        StaleFlagManager.mark_all_as_stale(delayed=True)
 
-        for v_id in var_ids_to_load:
-            v = self._vars[v_id][0]
-            v_ndx = self._pyomo_var_to_solver_var_map[v_id]
-            res[v] = var_vals[v_ndx]
+    def _get_primals(self, vars_to_load=None):
+        variables, vals = self._get_primal_values(vars_to_load)
+        return ComponentMap(zip(variables, vals.tolist()))
 
-        return res
+    def _get_primals_array(self, vars_to_load):
+        return self._get_primal_values(vars_to_load)[1]
 
     def _get_reduced_costs(self, vars_to_load=None):
         if self._sol is None or not self._sol.dual_valid:
@@ -806,14 +959,11 @@ class Highs(PersistentSolverMixin, PersistentSolverUtils, PersistentSolverBase):
         if self._sol is None or not self._sol.dual_valid:
             raise NoDualsError()
 
-        res = {}
-        if cons_to_load is None:
-            cons_to_load = list(self._pyomo_con_to_solver_con_map.keys())
-
         duals = self._sol.row_dual
+        if cons_to_load is None:
+            # The rows are numbered contiguously in the order the
+            # constraints were added
+            return dict(zip(self._pyomo_con_to_solver_con_map, duals))
 
-        for c in cons_to_load:
-            c_ndx = self._pyomo_con_to_solver_con_map[c]
-            res[c] = duals[c_ndx]
-
-        return res
+        con_map = self._pyomo_con_to_solver_con_map
+        return {c: duals[con_map[c]] for c in cons_to_load}
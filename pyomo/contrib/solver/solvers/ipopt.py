@@ -14,13 +14,16 @@ import os
 import subprocess
 import datetime
 import io
+import itertools
 import re
 import sys
-import threading
-from typing import Optional, Tuple, Union, Mapping, List, Dict, Any, Sequence
+import weakref
+from array import array
+from typing import Optional, Tuple, Union, Mapping, List, Dict, Any, Sequence, Callable
 
 from pyomo.common import Executable
 from pyomo.common.config import (
+    Bool,
     ConfigValue,
     document_class_CONFIG,
     ConfigDict,
@@ -50,8 +53,10 @@ from pyomo.contrib.solver.common.util import (
     NoFeasibleSolutionError,
     NoOptimalSolutionError,
     NoSolutionError,
+    run_subprocess_async,
 )
 from pyomo.common.tee import TeeStream
+from pyomo.opt.solver.log_parser import LogParser, IpoptLogParser
 from pyomo.core.expr.visitor import replace_expressions
 from pyomo.core.expr.numvalue import value
 from pyomo.core.base.suffix import Suffix
@@ -64,6 +69,9 @@ logger = logging.getLogger(__name__)
 # in ipopt's output, per https://coin-or.github.io/Ipopt/OUTPUT.html
 _ALPHA_PR_CHARS = set("fFhHkKnNRwstTr")
 
+# Counter used to give the interface files of every solve a unique name
+_solve_counter = itertools.count()
+
 
 class IpoptConfig(SolverConfig):
     def __init__(
@@ -94,6 +102,32 @@ class IpoptConfig(SolverConfig):
         self.writer_config: ConfigDict = self.declare(
             'writer_config', NLWriter.CONFIG()
         )
+        self.warm_start: bool = self.declare(
+            'warm_start',
+            ConfigValue(
+                domain=Bool,
+                default=False,
+                description="If True, warm-start Ipopt from the last successful "
+                "solve of the same model by this solver interface: the "
+                "constraint multipliers and variable bound multipliers "
+                "from that solve are passed to Ipopt (along with the "
+                "current variable values) and the Ipopt warm-start "
+                "options are enabled (unless they were explicitly set "
+                "in solver_options).",
+            ),
+        )
+        self.progress_callback: Optional[Callable] = self.declare(
+            'progress_callback',
+            ConfigValue(
+                default=None,
+                description="""Function called with a
+                :py:class:`~pyomo.opt.solver.log_parser.SolverProgress`
+                record for each iteration of the Ipopt log while Ipopt
+                is running.  If the function returns ``True``, Ipopt is
+                interrupted and the current point is returned with the
+                ``interrupted`` termination condition.""",
+            ),
+        )
 
 
 class IpoptSolutionLoader(SolSolutionLoader):
@@ -154,6 +188,92 @@ class IpoptSolutionLoader(SolSolutionLoader):
         return res
 
 
+class _WarmStartData:
+    """The multipliers from a successful Ipopt solve
+
+    Values are stored (unscaled) in arrays ordered by the NL columns
+    (``variables``) and rows (``constraints``) of the solve that
+    generated them.
+
+    """
+
+    __slots__ = ('variables', 'constraints', 'duals', 'zL', 'zU')
+
+    def __init__(self, sol_data, nl_info):
+        self.variables = nl_info.variables
+        self.constraints = nl_info.constraints
+        if nl_info.scaling is None:
+            var_scale = [1] * len(self.variables)
+            con_scale = [1] * len(self.constraints)
+            obj_scale = 1
+        else:
+            var_scale = nl_info.scaling.variables
+            con_scale = nl_info.scaling.constraints
+            obj_scale = nl_info.scaling.objectives[0]
+        self.duals = array(
+            'd', (v * s / obj_scale for v, s in zip(sol_data.duals, con_scale))
+        )
+        zL = sol_data.var_suffixes.get('ipopt_zL_out', {})
+        zU = sol_data.var_suffixes.get('ipopt_zU_out', {})
+        self.zL = array(
+            'd', (zL.get(i, 0) * s / obj_scale for i, s in enumerate(var_scale))
+        )
+        self.zU = array(
+            'd', (zU.get(i, 0) * s / obj_scale for i, s in enumerate(var_scale))
+        )
+
+    def write(self, ostream, nl_info, exclude):
+        """Write the multipliers as NL suffix / dual initialization segments
+
+        The stored values are mapped onto the columns / rows (and
+        scaling) of the NL file described by ``nl_info``.  Segments for
+        suffixes in ``exclude`` (i.e., that the user is already
+        exporting) are not written.
+
+        """
+        if nl_info.scaling is None:
+            var_scale = [1] * len(nl_info.variables)
+            con_scale = [1] * len(nl_info.constraints)
+            obj_scale = 1
+        else:
+            var_scale = nl_info.scaling.variables
+            con_scale = nl_info.scaling.constraints
+            obj_scale = nl_info.scaling.objectives[0]
+
+        col = {id(v): i for i, v in enumerate(self.variables)}
+        for name, data in (('ipopt_zL_in', self.zL), ('ipopt_zU_in', self.zU)):
+            if name in exclude:
+                continue
+            vals = []
+            for i, (v, s) in enumerate(zip(nl_info.variables, var_scale)):
+                j = col.get(id(v), None)
+                if j is not None and data[j]:
+                    vals.append(f"{i} {data[j] * obj_scale / s!s}\n")
+            if vals:
+                ostream.write(f"S4 {len(vals)} {name}\n")
+                ostream.write(''.join(vals))
+
+        if 'dual' in exclude:
+            return
+        row = {id(c): i for i, c in enumerate(self.constraints)}
+        vals = []
+        for i, (c, s) in enumerate(zip(nl_info.constraints, con_scale)):
+            j = row.get(id(c), None)
+            if j is not None and self.duals[j]:
+                vals.append(f"{i} {self.duals[j] * obj_scale / s!s}\n")
+        if vals:
+            ostream.write(f"d{len(vals)}\n")
+            ostream.write(''.join(vals))
+
+
+# Ipopt options enabled when warm-starting (unless set by the user)
+_warm_start_options = {
+    'warm_start_init_point': 'yes',
+    'warm_start_bound_push': 1e-9,
+    'warm_start_mult_bound_push': 1e-9,
+}
+
+
 ipopt_command_line_options = {
     'acceptable_compl_inf_tol',
     'acceptable_constr_viol_tol',
@@ -236,6 +356,9 @@ class Ipopt(SolverBase):
         self._available_cache = None
         self._version_cache = None
         self._version_timeout = 2
+        # Multipliers from the last successful solve of each model (for
+        # warm-starting subsequent solves; see the warm_start option)
+        self._warm_start_cache = weakref.WeakKeyDictionary()
 
         #: Instance configuration;
         #: see :ref:`pyomo.contrib.solver.solvers.ipopt.Ipopt::CONFIG`.
@@ -339,6 +462,73 @@ class Ipopt(SolverBase):
 
     def solve(self, model, **kwds) -> Results:
         "Solve a model using Ipopt"
+        solver = self._solve(model, **kwds)
+        try:
+            cmd, env, timeout, ostreams = next(solver)
+            try:
+                returncode = self._run_subprocess(cmd, env, timeout, ostreams)
+            except BaseException as e:
+                # _solve() cleans up and (re)raises the exception
+                solver.throw(e)
+            else:
+                solver.send(returncode)
+        except StopIteration as e:
+            return e.value
+        raise RuntimeError("Ipopt solve generator did not complete")
+
+    async def solve_async(self, model, **kwds) -> Results:
+        """Solve a model using Ipopt without blocking the running event loop
+
+        The NL file is written (and the solution loaded) in the event
+        loop thread, but the Ipopt subprocess is run asynchronously, so
+        many solves may be in flight at once.  The Ipopt output is
+        streamed to ``tee`` as it is generated.  The subprocess is
+        killed if the solve times out (see ``time_limit``) or the
+        awaiting task is cancelled.
+
+        Variables are marked as stale when the solution of each solve is
+        loaded, so the stale flags are the same as if the solves had
+        been run sequentially in the order they completed.
+
+        """
+        solver = self._solve(model, **kwds)
+        try:
+            cmd, env, timeout, ostreams = next(solver)
+            try:
+                returncode = await run_subprocess_async(
+                    cmd, ostreams, timeout=timeout, env=env
+                )
+            except BaseException as e:
+                # _solve() cleans up and (re)raises the exception
+                solver.throw(e)
+            else:
+                solver.send(returncode)
+        except StopIteration as e:
+            return e.value
+        raise RuntimeError("Ipopt solve generator did not complete")
+
+    def _run_subprocess(self, cmd, env, timeout, ostreams):
+        with TeeStream(*ostreams) as t:
+            with subprocess.Popen(
+                cmd, env=env, universal_newlines=True, stdout=t.STDOUT, stderr=t.STDERR
+            ) as process:
+                # Let the log parser (if any) interrupt Ipopt
+                for stream in ostreams:
+                    if isinstance(stream, LogParser):
+                        stream.attach(process)
+                try:
+                    process.wait(timeout=timeout)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait()
+                    raise
+        return process.returncode
+
+    def _solve(self, model, **kwds):
+        # This generator implements the solve, yielding the Ipopt
+        # command (and the timeout and output streams) to the caller,
+        # which runs the command and sends back the return code.
+        #
         # Begin time tracking
         start_timestamp = datetime.datetime.now(datetime.timezone.utc)
         # Update configuration options, based on keywords passed to solve
@@ -359,7 +549,6 @@ class Ipopt(SolverBase):
             timer = HierarchicalTimer()
         else:
             timer = config.timer
-        StaleFlagManager.mark_all_as_stale()
         with TempfileManager.new_context() as tempfile:
             if config.working_dir is None:
                 dname = tempfile.mkdtemp()
@@ -379,13 +568,13 @@ class Ipopt(SolverBase):
             if basename[0] in "'\"" and basename[0] == basename[-1]:
                 basename = basename[1:-1]
             # The base file name for this interface is "model_name + PID
-            # + thread id", so that this is reasonably unique in both
-            # parallel and threaded environments (even when working_dir
-            # is set to a persistent directory).  Note that the Pyomo
-            # solver interfaces are not formally thread-safe (yet), so
-            # this is a bit of future-proofing.
+            # + solve counter", so that this is unique for every solve
+            # in parallel, threaded and asynchronous environments (even
+            # when working_dir is set to a persistent directory).  See
+            # the SolverBase documentation for the thread-safety
+            # guarantees of the solver interfaces.
             basename = os.path.join(
-                dname, f"{basename}.{os.getpid()}.{threading.get_ident()}"
+                dname, f"{basename}.{os.getpid()}.{next(_solve_counter)}"
             )
             for ext in ('.nl', '.row', '.col', '.sol', '.opt'):
                 if os.path.exists(basename + ext):
@@ -403,16 +592,20 @@ class Ipopt(SolverBase):
                 open(basename + '.col', 'w', encoding='utf-8') as col_file,
             ):
                 timer.start('write_nl_file')
-                self._writer.config.set_value(config.writer_config)
                 try:
+                    # Pass the writer configuration for this solve
+                    # (rather than updating the writer's configuration)
+                    # so that concurrent solves do not interfere.
                     nl_info = self._writer.write(
                         model,
                         nl_file,
                         row_file,
                         col_file,
+                        config=config.writer_config,
                         symbolic_solver_labels=config.symbolic_solver_labels,
                     )
                     proven_infeasible = False
+                    warm_start = self._write_warm_start(model, nl_file, nl_info, config)
                 except InfeasibleConstraintException:
                     proven_infeasible = True
                 timer.stop('write_nl_file')
@@ -424,6 +617,9 @@ class Ipopt(SolverBase):
                         env, *nl_info.external_function_libraries
                     )
                 self._verify_ipopt_options(config)
+                if warm_start:
+                    for opt, val in _warm_start_options.items():
+                        config.solver_options.setdefault(opt, val)
                 # Write the options file, if there should be one.  If
                 # the file was written, then 'options_file_name' was
                 # added to config.options (so we can correctly build the
@@ -443,24 +639,22 @@ class Ipopt(SolverBase):
                     timeout = None
 
                 ostreams = [io.StringIO()] + config.tee
+                if config.progress_callback is not None:
+                    log_parser = IpoptLogParser(config.progress_callback)
+                    ostreams.append(log_parser)
+                else:
+                    log_parser = None
                 timer.start('subprocess')
                 try:
-                    with TeeStream(*ostreams) as t:
-                        process = subprocess.run(
-                            cmd,
-                            timeout=timeout,
-                            env=env,
-                            universal_newlines=True,
-                            stdout=t.STDOUT,
-                            stderr=t.STDERR,
-                            check=False,
-                        )
+                    returncode = yield cmd, env, timeout, ostreams
                 except OSError:
                     err = sys.exc_info()[1]
                     msg = 'Could not execute the command: %s\tError message: %s'
                     raise ApplicationError(msg % (cmd, err))
                 finally:
                     timer.stop('subprocess')
+                    if log_parser is not None:
+                        log_parser.close()
 
                 # This is the data we need to parse to get the iterations
                 # and time
@@ -487,18 +681,35 @@ class Ipopt(SolverBase):
                     results.iteration_count = 0
                     results.timing_info.total_seconds = 0
             else:
+                # The progress_callback stopped Ipopt (which then reports
+                # the current point)
+                interrupted = (
+                    log_parser is not None and log_parser.termination_requested
+                )
                 if os.path.isfile(basename + '.sol'):
                     with open(basename + '.sol', 'r', encoding='utf-8') as sol_file:
                         timer.start('parse_sol')
-                        results = self._parse_solution(sol_file, nl_info)
+                        results = self._parse_solution(
+                            sol_file, nl_info, interrupted=interrupted
+                        )
                         timer.stop('parse_sol')
                 else:
                     results = Results()
-                if process.returncode != 0:
-                    results.extra_info.return_code = process.returncode
+                if returncode != 0 and not interrupted:
+                    results.extra_info.return_code = returncode
                     results.termination_condition = TerminationCondition.error
                     results.solution_loader = SolSolutionLoader(None, None)
                 else:
+                    if interrupted and (
+                        results.termination_condition
+                        != TerminationCondition.convergenceCriteriaSatisfied
+                    ):
+                        results.termination_condition = TerminationCondition.interrupted
+                        if results.solution_loader is None:
+                            # Ipopt exited before writing the .sol file
+                            results.solution_loader = SolSolutionLoader(None, None)
+                    if config.warm_start:
+                        self._update_warm_start(model, results)
                     try:
                         results.iteration_count = parsed_output_data.pop('iters')
                         cpu_seconds = parsed_output_data.pop('cpu_seconds')
@@ -517,6 +728,11 @@ class Ipopt(SolverBase):
                             f"Full error message: {e}\n"
                             f"Parsed solver data: {parsed_output_data}\n",
                         )
+        # Mark the variables as stale only once the solve is complete
+        # (and immediately before the solution is loaded), so that
+        # concurrent solve_async() calls in the same thread do not mark
+        # each other's solutions as stale.
+        StaleFlagManager.mark_all_as_stale()
         if (
             config.raise_exception_on_nonoptimal_result
             and results.solution_status != SolutionStatus.optimal
@@ -575,6 +791,35 @@ class Ipopt(SolverBase):
         results.timing_info.timer = timer
         return results
 
+    def _write_warm_start(self, model, ostream, nl_info, config):
+        # Append the multipliers from the previous solve of this model
+        # (if any) to the NL file.  Returns True if the solve should be
+        # warm-started.
+        if not config.warm_start:
+            return False
+        data = self._warm_start_cache.get(model, None)
+        if data is None:
+            return False
+        # Do not override suffixes that the user is explicitly exporting
+        exclude = {
+            suffix.local_name
+            for suffix in model.component_objects(Suffix, active=True)
+            if suffix.export_enabled() and suffix
+        }
+        data.write(ostream, nl_info, exclude)
+        return True
+
+    def _update_warm_start(self, model, results):
+        if results.solution_status not in {
+            SolutionStatus.feasible,
+            SolutionStatus.optimal,
+        }:
+            return
+        loader = results.solution_loader
+        self._warm_start_cache[model] = _WarmStartData(
+            loader._sol_data, loader._nl_info
+        )
+
     def _parse_ipopt_output(self, output: Union[str, io.StringIO]) -> Dict[str, Any]:
         parsed_data = {}
 
@@ -704,9 +949,14 @@ class Ipopt(SolverBase):
         return parsed_data
 
     def _parse_solution(
-        self, instream: io.TextIOBase, nl_info: NLWriterInfo
+        self, instream: io.TextIOBase, nl_info: NLWriterInfo, interrupted=False
     ) -> Results:
         results = Results()
+        if interrupted:
+            # Ipopt reports the point where it was interrupted with a
+            # failure status (which does not set the solution status):
+            # keep the (not necessarily feasible) point
+            results.solution_status = SolutionStatus.infeasible
         res, sol_data = parse_sol_file(
             sol_file=instream, nl_info=nl_info, result=results
         )
@@ -478,6 +478,18 @@ class TestGurobiPersistent(unittest.TestCase):
         res.solution_loader.load_vars(solution_number=2)
         self.assertAlmostEqual(pyo.value(m.obj.expr), 6.592304628123309)
 
+    def test_get_primals_array(self):
+        m = create_pmedian_model()
+        opt = GurobiPersistent()
+        opt.config.solver_options['PoolSolutions'] = 3
+        opt.config.solver_options['PoolSearchMode'] = 2
+        res = opt.solve(m)
+        variables = list(m.component_data_objects(pyo.Var))
+        for n in range(3):
+            primals = res.solution_loader.get_primals(solution_number=n)
+            vals = res.solution_loader.get_primals_array(variables, solution_number=n)
+            self.assertEqual(vals.tolist(), [primals[v] for v in variables])
+
     def test_zero_time_limit(self):
         m = create_pmedian_model()
         opt = GurobiPersistent()
@@ -713,3 +725,56 @@ class TestManualModel(unittest.TestCase):
         opt.remove_sos_constraints([m.c2])
         opt.update()
         self.assertEqual(opt._solver_model.getAttr('NumSOS'), 1)
+
+    def test_linear_constraint_block_row_order(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([1, 2, 3], bounds=(0, None))
+        m.obj = pyo.Objective(expr=sum(m.x.values()))
+        m.c1 = pyo.Constraint(expr=m.x[1] >= 1)
+        m.r = pyo.Constraint(expr=(1, m.x[1] + m.x[3], 10))
+        m.c2 = pyo.Constraint(expr=m.x[2] >= 2)
+        m.q = pyo.Constraint(expr=m.x[1] ** 2 + m.x[2] <= 20)
+        m.c3 = pyo.Constraint(expr=m.x[3] >= 3)
+
+        opt = self.opt
+        opt.config.symbolic_solver_labels = True
+        opt.set_instance(m)
+        opt.update()
+        # The rows are added in the order of the Pyomo constraints
+        self.assertEqual(
+            [c.ConstrName for c in opt._solver_model.getConstrs()],
+            ['c1', 'r', 'c2', 'c3'],
+        )
+        self.assertEqual([c.QCName for c in opt._solver_model.getQConstrs()], ['q'])
+
+    def test_linear_constraint_block(self):
+        m = pyo.ConcreteModel()
+        m.a = pyo.Set(initialize=[1, 2, 3])
+        m.x = pyo.Var(m.a, bounds=(0, None))
+        m.p = pyo.Param(m.a, mutable=True, initialize={1: 1, 2: 2, 3: 3})
+        m.q = pyo.Param(mutable=True, initialize=1)
+        m.obj = pyo.Objective(expr=sum(m.x.values()))
+        m.c = pyo.Constraint(m.a, rule=lambda m, i: m.x[i] >= m.p[i])
+        m.e = pyo.Constraint(expr=m.q * m.x[1] - m.x[2] <= 0)
+        m.r = pyo.Constraint(expr=(1, m.x[1] + m.x[3], 10))
+
+        opt = self.opt
+        opt.config.symbolic_solver_labels = True
+        opt.set_instance(m)
+        self.assertEqual(opt.get_model_attr('NumConstrs'), 5)
+        self.assertEqual(opt.get_linear_constraint_attr(m.c[2], 'RHS'), 2)
+        self.assertEqual(opt.get_linear_constraint_attr(m.c[2], 'ConstrName'), 'c[2]')
+        self.assertEqual(opt.get_linear_constraint_attr(m.e, 'Sense'), '<')
+        res = opt.solve(m)
+        self.assertAlmostEqual(res.incumbent_objective, 6)
+
+        m.p[1] = 4
+        m.q = 2
+        opt.update_parameters()
+        res = opt.solve(m)
+        self.assertAlmostEqual(m.x[1].value, 4)
+        self.assertAlmostEqual(m.x[2].value, 8)
+        self.assertAlmostEqual(res.incumbent_objective, 15)
+
+        opt.remove_constraints([m.c[1], m.c[2]])
+        self.assertEqual(opt.get_model_attr('NumConstrs'), 3)
@@ -9,10 +9,13 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+from concurrent.futures import ThreadPoolExecutor
+
 import pyomo.common.unittest as unittest
 import pyomo.environ as pyo
 
 from pyomo.contrib.solver.solvers.highs import Highs
+from pyomo.core.staleflag import StaleFlagManager
 
 opt = Highs()
 if not opt.available():
@@ -109,3 +112,96 @@ class TestBugs(unittest.TestCase):
         self.assertAlmostEqual(m.fx.value, 1, places=5)
         self.assertAlmostEqual(m.fy.value, 0, places=5)
         self.assertAlmostEqual(r.objective_bound, 0.5, places=5)
+
+
+class TestThreadSafety(unittest.TestCase):
+    def test_solve_threaded(self):
+        # Stress test: solve many distinct models concurrently in
+        # threads (persistent solvers are not shared between threads)
+        def _solve(i):
+            m = pyo.ConcreteModel()
+            m.x = pyo.Var(bounds=(-10, 10))
+            m.y = pyo.Var()
+            m.obj = pyo.Objective(expr=m.y)
+            m.c1 = pyo.Constraint(expr=m.y >= m.x + i)
+            m.c2 = pyo.Constraint(expr=m.y >= -m.x + i)
+            res = Highs().solve(m)
+            return res.objective_bound, m.x.value, m.y.value, m.y.stale
+
+        StaleFlagManager.set_thread_local()
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(_solve, range(40)))
+        finally:
+            StaleFlagManager.set_thread_local(False)
+        for i, (bound, x, y, stale) in enumerate(results):
+            self.assertAlmostEqual(bound, i)
+            self.assertAlmostEqual(x, 0)
+            self.assertAlmostEqual(y, i)
+            self.assertFalse(stale)
+
+
+class TestBulkLoad(unittest.TestCase):
+    def test_set_instance(self):
+        m = pyo.ConcreteModel()
+        m.I = pyo.RangeSet(100)
+        m.x = pyo.Var(m.I, bounds=(0, None))
+        m.y = pyo.Var(m.I, domain=pyo.Binary)
+        m.p = pyo.Param(mutable=True, initialize=2)
+        m.c = pyo.Constraint(m.I, rule=lambda m, i: m.x[i] <= 100 * m.y[i])
+        m.d = pyo.Constraint(expr=m.p * m.x[1] + sum(m.x.values()) >= 50)
+        m.e = pyo.Constraint(expr=sum(m.y.values()) <= m.p)
+        m.obj = pyo.Objective(expr=sum(m.x.values()) + sum(m.y.values()))
+
+        opt = Highs()
+        opt.set_instance(m)
+        self.assertIsNone(opt._bulk_data)
+        self.assertEqual(opt._solver_model.getNumCol(), 200)
+        self.assertEqual(opt._solver_model.getNumRow(), 102)
+        # Mutable parameter helpers are only created for rows that
+        # reference the mutable parameter
+        self.assertEqual(set(opt._mutable_helpers), {m.d, m.e})
+
+        res = opt.solve(m)
+        self.assertAlmostEqual(res.incumbent_objective, 50 / 3 + 1, places=5)
+        m.p = 3
+        res = opt.solve(m)
+        self.assertAlmostEqual(res.incumbent_objective, 12.5 + 1, places=5)
+
+    def test_load_solution(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([1, 2, 3], bounds=(0, None))
+        m.y = pyo.Var()
+        m.c1 = pyo.Constraint(expr=m.x[1] + m.x[2] >= 1)
+        m.c2 = pyo.Constraint(expr=m.x[2] + m.x[3] >= 2)
+        m.obj = pyo.Objective(expr=m.x[1] + 2 * m.x[2] + 3 * m.x[3])
+
+        opt = Highs()
+        res = opt.solve(m)
+        self.assertEqual([m.x[1].value, m.x[2].value, m.x[3].value], [0, 2, 0])
+        # Unused variables are not loaded
+        self.assertIsNone(m.y.value)
+        self.assertEqual(
+            res.solution_loader.get_primals_array([m.x[3], m.x[2]]).tolist(), [0, 2]
+        )
+        primals = res.solution_loader.get_primals()
+        self.assertEqual(len(primals), 3)
+        self.assertEqual(primals[m.x[2]], 2)
+        duals = res.solution_loader.get_duals()
+        self.assertEqual(list(duals), [m.c1, m.c2])
+        self.assertAlmostEqual(duals[m.c2], 2)
+
+        # The referenced columns are updated when the model changes
+        m.c3 = pyo.Constraint(expr=m.y >= m.x[1] + 3)
+        m.obj.expr += m.y
+        res = opt.solve(m)
+        self.assertAlmostEqual(m.y.value, 3)
+        self.assertEqual(len(res.solution_loader.get_primals()), 4)
+        del m.c3
+        m.obj.expr = m.x[1] + 2 * m.x[2] + 3 * m.x[3]
+        m.c4 = pyo.Constraint(expr=m.x[1] >= 1)
+        res = opt.solve(m)
+        self.assertEqual(
+            res.solution_loader.get_primals_array([m.x[1], m.x[2]]).tolist(), [1, 2]
+        )
+        self.assertEqual(len(res.solution_loader.get_primals()), 3)
@@ -9,8 +9,11 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import asyncio
+import io
 import os
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 
 import pyomo.environ as pyo
 from pyomo.common.envvar import is_windows
@@ -22,8 +25,10 @@ import pyomo.contrib.solver.solvers.ipopt as ipopt
 from pyomo.contrib.solver.common.util import NoSolutionError
 from pyomo.contrib.solver.common.results import TerminationCondition, SolutionStatus
 from pyomo.contrib.solver.common.factory import SolverFactory
+from pyomo.contrib.solver.solvers.sol_reader import SolFileData
 from pyomo.common import unittest, Executable
 from pyomo.common.tempfiles import TempfileManager
+from pyomo.core.staleflag import StaleFlagManager
 from pyomo.repn.plugins.nl_writer import NLWriter
 
 ipopt_available = ipopt.Ipopt().available()
@@ -85,6 +90,81 @@ class TestIpoptSolutionLoader(unittest.TestCase):
             loader.get_reduced_costs()
 
 
+class TestWarmStartData(unittest.TestCase):
+    def _write(self, m, **kwds):
+        OUT = io.StringIO()
+        nl_info = NLWriter().write(m, OUT, symbolic_solver_labels=True, **kwds)
+        return nl_info
+
+    def test_write(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var(bounds=(0, 10))
+        m.y = pyo.Var(bounds=(0, None))
+        m.z = pyo.Var(bounds=(None, 5))
+        m.c1 = pyo.Constraint(expr=m.x + m.y >= 1)
+        m.c2 = pyo.Constraint(expr=m.y + m.z <= 4)
+        m.o = pyo.Objective(expr=m.x**2 + m.y**2 + m.z**2)
+        nl_info = self._write(m)
+        self.assertEqual([v.name for v in nl_info.variables], ['x', 'y', 'z'])
+        self.assertEqual([c.name for c in nl_info.constraints], ['c1', 'c2'])
+
+        sol_data = SolFileData()
+        sol_data.primals = [1, 2, 3]
+        sol_data.duals = [0.5, -1.5]
+        sol_data.var_suffixes['ipopt_zL_out'] = {0: 0.25, 1: 2}
+        sol_data.var_suffixes['ipopt_zU_out'] = {0: -0.75, 2: -3}
+        data = ipopt._WarmStartData(sol_data, nl_info)
+
+        # Reorder the model (and drop a constraint)
+        m.c1.deactivate()
+        m.c3 = pyo.Constraint(expr=m.x + m.z >= 1)
+        m.o.deactivate()
+        m.o2 = pyo.Objective(expr=m.x + m.y**2 + m.z**2)
+        nl_info = self._write(m)
+        self.assertEqual([v.name for v in nl_info.variables], ['y', 'z', 'x'])
+        self.assertEqual([c.name for c in nl_info.constraints], ['c2', 'c3'])
+
+        OUT = io.StringIO()
+        data.write(OUT, nl_info, set())
+        self.assertEqual(
+            OUT.getvalue(),
+            "S4 2 ipopt_zL_in\n0 2.0\n2 0.25\n"
+            "S4 2 ipopt_zU_in\n1 -3.0\n2 -0.75\n"
+            "d1\n0 -1.5\n",
+        )
+
+        # Suffixes the user is exporting are not written
+        OUT = io.StringIO()
+        data.write(OUT, nl_info, {'ipopt_zU_in', 'dual'})
+        self.assertEqual(OUT.getvalue(), "S4 2 ipopt_zL_in\n0 2.0\n2 0.25\n")
+
+    def test_write_scaled(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var(bounds=(0, 10))
+        m.c = pyo.Constraint(expr=m.x >= 1)
+        m.o = pyo.Objective(expr=m.x**2)
+        m.scaling_factor = pyo.Suffix(direction=pyo.Suffix.EXPORT)
+        m.scaling_factor[m.x] = 2
+        m.scaling_factor[m.c] = 4
+        m.scaling_factor[m.o] = 8
+        nl_info = self._write(m)
+        sol_data = SolFileData()
+        sol_data.duals = [3]
+        sol_data.var_suffixes['ipopt_zL_out'] = {0: 5}
+        data = ipopt._WarmStartData(sol_data, nl_info)
+        # Values are stored unscaled
+        self.assertEqual(list(data.duals), [3 * 4 / 8])
+        self.assertEqual(list(data.zL), [5 * 2 / 8])
+        self.assertEqual(list(data.zU), [0])
+
+        # ... and rescaled when written
+        m.scaling_factor[m.x] = 1
+        nl_info = self._write(m)
+        OUT = io.StringIO()
+        data.write(OUT, nl_info, set())
+        self.assertEqual(OUT.getvalue(), "S4 1 ipopt_zL_in\n0 10.0\nd1\n0 3.0\n")
+
+
 @unittest.skipIf(not ipopt_available, "The 'ipopt' command is not available")
 class TestIpoptInterface(unittest.TestCase):
     def test_command_line_options(self):
@@ -478,6 +558,136 @@ class TestIpopt(unittest.TestCase):
         self.assertAlmostEqual(model.x.value, 1)
         self.assertAlmostEqual(model.y.value, 1)
 
+    def test_ipopt_solve_async(self):
+        models = [self.create_model() for i in range(4)]
+        solver = ipopt.Ipopt()
+        logs = [io.StringIO() for m in models]
+
+        async def _solve_all():
+            return await asyncio.gather(
+                *(solver.solve_async(m, tee=log) for m, log in zip(models, logs))
+            )
+
+        for model, log, results in zip(models, logs, asyncio.run(_solve_all())):
+            self.assertAlmostEqual(model.x.value, 1)
+            self.assertAlmostEqual(model.y.value, 1)
+            self.assertEqual(results.iteration_count, 11)
+            self.assertIn('Optimal Solution Found', log.getvalue())
+            self.assertEqual(results.solver_log, log.getvalue())
+
+    def test_ipopt_solve_async_working_dir(self):
+        # Concurrent solves in the same working directory (and thread)
+        # must not share interface files
+        models = []
+        for i in range(4):
+            m = pyo.ConcreteModel(name='model')
+            m.x = pyo.Var()
+            m.o = pyo.Objective(expr=(m.x - i) ** 2)
+            models.append(m)
+        solver = ipopt.Ipopt()
+
+        async def _solve_all(working_dir):
+            return await asyncio.gather(
+                *(solver.solve_async(m, working_dir=working_dir) for m in models)
+            )
+
+        with TempfileManager.new_context() as tempfile:
+            working_dir = tempfile.mkdtemp()
+            asyncio.run(_solve_all(working_dir))
+            self.assertEqual(
+                len({f for f in os.listdir(working_dir) if f.endswith('.nl')}), 4
+            )
+        for i, m in enumerate(models):
+            self.assertAlmostEqual(m.x.value, i)
+        # The stale flags are the same as if the models had been solved
+        # sequentially: only the last solution loaded is not stale
+        self.assertEqual(sum(not m.x.stale for m in models), 1)
+
+    def test_ipopt_progress_callback_interrupt(self):
+        # A (large) chained Rosenbrock problem, so that Ipopt is still
+        # running when the interrupt arrives
+        m = pyo.ConcreteModel()
+        m.I = pyo.RangeSet(5000)
+        m.x = pyo.Var(m.I, initialize=-1.2)
+        m.o = pyo.Objective(
+            expr=sum(
+                100 * (m.x[i + 1] - m.x[i] ** 2) ** 2 + (1 - m.x[i]) ** 2
+                for i in m.I
+                if i < 5000
+            )
+        )
+        records = []
+
+        def callback(progress):
+            records.append(progress)
+            return progress.iteration >= 1
+
+        results = ipopt.Ipopt().solve(
+            m, progress_callback=callback, raise_exception_on_nonoptimal_result=False
+        )
+        self.assertEqual(
+            results.termination_condition, TerminationCondition.interrupted
+        )
+        self.assertLess(len(records), 100)
+        # The point where Ipopt stopped is loaded into the model
+        self.assertNotEqual(results.solution_status, SolutionStatus.noSolution)
+        self.assertFalse(m.x[1].stale)
+        self.assertNotAlmostEqual(m.x[1].value, 1)
+
+    def test_ipopt_solve_threaded(self):
+        # Stress test: solve many distinct models concurrently in
+        # threads using a single solver object
+        solver = ipopt.Ipopt()
+
+        def _solve(i):
+            m = pyo.ConcreteModel()
+            m.x = pyo.Var()
+            m.y = pyo.Var()
+            m.o = pyo.Objective(expr=(m.x - i) ** 2 + (m.y - 2 * i) ** 2)
+            results = solver.solve(m)
+            return m.x.value, m.y.value, m.x.stale, results.solver_log
+
+        StaleFlagManager.set_thread_local()
+        try:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                results = list(executor.map(_solve, range(40)))
+        finally:
+            StaleFlagManager.set_thread_local(False)
+        for i, (x, y, stale, log) in enumerate(results):
+            self.assertAlmostEqual(x, i)
+            self.assertAlmostEqual(y, 2 * i)
+            self.assertFalse(stale)
+            self.assertIn('Optimal Solution Found', log)
+
+    def test_ipopt_warm_start(self):
+        model = pyo.ConcreteModel()
+        model.x = pyo.Var(bounds=(0, None))
+        model.y = pyo.Var(bounds=(0, None))
+        model.p = pyo.Param(initialize=1, mutable=True)
+        model.c = pyo.Constraint(expr=model.x + 2 * model.y >= model.p)
+        model.o = pyo.Objective(expr=model.x**2 + model.y**2 + model.x * model.y)
+        solver = ipopt.Ipopt(warm_start=True)
+        results = solver.solve(model)
+        cold_iters = results.iteration_count
+        self.assertNotIn('warm_start_init_point', results.solver_config.solver_options)
+        self.assertIn(model, solver._warm_start_cache)
+
+        # Re-solving the slightly perturbed model is warm-started from
+        # the previous solution (including the multipliers)
+        model.p = 1.01
+        results = solver.solve(model)
+        self.assertEqual(
+            results.solver_config.solver_options['warm_start_init_point'], 'yes'
+        )
+        self.assertLess(results.iteration_count, cold_iters)
+        self.assertAlmostEqual(model.y.value, 1.01 * 3 / 7, places=5)
+
+        # Explicit solver_options are not overridden
+        results = solver.solve(model, solver_options={'warm_start_init_point': 'no'})
+        self.assertEqual(
+            results.solver_config.solver_options['warm_start_init_point'], 'no'
+        )
+
     def test_ipopt_results(self):
         model = self.create_model()
         results = ipopt.Ipopt().solve(model)
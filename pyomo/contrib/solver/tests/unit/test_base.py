@@ -9,7 +9,9 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import asyncio
 import os
+import threading
 
 from pyomo.common import unittest
 from pyomo.common.config import ConfigDict
@@ -29,6 +31,7 @@ class TestSolverBase(unittest.TestCase):
             'available',
             'is_persistent',
             'solve',
+            'solve_async',
             'version',
         ]
         method_list = [
@@ -46,6 +49,8 @@ class TestSolverBase(unittest.TestCase):
             self.assertEqual(instance.version(), None)
         with self.assertRaises(NotImplementedError):
             self.assertEqual(instance.solve(None), None)
+        with self.assertRaises(NotImplementedError):
+            asyncio.run(instance.solve_async(None))
         with self.assertRaises(NotImplementedError):
             self.assertEqual(instance.available(), None)
 
@@ -63,6 +68,23 @@ class TestSolverBase(unittest.TestCase):
         instance = base.SolverBase(name='my_unique_name')
         self.assertEqual(instance.name, 'my_unique_name')
 
+    def test_solve_async(self):
+        class _Solver(base.SolverBase):
+            def solve(self, model, **kwds):
+                return threading.get_ident(), model, kwds
+
+        async def _solve_all():
+            return await asyncio.gather(
+                *(_Solver().solve_async(i, tee=True) for i in range(3))
+            )
+
+        results = asyncio.run(_solve_all())
+        self.assertEqual(
+            [r[1:] for r in results], [(i, {'tee': True}) for i in range(3)]
+        )
+        # The solves were run outside the event loop thread
+        self.assertNotIn(threading.get_ident(), [r[0] for r in results])
+
 
 class TestPersistentSolverBase(unittest.TestCase):
     def test_class_method_list(self):
@@ -86,6 +108,7 @@ class TestPersistentSolverBase(unittest.TestCase):
             'set_instance',
             'set_objective',
             'solve',
+            'solve_async',
             'update_parameters',
             'update_variables',
             'version',
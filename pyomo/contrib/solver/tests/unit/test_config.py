@@ -79,6 +79,12 @@ class TestSolverConfig(unittest.TestCase):
         self.assertEqual(config.time_limit, 1.0)
         self.assertIsInstance(config.time_limit, float)
 
+    def test_progress_callback_not_supported(self):
+        # Only the interfaces that parse the solver log declare the
+        # progress_callback option
+        with self.assertRaisesRegex(ValueError, "progress_callback"):
+            SolverConfig()(value={'progress_callback': lambda progress: None})
+
 
 class TestBranchAndBoundConfig(unittest.TestCase):
     def test_interface_default_instantiation(self):
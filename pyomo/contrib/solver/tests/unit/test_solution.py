@@ -9,7 +9,10 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import pyomo.environ as pyo
 from pyomo.common import unittest
+from pyomo.common.collections import ComponentMap
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.contrib.solver.common.solution_loader import (
     SolutionLoaderBase,
     PersistentSolutionLoader,
@@ -18,7 +21,13 @@ from pyomo.contrib.solver.common.solution_loader import (
 
 class TestSolutionLoaderBase(unittest.TestCase):
     def test_member_list(self):
-        expected_list = ['load_vars', 'get_primals', 'get_duals', 'get_reduced_costs']
+        expected_list = [
+            'load_vars',
+            'get_primals',
+            'get_primals_array',
+            'get_duals',
+            'get_reduced_costs',
+        ]
         method_list = [
             method
             for method in dir(SolutionLoaderBase)
@@ -30,17 +39,38 @@ class TestSolutionLoaderBase(unittest.TestCase):
         self.instance = SolutionLoaderBase()
         with self.assertRaises(NotImplementedError):
             self.instance.get_primals()
+        with self.assertRaises(NotImplementedError):
+            self.instance.get_primals_array([])
         with self.assertRaises(NotImplementedError):
             self.instance.get_duals()
         with self.assertRaises(NotImplementedError):
             self.instance.get_reduced_costs()
 
+    @unittest.skipUnless(numpy_available, "numpy is not available")
+    def test_get_primals_array(self):
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([1, 2, 3])
+
+        class Loader(SolutionLoaderBase):
+            def get_primals(self, vars_to_load=None):
+                return ComponentMap((v, 10 * v.index()) for v in vars_to_load)
+
+        vals = Loader().get_primals_array([m.x[3], m.x[1]])
+        self.assertIsInstance(vals, np.ndarray)
+        self.assertEqual(vals.tolist(), [30, 10])
+
 
 class TestSolSolutionLoader(unittest.TestCase):
     # I am currently unsure how to test this further because it relies heavily on
     # SolFileData and NLWriterInfo
     def test_member_list(self):
-        expected_list = ['load_vars', 'get_primals', 'get_duals', 'get_reduced_costs']
+        expected_list = [
+            'load_vars',
+            'get_primals',
+            'get_primals_array',
+            'get_duals',
+            'get_reduced_costs',
+        ]
         method_list = [
             method
             for method in dir(SolutionLoaderBase)
@@ -54,6 +84,7 @@ class TestPersistentSolutionLoader(unittest.TestCase):
         expected_list = [
             'load_vars',
             'get_primals',
+            'get_primals_array',
             'get_duals',
             'get_reduced_costs',
             'invalidate',
@@ -78,3 +109,7 @@ class TestPersistentSolutionLoader(unittest.TestCase):
         self.instance.invalidate()
         with self.assertRaises(RuntimeError):
             self.instance.get_primals()
+        with self.assertRaises(RuntimeError):
+            self.instance.get_primals_array([])
+        with self.assertRaises(RuntimeError):
+            self.instance.load_vars()
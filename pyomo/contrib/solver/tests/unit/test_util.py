@@ -9,14 +9,25 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import asyncio
+import io
+import subprocess
+import sys
+import time
+
 from pyomo.common import unittest
 import pyomo.environ as pyo
-from pyomo.contrib.solver.common.util import collect_vars_and_named_exprs, get_objective
+from pyomo.contrib.solver.common.util import (
+    collect_vars_and_named_exprs,
+    get_objective,
+    run_subprocess_async,
+)
 from pyomo.opt.results.solver import (
     SolverStatus as LegacySolverStatus,
     TerminationCondition as LegacyTerminationCondition,
 )
 from pyomo.opt.results import SolverResults as LegacySolverResults
+from pyomo.opt.solver.log_parser import IpoptLogParser
 from pyomo.contrib.solver.common.results import Results, SolutionStatus
 from typing import Callable
 from pyomo.common.gsl import find_GSL
@@ -124,3 +135,74 @@ class TestGenericUtils(unittest.TestCase):
         results.solver.termination_condition = LegacySolverStatus.aborted
         with self.assertRaises(RuntimeError):
             pyo.assert_optimal_termination(results)
+
+
+class TestRunSubprocessAsync(unittest.TestCase):
+    def test_output_and_returncode(self):
+        cmd = [
+            sys.executable,
+            '-c',
+            'import sys; print("out"); print("err", file=sys.stderr); sys.exit(3)',
+        ]
+        streams = [io.StringIO(), io.StringIO()]
+        rc = asyncio.run(run_subprocess_async(cmd, streams))
+        self.assertEqual(rc, 3)
+        for stream in streams:
+            self.assertEqual(sorted(stream.getvalue().splitlines()), ['err', 'out'])
+
+    def test_concurrent(self):
+        cmd = [sys.executable, '-c', 'import time; time.sleep(0.5)']
+
+        async def _run_all():
+            return await asyncio.gather(
+                *(run_subprocess_async(cmd, []) for i in range(4))
+            )
+
+        start = time.time()
+        self.assertEqual(asyncio.run(_run_all()), [0] * 4)
+        self.assertLess(time.time() - start, 1.5)
+
+    def test_timeout(self):
+        cmd = [
+            sys.executable,
+            '-c',
+            'import sys, time; print("started"); sys.stdout.flush(); time.sleep(10)',
+        ]
+        stream = io.StringIO()
+        start = time.time()
+        with self.assertRaises(subprocess.TimeoutExpired):
+            asyncio.run(run_subprocess_async(cmd, [stream], timeout=1))
+        self.assertLess(time.time() - start, 5)
+        self.assertEqual(stream.getvalue(), 'started\n')
+
+    def test_log_parser_interrupt(self):
+        cmd = [
+            sys.executable,
+            '-c',
+            'import time\n'
+            'for i in range(1000):\n'
+            '    print("%4d  1.0e+00 1.0e+00 1.0e+00  -1.0 0.0e+00    -  '
+            '0.0e+00 0.0e+00   0" % i, flush=True)\n'
+            '    time.sleep(0.01)\n',
+        ]
+        parser = IpoptLogParser(lambda progress: progress.iteration >= 5)
+        start = time.time()
+        rc = asyncio.run(run_subprocess_async(cmd, [parser]))
+        self.assertLess(time.time() - start, 5)
+        self.assertNotEqual(rc, 0)
+        self.assertTrue(parser.termination_requested)
+        self.assertLess(parser.last_progress.iteration, 100)
+
+    def test_cancel(self):
+        cmd = [sys.executable, '-c', 'import time; time.sleep(10)']
+
+        async def _cancel():
+            task = asyncio.ensure_future(run_subprocess_async(cmd, []))
+            await asyncio.sleep(0.5)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        start = time.time()
+        asyncio.run(_cancel())
+        self.assertLess(time.time() - start, 5)
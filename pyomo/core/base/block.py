@@ -12,7 +12,10 @@
 from __future__ import annotations
 import copy
 import functools
+import gc
 import logging
+import os
+import pickle
 import sys
 import weakref
 import textwrap
@@ -20,13 +23,14 @@ import textwrap
 from collections import defaultdict
 from contextlib import contextmanager
 from inspect import isclass, currentframe
-from io import StringIO
+from io import BytesIO, StringIO
 from itertools import filterfalse, chain
 from operator import itemgetter, attrgetter
 from typing import Union, Any, Type
 
 from pyomo.common.autoslots import AutoSlots
 from pyomo.common.collections import Mapping
+from pyomo.common.dependencies import multiprocessing
 from pyomo.common.deprecation import deprecated, deprecation_warning, RenamedClass
 from pyomo.common.formatting import StreamIndenter
 from pyomo.common.gc_manager import PauseGC
@@ -34,6 +38,7 @@ from pyomo.common.log import is_debug_set
 from pyomo.common.pyomo_typing import overload
 from pyomo.common.timing import ConstructionTimer
 from pyomo.core.base.component import (
+    ComponentBase,
     Component,
     ComponentData,
     ActiveComponentData,
@@ -41,7 +46,7 @@ from pyomo.core.base.component import (
 )
 from pyomo.core.base.enums import SortComponents, TraversalStrategy
 from pyomo.core.base.global_set import UnindexedComponent_index
-from pyomo.core.base.componentuid import ComponentUID
+from pyomo.core.base.componentuid import ComponentUID, _invalidate_resolution_index
 from pyomo.core.base.set import Any
 from pyomo.core.base.var import Var
 from pyomo.core.base.initializer import Initializer
@@ -253,6 +258,102 @@ class _BlockConstruction(object):
     data = {}
 
 
+class _ParallelBlockConstruction(object):
+    """
+    This class holds the state used when constructing the BlockData
+    objects of an IndexedBlock in (forked) worker processes.
+
+    The workers inherit the model (and this state) from the parent
+    process, so only the position of each index needs to be sent to
+    the workers.  Each worker fires the block rule and returns the
+    pickled BlockData.  References from the new BlockData to
+    components outside of it (e.g., Vars declared on the parent model)
+    are pickled by ComponentUID and resolved against the model in the
+    parent process.  Components that cannot be found by name
+    (anonymous sets and components not attached to the model) are
+    pickled by id if they existed when the workers were forked (as
+    forked workers share the parent's addresses) and resolved to the
+    original object in the parent process.
+    """
+
+    block = None
+    indices = None
+    # All (gc-tracked) objects that existed when the workers were
+    # forked.  This also keeps them alive (and their ids valid) in the
+    # parent process until the construction is complete.
+    objects = None
+    _object_ids = None
+    _objects_by_id = None
+
+    @staticmethod
+    def worker(i):
+        self = _ParallelBlockConstruction
+        _block = self.block._getitem_when_not_present(self.indices[i])
+        buf = BytesIO()
+        _BlockDataPickler(buf, _block).dump(_block)
+        return buf.getvalue()
+
+    @staticmethod
+    def existed_before_fork(obj):
+        self = _ParallelBlockConstruction
+        if self._object_ids is None:
+            self._object_ids = set(map(id, self.objects))
+        return id(obj) in self._object_ids
+
+    @staticmethod
+    def object_by_id(obj_id):
+        self = _ParallelBlockConstruction
+        if self._objects_by_id is None:
+            self._objects_by_id = dict(zip(map(id, self.objects), self.objects))
+        return self._objects_by_id[obj_id]
+
+    @staticmethod
+    def reset(objects=None):
+        self = _ParallelBlockConstruction
+        self.objects = objects
+        self._object_ids = None
+        self._objects_by_id = None
+
+
+class _BlockDataPickler(pickle.Pickler):
+    def __init__(self, file, block):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._block = block
+        self._model = block.model()
+
+    def persistent_id(self, obj):
+        if not isinstance(obj, ComponentBase):
+            return None
+        if obj.model() is self._model:
+            b = obj if isinstance(obj, BlockData) else obj.parent_block()
+            while b is not None:
+                if b is self._block:
+                    return None
+                b = b.parent_block()
+            comp = obj.parent_component()
+            parent = comp.parent_block()
+            if parent is None or parent.component(comp.local_name) is comp:
+                return str(ComponentUID(obj))
+        # Anonymous (e.g., implicit index sets) and unattached
+        # components cannot be found by name: refer to the original
+        # object (by id) so that all references resolve to the same
+        # object in the parent process.
+        if _ParallelBlockConstruction.existed_before_fork(obj):
+            return id(obj)
+        return None
+
+
+class _BlockDataUnpickler(pickle.Unpickler):
+    def __init__(self, file, model):
+        super().__init__(file)
+        self._model = model
+
+    def persistent_load(self, pid):
+        if pid.__class__ is int:
+            return _ParallelBlockConstruction.object_by_id(pid)
+        return ComponentUID(pid).find_component_on(self._model)
+
+
 class PseudoMap(AutoSlots.Mixin):
     """
     This class presents a "mock" dict interface to the internal
@@ -925,6 +1026,35 @@ class BlockData(ActiveComponentData):
         """
         return ComponentUID(label_or_component).find_component_on(self)
 
+    def find_components(self, labels_or_components):
+        """
+        Returns a list of components in the block given their names.
+
+        This is equivalent to calling :meth:`find_component` for each
+        entry, but is more efficient when resolving many components
+        (e.g., when loading data keyed by ComponentUID): ComponentUID
+        entries are used directly, and components that share a common
+        path are only resolved once.
+
+        Parameters
+        ----------
+        labels_or_components : Iterable of str, Component, or ComponentUID
+            The names of the components to find in this block.
+
+        Returns
+        -------
+        list
+            The components on the block identified by each entry (None
+            for entries where a matching component is not found).
+
+        """
+        return [
+            (x if x.__class__ is ComponentUID else ComponentUID(x)).find_component_on(
+                self
+            )
+            for x in labels_or_components
+        ]
+
     @contextmanager
     def _declare_reserved_components(self):
         # Temporarily mask the class reserved words like with a local
@@ -1175,6 +1305,8 @@ component, use the block del_component() and add_component() methods.
 
         # Clear the _parent attribute
         obj._parent = None
+        # Any (cached) ComponentUID resolutions may now be stale
+        _invalidate_resolution_index()
         # Update the context of any anonymous sets
         if getattr(obj, '_anonymous_sets', None) is not None:
             for _set in obj._anonymous_sets:
@@ -2107,7 +2239,14 @@ class Block(ActiveIndexedComponent):
     # `options` is ignored since it is deprecated
     @overload
     def __init__(
-        self, *indexes, rule=None, concrete=False, dense=True, name=None, doc=None
+        self,
+        *indexes,
+        rule=None,
+        concrete=False,
+        dense=True,
+        parallel=None,
+        name=None,
+        doc=None,
     ): ...
 
     def __init__(self, *args, **kwargs):
@@ -2120,6 +2259,9 @@ class Block(ActiveIndexedComponent):
         # As dense applies to the whole container, we will not use an
         # initializer
         self._dense = kwargs.pop('dense', True)
+        # Number of worker processes to use when constructing the
+        # BlockData objects of an IndexedBlock (True uses all CPUs)
+        self._parallel = kwargs.pop('parallel', None)
         kwargs.setdefault('ctype', Block)
         if _options is not None:
             deprecation_warning(
@@ -2216,9 +2358,10 @@ class Block(ActiveIndexedComponent):
                 if self.index_set().isfinite() and (
                     self._dense or self._rule is not None
                 ):
-                    for _idx in self.index_set():
-                        # Trigger population & call the rule
-                        self._getitem_when_not_present(_idx)
+                    if not self._construct_in_parallel():
+                        for _idx in self.index_set():
+                            # Trigger population & call the rule
+                            self._getitem_when_not_present(_idx)
             else:
                 # We must check that any pre-existing components are
                 # constructed.  This catches the case where someone is
@@ -2252,6 +2395,59 @@ class Block(ActiveIndexedComponent):
                 _BlockConstruction.data.pop(id(self), None)
             timer.report()
 
+    def _construct_in_parallel(self):
+        """Construct the BlockData objects using worker processes
+
+        This fires the rule for each index in a separate (forked)
+        worker process and attaches the resulting BlockData objects in
+        the order of the index set.  Rules must only modify the block
+        being constructed: changes to other parts of the model made by
+        the rule are not propagated back from the workers.
+
+        Returns False if the block should be constructed serially
+        (parallel construction was not requested, there is no rule,
+        the block is not attached to a model, the 'fork' start method
+        is not available, or we are already inside a worker process).
+
+        """
+        nproc = self._parallel
+        if not nproc or self._rule is None or self.parent_block() is None:
+            return False
+        if nproc is True:
+            nproc = os.cpu_count() or 1
+        indices = list(self.index_set())
+        nproc = min(nproc, len(indices))
+        if nproc < 2 or _ParallelBlockConstruction.block is not None:
+            return False
+        if 'fork' not in multiprocessing.get_all_start_methods():
+            logger.warning(
+                "Parallel construction of Block '%s' requires the 'fork' "
+                "multiprocessing start method.  Constructing the block "
+                "serially." % (self.name,)
+            )
+            return False
+
+        model = self.model()
+        _ParallelBlockConstruction.block = self
+        _ParallelBlockConstruction.indices = indices
+        _ParallelBlockConstruction.reset(gc.get_objects())
+        try:
+            with multiprocessing.get_context('fork').Pool(nproc) as pool:
+                results = pool.imap(
+                    _ParallelBlockConstruction.worker,
+                    range(len(indices)),
+                    chunksize=max(1, len(indices) // (4 * nproc)),
+                )
+                for idx, data in zip(indices, results):
+                    _block = _BlockDataUnpickler(BytesIO(data), model).load()
+                    _block._index = idx
+                    self._data[idx] = _block
+        finally:
+            _ParallelBlockConstruction.block = None
+            _ParallelBlockConstruction.indices = None
+            _ParallelBlockConstruction.reset()
+        return True
+
     def _pprint_callback(self, ostream, idx, data):
         if not self.is_indexed():
             data._pprint_blockdata_components(ostream)
@@ -11,11 +11,13 @@
 
 import codecs
 import re
+import weakref
 import ply.lex
 
 from pyomo.common.collections import ComponentMap
 from pyomo.common.dependencies import pickle
 from pyomo.common.deprecation import deprecated
+from pyomo.core.base.component import Component
 from pyomo.core.base.component_namer import (
     literals,
     special_chars,
@@ -27,6 +29,23 @@ from pyomo.core.base.indexed_component_slice import IndexedComponent_slice
 from pyomo.core.base.reference import Reference
 
 
+# Index of (previously resolved) components for each block: maps the
+# (hashable) CUID path to a component to the component.  As components
+# are only ever added to (and not moved within) the model, entries can
+# only become stale when components or block data are removed, so the
+# entire index is cleared whenever that happens (see
+# _invalidate_resolution_index()).
+_resolution_index = weakref.WeakKeyDictionary()
+
+# Upper bound on the number of parsed CUID strings that we will cache
+_PARSE_CACHE_SIZE = 100000
+
+
+def _invalidate_resolution_index():
+    if _resolution_index:
+        _resolution_index.clear()
+
+
 class _NotSpecified(object):
     pass
 
@@ -71,6 +90,7 @@ class ComponentUID(object):
     __slots__ = ('_cids',)
 
     _lex = None
+    _parse_cache = {}
     _repr_v1_map = {
         slice: lambda x: '*',
         Ellipsis.__class__: lambda x: '**',
@@ -85,10 +105,7 @@ class ComponentUID(object):
         if isinstance(component, str):
             if context is not None:
                 _context_err(str)
-            try:
-                self._cids = tuple(self._parse_cuid_v2(component))
-            except (OSError, IOError):
-                self._cids = tuple(self._parse_cuid_v1(component))
+            self._cids = self._parse_cuid(component)
         elif type(component) is ComponentUID:
             if context is not None:
                 _context_err(ComponentUID)
@@ -448,6 +465,25 @@ class ComponentUID(object):
         rcuid.reverse()
         return rcuid
 
+    def _parse_cuid(self, label):
+        """Parse a string (v2 or v1 repr format) into the _cids tuple
+
+        As models are commonly queried repeatedly using the same
+        strings, the parsed results are cached.
+
+        """
+        _cache = ComponentUID._parse_cache
+        cids = _cache.get(label, None)
+        if cids is None:
+            try:
+                cids = tuple(self._parse_cuid_v2(label))
+            except (OSError, IOError):
+                cids = tuple(self._parse_cuid_v1(label))
+            if len(_cache) >= _PARSE_CACHE_SIZE:
+                _cache.clear()
+            _cache[label] = cids
+        return cids
+
     def _parse_cuid_v2(self, label):
         """Parse a string (v2 repr format) and yield name, idx pairs
 
@@ -533,21 +569,71 @@ class ComponentUID(object):
                     yield (c_info[0], tuple(idx))
 
     def _resolve_cuid(self, block):
-        obj = block
-        for name, idx in self._cids:
+        if not self._cids:
+            return block
+        name, idx = self._cids[-1]
+        obj = self._resolve_component(block, self._cids[:-1], name)
+        if obj is None or not idx:
+            return obj
+        try:
+            if len(idx) == 1:
+                return obj[idx[0]]
+            else:
+                return obj[idx]
+        except KeyError:
+            return None
+        except AttributeError:
+            return None
+        except IndexError:
+            return None
+
+    def _resolve_component(self, block, path, name):
+        """Return the component `name` on the block identified by `path`
+
+        Components are looked up in (and recorded in) the resolution
+        index for the block, so that models queried repeatedly (e.g.,
+        when loading data) do not need to re-walk the model hierarchy.
+        Paths containing slices are resolved directly.
+
+        """
+        try:
+            index = _resolution_index.get(block, None)
+        except TypeError:
+            # block does not support weak references
+            index = None
+            key = None
+        else:
+            key = (path, name)
             try:
-                if not idx:
-                    obj = getattr(obj, name)
-                elif len(idx) == 1:
-                    obj = getattr(obj, name)[idx[0]]
+                return index[key]
+            except (KeyError, TypeError):
+                # not in the index (or the path is not hashable)
+                pass
+
+        obj = block
+        try:
+            for _name, _idx in path:
+                if not _idx:
+                    obj = getattr(obj, _name)
+                elif len(_idx) == 1:
+                    obj = getattr(obj, _name)[_idx[0]]
                 else:
-                    obj = getattr(obj, name)[idx]
-            except KeyError:
-                return None
-            except AttributeError:
-                return None
-            except IndexError:
-                return None
+                    obj = getattr(obj, _name)[_idx]
+            obj = getattr(obj, name)
+        except KeyError:
+            return None
+        except AttributeError:
+            return None
+        except IndexError:
+            return None
+
+        if key is not None and isinstance(obj, Component):
+            if index is None:
+                index = _resolution_index[block] = {}
+            try:
+                index[key] = obj
+            except TypeError:
+                pass
         return obj
 
     @deprecated(
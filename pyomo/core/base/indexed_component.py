@@ -27,6 +27,7 @@ from pyomo.core.pyomoobject import PyomoObject
 from pyomo.common import DeveloperError
 from pyomo.common.autoslots import fast_deepcopy
 from pyomo.common.collections import ComponentSet
+from pyomo.common.dependencies import numpy
 from pyomo.common.deprecation import deprecated, deprecation_warning
 from pyomo.common.errors import TemplateExpressionError
 from pyomo.common.modeling import NOTSET
@@ -37,6 +38,11 @@ from collections.abc import Sequence
 
 logger = logging.getLogger('pyomo.core')
 
+# When a sparse component is indexed by a cross product with more than
+# this many members for every data object, keys() orders the data by
+# position in the product instead of scanning the entire product.
+_SPARSE_PRODUCT_RATIO = 32
+
 sequence_types = {tuple, list}
 slicer_types = {slice, Ellipsis.__class__, IndexedComponent_slice}
 
@@ -379,6 +385,7 @@ class IndexedComponent(Component):
         """Clear the data in this component"""
         if self.is_indexed():
             self._data = {}
+            BASE.componentuid._invalidate_resolution_index()
         else:
             raise DeveloperError(
                 "Derived scalar component %s failed to define clear()."
@@ -470,6 +477,21 @@ class IndexedComponent(Component):
             else:
                 return self._data.__iter__()
 
+        if (
+            self._data.__class__ is dict
+            and isinstance(self._index_set, BASE.set.SetProduct_OrderedSet)
+            and len(self._data) * _SPARSE_PRODUCT_RATIO < len(self._index_set)
+        ):
+            #
+            # The data is very sparse relative to a (potentially huge)
+            # cross product.  Rather than walk the entire product, sort
+            # the existing indices by their (arithmetically computed)
+            # position in the product.
+            #
+            if SortComponents.SORTED_INDICES in sort:
+                return iter(sorted_robust(self._data))
+            return iter(sorted(self._data, key=self._index_set.ord))
+
         if SortComponents.SORTED_INDICES in sort:
             ans = self._index_set.sorted_iter()
         elif SortComponents.ORDERED_INDICES in sort:
@@ -558,6 +580,19 @@ You can silence this warning by one of three ways:
                 pass
         return map(self.__getitem__, self.keys(sort))
 
+    def _values_list(self):
+        """Return a list of the component data objects (in keys() order)
+
+        This is a fast equivalent of ``list(self.values())`` for
+        bulk operations: it bypasses __getitem__ for all indices that
+        are already present in the underlying data store.
+
+        """
+        try:
+            return list(map(self._data.__getitem__, self.keys()))
+        except KeyError:
+            return list(self.values())
+
     def items(self, sort=SortComponents.UNSORTED, ordered=NOTSET):
         """Return an iterator of (index,data) component data tuples
 
@@ -747,6 +782,8 @@ You can silence this warning by one of three ways:
                 # Remove reference to this object
                 self._data[index]._component = None
             del self._data[index]
+            # Any (cached) ComponentUID resolutions may now be stale
+            BASE.componentuid._invalidate_resolution_index()
 
     def _construct_from_rule_using_setitem(self):
         if self._rule is None:
@@ -807,6 +844,26 @@ You can silence this warning by one of three ways:
             "not been constructed." % (self.name, idx_str)
         )
 
+    def _indices_are_valid_integers(self, indices):
+        """Test if all the indices are native ints within the index set
+
+        This allows callers processing many incoming indices at once
+        (e.g., from numeric initialization data) to bypass calling
+        :meth:`_validate_index` on each index.  The test is performed in
+        a single vectorized pass and is only supported for integer
+        indices into (numeric) range sets.
+
+        """
+        if not isinstance(self._index_set, BASE.set.InfiniteRangeSetData):
+            return False
+        if not isinstance(indices, range) and any(
+            i.__class__ is not int for i in indices
+        ):
+            return False
+        return bool(
+            BASE.set._array_in_domain(self._index_set, numpy.array(list(indices)))
+        )
+
     def _validate_index(self, idx):
         if not IndexedComponent._DEFAULT_INDEX_CHECKING_ENABLED:
             # Return whatever index was provided if the global flag dictates
@@ -1188,6 +1245,27 @@ class ActiveIndexedComponent(IndexedComponent, ActiveComponent):
 # Ideally, this would inherit from np.lib.mixins.NDArrayOperatorsMixin,
 # but doing so overrides things like __contains__ in addition to the
 # operators that we are interested in.
+def _array_to_list(values, expected_len, name, nan_to_none=True):
+    """Convert a 1-D array of values into a list of Python scalars
+
+    This is a helper for the bulk (array-based) component APIs.  If
+    ``nan_to_none`` is True, NaN entries are mapped to None.
+
+    """
+    values = numpy.asarray(values)
+    if values.ndim != 1 or values.shape[0] != expected_len:
+        raise ValueError(
+            f"Array of shape {values.shape} is not compatible with "
+            f"component '{name}' ({expected_len} entries)"
+        )
+    if nan_to_none and values.dtype.kind == 'f':
+        nan = numpy.isnan(values)
+        if nan.any():
+            values = values.astype(object)
+            values[nan] = None
+    return values.tolist()
+
+
 class IndexedComponent_NDArrayMixin(object):
     """Support using IndexedComponent with numpy.ndarray
 
@@ -303,6 +303,40 @@ class ItemInitializer(InitializerBase):
         except AttributeError:
             return range(len(self._dict))
 
+    def numeric_values(self):
+        """Return the indices and values, along with the values as an ndarray
+
+        This supports vectorized processing (e.g., domain validation)
+        of the initialization data.  Returns a tuple ``(indices, values,
+        array)``, where ``values`` is a list of the (original) values
+        and ``array`` is a 1-D numeric numpy.ndarray of the same values.
+        Returns None if the data is not a dict, sequence, numpy.ndarray
+        or pandas.Series of numeric values (or if numpy is not
+        available).
+
+        """
+        if not numpy_available or isinstance(self._dict, PyomoObject):
+            return None
+        _dict = self._dict
+        if isinstance(_dict, Mapping):
+            indices = list(_dict.keys())
+            values = list(_dict.values())
+        elif pandas_available and isinstance(_dict, pandas.Series):
+            indices = _dict.index.tolist()
+            values = _dict.to_numpy()
+        else:
+            indices = range(len(_dict))
+            values = _dict
+        try:
+            array = numpy.asarray(values)
+        except Exception:
+            return None
+        if array.ndim != 1 or array.dtype.kind not in 'biuf':
+            return None
+        if isinstance(values, numpy.ndarray):
+            values = array.tolist()
+        return indices, values, array
+
 
 class DataFrameInitializer(InitializerBase):
     """Initializer for pandas DataFrame values"""
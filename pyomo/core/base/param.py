@@ -17,6 +17,7 @@ from typing import Union, Type
 from weakref import ref as weakref_ref
 
 from pyomo.common.autoslots import AutoSlots
+from pyomo.common.dependencies import numpy
 from pyomo.common.deprecation import deprecation_warning, RenamedClass
 from pyomo.common.log import is_debug_set
 from pyomo.common.modeling import NOTSET
@@ -31,10 +32,11 @@ from pyomo.core.base.indexed_component import (
     IndexedComponent,
     UnindexedComponent_set,
     IndexedComponent_NDArrayMixin,
+    _array_to_list,
 )
-from pyomo.core.base.initializer import Initializer, PartialInitializer
+from pyomo.core.base.initializer import Initializer, PartialInitializer, ItemInitializer
 from pyomo.core.base.misc import apply_indexed_rule, apply_parameterized_indexed_rule
-from pyomo.core.base.set import Reals, _AnySet, SetInitializer
+from pyomo.core.base.set import Reals, _AnySet, SetInitializer, _array_in_domain
 from pyomo.core.base.units_container import units
 from pyomo.core.expr import GetItemExpression
 
@@ -738,6 +740,57 @@ class Param(IndexedComponent, IndexedComponent_NDArrayMixin):
                 self._data[index] = old_value
                 raise
 
+    def _construct_from_numeric_values(self):
+        """Initialize the Param from numeric data (dict, list, ndarray, Series)
+
+        If there is no validation rule, the initialization data is
+        checked against the Param domain in a single vectorized pass
+        and then stored without any further per-element validation.
+        Returns False (without modifying the Param) if this is not
+        possible, in which case the data must be processed through
+        :meth:`_construct_from_rule_using_setitem`.
+
+        """
+        rule = self._rule
+        if (
+            self._validate is not None
+            or not self.is_indexed()
+            or not isinstance(rule, ItemInitializer)
+        ):
+            return False
+        numeric_values = rule.numeric_values()
+        if numeric_values is None:
+            return False
+        indices, values, array = numeric_values
+        if not _array_in_domain(self.domain, array):
+            return False
+        _data = self._data
+        validate_index = not self._indices_are_valid_integers(indices)
+        index = None  # set so it is defined for the `except:` below
+        try:
+            for index, val in zip(indices, values):
+                if validate_index and index not in _data:
+                    # The index is coming in externally; we need to validate it
+                    index = self._validate_index(index)
+                if not self._mutable:
+                    _data[index] = val
+                elif index in _data:
+                    _data[index]._value = val
+                else:
+                    obj = _data[index] = ParamData(self)
+                    obj._value = val
+                    obj._index = index
+        except:
+            # Report the error the same way as
+            # _construct_from_rule_using_setitem()
+            err = sys.exc_info()[1]
+            logger.error(
+                "Rule failed for %s '%s' with index %s:\n%s: %s"
+                % (self.ctype.__name__, self.name, str(index), type(err).__name__, err)
+            )
+            raise
+        return True
+
     def _setitem_when_not_present(self, index, value, _check_domain=True):
         #
         # We need to ensure that users don't override the value for immutable
@@ -866,7 +919,8 @@ class Param(IndexedComponent, IndexedComponent_NDArrayMixin):
             #
             # Step #1: initialize data from rule value
             #
-            self._construct_from_rule_using_setitem()
+            if not self._construct_from_numeric_values():
+                self._construct_from_rule_using_setitem()
             #
             # Step #2: allow any user-specified (external) data to override
             # the initialization
@@ -1016,6 +1070,49 @@ class IndexedParam(Param):
             component_list.append((self, _new))
         return _ans
 
+    def get_values_array(self):
+        """Return the parameter values as a :class:`numpy.ndarray`
+
+        The values are returned in the order of :meth:`keys`.  Mutable
+        parameters without a value are returned as NaN.
+
+        """
+        if self._mutable:
+            vals = (p(exception=False) for p in self.values())
+        else:
+            vals = self.values()
+        return numpy.fromiter(
+            (float('nan') if v is None else v for v in vals),
+            dtype=float,
+            count=len(self),
+        )
+
+    def set_values_array(self, values):
+        """Set the values of a mutable parameter from a :class:`numpy.ndarray`
+
+        ``values`` must be a 1-D array aligned with the order of
+        :meth:`keys`.  For numeric arrays (and parameters without a
+        ``validate`` rule) the values are checked against the parameter
+        domain in a single vectorized pass and then assigned without
+        any further per-element validation.  Otherwise each value is
+        assigned (and validated) individually.
+
+        """
+        if not self._mutable:
+            _raise_modifying_immutable_error(self, '*')
+        paramdata = self._values_list()
+        vals = _array_to_list(values, len(paramdata), self.name, nan_to_none=False)
+        if (
+            self._validate is None
+            and numpy.asarray(values).dtype.kind in 'biuf'
+            and _array_in_domain(self.domain, values)
+        ):
+            for p, val in zip(paramdata, vals):
+                p._value = val
+        else:
+            for p, val in zip(paramdata, vals):
+                p.set_value(val)
+
     # Because CP supports indirection [the ability to index objects by
     # another (inter) Var] for certain types (including Var), we will
     # catch the normal RuntimeError and return a (variable)
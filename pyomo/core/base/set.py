@@ -23,6 +23,7 @@ from typing import Union, Type, Any as typingAny
 
 from pyomo.common.autoslots import AutoSlots
 from pyomo.common.collections import ComponentSet
+from pyomo.common.dependencies import numpy, numpy_available
 from pyomo.common.deprecation import deprecated, deprecation_warning, RenamedClass
 from pyomo.common.errors import DeveloperError, PyomoException
 from pyomo.common.log import is_debug_set
@@ -4215,13 +4216,55 @@ class SetProduct_FiniteSet(_FiniteSetMixin, SetProduct_InfiniteSet):
     __slots__ = tuple()
 
     def _iter_impl(self):
-        _iter = itertools.product(*self._sets)
+        return self._product_iter(iter)
+
+    def __reversed__(self):
+        # The reverse of a cross product is the cross product of the
+        # reversed subsets.  Generating it directly avoids
+        # materializing the (potentially huge) product in data().
+        return self._product_iter(reversed)
+
+    def sorted_iter(self):
+        # If every subset has a fixed dimentionality, then the sorted
+        # order of the product is the product of the sorted subsets.
+        # This allows us to stream the result without collecting (and
+        # sorting) every member of the product.
+        if any(s.dimen is None or s.dimen is UnknownSetDimen for s in self._sets):
+            return super().sorted_iter()
+        return self._product_iter(lambda s: s.sorted_iter())
+
+    def sorted_data(self):
+        return tuple(self.sorted_iter())
+
+    def _leaf_sets(self):
+        """Return the list of (non-product) subsets in this product
+
+        Nested products (e.g., from ``A * B * C``) are expanded in
+        place.  This is important for iteration, as
+        itertools.product() collects each of its arguments: expanding
+        the nested products ensures that we only ever collect the
+        (much smaller) leaf sets and not the full inner product.
+
+        """
+        if not (FLATTEN_CROSS_PRODUCT and normalize_index.flatten):
+            return self._sets
+        ans = []
+        for s in self._sets:
+            if isinstance(s, SetProduct_FiniteSet):
+                ans.extend(s._leaf_sets())
+            else:
+                ans.append(s)
+        return ans
+
+    def _product_iter(self, subset_iter):
+        leaves = self._leaf_sets()
+        _iter = itertools.product(*map(subset_iter, leaves))
         # Note: if all the member sets are simple 1-d sets, then there
         # is no need to call flatten_product.
         if (
             FLATTEN_CROSS_PRODUCT
             and normalize_index.flatten
-            and self.dimen != len(self._sets)
+            and self.dimen != len(leaves)
         ):
             return (self._flatten_product(_) for _ in _iter)
         return _iter
@@ -4271,8 +4314,15 @@ class SetProduct_OrderedSet(
             )
         val, cutPoints = found
         if cutPoints is not None:
+            # Note: unpack single-member slices, as not all Sets will
+            # accept 1-tuples for scalar members
             val = tuple(
-                val[cutPoints[i] : cutPoints[i + 1]] for i in range(len(self._sets))
+                (
+                    val[cutPoints[i]]
+                    if cutPoints[i + 1] - cutPoints[i] == 1
+                    else val[cutPoints[i] : cutPoints[i + 1]]
+                )
+                for i in range(len(self._sets))
             )
         _idx = tuple(s.ord(val[i]) - 1 for i, s in enumerate(self._sets))
         _len = list(len(_) for _ in self._sets)
@@ -4677,6 +4727,62 @@ integer_global_set_ids = set(
     )
 )
 
+
+def _array_in_domain(domain, values):
+    """Vectorized test that every entry in a numeric array is in a domain
+
+    This implements a single-pass (NumPy) equivalent of ``all(v in
+    domain for v in values)`` for domains defined by numeric ranges
+    (including all the global numeric Sets like :py:data:`Reals`,
+    :py:data:`NonNegativeIntegers` and :py:data:`Binary`) and for the
+    :py:data:`Any` sets.
+
+    Parameters
+    ----------
+    domain: SetData
+        the domain to test the values against
+
+    values: numpy.ndarray
+        the values to test
+
+    Returns
+    -------
+    bool or None
+        True if all values are in the domain, False if any are not, and
+        None if the test could not be vectorized (e.g., for custom
+        domains or non-numeric data).  In the latter case, the caller
+        should fall back on testing each value individually.
+
+    """
+    if isinstance(domain, _AnySet):
+        return True
+    if not numpy_available or not isinstance(domain, InfiniteRangeSetData):
+        return None
+    values = numpy.asarray(values)
+    if values.dtype.kind not in 'biuf':
+        return None
+    values = values.astype(float, copy=False)
+    ans = numpy.zeros(values.shape, dtype=bool)
+    for r in domain.ranges():
+        if r.__class__ is not NumericRange:
+            return None
+        if r.step:
+            _dir = math.copysign(1, r.step)
+            _from_start = values - r.start
+            with numpy.errstate(invalid='ignore'):
+                _rem = _from_start - r.step * numpy.round(_from_start / r.step)
+                ans |= (
+                    (0 <= _dir * _from_start)
+                    & (_dir * _from_start <= _dir * (r.end - r.start))
+                    & (abs(_rem) <= r._EPS)
+                )
+        else:
+            ans |= (values >= r.start if r.closed[0] else values > r.start) & (
+                values <= r.end if r.closed[1] else values < r.end
+            )
+    return bool(ans.all())
+
+
 RealSet = Reals.__class__
 IntegerSet = Integers.__class__
 BinarySet = Binary.__class__
@@ -16,6 +16,7 @@ from pyomo.common.pyomo_typing import overload
 from weakref import ref as weakref_ref
 from typing import Union, Type
 
+from pyomo.common.dependencies import numpy, numpy_available
 from pyomo.common.deprecation import RenamedClass
 from pyomo.common.log import is_debug_set
 from pyomo.common.modeling import NOTSET
@@ -38,11 +39,13 @@ from pyomo.core.base.indexed_component import (
     IndexedComponent,
     UnindexedComponent_set,
     IndexedComponent_NDArrayMixin,
+    _array_to_list,
 )
 from pyomo.core.base.initializer import (
     Initializer,
     DefaultInitializer,
     BoundInitializer,
+    ItemInitializer,
 )
 from pyomo.core.base.set import (
     Reals,
@@ -51,6 +54,7 @@ from pyomo.core.base.set import (
     SetInitializer,
     real_global_set_ids,
     integer_global_set_ids,
+    _array_in_domain,
 )
 from pyomo.core.base.units_container import units
 
@@ -58,6 +62,7 @@ logger = logging.getLogger('pyomo.core')
 
 _inf = float('inf')
 _ninf = -_inf
+_nan = float('nan')
 _nonfinite_values = {_inf, _ninf}
 _known_global_real_domains = dict(
     [(_, True) for _ in real_global_set_ids]
@@ -716,14 +721,28 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
                 self._dense = False
 
             if self._rule_init is not None and self._rule_init.contains_indices():
+                # If the initial values are numeric data (dict, list,
+                # ndarray, Series) and the domain and bounds are
+                # constant, we can validate all the values at once
+                numeric_values = None
+                if (
+                    isinstance(self._rule_init, ItemInitializer)
+                    and self._rule_domain.constant()
+                    and (self._rule_bounds is None or self._rule_bounds.constant())
+                ):
+                    numeric_values = self._rule_init.numeric_values()
                 # Historically we have allowed Vars to be initialized by
                 # a sparse map (i.e., a dict containing only some of the
                 # keys).  We will wrap the incoming initializer to map
                 # KeyErrors to None
                 self._rule_init = DefaultInitializer(self._rule_init, None, KeyError)
-                # The index is coming in externally; we need to validate it
-                for index in self._rule_init.indices():
-                    self[index]
+                if numeric_values is not None:
+                    self._construct_from_numeric_values(*numeric_values)
+                else:
+                    # The index is coming in externally; we need to
+                    # validate it
+                    for index in self._rule_init.indices():
+                        self[index]
                 # If this is a dense object, we need to ensure that it
                 # has been filled in.
                 if self._dense:
@@ -834,6 +853,64 @@ class Var(IndexedComponent, IndexedComponent_NDArrayMixin):
             raise
         return obj
 
+    def _construct_from_numeric_values(self, indices, values, array):
+        """Create the VarData objects from numeric initialization data
+
+        As the domain and bounds are constant, the first VarData is
+        created (and validated) normally and then used as a template for
+        the remaining VarData objects.  The initial values are validated
+        against the domain and bounds in a single vectorized pass,
+        falling back on per-element validation if that is not possible
+        (or if any value fails the test).
+
+        """
+        _data = self._data
+        _copy = self._ComponentDataClass.copy
+        vardata = []
+        ref = None
+        validate_index = not self._indices_are_valid_integers(indices)
+        for index in indices:
+            if validate_index:
+                if index in _data:
+                    vardata.append(_data[index])
+                    continue
+                # The index is coming in externally; we need to validate it
+                index = self._validate_index(index)
+            if index in _data:
+                obj = _data[index]
+            elif ref is None:
+                obj = ref = self._getitem_when_not_present(index)
+            else:
+                obj = _data[index] = _copy(ref)
+                # NOTE: as with the dense construction, we are adding
+                # the VarData without calling _getitem_when_not_present
+                obj._index = index
+            vardata.append(obj)
+        if ref is None:
+            # Every index was a duplicate (or there was no data)
+            for obj, val in zip(vardata, values):
+                obj.set_value(val)
+            return
+        if array.dtype.kind == 'f' and numpy.isnan(array).any():
+            valid = False
+        else:
+            lb, ub = ref.lb, ref.ub
+            valid = (
+                _array_in_domain(ref._domain, array)
+                and (lb is None or not (array < lb).any())
+                and (ub is None or not (array > ub).any())
+            )
+        if valid:
+            for obj, val in zip(vardata, values):
+                obj._value = val
+                obj._stale = StaleFlagManager.get_flag(obj._stale)
+        else:
+            for obj, val in zip(vardata, values):
+                # ref was already set (and validated) by
+                # _getitem_when_not_present
+                if obj is not ref:
+                    obj.set_value(val)
+
     def _pprint(self):
         """Print component information."""
         headers = [
@@ -882,14 +959,28 @@ class IndexedVar(Var):
     def setlb(self, val):
         """
         Set the lower bound for this variable.
+
+        If ``val`` is a :class:`numpy.ndarray`, it is interpreted as the
+        lower bound for each variable in this container (in the order
+        returned by :meth:`keys`).  NaN entries clear the bound.
         """
+        if numpy_available and isinstance(val, numpy.ndarray):
+            self._set_bounds_array(val, 'lower')
+            return
         for vardata in self.values():
             vardata.lower = val
 
     def setub(self, val):
         """
         Set the upper bound for this variable.
+
+        If ``val`` is a :class:`numpy.ndarray`, it is interpreted as the
+        upper bound for each variable in this container (in the order
+        returned by :meth:`keys`).  NaN entries clear the bound.
         """
+        if numpy_available and isinstance(val, numpy.ndarray):
+            self._set_bounds_array(val, 'upper')
+            return
         for vardata in self.values():
             vardata.upper = val
 
@@ -899,9 +990,15 @@ class IndexedVar(Var):
         This sets the :attr:`fixed` indicator to True for every variable
         in this IndexedVar.  If ``value`` is provided, the value (and
         the ``skip_validation`` flag) are first passed to
-        :meth:`set_value`.
+        :meth:`set_value`.  If ``value`` is a :class:`numpy.ndarray`,
+        the values are set using :meth:`set_values_array`.
 
         """
+        if numpy_available and isinstance(value, numpy.ndarray):
+            self.set_values_array(value, skip_validation)
+            for vardata in self.values():
+                vardata._fixed = True
+            return
         for vardata in self.values():
             vardata.fix(value, skip_validation)
 
@@ -919,6 +1016,83 @@ class IndexedVar(Var):
         """Alias for :meth:`unfix`"""
         return self.unfix()
 
+    def get_values_array(self):
+        """Return the variable values as a :class:`numpy.ndarray`
+
+        The values are returned in the order of :meth:`keys`.
+        Variables whose value is None are returned as NaN.
+
+        """
+        return numpy.fromiter(
+            (_nan if v._value is None else v._value for v in self._values_list()),
+            dtype=float,
+            count=len(self),
+        )
+
+    def set_values_array(self, values, skip_validation=False):
+        """Set the values of all variables from a :class:`numpy.ndarray`
+
+        ``values`` must be a 1-D array aligned with the order of
+        :meth:`keys`.  NaN entries clear the corresponding variable
+        value (i.e., set it to None).
+
+        Unless ``skip_validation`` is True, the values are validated
+        against the variable domains and bounds.  For numeric arrays
+        where all variables share a common numeric (range) domain, this
+        check is performed in a single vectorized pass, and the values
+        are then assigned without any further per-variable validation.
+        Otherwise, each value is assigned (and validated) through
+        :meth:`VarData.set_value`.
+
+        """
+        vardata = self._values_list()
+        vals = _array_to_list(values, len(vardata), self.name)
+        if numpy.asarray(values).dtype.kind not in 'biuf':
+            for v, val in zip(vardata, vals):
+                v.set_value(val, skip_validation)
+            return
+        if not skip_validation and not self._values_array_is_valid(vardata, values):
+            for v, val in zip(vardata, vals):
+                v.set_value(val)
+            return
+        for v, val in zip(vardata, vals):
+            v._value = val
+            v._stale = 0 if val is None else StaleFlagManager.get_flag(v._stale)
+
+    @staticmethod
+    def _values_array_is_valid(vardata, values):
+        # Note: this returns False both for invalid values *and* when
+        # the domain / bounds cannot be tested in a vectorized manner
+        # (the caller will then fall back on per-element validation)
+        if not vardata:
+            return True
+        domain = vardata[0]._domain
+        if any(v._domain is not domain for v in vardata):
+            return False
+        values = numpy.asarray(values, dtype=float)
+        if not _array_in_domain(domain, values[~numpy.isnan(values)]):
+            return False
+        try:
+            lb = numpy.array([v._lb for v in vardata], dtype=float)
+            ub = numpy.array([v._ub for v in vardata], dtype=float)
+        except (TypeError, ValueError):
+            # Bounds are (mutable) expressions
+            return False
+        return not ((values < lb).any() or (values > ub).any())
+
+    def _set_bounds_array(self, values, bound_type):
+        vardata = self._values_list()
+        vals = _array_to_list(values, len(vardata), self.name)
+        if values.dtype.kind not in 'biuf':
+            for v, val in zip(vardata, vals):
+                setattr(v, bound_type, val)
+        elif bound_type == 'lower':
+            for v, val in zip(vardata, vals):
+                v._lb = val
+        else:
+            for v, val in zip(vardata, vals):
+                v._ub = val
+
     @property
     def domain(self):
         raise AttributeError(
@@ -9,10 +9,19 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import itertools
+import threading
+
+
+# Stale flag values are drawn from a single (process-wide) counter so
+# that the flags generated by the per-thread managers never collide
+_flag_counter = itertools.count(1)
+
 
 class _StaleFlagManager(object):
     def __init__(self):
         self._current = 0
+        self._thread_local = None
         self.mark_all_as_stale()
 
     def stale_mapper(self, encode, value):
@@ -40,7 +49,7 @@ class _StaleFlagManager(object):
 
         """
         if current_flag == self._current:
-            self._current += 1
+            self._current = next(_flag_counter)
             setattr(self, 'get_flag', getattr(self, '_get_flag'))
         return self._current
 
@@ -67,7 +76,51 @@ class _StaleFlagManager(object):
             setattr(self, 'get_flag', getattr(self, '_get_flag_delayed'))
         else:
             setattr(self, 'get_flag', getattr(self, '_get_flag'))
-            self._current += 1
+            self._current = next(_flag_counter)
+
+    def set_thread_local(self, enable=True):
+        """Track the global stale flag separately for each thread
+
+        By default, the stale flag is shared by all threads, so a call
+        to :meth:`mark_all_as_stale` (e.g., at the start of every
+        solve) in one thread marks the variables being loaded by
+        another thread as stale.  When enabled, each thread maintains
+        its own stale flag, so that threads solving distinct models do
+        not interfere with each other.  The staleness of a variable is
+        then relative to the thread that queries it: variables updated
+        in one thread appear stale to all other threads.
+
+        This mode adds a small overhead to every variable update, and is
+        disabled by default.
+
+        """
+        if enable:
+            if self._thread_local is not None:
+                return
+            local = self._thread_local = _ThreadLocalStaleFlagManager()
+            # The current thread continues from the global state
+            local.manager._copy_state(self)
+            self.get_flag = lambda current_flag: local.manager.get_flag(current_flag)
+            self.is_stale = lambda val: local.manager.is_stale(val)
+            self.mark_all_as_stale = lambda delayed=False: (
+                local.manager.mark_all_as_stale(delayed)
+            )
+        elif self._thread_local is not None:
+            local = self._thread_local
+            self._thread_local = None
+            del self.is_stale
+            del self.mark_all_as_stale
+            # The global state continues from the current thread
+            self._copy_state(local.manager)
+
+    def _copy_state(self, other):
+        self._current = other._current
+        setattr(self, 'get_flag', getattr(self, other.get_flag.__name__))
+
+
+class _ThreadLocalStaleFlagManager(threading.local):
+    def __init__(self):
+        self.manager = _StaleFlagManager()
 
 
 StaleFlagManager = _StaleFlagManager()
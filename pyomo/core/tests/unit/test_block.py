@@ -52,6 +52,7 @@ from pyomo.environ import (
     Any,
 )
 from pyomo.common.collections import ComponentSet
+from pyomo.common.dependencies import multiprocessing
 from pyomo.common.log import LoggingIntercept
 from pyomo.common.tempfiles import TempfileManager
 from pyomo.core.base.block import (
@@ -3323,6 +3324,103 @@ class TestBlock(unittest.TestCase):
         self.assertEqual(value(i.b[3].p), 3)
         self.assertEqual(value(i.b[4].p), 4)
 
+    @unittest.skipUnless(
+        'fork' in multiprocessing.get_all_start_methods(),
+        "parallel Block construction requires the 'fork' start method",
+    )
+    def test_parallel_construction(self):
+        m = ConcreteModel()
+        m.x = Var()
+        m.I = Set(initialize=[3, 1, 2, 5, 4])
+
+        def b_rule(b, i):
+            b.y = Var(bounds=(0, i))
+            b.c = Constraint(expr=b.y >= m.x + i)
+            b.sub = Block()
+            b.sub.z = Var(m.I)
+            b.e = Expression(expr=b.sub.z[i] * b.y)
+            b.pid = os.getpid()
+
+        m.b = Block(m.I, rule=b_rule, parallel=2)
+        m.s = Block(m.I, rule=b_rule)
+        self.assertEqual(list(m.b), [3, 1, 2, 5, 4])
+        for i in m.I:
+            b = m.b[i]
+            self.assertIs(b.parent_component(), m.b)
+            self.assertEqual(b.index(), i)
+            self.assertEqual(b.y.bounds, (0, i))
+            self.assertIs(b.sub.parent_block(), b)
+            self.assertIs(b.sub.z.index_set(), m.I)
+            self.assertEqual(
+                [v.name for v in EXPR.identify_variables(b.c.body)],
+                ['x', 'b[%s].y' % i],
+            )
+            self.assertIs(list(EXPR.identify_variables(b.c.body))[0], m.x)
+            self.assertIs(b.e.expr.args[0], b.sub.z[i])
+            self.assertNotEqual(b.pid, os.getpid())
+            self.assertEqual(str(b.c.body), str(m.s[i].c.body).replace('s[', 'b['))
+
+        # Errors in the rule are raised in the parent process
+        def bad_rule(b, i):
+            if i == 2:
+                raise RuntimeError("bad index")
+
+        with self.assertRaisesRegex(RuntimeError, "bad index"):
+            m.bad = Block(m.I, rule=bad_rule, parallel=2)
+
+    @unittest.skipUnless(
+        'fork' in multiprocessing.get_all_start_methods(),
+        "parallel Block construction requires the 'fork' start method",
+    )
+    def test_parallel_construction_unnamed_components(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3])
+        # Components that cannot be found by name: an implicit
+        # (anonymous) index set and a Param that is not attached to
+        # any model
+        p = Param(initialize=3, mutable=True)
+        p.construct()
+
+        def b_rule(b, i):
+            b.y = Var(m.x.index_set())
+            b.z = Var([4, 5])
+            b.c = Constraint(expr=b.y[i] <= p)
+
+        m.b = Block(m.x.index_set(), rule=b_rule, parallel=2)
+        for i in m.b:
+            self.assertIs(m.b[i].y.index_set(), m.x.index_set())
+            self.assertIs(m.b[i].c.upper, p)
+            self.assertEqual(list(m.b[i].z), [4, 5])
+            self.assertIs(m.b[i].z.index_set().parent_block(), m.b[i])
+        self.assertIsNot(m.b[1].z.index_set(), m.b[2].z.index_set())
+
+    @unittest.skipUnless(
+        'fork' in multiprocessing.get_all_start_methods(),
+        "parallel Block construction requires the 'fork' start method",
+    )
+    def test_parallel_abstract_construction(self):
+        m = AbstractModel()
+        m.I = Set()
+
+        def b_rule(b, i):
+            b.p = Param(default=i)
+            b.J = Set(initialize=range(i))
+
+        m.b = Block(m.I, rule=b_rule, parallel=2)
+
+        i = m.create_instance(
+            {
+                None: {
+                    'I': {None: [1, 2, 3]},
+                    'b': {1: {'p': {None: 10}}, 3: {'J': {None: [9]}}},
+                }
+            }
+        )
+        self.assertEqual(list(i.b[1].J), [0])
+        self.assertEqual(list(i.b[2].J), [0, 1])
+        self.assertEqual(list(i.b[3].J), [9])
+        self.assertEqual([value(i.b[j].p) for j in i.I], [10, 2, 3])
+
     def test_deprecated_options(self):
         m = ConcreteModel()
 
@@ -3382,6 +3480,21 @@ class TestBlock(unittest.TestCase):
         self.assertIs(b1.find_component(cuid1), b1.b2.v1)
         self.assertIs(b1.find_component(cuid2), b1.b2.v2[2])
 
+    def test_find_components(self):
+        b1 = Block(concrete=True)
+        b1.b2 = Block([1, 2])
+        b1.b2[1].v1 = Var()
+        b1.b2[2].v2 = Var([1, 2])
+        self.assertEqual(
+            b1.find_components(
+                ["b2[1].v1", ComponentUID("b2[2].v2[2]"), b1.b2[2].v2, "b2[1].v2"]
+            ),
+            [b1.b2[1].v1, b1.b2[2].v2[2], b1.b2[2].v2, None],
+        )
+        ref = b1.find_components(["b2[*].v1"])[0]
+        self.assertIs(ref.ctype, Var)
+        self.assertEqual(list(ref.values()), [b1.b2[1].v1])
+
     def test_deduplicate_component_data_objects(self):
         m = ConcreteModel()
         m.b = Block()
@@ -249,6 +249,38 @@ class TestComponentUID(unittest.TestCase):
         cuid = ComponentUID(ref)
         self.assertTrue(cuid.find_component_on(self.m) is ref)
 
+    def test_find_component_after_structure_change(self):
+        m = ConcreteModel()
+        m.b = Block([1, 2])
+        m.b[1].x = Var([1, 2])
+        cuid = ComponentUID('b[1].x[2]')
+        self.assertIs(cuid.find_component_on(m), m.b[1].x[2])
+        # Parsed strings are cached (and shared)
+        self.assertIs(ComponentUID('b[1].x[2]')._cids, cuid._cids)
+        self.assertIs(ComponentUID('b[1].x[2]').find_component_on(m), m.b[1].x[2])
+
+        # Deleting components invalidates previously resolved components
+        x = m.b[1].x
+        m.b[1].del_component(x)
+        self.assertIsNone(cuid.find_component_on(m))
+        m.b[1].x = Var([2])
+        self.assertIs(cuid.find_component_on(m), m.b[1].x[2])
+        self.assertIsNot(m.b[1].x, x)
+
+        # ... as does deleting (or clearing) block data
+        del m.b[1]
+        self.assertIsNone(cuid.find_component_on(m))
+        m.b[1].x = Var([2])
+        self.assertIs(cuid.find_component_on(m), m.b[1].x[2])
+        m.b.clear()
+        self.assertIsNone(cuid.find_component_on(m))
+
+        # Components on a clone resolve independently
+        m.b[1].x = Var([2])
+        i = m.clone()
+        self.assertIs(cuid.find_component_on(i), i.b[1].x[2])
+        self.assertIs(cuid.find_component_on(m), m.b[1].x[2])
+
     def test_find_wildcard(self):
         cuid = ComponentUID('b:1,$2.c.a:*')
         comp = cuid.find_component_on(self.m)
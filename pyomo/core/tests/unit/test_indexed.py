@@ -327,6 +327,20 @@ class TestIndexedComponent(unittest.TestCase):
             self.assertEqual(list(m.x.keys(ordered=False)), unordered)
         self.assertIn('keys(ordered=False) is deprecated', LOG.getvalue())
 
+    def test_sparse_product_keys(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[3, 1, 2])
+        m.J = Set(initialize=range(1000))
+        m.x = Var(m.I * m.J * m.J, dense=False)
+        self.assertEqual(len(m.x.index_set()), 3000000)
+        for i in [(2, 5, 1), (3, 999, 0), (1, 0, 0), (3, 1, 1)]:
+            m.x[i].value = 1
+        ordered = [(3, 1, 1), (3, 999, 0), (1, 0, 0), (2, 5, 1)]
+        self.assertEqual(list(m.x.keys()), ordered)
+        self.assertEqual(list(m.x.keys(SortComponents.ORDERED_INDICES)), ordered)
+        self.assertEqual(list(m.x.keys(True)), sorted(ordered))
+        self.assertEqual(list(m.x.values()), [m.x[i] for i in ordered])
+
     def test_ordered_values_deprecation(self):
         m = ConcreteModel()
         unordered = [1, 3, 2]
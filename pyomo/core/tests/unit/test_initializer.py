@@ -768,6 +768,24 @@ class Test_Initializer(unittest.TestCase):
         # self.assertEqual(a(None, 1), 2)
         # self.assertEqual(a(None, 2), 4)
 
+    @unittest.skipUnless(numpy_available, "Numpy is not installed")
+    def test_numeric_values(self):
+        a = Initializer({1: 5, 3: 2.5})
+        indices, values, array = a.numeric_values()
+        self.assertEqual(list(indices), [1, 3])
+        self.assertEqual(values, [5, 2.5])
+        self.assertEqual(array.tolist(), [5, 2.5])
+
+        a = Initializer(np.array([1, 2, 4]))
+        indices, values, array = a.numeric_values()
+        self.assertEqual(list(indices), [0, 1, 2])
+        self.assertEqual(values, [1, 2, 4])
+        self.assertIs(type(values[0]), int)
+
+        self.assertIsNone(Initializer({1: 5, 2: 'a'}).numeric_values())
+        self.assertIsNone(Initializer({1: 5, 2: None}).numeric_values())
+        self.assertIsNone(Initializer([(1, 2), (3, 4)]).numeric_values())
+
     def test_str(self):
         a = Initializer("a string")
         self.assertIs(type(a), ConstantInitializer)
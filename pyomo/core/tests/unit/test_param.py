@@ -24,6 +24,7 @@ import os
 import sys
 
 import pyomo.common.unittest as unittest
+from pyomo.common.dependencies import numpy as np, numpy_available
 
 from pyomo.environ import (
     Set,
@@ -2295,6 +2296,52 @@ class MiscIndexedParamBehaviorTests(unittest.TestCase):
         self.assertEqual(len(m.p), 2)
         self.assertEqual(len(m.p._data), 0)
 
+    @unittest.skipUnless(numpy_available, "numpy is not available")
+    def test_values_array(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[3, 1, 2])
+        m.p = Param(m.I, mutable=True, domain=NonNegativeReals, default=1)
+        np.testing.assert_array_equal(m.p.get_values_array(), [1, 1, 1])
+        m.p.set_values_array(np.array([4, 5.5, 6]))
+        self.assertEqual([m.p[i].value for i in m.I], [4, 5.5, 6])
+        np.testing.assert_array_equal(m.p.get_values_array(), [4, 5.5, 6])
+
+        with self.assertRaisesRegex(ValueError, "Value not in parameter domain"):
+            m.p.set_values_array(np.array([1, -2, 3]))
+        with self.assertRaisesRegex(ValueError, "not compatible with component 'p'"):
+            m.p.set_values_array(np.array([1, 2]))
+
+        m.q = Param(m.I, initialize={1: 1, 2: 2, 3: 3})
+        np.testing.assert_array_equal(m.q.get_values_array(), [3, 1, 2])
+        with self.assertRaisesRegex(TypeError, "immutable parameter"):
+            m.q.set_values_array(np.array([1, 2, 3]))
+
+        m.r = Param(m.I, mutable=True, initialize=0, validate=lambda m, v, i: v < 5)
+        with self.assertRaisesRegex(ValueError, "failed parameter validation"):
+            m.r.set_values_array(np.array([1, 6, 3]))
+
+    @unittest.skipUnless(numpy_available, "numpy is not available")
+    def test_construct_from_numeric_values(self):
+        m = ConcreteModel()
+        m.I = RangeSet(0, 2)
+        m.p = Param(m.I, initialize=np.array([3, 1, 2]), within=NonNegativeIntegers)
+        self.assertEqual(m.p.extract_values(), {0: 3, 1: 1, 2: 2})
+        self.assertIs(type(m.p[0]), int)
+        m.q = Param(m.I, initialize={2: 1.5, 0: 2}, mutable=True)
+        self.assertEqual(m.q.extract_values(), {2: 1.5, 0: 2})
+        self.assertEqual(m.q[2].index(), 2)
+        self.assertIs(m.q[0].parent_component(), m.q)
+        with self.assertRaisesRegex(ValueError, "Value not in parameter domain"):
+            m.r = Param(m.I, initialize=[3, -1, 2], within=NonNegativeReals)
+        with self.assertRaisesRegex(ValueError, "failed parameter validation"):
+            m.s = Param(m.I, initialize=[3, 6, 2], validate=lambda m, v, i: v < 5)
+        with LoggingIntercept() as LOG:
+            with self.assertRaisesRegex(KeyError, "Index '3' is not valid"):
+                m.t = Param(m.I, initialize={3: 1})
+        self.assertIn(
+            "Rule failed for Param 't' with index 3:\nKeyError:", LOG.getvalue()
+        )
+
 
 # Add test methods for all intrinsic functions
 assignTestsIndexedParamTests(MiscIndexedParamBehaviorTests, intrinsic_test_list)
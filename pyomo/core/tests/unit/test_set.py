@@ -3465,6 +3465,40 @@ J : Size=1, Index=None, Ordered=False
         self.assertIn((2, 5), m.Z)
         self.assertNotIn((2, 5, 3), m.Z)
 
+    def test_setproduct_reversed_sorted_iter(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[3, 1, 2])
+        m.J = Set(initialize=[(6, 'b'), (5, 'a')])
+        m.K = Set(initialize=[8, 7])
+        m.Z = m.I * m.J * m.K
+        self.assertEqual(list(reversed(m.Z)), list(reversed(list(m.Z))))
+        self.assertEqual(list(m.Z.sorted_iter()), sorted(m.Z))
+        self.assertEqual(m.Z.sorted_data(), tuple(sorted(m.Z)))
+        self.assertEqual(m.Z.first(), (3, 6, 'b', 8))
+        self.assertEqual(m.Z.last(), (2, 5, 'a', 7))
+
+        m.U = Set(initialize=[2, 1], ordered=False)
+        m.Y = m.U * m.K
+        self.assertIs(type(m.Y), SetProduct_FiniteSet)
+        self.assertEqual(list(reversed(m.Y)), list(reversed(list(m.Y))))
+        self.assertEqual(list(m.Y.sorted_iter()), [(1, 7), (1, 8), (2, 7), (2, 8)])
+
+    def test_setproduct_large_lazy(self):
+        # These operations would take (and exhaust) significant memory
+        # if they materialized the 10**16-member product.
+        m = ConcreteModel()
+        m.I = RangeSet(10000)
+        m.J = Set(initialize=range(10000))
+        m.K = Set(initialize=range(10000))
+        m.Z = m.I * m.J * m.K * m.I
+        self.assertEqual(len(m.Z), 10**16)
+        self.assertIn((5, 6, 7, 8), m.Z)
+        self.assertNotIn((5, 6, 7, 10001), m.Z)
+        self.assertEqual(next(iter(m.Z)), (1, 0, 0, 1))
+        self.assertEqual(m.Z.last(), (10000, 9999, 9999, 10000))
+        self.assertEqual(next(m.Z.sorted_iter()), (1, 0, 0, 1))
+        self.assertEqual(m.Z.ord((1, 0, 1, 1)), 10001)
+
 
 class TestGlobalSets(unittest.TestCase):
     def test_globals(self):
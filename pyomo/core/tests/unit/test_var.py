@@ -16,6 +16,8 @@
 #
 
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from os.path import abspath, dirname
 
 currdir = dirname(abspath(__file__)) + os.sep
@@ -23,6 +25,7 @@ currdir = dirname(abspath(__file__)) + os.sep
 from io import StringIO
 
 import pyomo.common.unittest as unittest
+from pyomo.common.dependencies import numpy as np, numpy_available
 from pyomo.common.log import LoggingIntercept
 
 from pyomo.core.base import IntegerSet
@@ -48,6 +51,7 @@ from pyomo.environ import (
     RealSet,
     NonNegativeReals,
     Integers,
+    NonNegativeIntegers,
     Binary,
     value,
 )
@@ -1767,6 +1771,52 @@ class MiscVarTests(unittest.TestCase):
         self.assertFalse(m.x.stale)
         self.assertFalse(m.y.stale)
 
+    def test_stale_thread_local(self):
+        m = ConcreteModel()
+        m.x = Var(initialize=0)
+        m.y = Var(initialize=0)
+        self.assertFalse(m.x.stale)
+
+        lock = threading.Lock()
+
+        def _update(v, barrier):
+            with lock:
+                StaleFlagManager.mark_all_as_stale()
+                v.set_value(1)
+            barrier.wait()
+            barrier.wait()
+            return v.stale
+
+        def _run():
+            barrier = threading.Barrier(3, timeout=10)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                fx = executor.submit(_update, m.x, barrier)
+                fy = executor.submit(_update, m.y, barrier)
+                # Wait for both threads to update their variables
+                barrier.wait()
+                main = m.x.stale, m.y.stale
+                barrier.wait()
+                return main, (fx.result(), fy.result())
+
+        StaleFlagManager.set_thread_local()
+        try:
+            # The current thread state is preserved
+            self.assertFalse(m.x.stale)
+            # Each thread sees only its own variable as not stale
+            self.assertEqual(_run(), ((True, True), (False, False)))
+            m.x = 2
+            self.assertFalse(m.x.stale)
+        finally:
+            StaleFlagManager.set_thread_local(False)
+        self.assertFalse(m.x.stale)
+        self.assertTrue(m.y.stale)
+
+        # With the shared stale flag, the last thread to call
+        # mark_all_as_stale() marks the other thread's variable stale
+        main, workers = _run()
+        self.assertEqual(sorted(main), [False, True])
+        self.assertEqual(sorted(workers), [False, True])
+
     def test_stale_clone(self):
         m = ConcreteModel()
         m.x = Var(initialize=0)
@@ -1827,6 +1877,96 @@ class MiscVarTests(unittest.TestCase):
         self.assertEqual(x.is_continuous(), False)
         self.assertEqual(x.bounds, (0, 1))
 
+    @unittest.skipUnless(numpy_available, "numpy is not available")
+    def test_values_array(self):
+        m = ConcreteModel()
+        m.I = Set(initialize=[3, 1, 2])
+        m.x = Var(m.I, domain=NonNegativeReals, bounds=(None, 10))
+        np.testing.assert_array_equal(m.x.get_values_array(), [np.nan] * 3)
+
+        StaleFlagManager.mark_all_as_stale()
+        with LoggingIntercept() as LOG:
+            m.x.set_values_array(np.array([1.5, 2, np.nan]))
+        self.assertEqual(LOG.getvalue(), "")
+        self.assertEqual([m.x[i].value for i in m.I], [1.5, 2, None])
+        self.assertEqual([m.x[i].stale for i in m.I], [False, False, True])
+        np.testing.assert_array_equal(m.x.get_values_array(), [1.5, 2, np.nan])
+
+        # Invalid values fall back on (logged) per-element validation
+        with LoggingIntercept() as LOG:
+            m.x.set_values_array(np.array([-1, 2, 11]))
+        self.assertIn("Setting Var 'x[3]' to a value `-1`", LOG.getvalue())
+        self.assertIn("Setting Var 'x[2]' to a numeric value `11`", LOG.getvalue())
+        self.assertEqual([m.x[i].value for i in m.I], [-1, 2, 11])
+
+        with LoggingIntercept() as LOG:
+            m.x.set_values_array(np.array([-1, 2, 11]), skip_validation=True)
+        self.assertEqual(LOG.getvalue(), "")
+
+        with self.assertRaisesRegex(ValueError, "not compatible with component 'x'"):
+            m.x.set_values_array(np.array([1, 2]))
+
+        m.y = Var([1, 2], domain=Integers)
+        with LoggingIntercept() as LOG:
+            m.y.set_values_array(np.array([1, 2.5]))
+        self.assertIn("Setting Var 'y[2]' to a value `2.5`", LOG.getvalue())
+
+    @unittest.skipUnless(numpy_available, "numpy is not available")
+    def test_bulk_bounds_and_fix(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3])
+        m.x.setlb(np.array([0, np.nan, -1]))
+        m.x.setub(np.array([1.5, 2, np.nan]))
+        self.assertEqual(
+            [m.x[i].bounds for i in m.x], [(0, 1.5), (None, 2), (-1, None)]
+        )
+        m.x.fix(np.array([1, 2, 3]))
+        self.assertEqual([m.x[i].value for i in m.x], [1, 2, 3])
+        self.assertTrue(all(m.x[i].fixed for i in m.x))
+
+    @unittest.skipUnless(numpy_available, "numpy is not available")
+    def test_construct_from_numeric_values(self):
+        m = ConcreteModel()
+        m.I = RangeSet(0, 3)
+        m.x = Var(m.I, initialize=np.array([1, 2.5, 0, 3]), bounds=(0, 5))
+        self.assertEqual([m.x[i].value for i in m.I], [1, 2.5, 0, 3])
+        self.assertEqual([m.x[i].bounds for i in m.I], [(0, 5)] * 4)
+        self.assertEqual([m.x[i].index() for i in m.I], [0, 1, 2, 3])
+        self.assertFalse(any(m.x[i].stale for i in m.I))
+        m.x[1].setlb(1)
+        self.assertEqual(m.x[0].lb, 0)
+
+        # Sparse dict: missing (dense) indices are still created
+        m.y = Var(m.I, initialize={3: 1, 1: 2}, domain=NonNegativeIntegers)
+        self.assertEqual(list(m.y), [0, 1, 2, 3])
+        self.assertEqual([m.y[i].value for i in m.I], [None, 2, None, 1])
+        self.assertTrue(m.y[0].stale)
+
+        # Values outside the domain / bounds are reported per element
+        with LoggingIntercept() as LOG:
+            m.z = Var(m.I, initialize=[1, 2.5, -1, 3], domain=NonNegativeIntegers)
+        self.assertIn("Setting Var 'z[1]' to a value `2.5`", LOG.getvalue())
+        self.assertIn("Setting Var 'z[2]' to a value `-1`", LOG.getvalue())
+        self.assertEqual([m.z[i].value for i in m.I], [1, 2.5, -1, 3])
+        with LoggingIntercept() as LOG:
+            m.w = Var(m.I, initialize=np.array([1, 2, 6, 3]), bounds=(0, 5))
+        self.assertIn("Setting Var 'w[2]' to a numeric value `6`", LOG.getvalue())
+
+        # The first (template) VarData is only validated once
+        with LoggingIntercept() as LOG:
+            m.u = Var(m.I, initialize=[-1, 2, 6, 3], bounds=(0, 5))
+        self.assertEqual(
+            LOG.getvalue().count("Setting Var 'u[0]' to a numeric value `-1`"), 1
+        )
+        self.assertEqual(
+            LOG.getvalue().count("Setting Var 'u[2]' to a numeric value `6`"), 1
+        )
+        self.assertEqual(LOG.getvalue().count("Setting Var"), 2)
+
+        # Invalid indices are still detected
+        with self.assertRaisesRegex(KeyError, "Index '4' is not valid"):
+            m.v = Var(m.I, initialize={4: 1})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -192,6 +192,7 @@ class BigM_Transformation(GDP_to_MIP_Transformation, _BigM_MixIn):
                 self.used_args.clear()
                 self._expr_bound_visitor.leaf_bounds.clear()
                 self._expr_bound_visitor.use_fixed_var_values_as_bounds = False
+                self._linear_body_bounds.clear()
 
     def _apply_to_impl(self, instance, **kwds):
         self._process_arguments(instance, **kwds)
@@ -208,6 +209,7 @@ class BigM_Transformation(GDP_to_MIP_Transformation, _BigM_MixIn):
         # the list.
         gdp_tree = self._get_gdp_tree_from_targets(instance, targets)
         preprocessed_targets = gdp_tree.reverse_topological_sort()
+        self._estimate_linear_Ms(preprocessed_targets)
 
         bigM = self._config.bigM
         for t in preprocessed_targets:
@@ -11,11 +11,18 @@
 
 import logging
 
-from pyomo.gdp import GDP_Error
-from pyomo.common.collections import ComponentSet
+from pyomo.gdp import Disjunction, GDP_Error
+from pyomo.common.collections import ComponentMap, ComponentSet
+from pyomo.common.dependencies import numpy as np, numpy_available
+from pyomo.common.numeric_types import native_numeric_types
 from pyomo.contrib.fbbt.expression_bounds_walker import ExpressionBoundsVisitor
 import pyomo.contrib.fbbt.interval as interval
-from pyomo.core import Suffix
+from pyomo.core import Block, Constraint, Suffix
+from pyomo.core.expr.numeric_expr import (
+    LinearExpression,
+    MonomialTermExpression,
+    SumExpression,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -94,6 +101,71 @@ def _warn_for_unused_bigM_args(bigM, used_args, logger):
             logger.warning(warning_msg)
 
 
+def _linear_terms(expr):
+    """Return the terms of a linear expression as a list of (coefficient,
+    Var) pairs, where the Var is None for constant terms.
+
+    Only sums of Vars, monomials with constant coefficients and constants
+    are recognized (these are what Pyomo generates for linear
+    expressions). For anything else, return None.
+    """
+    if expr.__class__ is SumExpression or expr.__class__ is LinearExpression:
+        args = expr.args
+    else:
+        args = (expr,)
+    terms = []
+    for arg in args:
+        if arg.__class__ in native_numeric_types:
+            terms.append((arg, None))
+        elif arg.__class__ is MonomialTermExpression:
+            coef, var = arg.args
+            if coef.__class__ not in native_numeric_types:
+                if not coef.is_parameter_type():
+                    return None
+                coef = coef.value
+                if coef.__class__ not in native_numeric_types:
+                    return None
+            terms.append((coef, var))
+        elif arg.is_expression_type():
+            return None
+        elif arg.is_variable_type():
+            terms.append((1, arg))
+        elif arg.is_parameter_type() and arg.value.__class__ in native_numeric_types:
+            terms.append((arg.value, None))
+        else:
+            return None
+    return terms
+
+
+def _sum_term_bounds(rows, cols, coefs, col_lbs, col_ubs, num_rows):
+    """Interval sum of the terms coef * [col_lb, col_ub] of each row of a
+    sparse (coordinate format) matrix
+
+    The terms are accumulated in order (as the ExpressionBoundsVisitor
+    does), and a row with a term that is not a number (i.e., 0 * inf) is
+    unbounded.
+    """
+    if numpy_available:
+        # 0 * inf (and inf - inf) give nan, which marks the unbounded rows
+        with np.errstate(invalid='ignore'):
+            coefs = np.array(coefs, dtype=float)
+            lbs = coefs * np.array(col_lbs, dtype=float)[cols]
+            ubs = coefs * np.array(col_ubs, dtype=float)[cols]
+            lower = np.bincount(rows, weights=np.minimum(lbs, ubs), minlength=num_rows)
+            upper = np.bincount(rows, weights=np.maximum(lbs, ubs), minlength=num_rows)
+        unbounded = np.isnan(lower)
+        lower[unbounded] = -interval.inf
+        upper[unbounded] = interval.inf
+        return zip(lower.tolist(), upper.tolist())
+    lower = [0] * num_rows
+    upper = [0] * num_rows
+    for row, col, coef in zip(rows, cols, coefs):
+        term_lb, term_ub = interval.mul(coef, coef, col_lbs[col], col_ubs[col])
+        lower[row] += term_lb
+        upper[row] += term_ub
+    return zip(lower, upper)
+
+
 class _BigM_MixIn(object):
     def _get_bigM_arg_list(self, bigm_args, block):
         # Gather what we know about blocks from args exactly once. We'll still
@@ -114,6 +186,79 @@ class _BigM_MixIn(object):
         self._expr_bound_visitor = ExpressionBoundsVisitor(
             use_fixed_var_values_as_bounds=False
         )
+        # map of linear constraints to the bounds on their bodies (see
+        # _estimate_linear_Ms)
+        self._linear_body_bounds = ComponentMap()
+
+    def _estimate_linear_Ms(self, preprocessed_targets):
+        """Calculate the bounds on the bodies of all the linear constraints
+        on the active Disjuncts of the target Disjunctions at once.
+
+        The bodies are collected into a sparse (CSR-like) array of
+        coefficients, which are multiplied by the corresponding Var
+        bounds and summed per constraint. _estimate_M then looks up these
+        bounds, and only walks the bodies that are not linear.
+        """
+        use_fixed_values = self._expr_bound_visitor.use_fixed_var_values_as_bounds
+        constraints = []
+        # The nonzeros of the coefficient matrix of the bodies, where
+        # column 0 is the constant term
+        rows = []
+        cols = []
+        coefs = []
+        # map of id(Var) to its column, and the bounds of the columns
+        var_cols = {}
+        col_lbs = [1]
+        col_ubs = [1]
+        for t in preprocessed_targets:
+            if t.ctype is not Disjunction:
+                continue
+            for disjunct in t.disjuncts:
+                if not disjunct.active:
+                    continue
+                for c in disjunct.component_data_objects(
+                    Constraint, active=True, descend_into=Block
+                ):
+                    terms = _linear_terms(c.body)
+                    if terms is None:
+                        continue
+                    row = len(constraints)
+                    start = len(rows)
+                    for coef, var in terms:
+                        if var is None:
+                            col = 0
+                        else:
+                            col = var_cols.get(id(var), None)
+                        if col is None:
+                            if var.fixed and use_fixed_values:
+                                lb = ub = var.value
+                                if lb is None:
+                                    # Leave the error to the visitor
+                                    break
+                            else:
+                                lb, ub = var.bounds
+                                if lb is None:
+                                    lb = -interval.inf
+                                if ub is None:
+                                    ub = interval.inf
+                            col = var_cols[id(var)] = len(col_lbs)
+                            col_lbs.append(lb)
+                            col_ubs.append(ub)
+                        rows.append(row)
+                        cols.append(col)
+                        coefs.append(coef)
+                    else:
+                        constraints.append(c)
+                        continue
+                    del rows[start:], cols[start:], coefs[start:]
+        if not constraints:
+            return
+        self._linear_body_bounds.update(
+            zip(
+                constraints,
+                _sum_term_bounds(rows, cols, coefs, col_lbs, col_ubs, len(constraints)),
+            )
+        )
 
     def _process_M_value(
         self,
@@ -222,7 +367,12 @@ class _BigM_MixIn(object):
         return lower, upper
 
     def _estimate_M(self, expr, constraint):
-        expr_lb, expr_ub = self._expr_bound_visitor.walk_expression(expr)
+        # expr is the body of constraint, which we may have already bounded
+        # in _estimate_linear_Ms
+        bounds = self._linear_body_bounds.get(constraint, None)
+        if bounds is None:
+            bounds = self._expr_bound_visitor.walk_expression(expr)
+        expr_lb, expr_ub = bounds
         if expr_lb == -interval.inf or expr_ub == interval.inf:
             raise GDP_Error(
                 "Cannot estimate M for unbounded "
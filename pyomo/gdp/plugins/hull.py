@@ -16,7 +16,12 @@ from collections import defaultdict
 from pyomo.common.autoslots import AutoSlots
 import pyomo.common.config as cfg
 from pyomo.common import deprecated
-from pyomo.common.collections import ComponentMap, ComponentSet, DefaultComponentMap
+from pyomo.common.collections import (
+    Bunch,
+    ComponentMap,
+    ComponentSet,
+    DefaultComponentMap,
+)
 from pyomo.common.modeling import unique_component_name
 from pyomo.core.expr.numvalue import ZeroConstant
 import pyomo.core.expr as EXPR
@@ -44,6 +49,12 @@ from pyomo.core import (
 from pyomo.gdp import Disjunct, Disjunction, GDP_Error
 from pyomo.gdp.disjunct import DisjunctData
 from pyomo.gdp.plugins.gdp_to_mip_transformation import GDP_to_MIP_Transformation
+from pyomo.gdp.plugins.multiple_bigm import (
+    ProcessStartMethod,
+    get_process_start_method,
+    worker_pool,
+    worker_state,
+)
 from pyomo.gdp.transformed_disjunct import _TransformedDisjunct
 from pyomo.gdp.util import (
     clone_without_expression_components,
@@ -199,11 +210,56 @@ class Hull_Reformulation(GDP_to_MIP_Transformation):
         """,
         ),
     )
+    CONFIG.declare(
+        'threads',
+        cfg.ConfigValue(
+            default=1,
+            domain=cfg.PositiveInt,
+            description="Number of worker processes to use when analyzing "
+            "independent Disjunctions",
+            doc="""
+        Number of worker processes to use when analyzing independent
+        Disjunctions.
+
+        If greater than 1, the Disjunctions that are neither nested nor
+        contain nested Disjunctions are analyzed in worker processes before
+        the transformation: these collect the Vars to disaggregate in each
+        Disjunct and which constraint bodies are linear. The components are
+        still created in this process, exactly as in serial mode, but
+        without collecting the Vars or the polynomial degrees again.
+        """,
+        ),
+    )
+    CONFIG.declare(
+        'process_start_method',
+        cfg.ConfigValue(
+            default=None,
+            domain=cfg.InEnum(ProcessStartMethod),
+            description="Start method used for spawning processes when "
+            "analyzing Disjunctions",
+            doc="""
+        Start method used for spawning processes when analyzing Disjunctions.
+
+        Options are the elements of the enum ProcessStartMethod, or
+        equivalently the strings 'fork', 'spawn', or 'forkserver', or None.
+        When None is passed, we use 'fork' on POSIX, unless Python has
+        multiple threads at the time the process pool is created, in which
+        case we use 'forkserver'. On Windows, we use 'spawn'. The 'spawn' and
+        'forkserver' methods require `dill`. This option is ignored if
+        `threads` is 1.
+        """,
+        ),
+    )
     transformation_name = 'hull'
 
     def __init__(self):
         super().__init__(logger)
         self._targets = set()
+        # The results of analyzing independent Disjunctions in worker
+        # processes: map of Disjuncts to the Vars to disaggregate, and the
+        # ConstraintDatas with linear bodies
+        self._disjunct_vars = ComponentMap()
+        self._linear_constraints = ComponentSet()
 
     def _collect_local_vars_from_block(self, block, local_var_dict):
         localVars = block.component('LocalVars')
@@ -247,6 +303,8 @@ class Hull_Reformulation(GDP_to_MIP_Transformation):
             self._restore_state()
             self._transformation_blocks.clear()
             self._algebraic_constraints.clear()
+            self._disjunct_vars.clear()
+            self._linear_constraints.clear()
 
     def _apply_to_impl(self, instance, **kwds):
         self._process_arguments(instance, **kwds)
@@ -266,6 +324,8 @@ class Hull_Reformulation(GDP_to_MIP_Transformation):
         preprocessed_targets = gdp_tree.reverse_topological_sort()
         # Get all LocalVars from Suffixes ahead of time
         local_vars_by_disjunct = self._get_user_defined_local_vars(preprocessed_targets)
+        if self._config.threads > 1:
+            self._analyze_disjunctions(instance, preprocessed_targets, gdp_tree)
 
         for t in preprocessed_targets:
             if t.ctype is Disjunction:
@@ -276,6 +336,54 @@ class Hull_Reformulation(GDP_to_MIP_Transformation):
             # disjunctions to transform them (which variables to disaggregate),
             # so for hull's purposes, they need not be in the tree.
 
+    def _analyze_disjunctions(self, instance, preprocessed_targets, gdp_tree):
+        # Only independent Disjunctions can be analyzed ahead of time:
+        # transforming nested Disjunctions changes the parent Disjuncts.
+        disjunctions = [
+            t
+            for t in preprocessed_targets
+            if t.ctype is Disjunction
+            and gdp_tree.parent(t) is None
+            and all(gdp_tree.is_leaf(d) for d in t.disjuncts if d.active)
+        ]
+        if len(disjunctions) < 2:
+            return
+        threads = min(self._config.threads, len(disjunctions))
+        # The workers refer to Vars by their position in this list
+        model = instance.model()
+        var_list = list(
+            model.component_data_objects(Var, descend_into=(Block, Disjunct))
+        )
+        method = get_process_start_method(self._config.process_start_method)
+        logger.info(
+            f"Analyzing {len(disjunctions)} Disjunctions on {threads} worker "
+            f"processes with process start method {method}."
+        )
+        state = Bunch(
+            model=model,
+            disjunction_names=[d.getname(fully_qualified=True) for d in disjunctions],
+            include_fixed=not self._config.assume_fixed_vars_permanent,
+        )
+        with worker_pool(
+            __name__, threads, state, method, initializer=_setup_analyze_disjunction
+        ) as pool:
+            results = pool.map(
+                _analyze_disjunction,
+                range(len(disjunctions)),
+                chunksize=max(1, len(disjunctions) // (4 * threads)),
+            )
+
+        for disjunction, analysis in zip(disjunctions, results):
+            if analysis is None:
+                # Transform this one serially
+                continue
+            active_disjuncts = [d for d in disjunction.disjuncts if d.active]
+            for disjunct, (var_ids, linear) in zip(active_disjuncts, analysis):
+                self._disjunct_vars[disjunct] = [var_list[i] for i in var_ids]
+                for c, is_linear in zip(_disjunct_constraints(disjunct), linear):
+                    if is_linear:
+                        self._linear_constraints.add(c)
+
     def _add_transformation_block(self, to_block):
         transBlock, new_block = super()._add_transformation_block(to_block)
         if not new_block:
@@ -337,14 +445,17 @@ class Hull_Reformulation(GDP_to_MIP_Transformation):
         for disjunct in active_disjuncts:
             # create the key for each disjunct now
             disjunct_disaggregated_var_map[disjunct] = ComponentMap()
-            for var in get_vars_from_components(
-                disjunct,
-                Constraint,
-                include_fixed=not self._config.assume_fixed_vars_permanent,
-                active=True,
-                sort=SortComponents.deterministic,
-                descend_into=Block,
-            ):
+            disjunct_vars = self._disjunct_vars.get(disjunct, None)
+            if disjunct_vars is None:
+                disjunct_vars = get_vars_from_components(
+                    disjunct,
+                    Constraint,
+                    include_fixed=not self._config.assume_fixed_vars_permanent,
+                    active=True,
+                    sort=SortComponents.deterministic,
+                    descend_into=Block,
+                )
+            for var in disjunct_vars:
                 # [ESJ 02/14/2020] By default, we disaggregate fixed variables
                 # on the philosophy that fixing is not a promise for the future
                 # and we are mathematically wrong if we don't transform these
@@ -678,7 +789,11 @@ class Hull_Reformulation(GDP_to_MIP_Transformation):
             unique = len(newConstraint)
             name = c.local_name + "_%s" % unique
 
-            NL = c.body.polynomial_degree() not in (0, 1)
+            if c in self._linear_constraints:
+                # We already know (from _analyze_disjunctions)
+                NL = False
+            else:
+                NL = c.body.polynomial_degree() not in (0, 1)
             EPS = self._config.EPS
             mode = self._config.perspective_function
 
@@ -988,3 +1103,58 @@ class Hull_Reformulation(GDP_to_MIP_Transformation):
 class _Deprecated_Name_Hull(Hull_Reformulation):
     def __init__(self):
         super(_Deprecated_Name_Hull, self).__init__()
+
+
+def _disjunct_constraints(disjunct):
+    return disjunct.component_data_objects(
+        Constraint, active=True, sort=SortComponents.deterministic, descend_into=Block
+    )
+
+
+# Things we call in subprocesses. These can't be member functions, or
+# else we'd have to pickle `self`, which is problematic.
+def _setup_analyze_disjunction(state):
+    model = state.model
+    state.disjunctions = [model.find_component(n) for n in state.disjunction_names]
+    # The coordinator refers to Vars by their position in this list
+    state.var_index = {
+        id(v): i
+        for i, v in enumerate(
+            model.component_data_objects(Var, descend_into=(Block, Disjunct))
+        )
+    }
+
+
+def _analyze_disjunction(idx):
+    """Collect the Vars to disaggregate and which constraint bodies are
+    linear in each active Disjunct of a Disjunction (in a worker process)
+
+    Returns a list of (Var positions, linear flags) for the active
+    Disjuncts, where the linear flags are in the order of
+    _disjunct_constraints(). Returns None if a Var is not on the model.
+    """
+    state = worker_state(__name__)
+    var_index = state.var_index
+    analysis = []
+    for disjunct in state.disjunctions[idx].disjuncts:
+        if not disjunct.active:
+            continue
+        var_ids = []
+        for var in get_vars_from_components(
+            disjunct,
+            Constraint,
+            include_fixed=state.include_fixed,
+            active=True,
+            sort=SortComponents.deterministic,
+            descend_into=Block,
+        ):
+            i = var_index.get(id(var), None)
+            if i is None:
+                return None
+            var_ids.append(i)
+        linear = [
+            c.body.polynomial_degree() in (0, 1)
+            for c in _disjunct_constraints(disjunct)
+        ]
+        analysis.append((var_ids, linear))
+    return analysis
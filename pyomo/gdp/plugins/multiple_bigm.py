@@ -9,6 +9,7 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+from contextlib import contextmanager
 import itertools
 import logging
 import math
@@ -16,7 +17,7 @@ import os
 import threading
 import enum
 
-from pyomo.common.collections import ComponentMap, ComponentSet
+from pyomo.common.collections import Bunch, ComponentMap, ComponentSet
 from pyomo.common.config import (
     ConfigDict,
     ConfigValue,
@@ -32,6 +33,7 @@ from pyomo.core import (
     Block,
     ConcreteModel,
     Constraint,
+    ConstraintList,
     maximize,
     minimize,
     NonNegativeIntegers,
@@ -75,17 +77,17 @@ _trusted_solvers = {
     'highs',
 }
 
-# Whether these are thread-local or at module scope makes no difference
-# for 'spawn' or 'forkserver', but it matters if we run single-threaded,
-# and possibly for edge cases of 'fork' (although it's not correct to
-# use fork() here while having multiple threads anyway, making it moot
-# in theory).
 _thread_local = threading.local()
-_thread_local.solver = None
-_thread_local.model = None
-_thread_local.config_use_primal_bound = None
 _thread_local.in_progress = False
 
+# The state of the worker functions run by worker_pool(), by name (see
+# worker_state()). Whether this is thread-local or at module scope makes
+# no difference for 'spawn' or 'forkserver', but it matters if we run
+# single-threaded, and possibly for edge cases of 'fork' (although it's
+# not correct to use fork() here while having multiple threads anyway,
+# making it moot in theory).
+_worker_states = threading.local()
+
 
 def Solver(val):
     if isinstance(val, str):
@@ -106,6 +108,103 @@ class ProcessStartMethod(str, enum.Enum):
     forkserver = 'forkserver'
 
 
+def get_process_start_method(process_start_method=None):
+    """Returns the start method to use for worker processes
+
+    If `process_start_method` is None, this is 'fork' on POSIX (or
+    'forkserver' if Python has multiple threads running) and 'spawn' on
+    Windows.
+    """
+    if process_start_method is not None:
+        return process_start_method
+    if os.name == 'nt':
+        return ProcessStartMethod.spawn
+    if len(threading.enumerate()) > 1:
+        return ProcessStartMethod.forkserver
+    return ProcessStartMethod.fork
+
+
+def worker_state(name):
+    """Returns the state of the worker functions registered under `name`
+
+    This is the `state` passed to worker_pool() (in the worker
+    processes) or to local_worker_state() (in this process).
+    """
+    return getattr(_worker_states, name, None)
+
+
+@contextmanager
+def local_worker_state(name, state):
+    """Context manager that makes `state` the worker state of `name` in
+    this process, so that the worker functions can also be called
+    without a pool
+    """
+    previous = worker_state(name)
+    setattr(_worker_states, name, state)
+    try:
+        yield state
+    finally:
+        setattr(_worker_states, name, previous)
+
+
+@contextmanager
+def worker_pool(name, processes, state, process_start_method=None, initializer=None):
+    """Context manager for a pool of worker processes sharing `state`
+
+    The worker functions (which must be module-level functions, as they
+    are pickled) get the state with worker_state(name). With the 'fork'
+    start method, the workers inherit the state from this process. With
+    'spawn' or 'forkserver', the state is pickled with dill once and
+    unpickled by every worker when it starts. If `initializer` is not
+    None, each worker then calls initializer(state), e.g., to create
+    objects that cannot be shared between processes, such as solvers.
+
+    On exit, the pool is closed (or terminated, if there was an
+    exception) and joined.
+    """
+    method = get_process_start_method(process_start_method)
+    if method == ProcessStartMethod.fork:
+        pickled_state = None
+    else:
+        if not dill_available:
+            raise GDP_Error(
+                "Dill is required when spawning processes using "
+                "methods 'spawn' or 'forkserver', but it could "
+                "not be imported."
+            )
+        pickled_state = dill.dumps(state)
+    with local_worker_state(name, state):
+        pool = multiprocessing.get_context(method.value).Pool(
+            processes=processes,
+            initializer=_setup_worker,
+            initargs=(name, pickled_state, initializer),
+        )
+        try:
+            yield pool
+        except:
+            pool.terminate()
+            raise
+        else:
+            pool.close()
+        finally:
+            pool.join()
+
+
+def _setup_worker(name, pickled_state, initializer):
+    if pickled_state is not None:
+        # When using 'spawn' or 'forkserver', Python starts in a new
+        # environment, so we need to manually ensure necessary plugins
+        # are registered (even if the main process has already
+        # registered them) before unpickling the state.
+        import pyomo.environ
+
+        setattr(_worker_states, name, dill.loads(pickled_state))
+    # (With 'fork', the workers are copies of the calling thread, so
+    # they already have the state.)
+    if initializer is not None:
+        initializer(worker_state(name))
+
+
 @TransformationFactory.register(
     'gdp.mbigm',
     doc="Relax disjunctive model using big-M terms specific to each disjunct",
@@ -168,6 +267,15 @@ class MultipleBigMTransformation(GDP_to_MIP_Transformation, _BigM_MixIn):
             domain=Solver,
             description="A solver to use to solve the continuous subproblems for "
             "calculating the M values",
+            doc="""
+            A solver to use to solve the continuous subproblems for
+            calculating the M values.
+
+            If the solver is not persistent, but a persistent interface to
+            it is available (e.g., 'gurobi_persistent' for 'gurobi'), the
+            persistent interface (with the same options) is used instead, so
+            that the subproblems are only loaded into the solver once.
+            """,
         ),
     )
     CONFIG.declare(
@@ -328,9 +436,7 @@ class MultipleBigMTransformation(GDP_to_MIP_Transformation, _BigM_MixIn):
                 self._arg_list.clear()
                 self._expr_bound_visitor.leaf_bounds.clear()
                 self._expr_bound_visitor.use_fixed_var_values_as_bounds = False
-                _thread_local.model = None
-                _thread_local.solver = None
-                _thread_local.config_use_primal_bound = None
+                self._linear_body_bounds.clear()
                 _thread_local.in_progress = False
 
     def _apply_to_impl(self, instance, **kwds):
@@ -367,6 +473,9 @@ class MultipleBigMTransformation(GDP_to_MIP_Transformation, _BigM_MixIn):
         # need information from the other Disjuncts in the Disjunction.
         gdp_tree = self._get_gdp_tree_from_targets(instance, targets)
         preprocessed_targets = gdp_tree.reverse_topological_sort()
+        if self._config.only_mbigm_bound_constraints:
+            # The other constraints are relaxed with estimated big-M values
+            self._estimate_linear_Ms(preprocessed_targets)
 
         arg_Ms = self._config.bigM if self._config.bigM is not None else {}
         self._transform_disjunctionDatas(
@@ -464,20 +573,36 @@ class MultipleBigMTransformation(GDP_to_MIP_Transformation, _BigM_MixIn):
                     )
         # (Now exiting the DisjunctionDatas loop)
         if jobs:
-            jobs_by_name = [
-                (
-                    constraint.getname(fully_qualified=True),
-                    other_disjunct.getname(fully_qualified=True),
-                    unsuccessful_solve_msg,
-                    is_upper,
-                )
-                for (
-                    constraint,
-                    other_disjunct,
-                    unsuccessful_solve_msg,
-                    is_upper,
-                ) in jobs
-            ]
+            # Every job for the same other_disjunct solves over the same
+            # feasible region (only the objective differs), so we
+            # calculate them in one batch. Each worker builds one scratch
+            # model for all the batches (see _calc_Ms).
+            batches = {}
+            for job in jobs:
+                batches.setdefault(job[1], []).append(job)
+            state = Bunch(
+                model=instance,
+                use_primal_bound=self._config.use_primal_bound,
+                batches=[
+                    (
+                        other_disjunct.getname(fully_qualified=True),
+                        [
+                            (
+                                constraint.getname(fully_qualified=True),
+                                unsuccessful_solve_msg,
+                                is_upper,
+                            )
+                            for (
+                                constraint,
+                                _,
+                                unsuccessful_solve_msg,
+                                is_upper,
+                            ) in batch
+                        ],
+                    )
+                    for other_disjunct, batch in batches.items()
+                ],
+            )
             threads = (
                 self._config.threads
                 if self._config.threads is not None
@@ -485,17 +610,38 @@ class MultipleBigMTransformation(GDP_to_MIP_Transformation, _BigM_MixIn):
                 # but it is not available on all platforms.
                 else os.cpu_count() - 1
             )
+            # There is no point in starting more workers than batches
+            threads = min(threads, len(batches))
             if threads > 1:
-                with self._setup_pool(threads, instance, len(jobs)) as pool:
-                    results = pool.starmap(func=_calc_M, iterable=jobs_by_name)
-                    pool.close()
-                    pool.join()
+                method = get_process_start_method(self._config.process_start_method)
+                logger.info(
+                    f"Running {len(jobs)} jobs in {len(batches)} batches on "
+                    f"{threads} worker processes with process start method "
+                    f"{method}."
+                )
+                # Each worker makes its own solver
+                state.solver_class = self._config.solver.__class__
+                state.solver_options = self._config.solver.options
+                with worker_pool(
+                    __name__, threads, state, method, initializer=_setup_calc_Ms
+                ) as pool:
+                    # The batches are coarse: hand them out one at a
+                    # time so that the workers stay balanced
+                    batch_results = pool.map(_calc_Ms, range(len(batches)), chunksize=1)
             else:
-                _thread_local.model = instance
-                _thread_local.solver = self._config.solver
-                _thread_local.config_use_primal_bound = self._config.use_primal_bound
-                logger.info(f"Running {len(jobs)} jobs single-threaded.")
-                results = itertools.starmap(_calc_M, jobs_by_name)
+                logger.info(
+                    f"Running {len(jobs)} jobs in {len(batches)} batches "
+                    "single-threaded."
+                )
+                state.solver = _get_persistent_solver(self._config.solver)
+                with local_worker_state(__name__, state):
+                    batch_results = [_calc_Ms(i) for i in range(len(batches))]
+            # Put the results back in the order of the jobs
+            results = {}
+            for batch, batch_result in zip(batches.values(), batch_results):
+                for job, result in zip(batch, batch_result):
+                    results[id(job)] = result
+            results = [results[id(job)] for job in jobs]
             deactivated = set()
             for (constraint, other_disjunct, _, is_upper), (
                 M,
@@ -829,53 +975,6 @@ class MultipleBigMTransformation(GDP_to_MIP_Transformation, _BigM_MixIn):
 
         return transformed_constraints
 
-    def _setup_pool(self, threads, instance, num_jobs):
-        method = (
-            self._config.process_start_method
-            if self._config.process_start_method is not None
-            else (
-                ProcessStartMethod.spawn
-                if os.name == 'nt'
-                else (
-                    ProcessStartMethod.forkserver
-                    if len(threading.enumerate()) > 1
-                    else ProcessStartMethod.fork
-                )
-            )
-        )
-        logger.info(
-            f"Running {num_jobs} jobs on {threads} worker "
-            f"processes with process start method {method}."
-        )
-        if (
-            method == ProcessStartMethod.spawn
-            or method == ProcessStartMethod.forkserver
-        ):
-            if not dill_available:
-                raise GDP_Error(
-                    "Dill is required when spawning processes using "
-                    "methods 'spawn' or 'forkserver', but it could "
-                    "not be imported."
-                )
-            pool = multiprocessing.get_context(method.value).Pool(
-                processes=threads,
-                initializer=_setup_spawn,
-                initargs=(
-                    dill.dumps(instance),
-                    dill.dumps(self._config.solver.__class__),
-                    dill.dumps(self._config.solver.options),
-                    self._config.use_primal_bound,
-                ),
-            )
-        elif method == ProcessStartMethod.fork:
-            _thread_local.model = instance
-            _thread_local.solver = self._config.solver
-            _thread_local.config_use_primal_bound = self._config.use_primal_bound
-            pool = multiprocessing.get_context('fork').Pool(
-                processes=threads, initializer=_setup_fork, initargs=()
-            )
-        return pool
-
     def _add_transformation_block(self, to_block):
         trans_block, new_block = super()._add_transformation_block(to_block)
 
@@ -952,36 +1051,115 @@ class MultipleBigMTransformation(GDP_to_MIP_Transformation, _BigM_MixIn):
 
 # Things we call in subprocesses. These can't be member functions, or
 # else we'd have to pickle `self`, which is problematic.
-def _setup_spawn(model, solver_class, solver_options, use_primal_bound):
-    # When using 'spawn' or 'forkserver', Python starts in a new
-    # environment and executes only this file, so we need to manually
-    # ensure necessary plugins are registered (even if the main process
-    # has already registered them).
-    import pyomo.environ
-
-    _thread_local.model = dill.loads(model)
-    _thread_local.solver = dill.loads(solver_class)(options=dill.loads(solver_options))
-    _thread_local.config_use_primal_bound = use_primal_bound
-
-
-def _setup_fork():
-    # model and config_use_primal_bound were already properly set, but
-    # remake the solver instead of using the passed argument. All these
-    # processes are copies of the calling thread so the thread-local
-    # still works.
-    _thread_local.solver = _thread_local.solver.__class__(
-        options=_thread_local.solver.options
+def _setup_calc_Ms(state):
+    state.solver = _get_persistent_solver(
+        state.solver_class(options=state.solver_options)
     )
 
 
-def _calc_M(constraint_name, other_disjunct_name, unsuccessful_message, is_upper):
-    solver = _thread_local.solver
-    model = _thread_local.model
-    scratch = _get_scratch_block(
-        model.find_component(constraint_name),
-        model.find_component(other_disjunct_name),
-        is_upper,
+def _is_persistent(solver):
+    # Legacy persistent solvers (and the APPSI persistent interfaces)
+    # can keep the scratch model loaded between solves
+    return (
+        getattr(solver, 'is_persistent', lambda: False)()
+        and hasattr(solver, 'set_instance')
+        and hasattr(solver, 'set_objective')
     )
+
+
+def _get_persistent_solver(solver):
+    """Returns solver if it is persistent, else the persistent interface
+    to the same solver (with the same options) if there is an available
+    one, else solver
+    """
+    if _is_persistent(solver):
+        return solver
+    name = getattr(solver, 'name', None)
+    if name is None or name + '_persistent' not in SolverFactory:
+        return solver
+    persistent = SolverFactory(name + '_persistent', options=solver.options)
+    if not persistent.available(exception_flag=False):
+        return solver
+    return persistent
+
+
+def _calc_Ms(batch_index):
+    """Calculate the M values of one of the batches of the worker state
+
+    The batches are (other_disjunct_name, jobs) tuples, where the jobs
+    are (constraint_name, unsuccessful_message, is_upper) tuples. Every
+    batch is solved on the same scratch model: only the objective and
+    the active other_disjunct constraints change between solves, so a
+    persistent solver is only given the model once. Returns a list of
+    (M, disjunct_infeasible) tuples in the order of the jobs.
+    """
+    state = worker_state(__name__)
+    solver = state.solver
+    persistent = _is_persistent(solver)
+    if state.scratch is None:
+        state.scratch = _get_scratch_model(state.model, state.batches)
+    scratch = state.scratch
+    _, batch = state.batches[batch_index]
+    results = []
+    for constraint_name, unsuccessful_message, is_upper in batch:
+        _set_scratch_objective(
+            scratch, state.model.find_component(constraint_name), is_upper
+        )
+        if state.active_batch != batch_index:
+            _activate_scratch_disjunct(state, batch_index, persistent)
+        elif persistent:
+            solver.set_objective(scratch.obj)
+        M, disjunct_infeasible = _calc_M(
+            solver, scratch, persistent, unsuccessful_message, is_upper
+        )
+        if disjunct_infeasible:
+            # The feasible region is the same for the rest of the batch
+            return results + [(M, True)] * (len(batch) - len(results))
+        results.append((M, disjunct_infeasible))
+    return results
+
+
+def _activate_scratch_disjunct(state, batch_index, persistent):
+    # Swap the constraints of the other_disjunct of the previous batch
+    # for those of this one (after setting the objective)
+    scratch = state.scratch
+    solver = state.solver
+    new = scratch.disjuncts[batch_index]
+    if state.active_batch is None:
+        new.activate()
+        if persistent:
+            solver.set_instance(scratch)
+    else:
+        old = scratch.disjuncts[state.active_batch]
+        if persistent:
+            _remove_constraints(solver, old.constraints.values())
+        old.deactivate()
+        new.activate()
+        if persistent:
+            _add_constraints(solver, new.constraints.values())
+            solver.set_objective(scratch.obj)
+    state.active_batch = batch_index
+
+
+def _add_constraints(solver, constraints):
+    if hasattr(solver, 'add_constraints'):
+        # APPSI
+        solver.add_constraints(list(constraints))
+    else:
+        for con in constraints:
+            solver.add_constraint(con)
+
+
+def _remove_constraints(solver, constraints):
+    if hasattr(solver, 'remove_constraints'):
+        # APPSI
+        solver.remove_constraints(list(constraints))
+    else:
+        for con in constraints:
+            solver.remove_constraint(con)
+
+
+def _calc_M(solver, scratch, persistent, unsuccessful_message, is_upper):
     results = solver.solve(scratch, tee=False, load_solutions=False, keepfiles=False)
     termination_condition = results.solver.termination_condition
     if is_upper:
@@ -1021,7 +1199,7 @@ def _calc_M(constraint_name, other_disjunct_name, unsuccessful_message, is_upper
         # mathematically incorrect in the presence of numerical error,
         # but it's the best a local solver like ipopt can do, so we
         # allow it to be used by setting an option.
-        if not _thread_local.config_use_primal_bound:
+        if not worker_state(__name__).use_primal_bound:
             M = bound
             if not math.isfinite(M):
                 raise GDP_Error(
@@ -1039,7 +1217,10 @@ def _calc_M(constraint_name, other_disjunct_name, unsuccessful_message, is_upper
                 # objective value. Try again by actually loading the
                 # solution and evaluating the objective expression.
                 try:
-                    scratch.solutions.load_from(results)
+                    if persistent and hasattr(solver, 'load_vars'):
+                        solver.load_vars()
+                    else:
+                        scratch.solutions.load_from(results)
                     M = value(scratch.obj)
                     if not math.isfinite(M):
                         raise ValueError()
@@ -1051,25 +1232,60 @@ def _calc_M(constraint_name, other_disjunct_name, unsuccessful_message, is_upper
         return (M, False)
 
 
-def _get_scratch_block(constraint, other_disjunct, is_upper):
-    scratch = ConcreteModel()
+def _set_scratch_objective(scratch, constraint, is_upper):
     if is_upper:
-        scratch.obj = Objective(expr=constraint.body - constraint.upper, sense=maximize)
+        scratch.obj.set_value(constraint.body - constraint.upper)
+        scratch.obj.sense = maximize
     else:
-        scratch.obj = Objective(expr=constraint.body - constraint.lower, sense=minimize)
-    # Create a Block component (via Reference) that actually points to a
-    # DisjunctData, as we want the writer to write it as if it were an
-    # ordinary Block rather than getting any special
-    # handling. DisjunctData inherits BlockData, so this should be
-    # valid.
-    scratch.disjunct_ref = Reference(other_disjunct, ctype=Block)
-
-    # Add references to every Var that appears in an active constraint.
+        scratch.obj.set_value(constraint.body - constraint.lower)
+        scratch.obj.sense = minimize
+
+
+def _get_scratch_model(model, batches):
+    """Build the model on which every batch of M calculations is solved
+
+    scratch.disjuncts[i] holds copies of the active constraints of the
+    other_disjunct of batch i, and is only active while the batch is
+    solved. (Copying the constraints means that the writers see them as
+    ordinary constraints rather than giving the Disjunct any special
+    handling.)
+    """
+    scratch = ConcreteModel()
+    # The objective is set for each job by _set_scratch_objective
+    scratch.obj = Objective(expr=0)
+    scratch.disjuncts = Block(range(len(batches)))
+    objective_constraints = []
+    for i, (other_disjunct_name, batch) in enumerate(batches):
+        blk = scratch.disjuncts[i]
+        blk.constraints = ConstraintList()
+        for constraint in model.find_component(
+            other_disjunct_name
+        ).component_data_objects(
+            Constraint,
+            active=True,
+            sort=SortComponents.deterministic,
+            descend_into=Block,
+        ):
+            blk.constraints.add(constraint.expr)
+        blk.deactivate()
+        objective_constraints.extend(
+            model.find_component(constraint_name) for constraint_name, _, _ in batch
+        )
+
+    # Add references to every Var that appears in a constraint of any
+    # batch, or in the objective of any job (so that persistent solvers
+    # see the same Vars for every batch).
     # TODO: If the writers don't assume Vars are declared on the Block
     # being solved, we won't need this!
     seen = set()
-    for constraint in scratch.component_data_objects(
-        Constraint, active=True, sort=SortComponents.deterministic, descend_into=Block
+    for constraint in itertools.chain(
+        scratch.component_data_objects(
+            Constraint,
+            active=None,
+            sort=SortComponents.deterministic,
+            descend_into=Block,
+        ),
+        objective_constraints,
     ):
         for var in EXPR.identify_variables(constraint.expr, include_fixed=True):
             if id(var) not in seen:
@@ -9,7 +9,9 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
-from pyomo.common.dependencies import dill_available
+import warnings
+
+from pyomo.common.dependencies import dill_available, numpy_available
 import pyomo.common.unittest as unittest
 from pyomo.common.deprecation import RenamedClass
 
@@ -27,10 +29,12 @@ from pyomo.environ import (
     ConcreteModel,
     Var,
     Any,
+    Param,
     value,
 )
 from pyomo.gdp import Disjunct, Disjunction, GDP_Error
 from pyomo.core.base import constraint, ConstraintData
+from pyomo.contrib.fbbt.expression_bounds_walker import ExpressionBoundsVisitor
 from pyomo.core.expr.compare import (
     assertExpressionsEqual,
     assertExpressionsStructurallyEqual,
@@ -2697,6 +2701,84 @@ class EstimatingMwithFixedVars(unittest.TestCase):
         ct.check_linear_coef(self, repn, promise.d.indicator_var, 7)
 
 
+class EstimatingMforLinearConstraints(unittest.TestCase):
+    def make_model(self):
+        m = ConcreteModel()
+        m.x = Var(bounds=(-2, 10))
+        m.y = Var(bounds=(0, None))
+        m.z = Var(bounds=(1, 3))
+        m.p = Param(initialize=0.5, mutable=True)
+        m.q = Param(initialize=0, mutable=True)
+        m.d = Disjunct()
+        m.d.c1 = Constraint(expr=m.x + 2 * m.z <= 13)
+        m.d.c2 = Constraint(expr=(-4, m.p * m.x - m.z + 3, 6))
+        m.d.c3 = Constraint(expr=m.x * m.z >= 1)
+        m.d.b = Block()
+        m.d.b.c = Constraint(expr=m.y - m.x >= 0)
+        m.d2 = Disjunct()
+        m.d2.c1 = Constraint(expr=m.x >= 7)
+        # 0 * [0, inf] is not bounded
+        m.d2.c2 = Constraint(expr=m.q * m.y + m.z <= 2)
+        m.d2.c3 = Constraint(expr=m.y**2 <= 2)
+        m.disj = Disjunction(expr=[m.d, m.d2])
+        return m
+
+    def check_linear_body_bounds(self, m, fixed=False):
+        bigm = TransformationFactory('gdp.bigm')
+        bigm._expr_bound_visitor.use_fixed_var_values_as_bounds = fixed
+        bigm._estimate_linear_Ms([m.disj])
+        linear = [m.d.c1, m.d.c2, m.d.b.c, m.d2.c1, m.d2.c2]
+        self.assertEqual(list(bigm._linear_body_bounds), linear)
+        # The bounds are the same as from walking the expressions
+        visitor = ExpressionBoundsVisitor(use_fixed_var_values_as_bounds=fixed)
+        for c in linear:
+            self.assertEqual(
+                bigm._linear_body_bounds[c], visitor.walk_expression(c.body)
+            )
+        return bigm._linear_body_bounds
+
+    def test_linear_body_bounds(self):
+        m = self.make_model()
+        bounds = self.check_linear_body_bounds(m)
+        self.assertEqual(bounds[m.d.c2], (-1, 7))
+        self.assertEqual(bounds[m.d2.c2], (-float('inf'), float('inf')))
+
+    @unittest.skipUnless(numpy_available, "numpy is not available")
+    def test_linear_body_bounds_no_numpy_warning(self):
+        m = self.make_model()
+        with warnings.catch_warnings():
+            # 0 * inf must not be reported as a RuntimeWarning
+            warnings.simplefilter('error')
+            bounds = self.check_linear_body_bounds(m)
+        self.assertEqual(bounds[m.d2.c2], (-float('inf'), float('inf')))
+
+    def test_linear_body_bounds_fixed_vars(self):
+        m = self.make_model()
+        m.z.fix(2)
+        bounds = self.check_linear_body_bounds(m)
+        self.assertEqual(bounds[m.d.c1], (0, 16))
+        bounds = self.check_linear_body_bounds(m, fixed=True)
+        self.assertEqual(bounds[m.d.c1], (2, 14))
+
+    def test_linear_body_bounds_without_numpy(self):
+        m = self.make_model()
+        with unittest.mock.patch('pyomo.gdp.plugins.bigm_mixin.numpy_available', False):
+            self.check_linear_body_bounds(m)
+
+    def test_Ms(self):
+        m = self.make_model()
+        m.d2.deactivate()
+        m.y.setub(4)
+        bigm = TransformationFactory('gdp.bigm')
+        bigm.apply_to(m)
+        self.assertEqual(bigm.get_M_value(m.d.c1), (None, 3))
+        self.assertEqual(bigm.get_M_value(m.d.c2), (3, 1))
+        self.assertEqual(bigm.get_M_value(m.d.c3), (-7, None))
+        self.assertEqual(bigm.get_M_value(m.d.b.c), (-10, None))
+        # The estimates are not kept after the transformation
+        self.assertEqual(len(bigm._linear_body_bounds), 0)
+
+
 class TrivialDisjuncts(unittest.TestCase):
     @unittest.skipIf(not ct.linear_solvers, "No linear solver available")
     def test_trivial_disjuncts_linear(self):
@@ -15,6 +15,7 @@ import random
 from io import StringIO
 
 import pyomo.common.unittest as unittest
+from pyomo.common.collections import Bunch
 
 from pyomo.common.dependencies import dill_available
 from pyomo.common.log import LoggingIntercept
@@ -38,6 +39,7 @@ from pyomo.environ import (
     Param,
     Objective,
     TerminationCondition,
+    inequality,
 )
 from pyomo.core.expr.compare import (
     assertExpressionsEqual,
@@ -49,6 +51,8 @@ from pyomo.repn import generate_standard_repn
 from pyomo.repn.linear import LinearRepnVisitor
 
 from pyomo.gdp import Disjunct, Disjunction, GDP_Error
+import pyomo.gdp.plugins.hull as hull_module
+from pyomo.gdp.plugins.multiple_bigm import local_worker_state
 import pyomo.gdp.tests.models as models
 import pyomo.gdp.tests.common_tests as ct
 
@@ -2512,6 +2516,136 @@ class DisaggregatingFixedVars(unittest.TestCase):
         self.assertIsNone(transBlock.disaggregatedVars.component("x"))
 
 
+class ParallelDisjunctionAnalysis(unittest.TestCase):
+    def make_model(self):
+        m = ConcreteModel()
+        m.I = RangeSet(3)
+        m.x = Var(m.I, bounds=(-5, 10))
+        m.y = Var(m.I, bounds=(0, 4))
+        m.z = Var(bounds=(1, 3))
+        m.w = Var(bounds=(2, 5))
+        m.p = Param(initialize=2, mutable=True)
+
+        @m.Disjunction(m.I)
+        def disjunction(m, i):
+            return [
+                [m.x[i] + 2 * m.y[i] <= 6, m.z**2 <= 4, m.y[i] == 0],
+                [m.p * m.x[i] - m.y[i] >= 1, inequality(0, m.x[i] - m.z + 1, 2)],
+            ]
+
+        # w is local to d1
+        m.d1 = Disjunct()
+        m.d1.c = Constraint(expr=m.w + m.z >= 4)
+        m.d1.LocalVars = Suffix(direction=Suffix.LOCAL)
+        m.d1.LocalVars[m.d1] = [m.w]
+        m.d2 = Disjunct()
+        m.d2.b = Block()
+        m.d2.b.c = Constraint(expr=m.z <= 2)
+        m.local = Disjunction(expr=[m.d1, m.d2])
+
+        # nested Disjunctions are transformed serially
+        m.outer1 = Disjunct()
+        m.outer1.c = Constraint(expr=m.x[1] + m.z <= 5)
+        m.outer1.inner = Disjunction(expr=[[m.x[2] >= 1], [m.x[2] <= -1]])
+        m.outer2 = Disjunct()
+        m.outer2.c = Constraint(expr=m.x[1] >= 7)
+        m.outer = Disjunction(expr=[m.outer1, m.outer2])
+        return m
+
+    def check_same_transformation(self, m1, m2):
+        cons1 = list(
+            m1.component_data_objects(Constraint, active=True, descend_into=Block)
+        )
+        cons2 = list(
+            m2.component_data_objects(Constraint, active=True, descend_into=Block)
+        )
+        self.assertEqual(
+            [c.getname(fully_qualified=True) for c in cons1],
+            [c.getname(fully_qualified=True) for c in cons2],
+        )
+        for c1, c2 in zip(cons1, cons2):
+            assertExpressionsStructurallyEqual(self, c1.expr, c2.expr)
+        self.assertEqual(
+            [v.name for v in m1.component_data_objects(Var) if v.fixed],
+            [v.name for v in m2.component_data_objects(Var) if v.fixed],
+        )
+        self.assertEqual(
+            [(v.name, v.bounds) for v in m1.component_data_objects(Var)],
+            [(v.name, v.bounds) for v in m2.component_data_objects(Var)],
+        )
+
+    @unittest.skipIf(sys.platform == 'win32', "'fork' is not available on Windows")
+    def test_fork_same_as_serial(self):
+        m = self.make_model()
+        # (unique_component_name resolves the name collisions randomly,
+        # so both transformations need the same random state to choose
+        # the same names)
+        random.seed(0)
+        serial = TransformationFactory('gdp.hull').create_using(m)
+        random.seed(0)
+        out = StringIO()
+        with unittest.mock.patch.object(
+            hull_module,
+            'get_vars_from_components',
+            wraps=hull_module.get_vars_from_components,
+        ) as get_vars:
+            with LoggingIntercept(out, 'pyomo.gdp.hull', logging.INFO):
+                TransformationFactory('gdp.hull').apply_to(
+                    m, threads=2, process_start_method='fork'
+                )
+        # The Vars of the Disjuncts of the independent Disjunctions were
+        # not collected again (only those of outer1, outer2 and the
+        # inner Disjuncts)
+        self.assertEqual(get_vars.call_count, 4)
+        # The three disjunction[i] and local are independent
+        self.assertIn(
+            "Analyzing 4 Disjunctions on 2 worker processes with process "
+            "start method ProcessStartMethod.fork.",
+            out.getvalue(),
+        )
+        self.check_same_transformation(serial, m)
+
+    @unittest.skipUnless(dill_available, "Dill is not available")
+    def test_spawn_same_as_serial(self):
+        m = self.make_model()
+        random.seed(0)
+        serial = TransformationFactory('gdp.hull').create_using(m)
+        random.seed(0)
+        TransformationFactory('gdp.hull').apply_to(
+            m, threads=2, process_start_method='spawn'
+        )
+        self.check_same_transformation(serial, m)
+
+    def test_analyze_disjunction(self):
+        m = self.make_model()
+        var_list = list(m.component_data_objects(Var, descend_into=True))
+        state = Bunch(
+            model=m, disjunction_names=['disjunction[1]', 'local'], include_fixed=True
+        )
+        hull_module._setup_analyze_disjunction(state)
+        self.assertEqual(state.disjunctions, [m.disjunction[1], m.local])
+        with local_worker_state(hull_module.__name__, state):
+            analysis = hull_module._analyze_disjunction(0)
+            self.assertEqual(len(analysis), 2)
+            var_ids, linear = analysis[0]
+            self.assertEqual([var_list[i] for i in var_ids], [m.x[1], m.y[1], m.z])
+            # z**2 is not linear
+            self.assertEqual(linear, [True, False, True])
+            # (mutable Params are constants)
+            var_ids, linear = analysis[1]
+            self.assertEqual(linear, [True, True])
+
+            m.z.fix(2)
+            state.include_fixed = False
+            analysis = hull_module._analyze_disjunction(1)
+            self.assertEqual([var_list[i].name for i in analysis[0][0]], ['w'])
+            self.assertEqual(analysis[1], ([], [True]))
+
+            # Vars that are not on the model are left to the serial code
+            state.var_index = {}
+            self.assertIsNone(hull_module._analyze_disjunction(0))
+
+
 class NameDeprecationTest(unittest.TestCase):
     def test_name_deprecated(self):
         m = models.makeTwoTermDisj()
@@ -19,6 +19,7 @@ from pyomo.common.dependencies import dill_available
 from pyomo.common.fileutils import import_file, PYOMO_ROOT_DIR
 from pyomo.common.log import LoggingIntercept
 import pyomo.common.unittest as unittest
+from pyomo.contrib.fbbt.fbbt import compute_bounds_on_expr
 from pyomo.core.expr.compare import (
     assertExpressionsEqual,
     assertExpressionsStructurallyEqual,
@@ -35,6 +36,7 @@ from pyomo.environ import (
     TransformationFactory,
     value,
     Var,
+    maximize,
 )
 from pyomo.gdp import Disjunct, Disjunction, GDP_Error
 from pyomo.gdp.tests.common_tests import (
@@ -44,6 +46,8 @@ from pyomo.gdp.tests.common_tests import (
     check_pprint_equal,
 )
 from pyomo.gdp.tests.models import make_indexed_equality_model
+from pyomo.gdp.plugins.multiple_bigm import ProcessStartMethod, get_process_start_method
+from pyomo.opt import SolverResults, TerminationCondition
 from pyomo.repn import generate_standard_repn
 
 
@@ -1077,6 +1081,28 @@ class IndexedDisjunction(unittest.TestCase):
         self.assertIs(cons_again[1], cons[1])
 
 
+class ProcessStartMethodTests(unittest.TestCase):
+    def test_get_process_start_method(self):
+        mbigm = 'pyomo.gdp.plugins.multiple_bigm'
+        self.assertEqual(
+            get_process_start_method(ProcessStartMethod.spawn), ProcessStartMethod.spawn
+        )
+        with unittest.mock.patch(mbigm + '.os.name', 'nt'):
+            self.assertEqual(get_process_start_method(), ProcessStartMethod.spawn)
+        with (
+            unittest.mock.patch(mbigm + '.os.name', 'posix'),
+            unittest.mock.patch(mbigm + '.threading.enumerate', return_value=[None]),
+        ):
+            self.assertEqual(get_process_start_method(), ProcessStartMethod.fork)
+        with (
+            unittest.mock.patch(mbigm + '.os.name', 'posix'),
+            unittest.mock.patch(
+                mbigm + '.threading.enumerate', return_value=[None, None]
+            ),
+        ):
+            self.assertEqual(get_process_start_method(), ProcessStartMethod.forkserver)
+
+
 class EdgeCases(unittest.TestCase):
     def make_infeasible_disjunct_model(self):
         m = ConcreteModel()
@@ -1191,3 +1217,184 @@ class EdgeCases(unittest.TestCase):
             TransformationFactory('gdp.mbigm').apply_to(
                 m, reduce_bound_constraints=False
             )
+
+
+class _BoxBoundPersistentSolver(object):
+    """A stand-in persistent solver for the M calculation subproblems
+
+    It 'solves' the scratch model by bounding the objective over the
+    variable bounds (ignoring the constraints), and reports the model as
+    (provably) infeasible if one of the loaded constraints is in
+    `infeasible` (by its string). It counts the calls to the persistent
+    interface, and checks that the loaded constraints are the active
+    ones.
+    """
+
+    name = 'box_bound_highs'
+    infeasible = ()
+
+    def __init__(self, options=None):
+        self.options = options if options is not None else {}
+        self.instance = None
+        self.constraints = set()
+        self.calls = {
+            'set_instance': 0,
+            'set_objective': 0,
+            'add_constraint': 0,
+            'remove_constraint': 0,
+            'solve': 0,
+        }
+
+    def is_persistent(self):
+        return True
+
+    def available(self, exception_flag=True):
+        return True
+
+    def set_instance(self, model):
+        self.calls['set_instance'] += 1
+        self.instance = model
+        self.constraints = set(
+            model.component_data_objects(Constraint, active=True, descend_into=True)
+        )
+
+    def set_objective(self, obj):
+        self.calls['set_objective'] += 1
+
+    def add_constraint(self, con):
+        self.calls['add_constraint'] += 1
+        self.constraints.add(con)
+
+    def remove_constraint(self, con):
+        self.calls['remove_constraint'] += 1
+        self.constraints.remove(con)
+
+    def solve(self, model, **kwds):
+        self.calls['solve'] += 1
+        assert model is self.instance
+        assert self.constraints == set(
+            model.component_data_objects(Constraint, active=True, descend_into=True)
+        )
+        results = SolverResults()
+        if any(str(con.expr) in self.infeasible for con in self.constraints):
+            results.solver.termination_condition = TerminationCondition.infeasible
+            return results
+        results.solver.termination_condition = TerminationCondition.optimal
+        lb, ub = compute_bounds_on_expr(model.obj.expr)
+        results.problem.lower_bound = results.problem.upper_bound = (
+            ub if model.obj.sense == maximize else lb
+        )
+        return results
+
+
+class _BoxBoundSolver(object):
+    """The non-persistent interface to _BoxBoundPersistentSolver"""
+
+    name = 'box_bound_highs'
+
+    def __init__(self, options=None):
+        self.options = options if options is not None else {}
+
+    def solve(self, model, **kwds):
+        raise RuntimeError("The persistent interface should be used")
+
+
+class BatchedMCalculation(unittest.TestCase):
+    def make_model(self):
+        m = ConcreteModel()
+        m.x = Var(bounds=(0, 10))
+        m.y = Var(bounds=(-5, 5))
+        m.z = Var(bounds=(-1, 1))
+        m.disjunction = Disjunction(
+            expr=[
+                [m.x + m.y <= 2, m.x - m.y >= 1],
+                [m.x + 2 * m.z <= 4],
+                [m.y - m.z >= 3],
+            ]
+        )
+        return m
+
+    def check_Ms(self, m, mbm):
+        d = m.disjunction.disjuncts
+        # Bounds of (body - rhs) over the variable bounds
+        self.assertStructuredAlmostEqual(
+            mbm.get_all_M_values(m),
+            {
+                (d[0].constraint[1], d[1]): (None, 13),
+                (d[0].constraint[1], d[2]): (None, 13),
+                (d[0].constraint[2], d[1]): (-6, None),
+                (d[0].constraint[2], d[2]): (-6, None),
+                (d[1].constraint[1], d[0]): (None, 8),
+                (d[1].constraint[1], d[2]): (None, 8),
+                (d[2].constraint[1], d[0]): (-9, None),
+                (d[2].constraint[1], d[1]): (-9, None),
+            },
+        )
+
+    def test_one_solver_instance(self):
+        m = self.make_model()
+        solver = _BoxBoundPersistentSolver()
+        mbm = TransformationFactory('gdp.mbigm')
+        out = StringIO()
+        with LoggingIntercept(out, 'pyomo.gdp.mbigm', logging.INFO):
+            mbm.apply_to(m, reduce_bound_constraints=False, threads=1, solver=solver)
+        self.assertIn("Running 8 jobs in 3 batches single-threaded.", out.getvalue())
+        self.check_Ms(m, mbm)
+        # The scratch model is loaded once. Between batches, only the
+        # constraints of the other Disjunct are swapped (the batches are
+        # for Disjuncts 1, 2 and 0, with 1, 1 and 2 constraints), and
+        # otherwise only the objective changes.
+        self.assertEqual(
+            solver.calls,
+            {
+                'set_instance': 1,
+                'set_objective': 7,
+                'add_constraint': 3,
+                'remove_constraint': 2,
+                'solve': 8,
+            },
+        )
+
+    def test_infeasible_disjunct_skips_batch(self):
+        m = self.make_model()
+        solver = _BoxBoundPersistentSolver()
+        solver.infeasible = (str(m.disjunction.disjuncts[2].constraint[1].expr),)
+        mbm = TransformationFactory('gdp.mbigm')
+        mbm.apply_to(m, reduce_bound_constraints=False, threads=1, solver=solver)
+        self.assertFalse(m.disjunction.disjuncts[2].active)
+        # One solve proves the Disjunct infeasible for the whole batch
+        self.assertEqual(solver.calls['set_instance'], 1)
+        self.assertEqual(solver.calls['solve'], 6)
+
+    def test_persistent_solver_upgrade(self):
+        m = self.make_model()
+        SolverFactory.register('box_bound_highs_persistent')(_BoxBoundPersistentSolver)
+        try:
+            mbm = TransformationFactory('gdp.mbigm')
+            mbm.apply_to(
+                m, reduce_bound_constraints=False, threads=1, solver=_BoxBoundSolver()
+            )
+        finally:
+            SolverFactory.unregister('box_bound_highs_persistent')
+        self.check_Ms(m, mbm)
+
+    @unittest.skipIf(os.name == 'nt', "'fork' is not available on Windows")
+    def test_batches_fork(self):
+        m = self.make_model()
+        mbm = TransformationFactory('gdp.mbigm')
+        out = StringIO()
+        with LoggingIntercept(out, 'pyomo.gdp.mbigm', logging.INFO):
+            mbm.apply_to(
+                m,
+                reduce_bound_constraints=False,
+                threads=8,
+                process_start_method='fork',
+                solver=_BoxBoundPersistentSolver(),
+            )
+        # No more workers than batches
+        self.assertIn(
+            "Running 8 jobs in 3 batches on 3 worker processes with process "
+            "start method ProcessStartMethod.fork.",
+            out.getvalue(),
+        )
+        self.check_Ms(m, mbm)
@@ -22,6 +22,7 @@ from pyomo.common.collections import Bunch
 
 from pyomo.opt.base.convert import convert_problem
 from pyomo.opt.base.formats import ResultsFormat
+from pyomo.opt.results.solver import SolverStatus, TerminationCondition
 import pyomo.opt.base.results
 
 logger = logging.getLogger('pyomo.opt')
@@ -253,6 +254,11 @@ def _raise_ephemeral_error(name, keyword=""):
 class OptSolver(object):
     """A generic optimization solver"""
 
+    # LogParser class used to report solver progress to the
+    # progress_callback (None if the solver does not support progress
+    # callbacks)
+    _log_parser = None
+
     #
     # Support "with" statements. Forgetting to call deactivate
     # on Plugins is a common source of memory leaks
@@ -557,6 +563,44 @@ class OptSolver(object):
     def solve(self, *args, **kwds):
         """Solve the problem"""
 
+        _model, orig_options = self._solve_begin(args, kwds)
+        try:
+            # we're good to go.
+            initial_time = time.time()
+
+            self._presolve(*args, **kwds)
+
+            presolve_completion_time = time.time()
+            if self._report_timing:
+                print(
+                    "      %6.2f seconds required for presolve"
+                    % (presolve_completion_time - initial_time)
+                )
+
+            if not _model is None:
+                self._initialize_callbacks(_model)
+
+            _status = self._apply_solver()
+            result = self._solve_end(_model, _status, presolve_completion_time)
+
+        finally:
+            #
+            # Reset the options dict
+            #
+            self.options = orig_options
+
+        return result
+
+    def _solve_begin(self, args, kwds):
+        """Prepare for solving the problem
+
+        This validates the models in ``args``, collects the import
+        suffixes, and processes the ephemeral solver options in
+        ``kwds``.  Returns the model being solved (or None) and the
+        original solver options, which the caller must restore once the
+        solve is complete.
+
+        """
         self.available(exception_flag=True)
         #
         # If the inputs are models, then validate that they have been
@@ -617,97 +661,92 @@ class OptSolver(object):
         self.options.update(
             self._options_string_to_dict(kwds.pop('options_string', ''))
         )
-        try:
-            # we're good to go.
-            initial_time = time.time()
+        return _model, orig_options
 
-            self._presolve(*args, **kwds)
+    def _solve_end(self, _model, _status, solve_start_time):
+        """Complete solving the problem
 
-            presolve_completion_time = time.time()
-            if self._report_timing:
-                print(
-                    "      %6.2f seconds required for presolve"
-                    % (presolve_completion_time - initial_time)
-                )
+        This checks the status returned by :meth:`_apply_solver`,
+        processes the solver output (:meth:`_postsolve`), and loads the
+        results into the model (if requested).  Returns the results.
 
-            if not _model is None:
-                self._initialize_callbacks(_model)
+        """
+        if hasattr(self, '_transformation_data'):
+            del self._transformation_data
+        from pyomo.core.kernel.block import IBlock
 
-            _status = self._apply_solver()
-            if hasattr(self, '_transformation_data'):
-                del self._transformation_data
-            if not hasattr(_status, 'rc'):
-                logger.warning(
-                    "Solver (%s) did not return a solver status code.\n"
-                    "This is indicative of an internal solver plugin error.\n"
-                    "Please report this to the Pyomo developers."
-                )
-            elif _status.rc:
-                logger.error(
-                    "Solver (%s) returned non-zero return code (%s)"
-                    % (self.name, _status.rc)
-                )
-                if self._tee:
-                    logger.error("See the solver log above for diagnostic information.")
-                elif hasattr(_status, 'log') and _status.log:
-                    logger.error("Solver log:\n" + str(_status.log))
-                raise ApplicationError("Solver (%s) did not exit normally" % self.name)
-            solve_completion_time = time.time()
-            if self._report_timing:
-                print(
-                    "      %6.2f seconds required for solver"
-                    % (solve_completion_time - presolve_completion_time)
-                )
+        # The progress_callback stopped the solver: the (nonzero) return
+        # code is expected, and the solver reported the current point
+        interrupted = getattr(_status, 'interrupted', False)
+        if not hasattr(_status, 'rc'):
+            logger.warning(
+                "Solver (%s) did not return a solver status code.\n"
+                "This is indicative of an internal solver plugin error.\n"
+                "Please report this to the Pyomo developers."
+            )
+        elif _status.rc and not interrupted:
+            logger.error(
+                "Solver (%s) returned non-zero return code (%s)"
+                % (self.name, _status.rc)
+            )
+            if self._tee:
+                logger.error("See the solver log above for diagnostic information.")
+            elif hasattr(_status, 'log') and _status.log:
+                logger.error("Solver log:\n" + str(_status.log))
+            raise ApplicationError("Solver (%s) did not exit normally" % self.name)
+        solve_completion_time = time.time()
+        if self._report_timing:
+            print(
+                "      %6.2f seconds required for solver"
+                % (solve_completion_time - solve_start_time)
+            )
 
-            result = self._postsolve()
-            result._smap_id = self._smap_id
-            result._smap = None
-            if _model:
-                if isinstance(_model, IBlock):
-                    if len(result.solution) == 1:
-                        result.solution(0).symbol_map = getattr(
-                            _model, "._symbol_maps"
-                        )[result._smap_id]
-                        result.solution(0).default_variable_value = (
-                            self._default_variable_value
-                        )
-                        if self._load_solutions:
-                            _model.load_solution(result.solution(0))
-                    else:
-                        assert len(result.solution) == 0
-                    # see the hack in the write method
-                    # we don't want this to stick around on the model
-                    # after the solve
-                    assert len(getattr(_model, "._symbol_maps")) == 1
-                    delattr(_model, "._symbol_maps")
-                    del result._smap_id
-                    if self._load_solutions and (len(result.solution) == 0):
-                        logger.error("No solution is available")
-                else:
+        result = self._postsolve()
+        if interrupted:
+            result.solver.status = SolverStatus.aborted
+            result.solver.termination_condition = TerminationCondition.userInterrupt
+        result._smap_id = self._smap_id
+        result._smap = None
+        if _model:
+            if isinstance(_model, IBlock):
+                if len(result.solution) == 1:
+                    result.solution(0).symbol_map = getattr(_model, "._symbol_maps")[
+                        result._smap_id
+                    ]
+                    result.solution(0).default_variable_value = (
+                        self._default_variable_value
+                    )
                     if self._load_solutions:
-                        _model.solutions.load_from(
-                            result,
-                            select=self._select_index,
-                            default_variable_value=self._default_variable_value,
-                        )
-                        result._smap_id = None
-                        result.solution.clear()
-                    else:
-                        result._smap = _model.solutions.symbol_map[self._smap_id]
-                        _model.solutions.delete_symbol_map(self._smap_id)
-            postsolve_completion_time = time.time()
-
-            if self._report_timing:
-                print(
-                    "      %6.2f seconds required for postsolve"
-                    % (postsolve_completion_time - solve_completion_time)
-                )
-
-        finally:
-            #
-            # Reset the options dict
-            #
-            self.options = orig_options
+                        _model.load_solution(result.solution(0))
+                else:
+                    assert len(result.solution) == 0
+                # see the hack in the write method
+                # we don't want this to stick around on the model
+                # after the solve
+                assert len(getattr(_model, "._symbol_maps")) == 1
+                delattr(_model, "._symbol_maps")
+                del result._smap_id
+                if self._load_solutions and (len(result.solution) == 0):
+                    logger.error("No solution is available")
+            else:
+                if self._load_solutions:
+                    _model.solutions.load_from(
+                        result,
+                        select=self._select_index,
+                        default_variable_value=self._default_variable_value,
+                    )
+                    result._smap_id = None
+                    result.solution.clear()
+                else:
+                    result._smap = _model.solutions.symbol_map[self._smap_id]
+                    _model.solutions.delete_symbol_map(self._smap_id)
+        postsolve_completion_time = time.time()
+
+        if self._report_timing:
+            print(
+                "      %6.2f seconds required for postsolve"
+                % (postsolve_completion_time - solve_completion_time)
+            )
 
         return result
 
@@ -719,6 +758,13 @@ class OptSolver(object):
         self._timelimit = kwds.pop("timelimit", None)
         self._report_timing = kwds.pop("report_timing", False)
         self._tee = kwds.pop("tee", False)
+        self._progress_callback = kwds.pop("progress_callback", None)
+        if self._progress_callback is not None and self._log_parser is None:
+            logger.warning(
+                "Solver (%s) does not support progress callbacks; "
+                "ignoring progress_callback" % (self.name,)
+            )
+            self._progress_callback = None
         self._assert_available = kwds.pop("available", True)
         self._suffixes = kwds.pop("suffixes", [])
 
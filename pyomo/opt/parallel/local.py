@@ -9,11 +9,26 @@
 #  This software is distributed under the 3-clause BSD License.
 #  ___________________________________________________________________________
 
+import copy
+import os
+import subprocess
+import sys
+import tempfile
 import time
+from collections import deque
+from io import StringIO
 
-from pyomo.common.collections import OrderedDict
+from pyomo.common.collections import Bunch, OrderedDict
+from pyomo.common.errors import ApplicationError, TempfileContextError
+from pyomo.common.tee import TeeStream
+from pyomo.common.tempfiles import TempfileManager
 
 import pyomo.opt
+from pyomo.opt.solver.shellcmd import (
+    SystemCallSolver,
+    SUBPROCESS_TIMEOUT_ABS_ADJUST,
+    SUBPROCESS_TIMEOUT_REL_ADJUST,
+)
 from pyomo.opt.parallel.manager import ActionManagerError, ActionStatus, ActionHandle
 from pyomo.opt.parallel.async_solver import (
     AsynchronousSolverManager,
@@ -77,3 +92,327 @@ class SolverManager_Serial(AsynchronousSolverManager):
                 "executes solvers synchronously"
             ),
         )
+
+
+class _LocalSolve(object):
+    """The state of a single solve queued in the 'parallel' solver manager"""
+
+    def __init__(self, ah, opt, model, orig_options, queue_time):
+        self.ah = ah
+        self.opt = opt
+        self.model = model
+        self.orig_options = orig_options
+        self.start_time = time.time()
+        self.queue_time = queue_time
+        self.tempfiles = None
+        self.process = None
+        self.log = None
+        self.log_parser = None
+        self.tee = None
+        self.deadline = None
+
+    def open_log(self):
+        """Return the file that the solver output is written to"""
+        if self.log_parser is None:
+            self.log = tempfile.TemporaryFile(mode='w+')
+            return self.log
+        # Parse the output (for the progress_callback) as the solver
+        # writes it
+        self.log = StringIO()
+        self.tee = TeeStream(self.log, self.log_parser)
+        return self.tee.STDOUT
+
+    def close_log(self):
+        """Close the solver output and return it (None if already closed)"""
+        if self.log is None:
+            return None
+        if self.tee is not None:
+            self.tee.close()
+            self.log_parser.close()
+            output = self.log.getvalue()
+        else:
+            self.log.seek(0)
+            output = self.log.read()
+            self.log.close()
+        self.log = self.tee = None
+        return output
+
+
+def _pop_tempfile_contexts(context, remove):
+    """Pop the TempfileManager contexts down to (and including) context
+
+    Returns
+    -------
+    list
+        The (fd, name) tuples of the temporary files and directories of
+        the popped contexts (which are only deleted if remove is True)
+
+    """
+    tempfiles = []
+    while True:
+        active = TempfileManager.context()
+        tempfiles.extend(active.tempfiles)
+        TempfileManager.pop(remove=remove)
+        if active is context:
+            return tempfiles
+
+
+@SolverManagerFactory.register(
+    "parallel", doc="Asynchronously execute solvers locally in concurrent subprocesses"
+)
+class SolverManager_Parallel(AsynchronousSolverManager):
+    """Solver manager that runs solver executables concurrently
+
+    Solves are written (e.g., the LP/NL files are generated) in the
+    calling process when they are queued, and the solver executables
+    are then run as concurrent subprocesses, with at most
+    ``max_workers`` (default: the number of CPUs) running at any time.
+    Problem writing therefore overlaps with the solver subprocesses
+    launched for previously-queued solves.  The solver output is
+    processed (and solutions loaded into the model) as each solve is
+    collected by :meth:`wait_any`, :meth:`wait_all`, or
+    :meth:`wait_for`.
+
+    As for a direct call to ``solve()``, a ``progress_callback`` is
+    called (from a reader thread) while the solver runs, for solvers
+    whose log can be parsed.
+
+    Solvers that do not run as an external executable (e.g., direct
+    or persistent interfaces) are executed synchronously when queued.
+
+    """
+
+    def __init__(self, max_workers=None, **kwds):
+        if max_workers is None:
+            max_workers = os.cpu_count() or 1
+        self.max_workers = max_workers
+        super(SolverManager_Parallel, self).__init__(**kwds)
+
+    def clear(self):
+        """
+        Clear manager state
+        """
+        if getattr(self, '_running', None):
+            self._kill_all_running_solves()
+        super(SolverManager_Parallel, self).clear()
+        self.results = OrderedDict()
+        # Solves that have been written but not yet started
+        self._pending = deque()
+        # Solves whose solver subprocess is running
+        self._running = {}
+        # Completed solves that have not been returned by wait_any()
+        self._done = deque()
+
+    def _perform_queue(self, ah, *args, **kwds):
+        """
+        Perform the queue operation.  This method returns the ActionHandle,
+        and the ActionHandle status indicates whether the queue was successful.
+        """
+        opt = kwds.pop('solver', kwds.pop('opt', None))
+        if opt is None:
+            raise ActionManagerError(
+                "No solver passed to %s, use keyword option 'solver'"
+                % (type(self).__name__)
+            )
+
+        time_start = time.time()
+        if isinstance(opt, str):
+            opt = pyomo.opt.SolverFactory(opt)
+        elif self._runs_as_subprocess(opt):
+            # Solver plugins hold the state of the current solve, so
+            # each queued solve needs its own solver object
+            opt = copy.deepcopy(opt)
+
+        if not self._runs_as_subprocess(opt):
+            results = opt.solve(*args, **kwds)
+            results.pyomo_solve_time = time.time() - time_start
+            self.results[ah.id] = results
+            ah.status = ActionStatus.done
+            self.event_handle[ah.id].update(ah)
+            self._done.append(ah.id)
+            return ah
+
+        # Write the problem (and generate the solver command line)
+        model, orig_options = opt._solve_begin(args, kwds)
+        context = TempfileManager.push()
+        try:
+            opt._presolve(*args, **kwds)
+            if model is not None:
+                opt._initialize_callbacks(model)
+        except:
+            opt.options = orig_options
+            _pop_tempfile_contexts(context, remove=True)
+            raise
+        job = _LocalSolve(ah, opt, model, orig_options, time_start)
+        job.log_parser = opt._create_log_parser()
+        # Other solves will be written (and completed) before this one
+        # completes, so the temporary files of this solve are moved off
+        # the TempfileManager stack until the solve is finalized.
+        job.tempfiles = TempfileManager.new_context()
+        job.tempfiles.tempfiles.extend(_pop_tempfile_contexts(context, remove=False))
+        self._pending.append(job)
+        self._start_pending_solves()
+        return ah
+
+    def _perform_wait_any(self):
+        """
+        Perform the wait_any operation.  This method returns an
+        ActionHandle with the results of waiting.  If None is returned
+        then the ActionManager assumes that it can call this method again.
+        Note that an ActionHandle can be returned with a dummy value,
+        to indicate an error.
+        """
+        while not self._done:
+            if not self._running:
+                if len(self.results) > 0:
+                    # All solves are complete: return any solve whose
+                    # results have not been retrieved
+                    ah_id, result = self.results.popitem(last=False)
+                    self.results[ah_id] = result
+                    return self.event_handle[ah_id]
+                return ActionHandle(
+                    error=True,
+                    explanation=(
+                        "No queued evaluations available in "
+                        "the 'parallel' solver manager"
+                    ),
+                )
+            self._poll_running_solves()
+        return self.event_handle[self._done.popleft()]
+
+    def wait_for(self, ah):
+        """
+        Wait for the specified action to complete.
+        """
+        while ah.status == ActionStatus.queued and self._running:
+            self._poll_running_solves()
+        if ah.id in self._done:
+            self._done.remove(ah.id)
+            self.queued_action_counter -= 1
+        if ah.status == ActionStatus.error:
+            raise ActionManagerError("Action %s failed: %s" % (ah, ah.explanation))
+        return self.get_results(ah)
+
+    def _runs_as_subprocess(self, opt):
+        # We can only run the solver asynchronously if it uses the
+        # standard SystemCallSolver mechanism to execute the solver
+        return (
+            isinstance(opt, SystemCallSolver)
+            and type(opt)._apply_solver is SystemCallSolver._apply_solver
+            and type(opt)._execute_command is SystemCallSolver._execute_command
+        )
+
+    def _start_pending_solves(self):
+        while self._pending and len(self._running) < self.max_workers:
+            job = self._pending.popleft()
+            opt = job.opt
+            command = opt._command
+            stdout = job.open_log()
+            if opt._timelimit is not None:
+                job.deadline = (
+                    time.time()
+                    + opt._timelimit
+                    + max(
+                        SUBPROCESS_TIMEOUT_ABS_ADJUST,
+                        SUBPROCESS_TIMEOUT_REL_ADJUST * opt._timelimit,
+                    )
+                )
+            job.start_time = time.time()
+            try:
+                job.process = subprocess.Popen(
+                    command.cmd,
+                    stdin=subprocess.PIPE if 'script' in command else None,
+                    env=command.env,
+                    stdout=stdout,
+                    stderr=subprocess.STDOUT,
+                    universal_newlines=True,
+                    cwd=command.cwd if "cwd" in command else None,
+                )
+                if 'script' in command:
+                    job.process.stdin.write(command.script)
+                    job.process.stdin.close()
+                if job.log_parser is not None:
+                    opt._attach_log_parser(job.log_parser, job.process)
+            except OSError as e:
+                self._finalize(
+                    job,
+                    ApplicationError(
+                        'Could not execute the command: %s\tError message: %s'
+                        % (command.cmd, e)
+                    ),
+                )
+                continue
+            self._running[job.ah.id] = job
+
+    def _poll_running_solves(self):
+        finished = []
+        for ah_id, job in self._running.items():
+            if job.process.poll() is not None:
+                finished.append(job)
+            elif job.deadline is not None and time.time() > job.deadline:
+                job.process.kill()
+                job.process.wait()
+                job.deadline = None
+                finished.append(job)
+        if not finished:
+            time.sleep(0.01)
+            return
+        for job in finished:
+            del self._running[job.ah.id]
+            self._finalize(job)
+        self._start_pending_solves()
+
+    def _finalize(self, job, error=None):
+        """Process the solver output and record the results of the solve"""
+        ah = job.ah
+        opt = job.opt
+        # The solver pops (and releases) the active context in
+        # opt._postsolve()
+        context = TempfileManager.push()
+        try:
+            if error is not None:
+                raise error
+            opt._rc = job.process.returncode
+            opt._log = job.close_log()
+            opt._interrupted = opt._solve_was_interrupted(job.log_parser)
+            opt._last_solve_time = time.time() - job.start_time
+            if opt._tee:
+                sys.stdout.write(opt._log)
+            results = opt._solve_end(
+                job.model,
+                Bunch(rc=opt._rc, log=opt._log, interrupted=opt._interrupted),
+                job.start_time,
+            )
+            results.pyomo_solve_time = time.time() - job.queue_time
+            self.results[ah.id] = results
+            ah.status = ActionStatus.done
+        except Exception as e:
+            ah.status = ActionStatus.error
+            ah.explanation = "%s: %s" % (type(e).__name__, e)
+        finally:
+            job.close_log()
+            opt.options = job.orig_options
+            try:
+                active = TempfileManager.context()
+            except TempfileContextError:
+                active = None
+            if active is context:
+                # The solve failed before opt._postsolve()
+                TempfileManager.pop(remove=not opt._keepfiles)
+            job.tempfiles.release(remove=not opt._keepfiles)
+        self.event_handle[ah.id].update(ah)
+        self._done.append(ah.id)
+
+    def _kill_all_running_solves(self):
+        for job in self._running.values():
+            job.process.kill()
+            job.process.wait()
+            job.close_log()
+            job.tempfiles.release()
+        self._running = {}
+        for job in self._pending:
+            job.tempfiles.release()
+        self._pending = deque()
+
+    def __exit__(self, t, v, traceback):
+        self._kill_all_running_solves()
@@ -0,0 +1,415 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+"""Incremental parsing of solver logs
+
+The parsers in this module are file-like objects that can be added to
+the output streams of a :class:`~pyomo.common.tee.TeeStream`.  As the
+solver writes its log, each complete line is parsed and every progress
+line (an iteration of an interior point / simplex method, or a node
+report from a branch-and-bound search) is turned into a
+:class:`SolverProgress` record and passed to a user callback while the
+solver is still running.
+
+If the callback returns ``True``, the parser requests that the solver
+stop.  This only has an effect if the solver interface registered a way
+to interrupt the solver: subprocesses registered with
+:meth:`LogParser.attach` are sent ``SIGINT`` (which Ipopt and CBC
+catch, stopping at the current point and reporting it), and in-process
+solvers can register an interrupt function with
+:meth:`LogParser.set_interrupt`.  GLPK does not catch ``SIGINT`` (the
+process would be killed without writing a solution), so the GLPK
+interface only reports progress and does not stop early.
+
+"""
+
+import logging
+import math
+import re
+import signal
+import sys
+import time
+
+logger = logging.getLogger(__name__)
+
+_mswindows = sys.platform.startswith('win')
+
+
+def _float(val):
+    try:
+        return float(val)
+    except ValueError:
+        return None
+
+
+class SolverProgress(object):
+    """Solver progress reported by one line of the solver log
+
+    Fields that the solver does not report are ``None``.
+
+    Attributes
+    ----------
+    solver: str
+        Name of the solver that generated the log
+    iteration: int
+        Iteration count (or processed node count for branch-and-bound)
+    objective: float
+        Current objective (or incumbent objective for branch-and-bound)
+    bound: float
+        Best objective bound
+    primal_infeasibility: float
+        Primal (constraint) infeasibility
+    dual_infeasibility: float
+        Dual infeasibility
+    gap: float
+        Relative optimality gap
+    elapsed_time: float
+        Seconds since the solver started (as reported by the solver,
+        or measured by the parser if the solver does not report it)
+    line: str
+        The log line this record was parsed from
+
+    """
+
+    __slots__ = (
+        'solver',
+        'iteration',
+        'objective',
+        'bound',
+        'primal_infeasibility',
+        'dual_infeasibility',
+        'gap',
+        'elapsed_time',
+        'line',
+    )
+
+    def __init__(self, solver, line, **kwds):
+        self.solver = solver
+        self.line = line
+        for field in self.__slots__[1:-1]:
+            setattr(self, field, kwds.pop(field, None))
+        if kwds:
+            raise ValueError(
+                f"Unrecognized SolverProgress fields: {', '.join(sorted(kwds))}"
+            )
+
+    def __repr__(self):
+        fields = ', '.join(
+            f'{field}={getattr(self, field)!r}'
+            for field in self.__slots__[:-1]
+            if getattr(self, field) is not None
+        )
+        return f'{self.__class__.__name__}({fields})'
+
+
+class LogParser(object):
+    """Base class for incremental solver log parsers
+
+    Derived classes implement :meth:`parse_line`.
+
+    Parameters
+    ----------
+    callback: Callable[[SolverProgress], Optional[bool]]
+        Function called with each :class:`SolverProgress` record.  If it
+        returns ``True``, the solver is asked to stop.
+
+    """
+
+    solver = None
+
+    def __init__(self, callback=None):
+        self.callback = callback
+        self.last_progress = None
+        self.termination_requested = False
+        self._interrupt = None
+        self._buffer = ''
+        self._start_time = time.time()
+
+    def attach(self, process):
+        """Register the solver subprocess to interrupt on request
+
+        ``process`` can be a :class:`subprocess.Popen` or an
+        :class:`asyncio.subprocess.Process`.
+
+        """
+
+        def interrupt():
+            if process.returncode is not None:
+                return
+            try:
+                if _mswindows:
+                    process.terminate()
+                else:
+                    process.send_signal(signal.SIGINT)
+            except ProcessLookupError:
+                # The process exited before we could signal it
+                pass
+
+        self.set_interrupt(interrupt)
+
+    def set_interrupt(self, interrupt):
+        """Register the function that asks the solver to stop
+
+        If termination was already requested, ``interrupt`` is called
+        immediately.
+
+        """
+        self._interrupt = interrupt
+        if self.termination_requested:
+            interrupt()
+
+    def request_termination(self):
+        """Ask the solver to stop at the current point"""
+        self.termination_requested = True
+        if self._interrupt is not None:
+            self._interrupt()
+
+    def parse_line(self, line):
+        """Parse one line of the log
+
+        Returns
+        -------
+        SolverProgress or None
+            The progress record, or None if the line does not report
+            solver progress
+
+        """
+        raise NotImplementedError(
+            f"{self.__class__.__name__} does not implement parse_line()"
+        )
+
+    def process_line(self, line):
+        progress = self.parse_line(line)
+        if progress is None:
+            return None
+        if progress.elapsed_time is None:
+            progress.elapsed_time = time.time() - self._start_time
+        self.last_progress = progress
+        if self.callback is not None and not self.termination_requested:
+            try:
+                stop = self.callback(progress)
+            except Exception:
+                # This runs in the TeeStream reader thread, so
+                # exceptions would not reach the caller anyway.
+                logger.exception("Error in solver progress callback")
+                stop = False
+            if stop:
+                self.request_termination()
+        return progress
+
+    #
+    # File-like interface (so parsers can be used as TeeStream outputs)
+    #
+
+    def write(self, data):
+        lines = (self._buffer + data).split('\n')
+        self._buffer = lines.pop()
+        for line in lines:
+            self.process_line(line.rstrip('\r'))
+        return len(data)
+
+    def writelines(self, lines):
+        for line in lines:
+            self.write(line)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        """Parse any remaining (unterminated) line"""
+        if self._buffer:
+            line, self._buffer = self._buffer, ''
+            self.process_line(line.rstrip('\r'))
+
+
+class IpoptLogParser(LogParser):
+    """Parse the Ipopt iteration table
+
+    ``iter objective inf_pr inf_du lg(mu) ||d|| lg(rg) alpha_du alpha_pr ls``
+    """
+
+    solver = 'ipopt'
+    _iter_re = re.compile(r'^\s*(\d+)r?\s+(\S+)\s+(\S+)\s+(\S+)(?:\s+\S+){6}\s*$')
+
+    def parse_line(self, line):
+        m = self._iter_re.match(line)
+        if m is None:
+            return None
+        iteration, obj, inf_pr, inf_du = m.groups()
+        objective = _float(obj)
+        if objective is None:
+            return None
+        return SolverProgress(
+            self.solver,
+            line,
+            iteration=int(iteration),
+            objective=objective,
+            primal_infeasibility=_float(inf_pr),
+            dual_infeasibility=_float(inf_du),
+        )
+
+
+class CBCLogParser(LogParser):
+    """Parse CBC node reports, new incumbents and CLP iterations"""
+
+    solver = 'cbc'
+    _node_re = re.compile(
+        r'^Cbc0010I After (\d+) nodes, \d+ on tree, (\S+) best solution, '
+        r'best possible (\S+) \(([\d.]+) seconds\)'
+    )
+    _solution_re = re.compile(
+        r'^Cbc00(?:04|12)I Integer solution of (\S+) found .*?after (\d+) '
+        r'iterations and (\d+) nodes \(([\d.]+) seconds\)'
+    )
+    _clp_re = re.compile(
+        r'^Clp0006I\s+(\d+)\s+Obj\s+(\S+)'
+        r'(?:\s+Primal inf\s+(\S+)\s+\(\d+\))?'
+        r'(?:\s+Dual inf\s+(\S+)\s+\(\d+\))?'
+    )
+
+    def __init__(self, callback=None):
+        super().__init__(callback)
+        self._bound = None
+
+    @staticmethod
+    def _gap(objective, bound):
+        if objective is None or bound is None or abs(objective) >= 1e50:
+            return None
+        return abs(objective - bound) / max(abs(objective), 1e-10)
+
+    def parse_line(self, line):
+        m = self._node_re.match(line)
+        if m is not None:
+            nodes, obj, bound, elapsed = m.groups()
+            objective = _float(obj)
+            self._bound = _float(bound)
+            if objective is not None and abs(objective) >= 1e50:
+                # No incumbent yet (CBC reports 1e50)
+                objective = None
+            return SolverProgress(
+                self.solver,
+                line,
+                iteration=int(nodes),
+                objective=objective,
+                bound=self._bound,
+                gap=self._gap(objective, self._bound),
+                elapsed_time=float(elapsed),
+            )
+        m = self._solution_re.match(line)
+        if m is not None:
+            obj, iters, nodes, elapsed = m.groups()
+            objective = _float(obj)
+            return SolverProgress(
+                self.solver,
+                line,
+                iteration=int(nodes),
+                objective=objective,
+                bound=self._bound,
+                gap=self._gap(objective, self._bound),
+                elapsed_time=float(elapsed),
+            )
+        m = self._clp_re.match(line)
+        if m is not None:
+            iteration, obj, inf_pr, inf_du = m.groups()
+            return SolverProgress(
+                self.solver,
+                line,
+                iteration=int(iteration),
+                objective=_float(obj),
+                primal_infeasibility=_float(inf_pr) if inf_pr else 0.0,
+                dual_infeasibility=_float(inf_du) if inf_du else 0.0,
+            )
+        return None
+
+
+class GLPKLogParser(LogParser):
+    """Parse GLPK simplex iterations and branch-and-bound progress"""
+
+    solver = 'glpk'
+    _simplex_re = re.compile(r'^[ *]\s*(\d+): obj =\s+(\S+)\s+inf(?:eas)? =\s+(\S+)')
+    _mip_re = re.compile(
+        r'^\+\s*(\d+): (?:mip =|>>>>>)\s+(not found yet|\S+)\s+[<>]=\s+(\S+)'
+        r'(?:\s+(\S+)%)?'
+    )
+
+    def parse_line(self, line):
+        m = self._mip_re.match(line)
+        if m is not None:
+            iteration, obj, bound, gap = m.groups()
+            gap = _float(gap) if gap else None
+            return SolverProgress(
+                self.solver,
+                line,
+                iteration=int(iteration),
+                objective=None if obj == 'not found yet' else _float(obj),
+                bound=_float(bound),
+                gap=None if gap is None else gap / 100,
+            )
+        m = self._simplex_re.match(line)
+        if m is not None:
+            iteration, obj, inf = m.groups()
+            return SolverProgress(
+                self.solver,
+                line,
+                iteration=int(iteration),
+                objective=_float(obj),
+                primal_infeasibility=_float(inf),
+            )
+        return None
+
+
+class HiGHSLogParser(LogParser):
+    """Parse HiGHS simplex / IPM iterations and MIP node reports"""
+
+    solver = 'highs'
+    _lp_re = re.compile(
+        r'^\s*(\d+)\s+(\S+)\s+(?:Pr|Ph1):\s*\d+\((\S+?)\)(?:;\s*Du:\s*\d+\((\S+?)\))?'
+        r'.*?\s([\d.]+)s\s*$'
+    )
+    _mip_re = re.compile(
+        r'^\s*(?:[A-Za-z]\s+)?(\d+)\s+\d+\s+\d+\s+[\d.]+%\s+(\S+)\s+(\S+)\s+'
+        r'(\S+)\s+(?:\d+\s+){4}([\d.]+)s\s*$'
+    )
+
+    def parse_line(self, line):
+        m = self._mip_re.match(line)
+        if m is not None:
+            nodes, bound, obj, gap = m.groups()[:4]
+            objective = _float(obj)
+            if objective is not None and math.isinf(objective):
+                objective = None
+            if gap.endswith('%'):
+                gap = _float(gap[:-1])
+                gap = None if gap is None else gap / 100
+            else:
+                # 'Large' (or no incumbent)
+                gap = None
+            return SolverProgress(
+                self.solver,
+                line,
+                iteration=int(nodes),
+                objective=objective,
+                bound=_float(bound),
+                gap=gap,
+                elapsed_time=float(m.group(5)),
+            )
+        m = self._lp_re.match(line)
+        if m is not None:
+            iteration, obj, inf_pr, inf_du, elapsed = m.groups()
+            return SolverProgress(
+                self.solver,
+                line,
+                iteration=int(iteration),
+                objective=_float(obj),
+                primal_infeasibility=_float(inf_pr),
+                dual_infeasibility=_float(inf_du) if inf_du else None,
+                elapsed_time=float(elapsed),
+            )
+        return None
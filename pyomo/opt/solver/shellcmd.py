@@ -45,6 +45,10 @@ SUBPROCESS_TIMEOUT_REL_ADJUST = 0.01
 class SystemCallSolver(OptSolver):
     """A generic command line solver"""
 
+    # True if the solver catches SIGINT and stops at the current point
+    # (so that the progress_callback can stop the solve early)
+    _interruptible = True
+
     def __init__(self, **kwargs):
         """Constructor"""
 
@@ -59,6 +63,8 @@ class SystemCallSolver(OptSolver):
         # broadly useful for reporting, and in cases where
         # a solver plugin may not report execution time.
         self._last_solve_time = None
+        # True if the progress_callback stopped the last solve
+        self._interrupted = False
         self._define_signal_handlers = None
         self._version_timeout = 2
 
@@ -265,7 +271,7 @@ class SystemCallSolver(OptSolver):
         sys.stdout.flush()
         self._rc, self._log = self._execute_command(self._command)
         sys.stdout.flush()
-        return Bunch(rc=self._rc, log=self._log)
+        return Bunch(rc=self._rc, log=self._log, interrupted=self._interrupted)
 
     def _postsolve(self):
         if self._log_file is not None:
@@ -328,34 +334,95 @@ class SystemCallSolver(OptSolver):
         ostreams = [StringIO()]
         if self._tee:
             ostreams.append(sys.stdout)
+        log_parser = self._create_log_parser()
+        if log_parser is not None:
+            ostreams.append(log_parser)
 
         try:
             with TeeStream(*ostreams) as t:
-                results = subprocess.run(
-                    command.cmd,
-                    input=_input,
-                    env=command.env,
-                    stdout=t.STDOUT,
-                    stderr=t.STDERR,
-                    timeout=timeout,
-                    universal_newlines=True,
-                    cwd=command.cwd if "cwd" in command else None,
-                )
+                if log_parser is None:
+                    results = subprocess.run(
+                        command.cmd,
+                        input=_input,
+                        env=command.env,
+                        stdout=t.STDOUT,
+                        stderr=t.STDERR,
+                        timeout=timeout,
+                        universal_newlines=True,
+                        cwd=command.cwd if "cwd" in command else None,
+                    )
+                    rc = results.returncode
+                else:
+                    # Run the process directly so that the log parser
+                    # can interrupt the solver
+                    rc = self._run_with_log_parser(
+                        command, _input, timeout, t, log_parser
+                    )
                 t.STDOUT.flush()
                 t.STDERR.flush()
 
-            rc = results.returncode
             log = ostreams[0].getvalue()
         except OSError:
             err = sys.exc_info()[1]
             msg = 'Could not execute the command: %s\tError message: %s'
             raise ApplicationError(msg % (command.cmd, err))
+        finally:
+            if log_parser is not None:
+                log_parser.close()
         sys.stdout.flush()
 
+        self._interrupted = self._solve_was_interrupted(log_parser)
         self._last_solve_time = time.time() - start_time
 
         return [rc, log]
 
+    def _create_log_parser(self):
+        """Return the log parser for the progress_callback of this solve
+
+        Returns None if there is no progress_callback, or if the solver
+        log cannot be parsed (in which case a warning is logged).
+        """
+        callback = getattr(self, '_progress_callback', None)
+        if callback is None or self._log_parser is None:
+            return None
+        return self._log_parser(callback)
+
+    def _attach_log_parser(self, log_parser, process):
+        """Let the log parser interrupt the solver subprocess"""
+        if self._interruptible:
+            log_parser.attach(process)
+
+    def _solve_was_interrupted(self, log_parser):
+        """Return True if the progress_callback stopped the solver"""
+        if log_parser is None or not log_parser.termination_requested:
+            return False
+        if not self._interruptible:
+            logger.warning(
+                "Solver (%s) cannot be interrupted; ignoring the "
+                "progress_callback request to stop the solve" % (self.name,)
+            )
+            return False
+        return True
+
+    def _run_with_log_parser(self, command, _input, timeout, tee, log_parser):
+        with subprocess.Popen(
+            command.cmd,
+            stdin=None if _input is None else subprocess.PIPE,
+            env=command.env,
+            stdout=tee.STDOUT,
+            stderr=tee.STDERR,
+            universal_newlines=True,
+            cwd=command.cwd if "cwd" in command else None,
+        ) as process:
+            self._attach_log_parser(log_parser, process)
+            try:
+                process.communicate(_input, timeout=timeout)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+                raise
+        return process.returncode
+
     def process_output(self, rc):
         """
         Process the output files.
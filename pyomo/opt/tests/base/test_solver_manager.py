@@ -0,0 +1,247 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Unit Tests for the local solver managers
+#
+
+import os
+import sys
+
+import pyomo.common.unittest as unittest
+from pyomo.common.collections import Bunch
+from pyomo.common.log import LoggingIntercept
+from pyomo.common.tempfiles import TempfileManager
+
+import pyomo.opt
+from pyomo.environ import ConcreteModel, Var, Objective, Constraint
+from pyomo.opt import (
+    ProblemFormat,
+    ResultsFormat,
+    SolverManagerFactory,
+    SolverResults,
+    SolverStatus,
+    TerminationCondition,
+)
+from pyomo.opt.parallel.local import SolverManager_Parallel
+from pyomo.opt.parallel.manager import ActionManagerError, ActionStatus
+from pyomo.opt.solver.log_parser import LogParser, SolverProgress
+from pyomo.opt.solver.shellcmd import SystemCallSolver
+
+# A "solver" that reports when it started and stopped
+_script = """
+import sys, time
+print('start', time.time())
+sys.stdout.flush()
+time.sleep(%s)
+print('end', time.time())
+sys.exit(%s)
+"""
+
+
+class SleepSolver(SystemCallSolver):
+    """A SystemCallSolver whose executable sleeps for a fixed time"""
+
+    def __init__(self, **kwds):
+        kwds['type'] = 'sleep_solver'
+        self.sleep = kwds.pop('sleep', 0.5)
+        self.returncode = kwds.pop('returncode', 0)
+        SystemCallSolver.__init__(self, **kwds)
+        self._valid_problem_formats = [ProblemFormat.cpxlp]
+        self._valid_result_formats = {ProblemFormat.cpxlp: ResultsFormat.soln}
+        self.set_problem_format(ProblemFormat.cpxlp)
+        self._capabilities = Bunch(linear=True)
+
+    def _default_executable(self):
+        return sys.executable
+
+    def create_command_line(self, executable, problem_files):
+        return Bunch(
+            cmd=[executable, '-c', _script % (self.sleep, self.returncode)],
+            log_file=None,
+            env=None,
+        )
+
+    def process_logfile(self):
+        results = SolverResults()
+        results.solver.status = SolverStatus.ok
+        results.solver.termination_condition = TerminationCondition.optimal
+        times = dict(line.split() for line in self._log.splitlines())
+        results.solver.start = float(times['start'])
+        results.solver.end = float(times['end'])
+        return results
+
+
+class SleepLogParser(LogParser):
+    solver = 'sleep_solver'
+
+    def parse_line(self, line):
+        event, t = line.split()
+        return SolverProgress(self.solver, line, elapsed_time=float(t))
+
+
+class ParsedSleepSolver(SleepSolver):
+    _log_parser = SleepLogParser
+
+
+def _model():
+    m = ConcreteModel()
+    m.x = Var(bounds=(0, 1))
+    m.c = Constraint(expr=m.x >= 0.5)
+    m.o = Objective(expr=m.x)
+    return m
+
+
+class TestSolverManagerParallel(unittest.TestCase):
+    def _run(self, max_workers, n=4):
+        models = [_model() for i in range(n)]
+        with SolverManager_Parallel(max_workers=max_workers) as manager:
+            ahs = [manager.queue(m, opt=SleepSolver()) for m in models]
+            manager.wait_all(ahs)
+            results = [manager.get_results(ah) for ah in ahs]
+        for ah in ahs:
+            self.assertEqual(ah.status, ActionStatus.done)
+        return sorted((r.solver.start, r.solver.end) for r in results)
+
+    def test_factory(self):
+        manager = SolverManagerFactory('parallel', max_workers=2)
+        self.assertIsInstance(manager, SolverManager_Parallel)
+        self.assertEqual(manager.max_workers, 2)
+
+    def test_concurrent_solves(self):
+        times = self._run(max_workers=4)
+        # All solves overlap in time
+        self.assertLess(max(t[0] for t in times), min(t[1] for t in times))
+
+    def test_max_workers(self):
+        times = self._run(max_workers=1)
+        # Each solve ends before the next one starts
+        for prev, curr in zip(times, times[1:]):
+            self.assertLessEqual(prev[1], curr[0])
+
+    def test_wait_any_and_wait_for(self):
+        manager = SolverManager_Parallel(max_workers=2)
+        opt = SleepSolver(sleep=0.1)
+        ah1 = manager.queue(_model(), opt=opt)
+        ah2 = manager.queue(_model(), opt=opt)
+        self.assertEqual(manager.num_queued(), 2)
+        ah = manager.wait_any()
+        self.assertIn(ah, (ah1, ah2))
+        self.assertEqual(manager.num_queued(), 1)
+        other = ah2 if ah is ah1 else ah1
+        results = manager.wait_for(other)
+        self.assertEqual(results.solver.status, SolverStatus.ok)
+        self.assertEqual(manager.num_queued(), 0)
+        self.assertIsNotNone(manager.get_results(ah))
+        # The solver object passed to queue() was not used for the solves
+        self.assertFalse(hasattr(opt, "_log"))
+
+    def test_solve_all(self):
+        models = [_model() for i in range(3)]
+        manager = SolverManager_Parallel(max_workers=2)
+        manager.solve_all(SleepSolver(sleep=0.1), models)
+        self.assertEqual(manager.num_queued(), 0)
+        self.assertEqual(manager.results, {})
+
+    def test_solver_error(self):
+        manager = SolverManager_Parallel()
+        ah = manager.queue(_model(), opt=SleepSolver(sleep=0, returncode=1))
+        with self.assertRaisesRegex(
+            ActionManagerError, "ApplicationError: Solver .* did not exit normally"
+        ):
+            manager.wait_for(ah)
+        self.assertEqual(ah.status, ActionStatus.error)
+
+    def test_tempfiles(self):
+        outer = TempfileManager.push()
+        try:
+            manager = SolverManager_Parallel(max_workers=1)
+            ahs = [
+                manager.queue(_model(), opt=SleepSolver(sleep=0.1)) for i in range(2)
+            ]
+            # The solves do not leave contexts on the TempfileManager stack
+            self.assertIs(TempfileManager.context(), outer)
+            jobs = list(manager._running.values()) + list(manager._pending)
+            fnames = [fname for job in jobs for fd, fname in job.tempfiles.tempfiles]
+            self.assertTrue(fnames)
+            self.assertTrue(all(os.path.exists(fname) for fname in fnames))
+            manager.wait_all(ahs)
+            self.assertIs(TempfileManager.context(), outer)
+            self.assertFalse(any(os.path.exists(fname) for fname in fnames))
+            for ah in ahs:
+                self.assertEqual(manager.event_handle[ah.id].status, ActionStatus.done)
+        finally:
+            TempfileManager.pop()
+
+    def test_tempfiles_presolve_error(self):
+        class BadSolver(SleepSolver):
+            def create_command_line(self, executable, problem_files):
+                raise RuntimeError("bad command line")
+
+        outer = TempfileManager.push()
+        try:
+            manager = SolverManager_Parallel()
+            with self.assertRaisesRegex(RuntimeError, "bad command line"):
+                manager.queue(_model(), opt=BadSolver())
+            self.assertIs(TempfileManager.context(), outer)
+        finally:
+            TempfileManager.pop()
+
+    def test_progress_callback(self):
+        progress = []
+        manager = SolverManager_Parallel(max_workers=2)
+        ahs = [
+            manager.queue(
+                _model(),
+                opt=ParsedSleepSolver(sleep=0.1),
+                progress_callback=progress.append,
+            )
+            for i in range(2)
+        ]
+        manager.wait_all(ahs)
+        self.assertEqual(
+            sorted(p.line.split()[0] for p in progress),
+            ['end', 'end', 'start', 'start'],
+        )
+        for ah in ahs:
+            results = manager.get_results(ah)
+            times = [p.elapsed_time for p in progress]
+            self.assertIn(results.solver.start, times)
+            self.assertIn(results.solver.end, times)
+
+    def test_progress_callback_not_supported(self):
+        manager = SolverManager_Parallel()
+        with LoggingIntercept() as LOG:
+            ah = manager.queue(
+                _model(), opt=SleepSolver(sleep=0), progress_callback=lambda p: None
+            )
+        self.assertIn("does not support progress callbacks", LOG.getvalue())
+        results = manager.wait_for(ah)
+        self.assertEqual(results.solver.status, SolverStatus.ok)
+
+    def test_no_solver(self):
+        manager = SolverManager_Parallel()
+        with self.assertRaisesRegex(ActionManagerError, "No solver passed"):
+            manager.queue(_model())
+
+    def test_synchronous_fallback(self):
+        class MockSolver(pyomo.opt.OptSolver):
+            def solve(self, *args, **kwds):
+                return Bunch(status='solved')
+
+        manager = SolverManager_Parallel()
+        ah = manager.queue(_model(), opt=MockSolver(type='mock'))
+        self.assertEqual(ah.status, ActionStatus.done)
+        self.assertEqual(manager.wait_any(), ah)
+        self.assertEqual(manager.get_results(ah).status, 'solved')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,303 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import subprocess
+import sys
+import time
+
+import pyomo.common.unittest as unittest
+from pyomo.common.collections import Bunch
+from pyomo.common.tee import TeeStream
+from pyomo.environ import ConcreteModel, Var, Objective, Constraint
+
+from pyomo.opt import (
+    ProblemFormat,
+    ResultsFormat,
+    SolverResults,
+    SolverStatus,
+    TerminationCondition,
+)
+from pyomo.opt.solver.shellcmd import SystemCallSolver
+
+from pyomo.opt.solver.log_parser import (
+    SolverProgress,
+    LogParser,
+    IpoptLogParser,
+    CBCLogParser,
+    GLPKLogParser,
+    HiGHSLogParser,
+)
+
+ipopt_log = """\
+This is Ipopt version 3.14.4, running with linear solver MUMPS 5.2.1.
+
+iter    objective    inf_pr   inf_du lg(mu)  ||d||  lg(rg) alpha_du alpha_pr  ls
+   0  1.0000000e+00 2.00e+00 1.00e+00  -1.0 0.00e+00    -  0.00e+00 0.00e+00   0
+   1r 5.0000000e-01 2.00e-01 3.00e-02  -1.0 1.00e+00    -  1.00e+00 1.00e+00f  1
+   2  2.5000000e-01 0.00e+00 1.00e-09  -2.5 5.00e-01    -  1.00e+00 1.00e+00h  1
+
+Number of Iterations....: 2
+"""
+
+cbc_log = """\
+Clp0006I 0  Obj 0 Primal inf 1.5 (3) Dual inf 0.25 (2)
+Cbc0010I After 0 nodes, 1 on tree, 1e+50 best solution, best possible -10 (0.01 seconds)
+Cbc0012I Integer solution of -8 found by rounding after 12 iterations and 3 nodes (0.50 seconds)
+Cbc0010I After 100 nodes, 12 on tree, -8 best solution, best possible -10 (1.25 seconds)
+Cbc0038I Full problem 10 rows 8 columns, reduced to 0 rows 0 columns
+"""
+
+glpk_log = """\
+GLPK Simplex Optimizer 5.0
+*     0: obj =   0.000000000e+00 inf =   1.000e+00 (1)
+*     3: obj =  -1.000000000e+01 infeas =  0.000e+00 (0)
+Integer optimization begins...
++     3: mip =     not found yet >=              -inf        (1; 0)
++     5: >>>>>  -8.000000000e+00 >=  -1.000000000e+01  25.0% (2; 0)
+"""
+
+highs_log = """\
+        Iteration        Objective     Infeasibilities num(sum)
+                0     0.0000000000e+00 Ph1: 2(2); Du: 1(1) 0s
+                3    -1.0000000000e+01 Pr: 0(0) 0s
+ T       0       0         0   0.00%   -inf            inf                Large        0      0      0         0     0.0s
+         5       2         1  50.00%   -10             -8                25.00%        1      0      0         3     0.1s
+"""
+
+
+_iteration_script = """
+import time
+for i in range(%s):
+    print('%%4d  1.0e+00 1.0e+00 1.0e+00  -1.0 0.0e+00    -  0.0e+00 0.0e+00   0'
+          %% i, flush=True)
+    time.sleep(0.01)
+"""
+
+
+class IterationSolver(SystemCallSolver):
+    """A SystemCallSolver whose executable prints an Ipopt iteration table"""
+
+    _log_parser = IpoptLogParser
+
+    def __init__(self, **kwds):
+        kwds['type'] = 'iteration_solver'
+        self.iterations = kwds.pop('iterations', 10)
+        SystemCallSolver.__init__(self, **kwds)
+        self._valid_problem_formats = [ProblemFormat.cpxlp]
+        self._valid_result_formats = {ProblemFormat.cpxlp: ResultsFormat.soln}
+        self.set_problem_format(ProblemFormat.cpxlp)
+        self._capabilities = Bunch(linear=True)
+
+    def _default_executable(self):
+        return sys.executable
+
+    def create_command_line(self, executable, problem_files):
+        return Bunch(
+            cmd=[executable, '-c', _iteration_script % (self.iterations,)],
+            log_file=None,
+            env=None,
+        )
+
+    def process_logfile(self):
+        results = SolverResults()
+        results.solver.status = SolverStatus.ok
+        results.solver.termination_condition = TerminationCondition.optimal
+        return results
+
+
+def _model():
+    m = ConcreteModel()
+    m.x = Var(bounds=(0, 1))
+    m.c = Constraint(expr=m.x >= 0.5)
+    m.o = Objective(expr=m.x)
+    return m
+
+
+class TestLogParsers(unittest.TestCase):
+    def _parse(self, parser_class, log):
+        records = []
+        parser = parser_class(records.append)
+        # Feed the log in small chunks (lines will be split across writes)
+        for i in range(0, len(log), 7):
+            parser.write(log[i : i + 7])
+        parser.close()
+        for record in records:
+            self.assertIsInstance(record, SolverProgress)
+            self.assertEqual(record.solver, parser_class.solver)
+            self.assertIsNotNone(record.elapsed_time)
+        self.assertIs(parser.last_progress, records[-1])
+        return records
+
+    def test_ipopt(self):
+        records = self._parse(IpoptLogParser, ipopt_log)
+        self.assertEqual([r.iteration for r in records], [0, 1, 2])
+        self.assertEqual([r.objective for r in records], [1, 0.5, 0.25])
+        self.assertEqual([r.primal_infeasibility for r in records], [2, 0.2, 0])
+        self.assertEqual([r.dual_infeasibility for r in records], [1, 0.03, 1e-9])
+        self.assertIsNone(records[0].gap)
+
+    def test_cbc(self):
+        records = self._parse(CBCLogParser, cbc_log)
+        self.assertEqual(len(records), 4)
+        self.assertEqual(records[0].primal_infeasibility, 1.5)
+        self.assertEqual(records[0].dual_infeasibility, 0.25)
+        # No incumbent yet
+        self.assertIsNone(records[1].objective)
+        self.assertEqual(records[1].bound, -10)
+        self.assertEqual(records[1].elapsed_time, 0.01)
+        self.assertEqual(records[2].objective, -8)
+        self.assertEqual(records[2].iteration, 3)
+        self.assertAlmostEqual(records[2].gap, 0.25)
+        self.assertEqual(records[3].iteration, 100)
+        self.assertEqual(records[3].elapsed_time, 1.25)
+
+    def test_glpk(self):
+        records = self._parse(GLPKLogParser, glpk_log)
+        self.assertEqual([r.iteration for r in records], [0, 3, 3, 5])
+        self.assertEqual(records[0].primal_infeasibility, 1)
+        self.assertEqual(records[1].objective, -10)
+        self.assertIsNone(records[2].objective)
+        self.assertEqual(records[2].bound, float('-inf'))
+        self.assertEqual(records[3].objective, -8)
+        self.assertEqual(records[3].bound, -10)
+        self.assertAlmostEqual(records[3].gap, 0.25)
+
+    def test_highs(self):
+        records = self._parse(HiGHSLogParser, highs_log)
+        self.assertEqual([r.iteration for r in records], [0, 3, 0, 5])
+        self.assertEqual(records[0].primal_infeasibility, 2)
+        self.assertEqual(records[0].dual_infeasibility, 1)
+        self.assertEqual(records[1].objective, -10)
+        self.assertIsNone(records[2].objective)
+        self.assertIsNone(records[2].gap)
+        self.assertEqual(records[3].objective, -8)
+        self.assertEqual(records[3].bound, -10)
+        self.assertAlmostEqual(records[3].gap, 0.25)
+        self.assertEqual(records[3].elapsed_time, 0.1)
+
+    def test_callback_exception(self):
+        def callback(progress):
+            raise RuntimeError("bad callback")
+
+        parser = IpoptLogParser(callback)
+        with self.assertLogs('pyomo.opt.solver.log_parser', level='ERROR') as cm:
+            parser.write(ipopt_log)
+        self.assertIn("Error in solver progress callback", cm.output[0])
+        self.assertFalse(parser.termination_requested)
+
+    def test_base_class(self):
+        with self.assertRaisesRegex(NotImplementedError, "does not implement"):
+            LogParser().write('line\n')
+
+    def test_set_interrupt(self):
+        interrupts = []
+        parser = IpoptLogParser(lambda progress: progress.iteration >= 1)
+        parser.write(ipopt_log)
+        self.assertTrue(parser.termination_requested)
+        # The interrupt is called once registered
+        parser.set_interrupt(lambda: interrupts.append(1))
+        self.assertEqual(interrupts, [1])
+        # ... and the callback is not called again
+        parser.callback = None
+        parser.write(ipopt_log)
+        self.assertEqual(interrupts, [1])
+
+    def test_interrupt_subprocess(self):
+        script = (
+            "import time\n"
+            "for i in range(1000):\n"
+            "    print('%4d  1.0e+00 1.0e+00 1.0e+00  -1.0 0.0e+00    -  "
+            "0.0e+00 0.0e+00   0' % i, flush=True)\n"
+            "    time.sleep(0.01)\n"
+        )
+        records = []
+
+        def callback(progress):
+            records.append(progress)
+            return progress.iteration >= 5
+
+        parser = IpoptLogParser(callback)
+        start = time.time()
+        with TeeStream(parser) as t:
+            with subprocess.Popen(
+                [sys.executable, '-c', script],
+                stdout=t.STDOUT,
+                stderr=subprocess.DEVNULL,
+                universal_newlines=True,
+            ) as process:
+                parser.attach(process)
+                process.wait(timeout=20)
+        self.assertLess(time.time() - start, 5)
+        self.assertNotEqual(process.returncode, 0)
+        self.assertTrue(parser.termination_requested)
+        self.assertGreaterEqual(records[-1].iteration, 5)
+        self.assertLess(len(records), 100)
+
+
+class TestSystemCallSolverProgress(unittest.TestCase):
+    def test_progress_callback(self):
+        records = []
+        opt = IterationSolver(iterations=10)
+        results = opt.solve(_model(), progress_callback=records.append)
+        self.assertEqual(results.solver.status, SolverStatus.ok)
+        self.assertEqual([r.iteration for r in records], list(range(10)))
+        # The complete log is still captured
+        self.assertEqual(len(opt._log.splitlines()), 10)
+
+    def test_early_termination(self):
+        records = []
+
+        def callback(progress):
+            records.append(progress)
+            return progress.iteration >= 5
+
+        opt = IterationSolver(iterations=1000)
+        start = time.time()
+        # (this solver does not report a solution to load)
+        results = opt.solve(_model(), progress_callback=callback, load_solutions=False)
+        self.assertLess(time.time() - start, 5)
+        self.assertLess(len(records), 100)
+        # The interrupted solve is reported as such (and not as an error)
+        self.assertEqual(results.solver.status, SolverStatus.aborted)
+        self.assertEqual(
+            results.solver.termination_condition, TerminationCondition.userInterrupt
+        )
+
+    def test_early_termination_not_interruptible(self):
+        records = []
+
+        def callback(progress):
+            records.append(progress)
+            return progress.iteration >= 5
+
+        opt = IterationSolver(iterations=20)
+        opt._interruptible = False
+        with self.assertLogs('pyomo.opt', level='WARNING') as cm:
+            results = opt.solve(_model(), progress_callback=callback)
+        self.assertIn("cannot be interrupted", cm.output[0])
+        # The solver ran to completion
+        self.assertEqual(len(opt._log.splitlines()), 20)
+        self.assertEqual(len(records), 6)
+        self.assertEqual(results.solver.status, SolverStatus.ok)
+        self.assertEqual(
+            results.solver.termination_condition, TerminationCondition.optimal
+        )
+
+    def test_unsupported(self):
+        opt = IterationSolver(iterations=2)
+        opt._log_parser = None
+        with self.assertLogs('pyomo.opt', level='WARNING') as cm:
+            opt.solve(_model(), progress_callback=lambda progress: None)
+        self.assertIn("does not support progress callbacks", cm.output[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -33,7 +33,9 @@ from pyomo.opt.results import (
     Solution,
 )
 from pyomo.opt.solver import SystemCallSolver
+from pyomo.opt.solver.log_parser import CBCLogParser
 from pyomo.solvers.mockmip import MockMIP
+from pyomo.solvers.plugins.solvers.mip_start import IncumbentMixin
 
 logger = logging.getLogger('pyomo.solvers')
 
@@ -77,15 +79,18 @@ class CBC(OptSolver):
 
 
 @SolverFactory.register('_cbc_shell', doc='Shell interface to the CBC LP/MIP solver')
-class CBCSHELL(SystemCallSolver):
+class CBCSHELL(IncumbentMixin, SystemCallSolver):
     """Shell interface to the CBC LP/MIP solver"""
 
+    _log_parser = CBCLogParser
+
     def __init__(self, **kwds):
         #
         # Call base constructor
         #
         kwds['type'] = 'cbc'
-        super(CBCSHELL, self).__init__(**kwds)
+        SystemCallSolver.__init__(self, **kwds)
+        IncumbentMixin.__init__(self)
 
         # NOTE: eventually both of the following attributes should be
         # migrated to a common base class.  is the current solve
@@ -96,6 +101,9 @@ class CBCSHELL(SystemCallSolver):
         # related to the above, the temporary name of the SOLN
         # warm-start file (if any).
         self._warm_start_file_name = None
+        # the number of values written to the warm-start file (None
+        # if the file was provided by the user)
+        self._warm_start_values_written = None
 
         #
         # Set up valid problem formats and valid results for each
@@ -176,32 +184,29 @@ class CBCSHELL(SystemCallSolver):
     def _write_soln_file(self, instance, filename):
         # Maybe this could be a useful method for any instance.
 
-        if isinstance(instance, IBlock):
-            smap = getattr(instance, "._symbol_maps")[self._smap_id]
-        else:
-            smap = instance.solutions.symbol_map[self._smap_id]
-        byObject = smap.byObject
+        # Start from the current variable values, falling back on the
+        # last incumbent found for this instance (if any).
+        if instance is not self._warm_start_instance:
+            self._set_warm_start_instance(instance)
 
         column_index = 0
         with open(filename, 'w') as solnfile:
-            for var in instance.component_data_objects(Var):
+            for name, (var, val) in self._mip_start_values().items():
                 # Cbc only expects integer variables with non-zero
                 # values for mipstart.
-                if (
-                    var.value
-                    and (var.is_integer() or var.is_binary())
-                    and (id(var) in byObject)
-                ):
-                    name = byObject[id(var)]
-                    solnfile.write('{} {} {}\n'.format(column_index, name, var.value))
+                if val and (var.is_integer() or var.is_binary()):
+                    solnfile.write('{} {} {}\n'.format(column_index, name, val))
                     # Cbc ignores column indexes, so the value does not matter.
                     column_index += 1
+        return column_index
 
     #
     # Write a warm-start file in the SOLN format.
     #
     def _warm_start(self, instance):
-        self._write_soln_file(instance, self._warm_start_file_name)
+        self._warm_start_values_written = self._write_soln_file(
+            instance, self._warm_start_file_name
+        )
 
     # over-ride presolve to extract the warm-start keyword, if specified.
     def _presolve(self, *args, **kwds):
@@ -214,6 +219,7 @@ class CBCSHELL(SystemCallSolver):
         # to a file.
         self._warm_start_solve = kwds.pop('warmstart', False)
         self._warm_start_file_name = kwds.pop('warmstart_file', None)
+        self._warm_start_values_written = None
         user_warmstart = False
         if self._warm_start_file_name is not None:
             user_warmstart = True
@@ -269,6 +275,7 @@ class CBCSHELL(SystemCallSolver):
                     "CBCplugin _presolve method can only handle a single "
                     "problem instance - %s were supplied" % (len(args),)
                 )
+            self._set_warm_start_instance(args[0])
 
             # write the warm-start file - currently only supports MIPs.
             # we only know how to deal with a single problem instance.
@@ -280,6 +287,8 @@ class CBCSHELL(SystemCallSolver):
                     print(
                         "Warm start write time=%.2f seconds" % (end_time - start_time)
                     )
+        else:
+            self._set_warm_start_instance(None)
 
     def _default_executable(self):
         executable = Executable("cbc")
@@ -450,6 +459,12 @@ class CBCSHELL(SystemCallSolver):
         upper_bound = None
         gap = None
         nodes = None
+        mip_start = {
+            'values_written': self._warm_start_values_written,
+            'values_read': None,
+            'accepted': None,
+            'objective': None,
+        }
         # See https://www.coin-or.org/Cbc/cbcuserguide.html#messages
         for line in output.split("\n"):
             tokens = tuple(re.split('[ \t]+', line.strip()))
@@ -572,6 +587,32 @@ class CBCSHELL(SystemCallSolver):
                 ):
                     results.problem.number_of_integer_variables = int(tokens[3])
                     results.problem.number_of_binary_variables = int(tokens[5][1:])
+                # https://github.com/coin-or/Cbc/blob/cb6bf98/Cbc/src/CbcMipStartIO.cpp
+                elif n_tokens > 5 and tokens[:4] == (
+                    'MIPStart',
+                    'values',
+                    'read',
+                    'for',
+                ):
+                    mip_start['values_read'] = int(tokens[4])
+                elif n_tokens > 5 and tokens[:5] == (
+                    'MIPStart',
+                    'provided',
+                    'solution',
+                    'with',
+                    'cost',
+                ):
+                    mip_start['accepted'] = True
+                    mip_start['objective'] = _float(tokens[5])
+                elif n_tokens > 6 and tokens[1:7] == (
+                    'mipstart',
+                    'values',
+                    'could',
+                    'not',
+                    'be',
+                    'used',
+                ):
+                    mip_start['accepted'] = False
                 elif n_tokens == 5 and tokens[3] == "NAME":
                     results.problem.name = tokens[4]
                 elif (
@@ -693,6 +734,10 @@ class CBCSHELL(SystemCallSolver):
         if results.problem.name is None:
             results.problem.name = 'unknown'
 
+        if self._warm_start_solve:
+            # Report how much of the MIP start CBC used
+            results.solver.mip_start = mip_start
+
         if soln.status is SolutionStatus.optimal:
             results.solver.termination_message = (
                 "Model was solved to optimality (subject to tolerances), and an "
@@ -1086,6 +1131,9 @@ class CBCSHELL(SystemCallSolver):
         # let the base class deal with returning results.
         results = super(CBCSHELL, self)._postsolve()
 
+        # remember the solution for warm-starting the next solve
+        self._record_incumbent(results)
+
         # finally, clean any temporary files registered with the temp file
         # manager, created populated *directly* by this plugin. does not
         # include, for example, the execution script. but does include
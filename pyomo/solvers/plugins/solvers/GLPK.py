@@ -14,6 +14,7 @@ import re
 import sys
 import csv
 import subprocess
+import time
 
 from pyomo.common.tempfiles import TempfileManager
 
@@ -32,7 +33,9 @@ from pyomo.opt import (
 )
 from pyomo.opt.base.solvers import _extract_version
 from pyomo.opt.solver import SystemCallSolver
+from pyomo.opt.solver.log_parser import GLPKLogParser
 from pyomo.solvers.mockmip import MockMIP
+from pyomo.solvers.plugins.solvers.mip_start import IncumbentMixin
 
 logger = logging.getLogger('pyomo.solvers')
 
@@ -53,6 +56,106 @@ GLP_INFEAS = 'i'  # solution is infeasible
 GLP_NOFEAS = 'n'  # no feasible solution exists
 GLP_OPT = 'o'  # solution is optimal
 
+# Section keywords in the CPLEX LP format (they must appear on a line
+# by themselves in the files written by Pyomo)
+_cpxlp_sections = {
+    'min': 'obj',
+    'minimize': 'obj',
+    'minimum': 'obj',
+    'max': 'obj',
+    'maximize': 'obj',
+    'maximum': 'obj',
+    's.t.': 'st',
+    'st': 'st',
+    'subject to': 'st',
+    'such that': 'st',
+    'bound': 'bounds',
+    'bounds': 'bounds',
+    'gen': 'int',
+    'general': 'int',
+    'generals': 'int',
+    'integer': 'int',
+    'integers': 'int',
+    'bin': 'int',
+    'binary': 'int',
+    'binaries': 'int',
+    'end': 'end',
+}
+_cpxlp_operators = {'<', '<=', '=<', '>', '>=', '=>', '='}
+
+
+def _scan_cpxlp_file(filename):
+    """Recover the GLPK row / column numbering of a CPLEX LP file
+
+    GLPK numbers the rows in the order they appear in the constraint
+    section and the columns in the order they first appear anywhere in
+    the file.
+
+    Returns
+    -------
+    columns: dict
+        Maps the column name to its (1-based) GLPK column number
+    rows: list
+        The terms (coefficient, column name) of each row
+    objective: list
+        The terms (coefficient, column name) of the objective
+
+    """
+    columns = {}
+    rows = []
+    objective = []
+    section = None
+    terms = objective
+    coef = 1
+    in_rhs = False
+    with open(filename, 'r') as FILE:
+        for line in FILE:
+            line = line.strip()
+            if not line or line[0] == '\\':
+                continue
+            key = ' '.join(line.lower().split())
+            if key in _cpxlp_sections:
+                section = _cpxlp_sections[key]
+                if section == 'end':
+                    break
+                continue
+            for token in line.split():
+                if section == 'obj' or section == 'st':
+                    if token[-1] == ':':
+                        # row (or objective) label
+                        if section == 'st':
+                            terms = []
+                            rows.append(terms)
+                        coef = 1
+                        in_rhs = False
+                        continue
+                    if token in _cpxlp_operators:
+                        in_rhs = True
+                        continue
+                    if in_rhs or token == '+':
+                        continue
+                    if token == '-':
+                        coef = -coef
+                        continue
+                    try:
+                        coef *= float(token)
+                        continue
+                    except ValueError:
+                        pass
+                    columns.setdefault(token, len(columns) + 1)
+                    terms.append((coef, token))
+                    coef = 1
+                elif section == 'bounds' or section == 'int':
+                    if token in _cpxlp_operators or token.lower() == 'free':
+                        continue
+                    try:
+                        float(token)
+                        continue
+                    except ValueError:
+                        pass
+                    columns.setdefault(token, len(columns) + 1)
+    return columns, rows, objective
+
 
 @SolverFactory.register('glpk', doc='The GLPK LP/MIP solver')
 class GLPK(OptSolver):
@@ -77,9 +180,13 @@ class GLPK(OptSolver):
 @SolverFactory.register(
     '_glpk_shell', doc='Shell interface to the GNU Linear Programming Kit'
 )
-class GLPKSHELL(SystemCallSolver):
+class GLPKSHELL(IncumbentMixin, SystemCallSolver):
     """Shell interface to the GLPK LP/MIP solver"""
 
+    _log_parser = GLPKLogParser
+    # glpsol does not catch SIGINT (it would exit without a solution)
+    _interruptible = False
+
     # Cache known versions so we do not need to repeatedly query the
     # version every time we run the solver.
     _known_versions = {}
@@ -90,9 +197,16 @@ class GLPKSHELL(SystemCallSolver):
         #
         kwargs['type'] = 'glpk'
         SystemCallSolver.__init__(self, **kwargs)
+        IncumbentMixin.__init__(self)
 
         self._rawfile = None
 
+        # is the current solve warm-started, and the name and number of
+        # values of the (GLPK MIP solution format) warm-start file
+        self._warm_start_solve = False
+        self._warm_start_file_name = None
+        self._warm_start_values_written = None
+
         #
         # Valid problem formats, and valid results for each format
         #
@@ -116,6 +230,99 @@ class GLPKSHELL(SystemCallSolver):
     def _default_results_format(self, prob_format):
         return ResultsFormat.soln
 
+    def warm_start_capable(self):
+        return self._problem_format == ProblemFormat.cpxlp
+
+    def _write_mip_start_file(self, filename):
+        """Write the warm-start file read by 'glpsol --use'
+
+        The file is in the GLPK MIP solution format, which identifies
+        rows and columns by their number, so the numbering is recovered
+        from the LP file that glpsol reads.  Columns without a start
+        value start at the value in their bounds closest to 0.
+
+        Returns
+        -------
+        int
+            The number of columns with a start value
+
+        """
+        columns, rows, objective = _scan_cpxlp_file(self._problem_files[0])
+        start = self._mip_start_values()
+        smap = self._warm_start_smap.bySymbol
+        values = {'ONE_VAR_CONSTANT': 1}
+        values_written = 0
+        for name in columns:
+            if name in start:
+                values[name] = start[name][1]
+                values_written += 1
+            elif name not in values:
+                var = smap.get(name, None)
+                val = 0
+                if var is not None and var.is_variable_type():
+                    lb, ub = var.bounds
+                    if lb is not None and lb > 0:
+                        val = lb
+                    elif ub is not None and ub < 0:
+                        val = ub
+                values[name] = val
+
+        def activity(terms):
+            return sum(coef * values[name] for coef, name in terms)
+
+        with open(filename, 'w') as FILE:
+            FILE.write("c Pyomo warm start for %s\n" % (self._problem_files[0],))
+            FILE.write(
+                "s mip %d %d f %.17g\n" % (len(rows), len(columns), activity(objective))
+            )
+            for i, terms in enumerate(rows, start=1):
+                FILE.write("i %d %.17g\n" % (i, activity(terms)))
+            for name, j in columns.items():
+                FILE.write("j %d %.17g\n" % (j, values[name]))
+            FILE.write("e o f\n")
+        return values_written
+
+    def _presolve(self, *args, **kwds):
+        # extract the warm-start keywords (if specified) before the base
+        # class builds the command line.
+        self._warm_start_solve = kwds.pop('warmstart', False)
+        self._warm_start_file_name = kwds.pop('warmstart_file', None)
+        self._warm_start_values_written = None
+        user_warmstart = self._warm_start_file_name is not None
+
+        super(GLPKSHELL, self)._presolve(*args, **kwds)
+
+        if (len(args) > 0) and (not isinstance(args[0], str)):
+            self._set_warm_start_instance(args[0])
+        else:
+            self._set_warm_start_instance(None)
+
+        if not self._warm_start_solve or user_warmstart:
+            return
+        if self._warm_start_instance is None:
+            # solving a problem file: the user is expected to have
+            # provided the warm-start file
+            values_written = 0
+        elif self._problem_format != ProblemFormat.cpxlp:
+            logger.warning(
+                "GLPK warm starts are only supported for the LP problem "
+                "format; ignoring the warmstart option."
+            )
+            values_written = 0
+        else:
+            start_time = time.time()
+            values_written = self._write_mip_start_file(self._warm_start_file_name)
+            if self._report_timing is True:
+                print("Warm start write time=%.2f seconds" % (time.time() - start_time))
+        if not values_written:
+            # nothing to warm-start from: do not pass the file to glpsol
+            cmd = self._command.cmd
+            i = cmd.index('--use')
+            del cmd[i : i + 2]
+            self._warm_start_solve = False
+        else:
+            self._warm_start_values_written = values_written
+
     def _default_executable(self):
         executable = Executable('glpsol')
         if not executable:
@@ -192,6 +399,13 @@ class GLPKSHELL(SystemCallSolver):
         cmd.extend(['--write', self._rawfile])
         cmd.extend(['--wglp', self._glpfile])
 
+        if self._warm_start_solve:
+            if self._warm_start_file_name is None:
+                self._warm_start_file_name = TempfileManager.create_tempfile(
+                    suffix='.glpk.mip'
+                )
+            cmd.extend(['--use', self._warm_start_file_name])
+
         if self._problem_format == ProblemFormat.cpxlp:
             cmd.extend(['--cpxlp', problem_files[0]])
         elif self._problem_format == ProblemFormat.mps:
@@ -252,6 +466,21 @@ class GLPKSHELL(SystemCallSolver):
                 ):
                     solv.termination_condition = TerminationCondition.unbounded
 
+        if self._warm_start_solve:
+            # glpsol does not report whether it used the start
+            solv.mip_start = {
+                'values_written': self._warm_start_values_written,
+                'values_read': None,
+                'accepted': None,
+                'objective': None,
+            }
+
+        return results
+
+    def _postsolve(self):
+        results = super(GLPKSHELL, self)._postsolve()
+        # remember the solution for warm-starting the next solve
+        self._record_incumbent(results)
         return results
 
     def _glpk_get_solution_status(self, status):
@@ -0,0 +1,135 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+
+import copy
+import weakref
+
+from pyomo.common.collections import ComponentMap
+from pyomo.core.kernel.block import IBlock
+from pyomo.opt import SolutionStatus
+
+# Solution statuses for which a solution is used as the incumbent for
+# warm-starting the next solve
+_incumbent_status = {
+    SolutionStatus.optimal,
+    SolutionStatus.feasible,
+    SolutionStatus.bestSoFar,
+    SolutionStatus.globallyOptimal,
+    SolutionStatus.locallyOptimal,
+}
+
+
+class IncumbentMixin(object):
+    """Mixin for shell MIP solvers that warm-start from the last incumbent
+
+    After every solve of a model (instance), the variable values of the
+    returned solution are remembered (whether or not they were loaded
+    into the model).  When the next solve of the same model is
+    warm-started, the start values are the current variable values
+    (so values set by the user after the last solve are honored),
+    falling back on that incumbent (mapped through the symbol map of
+    the new problem file) for variables without a value (e.g., when the
+    last solution was not loaded into the model).
+
+    Derived classes call :meth:`_set_warm_start_instance` from
+    ``_presolve`` (once the symbol map for the problem file exists) and
+    :meth:`_record_incumbent` from ``_postsolve``.
+
+    Deep copies of the solver (e.g., the copy the 'parallel' solver
+    manager makes for each queued solve) share the incumbents with the
+    original solver, so they warm-start from (and record) the same
+    incumbents.  Pickled solvers do not keep the incumbents.
+
+    """
+
+    def __init__(self):
+        # model -> ComponentMap of the variable values in the last
+        # solution returned for that model
+        self._incumbents = weakref.WeakKeyDictionary()
+        self._warm_start_instance = None
+        self._warm_start_smap = None
+
+    def __deepcopy__(self, memo):
+        # The incumbents (and the model of the current solve) refer to
+        # the original models, so they are shared rather than copied
+        for obj in (self._incumbents, self._warm_start_instance, self._warm_start_smap):
+            if obj is not None:
+                memo[id(obj)] = obj
+        ans = memo[id(self)] = self.__class__.__new__(self.__class__)
+        for key, val in self.__dict__.items():
+            ans.__dict__[key] = copy.deepcopy(val, memo)
+        return ans
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state['_incumbents'] = None
+        state['_warm_start_instance'] = None
+        state['_warm_start_smap'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._incumbents = weakref.WeakKeyDictionary()
+
+    def _set_warm_start_instance(self, instance):
+        if instance is None:
+            self._warm_start_instance = None
+            self._warm_start_smap = None
+            return
+        self._warm_start_instance = instance
+        if isinstance(instance, IBlock):
+            self._warm_start_smap = getattr(instance, "._symbol_maps")[self._smap_id]
+        else:
+            self._warm_start_smap = instance.solutions.symbol_map[self._smap_id]
+
+    def _mip_start_values(self):
+        """Return the start value for each variable in the problem file
+
+        Returns
+        -------
+        dict
+            Maps the variable name (in the problem file) to the pair
+            (VarData, start value).  Variables without a start value
+            are omitted.
+
+        """
+        incumbent = self._incumbents.get(self._warm_start_instance, None)
+        if incumbent is None:
+            incumbent = ComponentMap()
+        values = {}
+        for symbol, obj in self._warm_start_smap.bySymbol.items():
+            if not getattr(obj, 'is_variable_type', bool)():
+                continue
+            val = obj.value
+            if val is None:
+                val = incumbent.get(obj, None)
+            if val is not None:
+                values[symbol] = (obj, val)
+        return values
+
+    def _record_incumbent(self, results):
+        instance = self._warm_start_instance
+        smap = self._warm_start_smap
+        # Do not hold on to the model between solves
+        self._set_warm_start_instance(None)
+        if instance is None or results is None or not len(results.solution):
+            return
+        soln = results.solution(0)
+        if soln.status not in _incumbent_status:
+            return
+        solution_vars = soln.variable
+        incumbent = ComponentMap()
+        for symbol, obj in smap.bySymbol.items():
+            if not getattr(obj, 'is_variable_type', bool)():
+                continue
+            # Solvers may omit variables at zero from the solution
+            incumbent[obj] = solution_vars.get(symbol, {}).get('Value', 0)
+        self._incumbents[instance] = incumbent
@@ -0,0 +1,324 @@
+#  ___________________________________________________________________________
+#
+#  Pyomo: Python Optimization Modeling Objects
+#  Copyright (c) 2008-2025
+#  National Technology and Engineering Solutions of Sandia, LLC
+#  Under the terms of Contract DE-NA0003525 with National Technology and
+#  Engineering Solutions of Sandia, LLC, the U.S. Government retains certain
+#  rights in this software.
+#  This software is distributed under the 3-clause BSD License.
+#  ___________________________________________________________________________
+#
+# Tests for warm-starting the CBC and GLPK shell interfaces from the
+# previous incumbent (these do not need the solver executables)
+#
+
+import copy
+import gc
+import pickle
+import sys
+
+import pyomo.common.unittest as unittest
+from pyomo.common.collections import Bunch
+from pyomo.common.tempfiles import TempfileManager
+
+from pyomo.environ import (
+    ConcreteModel,
+    Var,
+    Constraint,
+    Objective,
+    Binary,
+    Integers,
+    maximize,
+)
+from pyomo.opt import (
+    ProblemFormat,
+    ResultsFormat,
+    SolverResults,
+    SolverStatus,
+    Solution,
+    SolutionStatus,
+    TerminationCondition,
+)
+from pyomo.opt.parallel.local import SolverManager_Parallel
+from pyomo.opt.solver import SystemCallSolver
+from pyomo.solvers.plugins.solvers.CBCplugin import CBCSHELL
+from pyomo.solvers.plugins.solvers.GLPK import GLPKSHELL, _scan_cpxlp_file
+from pyomo.solvers.plugins.solvers.mip_start import IncumbentMixin
+
+
+def _model():
+    m = ConcreteModel()
+    m.x = Var(within=Binary)
+    m.y = Var(bounds=(-1, 4), within=Integers)
+    m.z = Var()
+    m.w = Var(bounds=(1, None))
+    m.o = Objective(expr=m.x + 2 * m.y + 3, sense=maximize)
+    m.c = Constraint(expr=(1, m.x + m.y + m.z, 3))
+    m.d = Constraint(expr=m.z == 2)
+    m.e = Constraint(expr=m.w * 2 >= m.x + 1)
+    return m
+
+
+class IncumbentSolver(IncumbentMixin, SystemCallSolver):
+    """A shell solver that reports its MIP start values and always
+    returns the solution x=1, y=3"""
+
+    def __init__(self, **kwds):
+        kwds['type'] = 'incumbent_solver'
+        SystemCallSolver.__init__(self, **kwds)
+        IncumbentMixin.__init__(self)
+        self._valid_problem_formats = [ProblemFormat.cpxlp]
+        self._valid_result_formats = {ProblemFormat.cpxlp: ResultsFormat.soln}
+        self.set_problem_format(ProblemFormat.cpxlp)
+        self._capabilities = Bunch(linear=True, integer=True)
+
+    def _default_executable(self):
+        return sys.executable
+
+    def create_command_line(self, executable, problem_files):
+        return Bunch(cmd=[executable, '-c', 'pass'], log_file=None, env=None)
+
+    def _presolve(self, *args, **kwds):
+        SystemCallSolver._presolve(self, *args, **kwds)
+        self._set_warm_start_instance(args[0])
+        self.start_values = {
+            var.name: val for var, val in self._mip_start_values().values()
+        }
+
+    def process_logfile(self):
+        results = SolverResults()
+        results.solver.status = SolverStatus.ok
+        results.solver.termination_condition = TerminationCondition.optimal
+        results.solver.start_values = self.start_values
+        soln = Solution()
+        soln.status = SolutionStatus.optimal
+        byObject = self._warm_start_smap.byObject
+        m = self._warm_start_instance
+        soln.variable[byObject[id(m.x)]] = {'Value': 1}
+        soln.variable[byObject[id(m.y)]] = {'Value': 3}
+        results.solution.insert(soln)
+        return results
+
+    def process_soln_file(self, results):
+        pass
+
+    def _postsolve(self):
+        results = SystemCallSolver._postsolve(self)
+        self._record_incumbent(results)
+        return results
+
+
+def _results(status, **values):
+    results = SolverResults()
+    soln = Solution()
+    soln.status = status
+    for name, val in values.items():
+        soln.variable[name] = {'Value': val}
+    results.solution.insert(soln)
+    return results
+
+
+class TestMIPStart(unittest.TestCase):
+    def setUp(self):
+        TempfileManager.push()
+
+    def tearDown(self):
+        TempfileManager.pop(remove=True)
+
+    def _write(self, opt, m):
+        fname = TempfileManager.create_tempfile(suffix='.lp')
+        _, smap_id = m.write(
+            fname, format='lp', io_options={'symbolic_solver_labels': True}
+        )
+        opt._smap_id = smap_id
+        opt._problem_files = [fname]
+        opt._set_warm_start_instance(m)
+        return fname
+
+    def test_record_incumbent(self):
+        m = _model()
+        opt = CBCSHELL()
+        self._write(opt, m)
+        opt._record_incumbent(_results(SolutionStatus.optimal, x=1, y=3))
+        self.assertIsNone(opt._warm_start_instance)
+        incumbent = opt._incumbents[m]
+        # Variables missing from the solution are at 0
+        self.assertEqual([incumbent[v] for v in (m.x, m.y, m.z, m.w)], [1, 3, 0, 0])
+
+        # Infeasible solutions are not recorded
+        self._write(opt, m)
+        opt._record_incumbent(_results(SolutionStatus.infeasible, x=0, y=4))
+        self.assertEqual(opt._incumbents[m][m.y], 3)
+
+        # ... and the incumbent is dropped with the model
+        del m, incumbent
+        gc.collect()
+        self.assertEqual(len(opt._incumbents), 0)
+
+    def test_copy_and_pickle(self):
+        m = _model()
+        opt = CBCSHELL()
+        self._write(opt, m)
+        opt._record_incumbent(_results(SolutionStatus.optimal, x=1, y=3))
+        # Copies share the incumbents (and do not copy the model)
+        opt_copy = copy.deepcopy(opt)
+        self.assertIs(opt_copy._incumbents, opt._incumbents)
+        self.assertIs(list(opt_copy._incumbents)[0], m)
+        # ... but pickles do not keep them
+        opt_copy = pickle.loads(pickle.dumps(opt))
+        self.assertEqual(len(opt_copy._incumbents), 0)
+        self.assertEqual(len(opt._incumbents), 1)
+
+    def test_parallel_solver_manager(self):
+        m = _model()
+        m.x.set_value(0)
+        opt = IncumbentSolver()
+        manager = SolverManager_Parallel()
+        results = manager.wait_for(manager.queue(m, opt=opt))
+        self.assertEqual(results.solver.start_values, {'x': 0})
+        self.assertEqual(opt._incumbents[m][m.y], 3)
+
+        # The next (queued) solves start from the current values, and
+        # from the incumbent for variables without a value
+        m.x.set_value(0)
+        m.y.set_value(None)
+        ahs = [manager.queue(m, opt=opt) for i in range(2)]
+        manager.wait_all(ahs)
+        for ah in ahs:
+            start_values = manager.get_results(ah).solver.start_values
+            self.assertEqual((start_values['x'], start_values['y']), (0, 3))
+
+    def test_user_values_override_incumbent(self):
+        m = _model()
+        opt = IncumbentSolver()
+        opt.solve(m)
+        self.assertEqual((m.x.value, m.y.value), (1, 3))
+        # The user changes a value after the solve
+        m.y.set_value(-1)
+        results = opt.solve(m)
+        self.assertEqual(results.solver.start_values['x'], 1)
+        self.assertEqual(results.solver.start_values['y'], -1)
+        # Solutions that are not loaded are still used for variables
+        # without a value
+        m.x.set_value(None)
+        m.y.set_value(None)
+        results = opt.solve(m, load_solutions=False)
+        self.assertEqual(results.solver.start_values['x'], 1)
+        self.assertEqual(results.solver.start_values['y'], 3)
+
+    def test_cbc_start_file(self):
+        m = _model()
+        m.y.set_value(2)
+        opt = CBCSHELL()
+        self._write(opt, m)
+        fname = TempfileManager.create_tempfile(suffix='.cbc.soln')
+        # No incumbent: start from the current values
+        self.assertEqual(opt._write_soln_file(m, fname), 1)
+        with open(fname) as FILE:
+            self.assertEqual(FILE.read(), "0 y 2\n")
+
+        # The incumbent is used for the variables without a value
+        opt._record_incumbent(_results(SolutionStatus.feasible, x=1, y=-1, z=2))
+        self._write(opt, m)
+        self.assertEqual(opt._write_soln_file(m, fname), 2)
+        with open(fname) as FILE:
+            self.assertEqual(FILE.read(), "0 x 1\n1 y 2\n")
+
+    def test_cbc_log(self):
+        opt = CBCSHELL()
+        opt._warm_start_solve = True
+        opt._warm_start_values_written = 2
+        opt._log_file = TempfileManager.create_tempfile(suffix='.log')
+        with open(opt._log_file, 'w') as FILE:
+            FILE.write(
+                "opening mipstart file /tmp/tmp.cbc.soln.\n"
+                "MIPStart values read for 2 variables.\n"
+                "MIPStart provided solution with cost 6\n"
+                "Result - Optimal solution found\n"
+            )
+        results = opt.process_logfile()
+        self.assertEqual(
+            results.solver.mip_start,
+            {'values_written': 2, 'values_read': 2, 'accepted': True, 'objective': 6},
+        )
+
+        with open(opt._log_file, 'w') as FILE:
+            FILE.write(
+                "MIPStart values read for 1 variables.\n"
+                "Warning: mipstart values could not be used to build a solution.\n"
+            )
+        results = opt.process_logfile()
+        self.assertEqual(results.solver.mip_start['values_read'], 1)
+        self.assertFalse(results.solver.mip_start['accepted'])
+        self.assertIsNone(results.solver.mip_start['objective'])
+
+        # Nothing is reported for solves that were not warm-started
+        opt._warm_start_solve = False
+        results = opt.process_logfile()
+        self.assertNotIn('mip_start', results.solver)
+
+    def test_scan_cpxlp_file(self):
+        m = _model()
+        opt = GLPKSHELL()
+        fname = self._write(opt, m)
+        columns, rows, objective = _scan_cpxlp_file(fname)
+        self.assertEqual(
+            columns, {'ONE_VAR_CONSTANT': 1, 'x': 2, 'y': 3, 'z': 4, 'w': 5}
+        )
+        self.assertEqual(
+            rows,
+            [
+                [(1, 'x'), (1, 'y'), (1, 'z')],
+                [(1, 'x'), (1, 'y'), (1, 'z')],
+                [(1, 'z')],
+                [(1, 'x'), (-2, 'w')],
+            ],
+        )
+        self.assertEqual(objective, [(3, 'ONE_VAR_CONSTANT'), (1, 'x'), (2, 'y')])
+
+    def test_glpk_start_file(self):
+        m = _model()
+        opt = GLPKSHELL()
+        self._write(opt, m)
+        opt._record_incumbent(_results(SolutionStatus.optimal, x=1, y=1, z=1, w=1))
+        # The current value takes precedence over the incumbent
+        m.w.set_value(3)
+        # The rows of the new problem file differ from the previous solve
+        m.del_component(m.c)
+        self._write(opt, m)
+        fname = TempfileManager.create_tempfile(suffix='.glpk.mip')
+        self.assertEqual(opt._write_mip_start_file(fname), 4)
+        with open(fname) as FILE:
+            lines = FILE.read().splitlines()
+        self.assertEqual(
+            lines[1:],
+            [
+                "s mip 2 5 f 6",
+                # c_e_d_: z == 2 ; c_u_e_: x - 2 w <= -1
+                "i 1 1",
+                "i 2 -5",
+                # ONE_VAR_CONSTANT, x, y, z, w
+                "j 1 1",
+                "j 2 1",
+                "j 3 1",
+                "j 4 1",
+                "j 5 3",
+                "e o f",
+            ],
+        )
+
+    def test_glpk_start_file_default_values(self):
+        m = _model()
+        opt = GLPKSHELL()
+        self._write(opt, m)
+        fname = TempfileManager.create_tempfile(suffix='.glpk.mip')
+        # Columns without values start at the bound closest to 0
+        self.assertEqual(opt._write_mip_start_file(fname), 0)
+        with open(fname) as FILE:
+            lines = FILE.read().splitlines()
+        self.assertEqual(lines[-6:-1], ["j 1 1", "j 2 0", "j 3 0", "j 4 0", "j 5 1"])
+
+
+if __name__ == "__main__":
+    unittest.main()